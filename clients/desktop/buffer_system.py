@@ -4,30 +4,59 @@ Manages multiple message buffers with navigation and mute capabilities.
 Ported from XG Legends buffer_system.lua
 """
 
+from collections import deque
+import itertools
+import re
 import time
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Deque, Dict, List, Set, Tuple, Optional
+
+DEFAULT_MAX_ITEMS = 5000  # Messages kept per buffer before the oldest are dropped
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Split text into the casefolded words used by the history index."""
+    return {word.casefold() for word in _WORD_RE.findall(text)}
 
 
 class BufferSystem:
-    """Manages multiple message buffers for organizing game output."""
+    """Manages multiple message buffers for organizing game output.
+
+    Each buffer is a bounded ring: once it holds ``max_items`` messages,
+    adding another drops the oldest. Message items are shared between a
+    buffer and "all", and a word index over the retained items backs
+    ``search``.
+    """
+
+    def __init__(self, max_items: int = DEFAULT_MAX_ITEMS):
+        """
+        Initialize the buffer system.
 
-    def __init__(self):
-        """Initialize the buffer system."""
-        self.buffers: Dict[str, List[Dict]] = {}  # name -> list of message items
+        Args:
+            max_items: Default number of messages each buffer keeps
+        """
+        self.max_items = max(1, max_items)
+        self.buffers: Dict[str, Deque[Dict]] = {}  # name -> ring of message items
         self.buffer_order: List[str] = []  # ordered list of buffer names
         self.current_buffer_index: int = 0  # which buffer user is viewing (0-based)
         self.buffer_positions: Dict[str, int] = {}  # name -> position (0 = newest)
         self.muted_buffers: Set[str] = set()  # set of muted buffer names
+        self._sequence = itertools.count()
+        self._refs: Dict[int, int] = {}  # seq -> number of buffers holding the item
+        self._index: Dict[str, Set[int]] = {}  # word -> seqs of items containing it
+        self._items: Dict[int, Dict] = {}  # seq -> item, for resolving index hits
 
-    def create_buffer(self, name: str) -> None:
+    def create_buffer(self, name: str, max_items: Optional[int] = None) -> None:
         """
         Create a new buffer.
 
         Args:
             name: Name of the buffer to create
+            max_items: Messages to keep in this buffer (default: ``self.max_items``)
         """
         if name not in self.buffers:
-            self.buffers[name] = []
+            self.buffers[name] = deque(maxlen=max(1, max_items or self.max_items))
             self.buffer_order.append(name)
             self.buffer_positions[name] = 0
 
@@ -44,14 +73,102 @@ class BufferSystem:
             self.create_buffer(buffer_name)
 
         # Create message item
-        item = {"text": text, "timestamp": time.time()}
+        seq = next(self._sequence)
+        item = {"text": text, "timestamp": time.time(), "buffer": buffer_name, "seq": seq}
+        self._items[seq] = item
+        self._refs[seq] = 0
+        for word in _tokenize(text):
+            self._index.setdefault(word, set()).add(seq)
 
         # Add to specified buffer
-        self.buffers[buffer_name].append(item)
+        self._push(buffer_name, item)
 
         # Also add to "all" buffer (unless this IS the "all" buffer)
         if buffer_name != "all" and "all" in self.buffers:
-            self.buffers["all"].append(item)
+            self._push("all", item)
+
+    def _push(self, buffer_name: str, item: Dict) -> None:
+        """Append an item to a buffer ring, releasing whatever falls off the end."""
+        buffer = self.buffers[buffer_name]
+        if len(buffer) == buffer.maxlen:
+            self._release(buffer[0])
+        buffer.append(item)
+        self._refs[item["seq"]] += 1
+
+    def _release(self, item: Dict) -> None:
+        """Drop one buffer's hold on an item, unindexing it once no buffer has it."""
+        seq = item["seq"]
+        self._refs[seq] -= 1
+        if self._refs[seq] > 0:
+            return
+        del self._refs[seq]
+        del self._items[seq]
+        for word in _tokenize(item["text"]):
+            seqs = self._index.get(word)
+            if seqs is not None:
+                seqs.discard(seq)
+                if not seqs:
+                    del self._index[word]
+
+    def _holds(self, buffer_name: str, item: Dict) -> bool:
+        """Check whether a buffer still holds an item (rings drop in seq order)."""
+        buffer = self.buffers.get(buffer_name)
+        if not buffer or item["seq"] < buffer[0]["seq"]:
+            return False
+        return buffer_name == "all" or item["buffer"] == buffer_name
+
+    def search(self, query: str, buffer_name: Optional[str] = None) -> List[Dict]:
+        """
+        Find messages containing every word of a query.
+
+        Args:
+            query: Words to look for (case-insensitive, whole words)
+            buffer_name: Only search this buffer (default: every retained message)
+
+        Returns:
+            Matching message items, newest first
+        """
+        words = _tokenize(query)
+        if not words:
+            return []
+        postings = sorted((self._index.get(word, set()) for word in words), key=len)
+        seqs = set(postings[0]).intersection(*postings[1:])
+        items = (self._items[seq] for seq in sorted(seqs, reverse=True))
+        if buffer_name is None:
+            return list(items)
+        return [item for item in items if self._holds(buffer_name, item)]
+
+    def find_in_buffer(self, query: str) -> bool:
+        """
+        Move to the next older message in the current buffer matching a query.
+
+        Wraps around to the newest match once the oldest has been passed.
+
+        Args:
+            query: Words to look for
+
+        Returns:
+            True if a match was found and the position moved, False otherwise
+        """
+        buffer_name = self.get_current_buffer_name()
+        matches = self.search(query, buffer_name) if buffer_name else []
+        if not matches:
+            return False
+
+        current = self.get_current_item()
+        target = matches[0]
+        if current is not None:
+            for item in matches:
+                if item["seq"] < current["seq"]:
+                    target = item
+                    break
+
+        buffer = self.buffers[buffer_name]
+        for position, item in enumerate(reversed(buffer)):
+            if item is target:
+                self.buffer_positions[buffer_name] = position
+                return True
+        return False
 
     def next_buffer(self) -> None:
         """Switch to the next buffer in the list (does not wrap)."""
@@ -205,11 +322,17 @@ class BufferSystem:
             buffer_name: Name of buffer to clear
         """
         if buffer_name in self.buffers:
-            self.buffers[buffer_name] = []
+            buffer = self.buffers[buffer_name]
+            for item in buffer:
+                self._release(item)
+            buffer.clear()
             self.buffer_positions[buffer_name] = 0
 
     def clear_all_buffers(self) -> None:
         """Clear all messages from all buffers."""
         for buffer_name in self.buffers:
-            self.buffers[buffer_name] = []
+            self.buffers[buffer_name].clear()
             self.buffer_positions[buffer_name] = 0
+        self._refs.clear()
+        self._items.clear()
+        self._index.clear()
@@ -22,6 +22,9 @@ from packet_validator import validate_incoming, validate_outgoing
 
 LOG = logging.getLogger(__name__)
 
+# Optional protocol features this client understands, sent when logging in.
+CLIENT_FEATURES = ["menu_paging"]
+
 
 class TLSUserDeclinedError(Exception):
     """Raised when the user declines to trust a presented TLS certificate."""
@@ -224,6 +227,7 @@ class NetworkManager:
             "patch": 0,
             "client_type": "Desktop",
             "platform": f"{platform_mod.system()} {platform_mod.release()} {platform_mod.machine()}",
+            "features": CLIENT_FEATURES,
         }
         if self.session_token and self._session_valid():
             packet["session_token"] = self.session_token
@@ -241,6 +245,7 @@ class NetworkManager:
             "username": username,
             "client_type": "Desktop",
             "platform": f"{platform_mod.system()} {platform_mod.release()} {platform_mod.machine()}",
+            "features": CLIENT_FEATURES,
         }
         if not self._validate_outgoing_packet(packet):
             raise RuntimeError("Client refused to send invalid refresh packet.")
@@ -616,6 +621,7 @@ _PACKET_DISPATCH = {
     "remove_playlist": lambda window, pkt: window.on_server_remove_playlist(pkt),
     "get_playlist_duration": lambda window, pkt: window.on_server_get_playlist_duration(pkt),
     "menu": lambda window, pkt: window.on_server_menu(pkt),
+    "menu_items": lambda window, pkt: window.on_server_menu_items(pkt),
     "request_input": lambda window, pkt: window.on_server_request_input(pkt),
     "clear_ui": lambda window, pkt: window.on_server_clear_ui(pkt),
     "game_list": lambda window, pkt: window.on_server_game_list(pkt),
@@ -1,6 +1,12 @@
 import ctypes
+import logging
+import threading
+from collections import OrderedDict
+
 from sound_lib import output, stream
 
+LOG = logging.getLogger(__name__)
+
 # Initialize audio output with error handling for headless/no-audio systems
 try:
     o = output.Output()
@@ -9,24 +15,135 @@ except Exception as e:
     print("Running in silent mode (no sound effects)")
     o = None
 
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024  # Sound file bytes kept in memory
+REAP_INTERVAL = 32  # Streams started between sweeps for finished ones
+
+
+class SoundBufferCache:
+    """Least-recently-used cache of sound file buffers, bounded by total bytes.
+
+    The most recently used buffer is never evicted, so a single file larger
+    than the budget still plays; it just pushes everything else out.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._buffers = OrderedDict()  # file name -> buffer, oldest use first
+        self._lock = threading.Lock()  # prefetch threads load alongside playback
+
+    def __contains__(self, file_name):
+        return file_name in self._buffers
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def get(self, file_name):
+        """Return a cached buffer and mark it recently used, or None."""
+        with self._lock:
+            buffer = self._buffers.get(file_name)
+            if buffer is not None:
+                self._buffers.move_to_end(file_name)
+            return buffer
+
+    def put(self, file_name, buffer):
+        """Cache a buffer, evicting least recently used ones over the budget."""
+        with self._lock:
+            previous = self._buffers.pop(file_name, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self._buffers[file_name] = buffer
+            self.total_bytes += len(buffer)
+            while self.total_bytes > self.max_bytes and len(self._buffers) > 1:
+                _, evicted = self._buffers.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def load(self, file_name):
+        """Return the buffer for a file, reading it from disk on a miss."""
+        buffer = self.get(file_name)
+        if buffer is None:
+            with open(file_name, "rb") as f:
+                buffer = ctypes.create_string_buffer(f.read())
+            self.put(file_name, buffer)
+        return buffer
+
 
 # this is easy so violence begets violence or something
 class SoundCacher:
-    def __init__(self):
-        self.cache = {}
-        self.refs = []  # so sound objects don't get eaten by the gc
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.cache = SoundBufferCache(max_bytes)
+        # stream -> buffer it reads from, so neither gets eaten by the gc while
+        # playing (an evicted buffer must outlive the streams still using it)
+        self.refs = {}
+        self._refs_lock = threading.Lock()
+        self._tracked_since_reap = 0
+
+    def load(self, file_name):
+        """Return the cached buffer for a sound file, reading it on a miss."""
+        return self.cache.load(file_name)
+
+    def open_stream(self, file_name):
+        """Create a stopped in-memory stream for a file and keep it alive."""
+        buffer = self.load(file_name)
+        sound = stream.FileStream(mem=True, file=buffer, length=len(buffer))
+        self.track(sound, buffer)
+        return sound
+
+    def track(self, sound, buffer):
+        """Hold a stream and its buffer until the stream finishes playing.
+
+        Every ``REAP_INTERVAL`` streams, finished ones are swept first; the
+        new stream is added after the sweep since it may not be playing yet.
+        """
+        if self._tracked_since_reap >= REAP_INTERVAL:
+            self.reap()
+        with self._refs_lock:
+            self.refs[sound] = buffer
+            self._tracked_since_reap += 1
+
+    def reap(self):
+        """Release streams that have finished playing.
+
+        Returns:
+            Number of streams released.
+        """
+        with self._refs_lock:
+            self._tracked_since_reap = 0
+            finished = [sound for sound in self.refs if not _is_live(sound)]
+            for sound in finished:
+                del self.refs[sound]
+        return len(finished)
+
+    def prefetch(self, file_names):
+        """Read files into the cache on a background thread.
+
+        Returns:
+            The loader thread, or None if there was nothing to load.
+        """
+        if o is None:
+            return None
+        pending = [
+            name for name in dict.fromkeys(file_names) if name and name not in self.cache
+        ]
+        if not pending:
+            return None
+        thread = threading.Thread(target=self._prefetch, args=(pending,), daemon=True)
+        thread.start()
+        return thread
+
+    def _prefetch(self, file_names):
+        for file_name in file_names:
+            try:
+                self.cache.load(file_name)
+            except OSError as exc:
+                LOG.debug("Failed to prefetch %s: %s", file_name, exc)
 
     def play(self, file_name, pan=0.0, volume=1.0, pitch=1.0):
         if o is None:
             # Silent mode - no audio device available
             return None
 
-        if file_name not in self.cache:
-            with open(file_name, "rb") as f:
-                self.cache[file_name] = ctypes.create_string_buffer(f.read())
-        sound = stream.FileStream(
-            mem=True, file=self.cache[file_name], length=len(self.cache[file_name])
-        )
+        sound = self.open_stream(file_name)
         if pan:
             sound.pan = pan
         if volume != 1.0:
@@ -34,5 +151,13 @@ class SoundCacher:
         if pitch != 1.0:
             sound.set_frequency(int(sound.get_frequency() * pitch))
         sound.play()
-        self.refs.append(sound)
         return sound
+
+
+def _is_live(sound):
+    """Check whether a stream is still playing or paused mid-way."""
+    try:
+        return bool(sound.is_playing or sound.is_paused)
+    except Exception:
+        # A stream whose BASS handle is already gone is certainly done
+        return False
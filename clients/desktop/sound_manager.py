@@ -99,23 +99,15 @@ class AudioPlaylist:
             self.current_stream = self.sound_manager.current_music
         else:  # sound
             # For sounds, we need to create the stream but not play it yet
-            from sound_lib import stream
-
             track_path = os.path.join(self.sound_manager.sounds_folder, track)
+            self.current_stream = self.sound_manager.sound_cacher.open_stream(
+                track_path
+            )
 
-            # Load from cache or create cache entry
-            if track not in self.sound_manager.sound_cacher.cache:
-                with open(track_path, "rb") as f:
-                    import ctypes
-
-                    self.sound_manager.sound_cacher.cache[track] = (
-                        ctypes.create_string_buffer(f.read())
-                    )
-
-            # Create stream without playing
-            cache_buffer = self.sound_manager.sound_cacher.cache[track]
-            self.current_stream = stream.FileStream(
-                mem=True, file=cache_buffer, length=len(cache_buffer)
+        # Warm the cache with the track that plays after this one
+        if len(self.tracks) > 1:
+            self.sound_manager.prefetch(
+                [self.tracks[(self.track_index + 1) % len(self.tracks)]]
             )
 
         # Register BASS callback BEFORE playing (critical for very short sounds)
@@ -143,7 +135,6 @@ class AudioPlaylist:
         # Now play the stream (callback is already registered)
         if self.current_stream and self.audio_type == "sound":
             self.current_stream.play()
-            self.sound_manager.sound_cacher.refs.append(self.current_stream)
 
         # Advance to next track index
         self.track_index += 1
@@ -182,21 +173,12 @@ class AudioPlaylist:
             track_path = os.path.join(self.sound_manager.sounds_folder, track)
 
             # Load the file to get its duration
-            import ctypes
             from sound_lib import stream as sound_stream
 
-            # Check cache first
-            if track_path not in self.sound_manager.sound_cacher.cache:
-                with open(track_path, "rb") as f:
-                    self.sound_manager.sound_cacher.cache[track_path] = (
-                        ctypes.create_string_buffer(f.read())
-                    )
-
             # Create temporary stream to get duration
+            cache_buffer = self.sound_manager.sound_cacher.load(track_path)
             temp_stream = sound_stream.FileStream(
-                mem=True,
-                file=self.sound_manager.sound_cacher.cache[track_path],
-                length=len(self.sound_manager.sound_cacher.cache[track_path]),
+                mem=True, file=cache_buffer, length=len(cache_buffer)
             )
 
             # Get length in seconds
@@ -371,6 +353,20 @@ class SoundManager:
         except Exception:
             return None
 
+    def prefetch(self, sound_names):
+        """
+        Load sounds into the cache in the background ahead of playing them.
+
+        Args:
+            sound_names: Names of sound files (assumed to be in sounds/ folder);
+                empty names are ignored
+        """
+        paths = [os.path.join(self.sounds_folder, name) for name in sound_names if name]
+        try:
+            self.sound_cacher.prefetch(paths)
+        except RuntimeError as exc:
+            LOG.debug("Failed to start sound prefetch: %s", exc)
+
     def music(self, music_name: str, looping: bool = True, fade_out_old: bool = True):
         """
         Play background music with looping.
@@ -534,6 +530,9 @@ class SoundManager:
         # Stop any existing ambience (forcibly, without outro)
         self.stop_ambience(force=True)
 
+        # Read the loop and outro while the intro plays
+        self.prefetch([loop_name, outro_name])
+
         # Start ambience playback in background thread
         def play_ambience_sequence():
             try:
@@ -568,26 +567,10 @@ class SoundManager:
 
                 # Play loop continuously
                 # We need to create the stream, set looping, then play
-                import ctypes
-                from sound_lib import stream as sound_stream
-
-                # Load loop sound
-                if loop_path not in self.sound_cacher.cache:
-                    with open(loop_path, "rb") as f:
-                        self.sound_cacher.cache[loop_path] = (
-                            ctypes.create_string_buffer(f.read())
-                        )
-
-                # Create stream and set looping before playing
-                self.ambience_loop = sound_stream.FileStream(
-                    mem=True,
-                    file=self.sound_cacher.cache[loop_path],
-                    length=len(self.sound_cacher.cache[loop_path]),
-                )
+                self.ambience_loop = self.sound_cacher.open_stream(loop_path)
                 self.ambience_loop.volume = self.ambience_volume
                 self.ambience_loop.looping = True
                 self.ambience_loop.play()
-                self.sound_cacher.refs.append(self.ambience_loop)
 
                 if self.ambience_loop:
                     # Wait until stop is requested
@@ -717,6 +700,10 @@ class SoundManager:
         playlist.playlist_id = playlist_id
         self.playlists[playlist_id] = playlist
 
+        # A playlist started later should not wait on disk for its first track
+        if not auto_start:
+            self.prefetch(playlist.tracks[:1])
+
     def remove_playlist(self, playlist_id):
         """
         Remove and stop a playlist.
@@ -67,10 +67,75 @@ def test_clear_buffer_and_all_buffers():
     buffers.create_buffer("activity")
     buffers.add_item("activity", "first")
     buffers.clear_buffer("activity")
-    assert buffers.buffers["activity"] == []
+    assert list(buffers.buffers["activity"]) == []
     assert buffers.buffer_positions["activity"] == 0
 
     buffers.add_item("activity", "second")
     buffers.add_item("activity", "third")
     buffers.clear_all_buffers()
     assert all(not buf for buf in buffers.buffers.values())
+
+
+def test_buffers_drop_oldest_items_past_their_cap():
+    buffers = BufferSystem(max_items=3)
+    buffers.create_buffer("all")
+    buffers.create_buffer("chats", max_items=5)
+    for i in range(6):
+        buffers.add_item("chats", f"msg-{i}")
+
+    assert [item["text"] for item in buffers.buffers["all"]] == ["msg-3", "msg-4", "msg-5"]
+    assert [item["text"] for item in buffers.buffers["chats"]][0] == "msg-1"
+    # "all" shares the item objects rather than copying them
+    assert buffers.buffers["all"][-1] is buffers.buffers["chats"][-1]
+
+
+def test_search_matches_whole_words_newest_first():
+    buffers = BufferSystem()
+    buffers.create_buffer("all")
+    buffers.create_buffer("chats")
+    buffers.create_buffer("activity")
+    buffers.add_item("chats", "Alice says hello")
+    buffers.add_item("activity", "Alice joined the table")
+    buffers.add_item("chats", "Bob says hello")
+
+    assert [item["text"] for item in buffers.search("alice")] == [
+        "Alice joined the table",
+        "Alice says hello",
+    ]
+    assert [item["text"] for item in buffers.search("says HELLO", "chats")] == [
+        "Bob says hello",
+        "Alice says hello",
+    ]
+    assert buffers.search("ali") == []
+    assert buffers.search("hello", "activity") == []
+
+
+def test_search_forgets_items_dropped_from_every_buffer():
+    buffers = BufferSystem(max_items=2)
+    buffers.create_buffer("all")
+    buffers.create_buffer("chats", max_items=3)
+    for word in ("apple", "banana", "cherry"):
+        buffers.add_item("chats", word)
+
+    # "apple" left "all" but is still in "chats"
+    assert buffers.search("apple", "all") == []
+    assert [item["text"] for item in buffers.search("apple")] == ["apple"]
+
+    buffers.add_item("chats", "date")
+    assert buffers.search("apple") == []
+    assert "apple" not in buffers._index
+
+
+def test_find_in_buffer_steps_to_older_matches_and_wraps():
+    buffers = BufferSystem()
+    buffers.create_buffer("all")
+    for text in ("roll 3", "pass", "roll 5", "pass"):
+        buffers.add_item("all", text)
+
+    assert buffers.find_in_buffer("roll") is True
+    assert buffers.get_current_item()["text"] == "roll 5"
+    assert buffers.find_in_buffer("roll") is True
+    assert buffers.get_current_item()["text"] == "roll 3"
+    assert buffers.find_in_buffer("roll") is True
+    assert buffers.get_current_item()["text"] == "roll 5"
+    assert buffers.find_in_buffer("bank") is False
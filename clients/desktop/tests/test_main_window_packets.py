@@ -82,7 +82,9 @@ def make_window():
         stop_ambience=lambda force=False: window.sound_events.append(f"stop_ambience:{force}"),
     )
     window.sound_events = []
-    window.network = types.SimpleNamespace(send_packet=lambda packet: window.sent_packets.append(packet))
+    window.network = types.SimpleNamespace(
+        send_packet=lambda packet: window.sent_packets.append(packet) or True
+    )
     window.sent_packets = []
     window.buffer_system = types.SimpleNamespace()
     window.current_mode = "list"
@@ -95,6 +97,7 @@ def make_window():
     window.set_grid_mode = main_mod.MainWindow.set_grid_mode.__get__(window)
     window.on_server_clear_ui = main_mod.MainWindow.on_server_clear_ui.__get__(window)
     window.on_server_menu = main_mod.MainWindow.on_server_menu.__get__(window)
+    window.on_server_menu_items = main_mod.MainWindow.on_server_menu_items.__get__(window)
     window.on_server_request_input = main_mod.MainWindow.on_server_request_input.__get__(window)
     window.on_server_clear_ui = main_mod.MainWindow.on_server_clear_ui.__get__(window)
     window.switch_to_edit_mode_calls = []
@@ -245,3 +248,37 @@ def test_on_server_status_records_last_message():
 
     assert window.last_server_status_packet == packet
     assert "Server maintenance in progress" in window.last_status_announcement
+
+
+def test_paged_menu_requests_and_appends_further_items():
+    window = make_window()
+    window.on_server_menu(
+        {
+            "type": "menu",
+            "menu_id": "status_box",
+            "items": [{"text": f"Line {i}", "id": "status_line"} for i in range(1, 41)],
+            "total_items": 45,
+        }
+    )
+    assert window.sent_packets == []
+
+    window.menu_list.SetSelection(35)
+    window._request_more_menu_items()
+    window._request_more_menu_items()
+    assert window.sent_packets == [
+        {"type": "request_menu_items", "menu_id": "status_box", "offset": 40}
+    ]
+
+    window.on_server_menu_items(
+        {
+            "type": "menu_items",
+            "menu_id": "status_box",
+            "offset": 40,
+            "items": [{"text": f"Line {i}", "id": "status_line"} for i in range(41, 46)],
+            "total_items": 45,
+        }
+    )
+    assert window.menu_list.GetCount() == 45
+    assert window.menu_list.GetString(44) == "Line 45"
+    assert len(window.current_menu_item_ids) == 45
+    assert len(window.sent_packets) == 1
@@ -65,6 +65,7 @@ PACKET_TO_HANDLER = {
     "remove_playlist": "on_server_remove_playlist",
     "get_playlist_duration": "on_server_get_playlist_duration",
     "menu": "on_server_menu",
+    "menu_items": "on_server_menu_items",
     "request_input": "on_server_request_input",
     "clear_ui": "on_server_clear_ui",
     "game_list": "on_server_game_list",
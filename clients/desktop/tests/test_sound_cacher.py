@@ -3,7 +3,7 @@ import types
 import pytest
 
 import sound_cacher
-from sound_cacher import SoundCacher
+from sound_cacher import SoundBufferCache, SoundCacher
 
 
 class DummyStream:
@@ -15,6 +15,12 @@ class DummyStream:
         self.mem = mem
         self.length = length
 
+        self.is_paused = False
+
+    @property
+    def is_playing(self):
+        return self.played
+
     def play(self):
         self.played = True
 
@@ -44,11 +50,59 @@ def test_sound_cacher_returns_stream(monkeypatch, tmp_path):
     assert pytest.approx(stream.volume) == 0.6
     assert pytest.approx(stream.get_frequency()) == int(44100 * 1.2)
     # Second call should reuse cached bytes
-    cache.play(str(audio_file))
+    again = cache.play(str(audio_file))
     assert str(audio_file) in cache.cache
+    assert again.mem is stream.mem
+    assert stream in cache.refs
 
 
 def test_sound_cacher_returns_none_when_no_output(monkeypatch, tmp_path):
     monkeypatch.setattr(sound_cacher, "o", None)
     cache = SoundCacher()
     assert cache.play(str(tmp_path / "missing.ogg")) is None
+
+
+def test_buffer_cache_evicts_least_recently_used_past_byte_budget(tmp_path):
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.ogg"
+        path.write_bytes(b"x" * 40)
+        paths.append(str(path))
+    cache = SoundBufferCache(max_bytes=100)
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])  # a is now the most recently used
+    cache.load(paths[2])
+
+    assert paths[0] in cache and paths[2] in cache
+    assert paths[1] not in cache
+    assert cache.total_bytes == 2 * 41  # create_string_buffer adds a NUL byte
+
+
+def test_reap_releases_finished_streams(monkeypatch, tmp_path):
+    monkeypatch.setattr(sound_cacher, "o", object())
+    monkeypatch.setattr(sound_cacher, "stream", types.SimpleNamespace(FileStream=DummyStream))
+    audio_file = tmp_path / "beep.ogg"
+    audio_file.write_bytes(b"wave-data")
+    cache = SoundCacher()
+
+    done = cache.play(str(audio_file))
+    playing = cache.play(str(audio_file))
+    done.played = False
+
+    assert cache.reap() == 1
+    assert list(cache.refs) == [playing]
+
+
+def test_prefetch_warms_cache_in_background(monkeypatch, tmp_path):
+    monkeypatch.setattr(sound_cacher, "o", object())
+    audio_file = tmp_path / "loop.ogg"
+    audio_file.write_bytes(b"loop")
+    cache = SoundCacher()
+
+    thread = cache.prefetch([str(audio_file), str(tmp_path / "missing.ogg")])
+    thread.join(timeout=5)
+
+    assert str(audio_file) in cache.cache
+    assert cache.prefetch([str(audio_file)]) is None
@@ -22,9 +22,13 @@ class DummySound:
 class FakeSoundCacher:
     def __init__(self):
         self.calls = []
-        self.refs = []
+        self.prefetched = []
+        self.refs = {}
         self.cache = {}
 
+    def prefetch(self, paths):
+        self.prefetched.extend(paths)
+
     def play(self, path, pan=0.0, volume=1.0, pitch=1.0):
         sound = DummySound()
         sound.pan = pan
@@ -122,6 +126,18 @@ def test_add_and_remove_playlist(monkeypatch, tmp_path):
     assert "bgm" not in manager.playlists
 
 
+def test_playlist_started_later_prefetches_first_track(monkeypatch, tmp_path):
+    class DummyPlaylist:
+        def __init__(self, tracks, *_args):
+            self.tracks = list(tracks)
+
+    monkeypatch.setattr(sm_mod, "AudioPlaylist", DummyPlaylist)
+    manager = make_manager(tmp_path)
+    manager.add_playlist("bgm", ["a.ogg", "b.ogg"], auto_start=False)
+
+    assert [p.rsplit("\\", 1)[-1].rsplit("/", 1)[-1] for p in manager.sound_cacher.prefetched] == ["a.ogg"]
+
+
 def test_play_returns_none_when_sound_cacher_fails(tmp_path):
     manager = make_manager(tmp_path)
 
@@ -21,6 +21,14 @@ from config_manager import set_item_in_dict
 
 LOG = logging.getLogger(__name__)
 
+# Request the next window of a paged menu when the selection is this close to
+# the last loaded item.
+MENU_PREFETCH_MARGIN = 10
+
+# Lines the history window may run past the "all" buffer cap before its oldest
+# lines are trimmed, so the trim happens in batches rather than per message.
+HISTORY_TRIM_SLACK = 200
+
 @dataclass(frozen=True)
 class UiPlatformConfig:
     window_size: tuple[int, int]
@@ -89,6 +97,8 @@ class MainWindow(wx.Frame):
         self.menu_list = None
         self.chat_input = None
         self.history_text = None
+        self._history_lines = 0  # Lines currently shown in history_text
+        self._history_search = ""  # Last query used to search the buffers
 
         # Initialize TTS speaker
         self.speaker = auto_output.Auto()
@@ -135,6 +145,8 @@ class MainWindow(wx.Frame):
         self.current_menu_id = None  # Track which menu is currently displayed
         self.current_menu_state = None  # Track previous menu state for comparison
         self.current_menu_item_ids = []  # Track item IDs for current menu (parallel to menu items)
+        self.current_menu_total = 0  # Full item count when the server pages a long menu
+        self.menu_items_requested = False  # A further window of the current menu is on its way
         self.current_edit_multiline = False  # Track if current editbox is multiline
         self.current_edit_read_only = False  # Track if current editbox is read-only
         self._pending_edit_clear = False  # Clear single-line value on first printable key
@@ -195,6 +207,8 @@ class MainWindow(wx.Frame):
         )
         # Bind to activation events to handle menu selections
         self.menu_list.Bind(wx.EVT_LISTBOX_DCLICK, self.on_menu_activate)
+        # Fetch further windows of paged menus as the selection nears the end
+        self.menu_list.Bind(wx.EVT_LISTBOX, self.on_menu_selection_change)
         # Bind focus events to enable/disable buffer navigation
         self.menu_list.Bind(wx.EVT_SET_FOCUS, self.on_menu_focus)
         self.menu_list.Bind(wx.EVT_KILL_FOCUS, self.on_menu_unfocus)
@@ -273,6 +287,7 @@ class MainWindow(wx.Frame):
         self.ID_OLDEST_MESSAGE = wx.NewIdRef()
         self.ID_NEWEST_MESSAGE = wx.NewIdRef()
         self.ID_TOGGLE_MUTE = wx.NewIdRef()
+        self.ID_SEARCH_HISTORY = wx.NewIdRef()
 
         # Common accelerators that work everywhere
         common_entries = [
@@ -304,6 +319,8 @@ class MainWindow(wx.Frame):
             wx.AcceleratorEntry(wx.ACCEL_SHIFT, ord("."), self.ID_NEWEST_MESSAGE),
             # Buffer mute: F4
             wx.AcceleratorEntry(wx.ACCEL_NORMAL, wx.WXK_F4, self.ID_TOGGLE_MUTE),
+            # Buffer search: Ctrl+F
+            wx.AcceleratorEntry(wx.ACCEL_CTRL, ord("F"), self.ID_SEARCH_HISTORY),
         ]
 
         # Create two accelerator tables
@@ -343,6 +360,7 @@ class MainWindow(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_oldest_message, id=self.ID_OLDEST_MESSAGE)
         self.Bind(wx.EVT_MENU, self.on_newest_message, id=self.ID_NEWEST_MESSAGE)
         self.Bind(wx.EVT_MENU, self.on_buffer_mute_toggle, id=self.ID_TOGGLE_MUTE)
+        self.Bind(wx.EVT_MENU, self.on_search_history, id=self.ID_SEARCH_HISTORY)
 
         # Bind key events for game keypresses
         self.Bind(wx.EVT_CHAR_HOOK, self.on_char_hook)
@@ -542,6 +560,25 @@ class MainWindow(wx.Frame):
         status = "muted" if is_muted else "unmuted"
         self.speaker.speak(f"Buffer {buffer_name} {status}.", interrupt=True)
 
+    def on_search_history(self, event):
+        """Handle Ctrl+F to jump to the next older message matching a query."""
+        dlg = wx.TextEntryDialog(
+            self, "Search this buffer for:", "Search history", self._history_search
+        )
+        try:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            query = dlg.GetValue().strip()
+        finally:
+            dlg.Destroy()
+        if not query:
+            return
+        self._history_search = query
+        if self.buffer_system.find_in_buffer(query):
+            self._announce_current_message()
+        else:
+            self.speaker.speak("No matches.", interrupt=True)
+
     def _announce_buffer_info(self):
         """Announce current buffer information (matches Legends format)."""
         name, count, position = self.buffer_system.get_buffer_info()
@@ -629,12 +666,15 @@ class MainWindow(wx.Frame):
                 if item_count > 0:
                     if self.sound_manager:
                         self.sound_manager.play_menuenter()
+                    # A paged menu's last item may not be loaded yet; the
+                    # server resolves the selection against the full list.
+                    selection = max(item_count, self.current_menu_total)
                     packet = {
                         "type": "menu",
                         "menu_id": self.current_menu_id,
-                        "selection": item_count,
+                        "selection": selection,
                     }
-                    last_index = item_count - 1
+                    last_index = selection - 1
                     if 0 <= last_index < len(self.current_menu_item_ids):
                         item_id = self.current_menu_item_ids[last_index]
                         if item_id is not None:
@@ -910,15 +950,22 @@ class MainWindow(wx.Frame):
         if not self.buffer_system.is_muted(
             self.buffer_system.get_current_buffer_name()
         ):
-            current = self.history_text.GetValue()
-            if current and not current.endswith("\n"):
-                text = "\n" + text
-
             # Save current insertion point to prevent auto-scrolling
             old_insertion_point = self.history_text.GetInsertionPoint()
 
-            # Append text to history widget
+            # Append text to history widget (every entry ends with a newline)
             self.history_text.AppendText(text + "\n")
+            self._history_lines += text.count("\n") + 1
+
+            # Keep the widget no longer than the buffer history it mirrors
+            limit = self.buffer_system.max_items
+            if self._history_lines > limit + HISTORY_TRIM_SLACK:
+                excess = self._history_lines - limit
+                cut = self.history_text.XYToPosition(0, excess)
+                if cut > 0:
+                    self.history_text.Remove(0, cut)
+                    old_insertion_point = max(0, old_insertion_point - cut)
+                self._history_lines = limit
 
             # Restore insertion point (prevents auto-scroll to end)
             self.history_text.SetInsertionPoint(old_insertion_point)
@@ -1466,6 +1513,7 @@ class MainWindow(wx.Frame):
 
             # Clear history and show window
             self.history_text.Clear()
+            self._history_lines = 0
             self.Show()
 
             # Connect with new credentials
@@ -2027,8 +2075,12 @@ class MainWindow(wx.Frame):
         menu_id = menu_data["menu_id"]
         position = menu_data["position"]
 
+        self.current_menu_total = menu_data["total_items"] or len(items)
+        self.menu_items_requested = False
+
         if self._menu_state_is_unchanged(menu_data):
             self._apply_menu_position(items, position)
+            self._request_more_menu_items()
             return
 
         self._apply_menu_settings(menu_data)
@@ -2045,6 +2097,47 @@ class MainWindow(wx.Frame):
             self._rebuild_menu(items, position)
 
         self._update_menu_sounds(item_sounds)
+        self._request_more_menu_items()
+
+    def on_server_menu_items(self, packet):
+        """Append the next window of a paged menu."""
+        offset = packet.get("offset", 0)
+        if packet.get("menu_id") != self.current_menu_id:
+            return
+        self.menu_items_requested = False
+        if offset != self.menu_list.GetCount():
+            return
+
+        self.current_menu_total = packet.get("total_items", 0)
+        for item in packet.get("items", []):
+            if isinstance(item, dict):
+                text, item_id, sound = item.get("text", ""), item.get("id"), item.get("sound")
+            else:
+                text, item_id, sound = str(item), None, None
+            index = self.menu_list.GetCount()
+            self.menu_list.Append(text)
+            self.menu_list.SetClientData(index, {"sound": sound} if sound else None)
+            self.current_menu_item_ids.append(item_id)
+            if isinstance(self.current_menu_state, dict):
+                self.current_menu_state["items"].append(text)
+                self.current_menu_state["item_sounds"].append(sound)
+        self._request_more_menu_items()
+
+    def on_menu_selection_change(self, event):
+        """Handle menu selection changes."""
+        self._request_more_menu_items()
+        event.Skip()
+
+    def _request_more_menu_items(self) -> None:
+        """Ask for the next window of a paged menu once the selection nears its end."""
+        count = self.menu_list.GetCount()
+        if self.menu_items_requested or count >= self.current_menu_total:
+            return
+        if self.menu_list.GetSelection() < count - MENU_PREFETCH_MARGIN:
+            return
+        self.menu_items_requested = self.network.send_packet(
+            {"type": "request_menu_items", "menu_id": self.current_menu_id, "offset": count}
+        )
 
     def _parse_menu_packet(self, packet: dict) -> dict:
         """Parse menu packet into structured data."""
@@ -2100,6 +2193,7 @@ class MainWindow(wx.Frame):
             "grid_enabled": grid_enabled,
             "grid_width": grid_width,
             "position": position,
+            "total_items": packet.get("total_items"),
         }
 
     def _menu_state_is_unchanged(self, menu_data: dict) -> bool:
@@ -2204,6 +2298,7 @@ class MainWindow(wx.Frame):
         self.menu_list.Clear()
         self.current_menu_id = None
         self.current_menu_state = None
+        self.current_menu_total = 0
         # Switch to list mode if in edit mode
         if self.current_mode == "edit":
             self.switch_to_list_mode()
@@ -1,7 +1,8 @@
 export function createA11y({ politeEl, assertiveEl }) {
   let announcementNonce = 0;
-  let latestPoliteId = 0;
   let latestAssertiveId = 0;
+  // Polite announcements made within one frame are spoken together, in order.
+  let pendingPolite = [];
   let lastAnnouncementText = "";
   let lastAnnouncementAt = 0;
 
@@ -23,26 +24,34 @@ export function createA11y({ politeEl, assertiveEl }) {
     }
     lastAnnouncementText = normalized;
     lastAnnouncementAt = now;
-    const id = announcementNonce;
-    if (assertive) {
-      latestAssertiveId = id;
-    } else {
-      latestPoliteId = id;
+    if (!assertive) {
+      pendingPolite.push(normalized);
+      if (pendingPolite.length === 1) {
+        requestAnimationFrame(() => {
+          const queued = pendingPolite.filter(Boolean).join(" ");
+          pendingPolite = [];
+          writeLiveRegion(target, queued);
+        });
+      }
+      return;
     }
+    const id = announcementNonce;
+    latestAssertiveId = id;
     requestAnimationFrame(() => {
-      if (assertive && id !== latestAssertiveId) {
+      if (id !== latestAssertiveId) {
         return;
       }
-      if (!assertive && id !== latestPoliteId) {
-        return;
-      }
-      // Reinsert as a fresh node so identical repeated text can still be announced.
-      const span = document.createElement("span");
-      span.setAttribute("data-announce-id", String(announcementNonce));
-      span.textContent = normalized;
-      target.replaceChildren(span);
+      writeLiveRegion(target, normalized);
     });
   }
 
+  function writeLiveRegion(target, text) {
+    // Reinsert as a fresh node so identical repeated text can still be announced.
+    const span = document.createElement("span");
+    span.setAttribute("data-announce-id", String(announcementNonce));
+    span.textContent = text;
+    target.replaceChildren(span);
+  }
+
   return { announce };
 }
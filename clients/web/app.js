@@ -21,6 +21,10 @@ const DEFAULT_AMBIENCE_VOLUME = 100;
 const SESSION_REFRESH_LEEWAY_SECONDS = 60;
 const RECONNECT_WINDOW_MS = 60_000;
 const RECONNECT_RETRY_DELAY_MS = 3_000;
+// Optional protocol features this client understands, sent when logging in.
+const CLIENT_FEATURES = ["menu_paging", "packet_batches"];
+// Request the next window of a paged menu this close to the last loaded item.
+const MENU_PREFETCH_MARGIN = 10;
 const DEFAULT_APP_VERSION = "2026.02.17.1";
 const DEFAULT_WEB_CLIENT_CONFIG = {
   serverUrl: "",
@@ -276,6 +280,7 @@ const menuView = createMenuView({
     sendMenuSelection(selectionIndex);
   },
 });
+store.subscribe(requestMoreMenuItems);
 let pendingInlineInput = null;
 let focusMenuOnNextMenuPacket = false;
 let pendingActionsMenuRequest = false;
@@ -477,6 +482,7 @@ function buildAuthorizePacketFromSession(username, sessionToken) {
     patch: 0,
     client_type: "Web",
     platform: getPlatformString(),
+    features: CLIENT_FEATURES,
   };
 }
 
@@ -486,6 +492,7 @@ function buildRefreshPacket(refreshToken, username = "") {
     refresh_token: refreshToken,
     client_type: "Web",
     platform: getPlatformString(),
+    features: CLIENT_FEATURES,
   };
   if (username) {
     packet.username = normalizeUsername(username);
@@ -821,6 +828,22 @@ function sendMenuSelection(selectionIndex) {
   network.send(packet);
 }
 
+function requestMoreMenuItems() {
+  const menu = store.state.currentMenu;
+  const loaded = menu.items.length;
+  if (!network || menu.itemsRequested || !menu.menuId || loaded >= (menu.totalItems ?? loaded)) {
+    return;
+  }
+  if (menu.selection < loaded - MENU_PREFETCH_MARGIN) {
+    return;
+  }
+  menu.itemsRequested = network.send({
+    type: "request_menu_items",
+    menu_id: menu.menuId,
+    offset: loaded,
+  });
+}
+
 function sendEscape() {
   network.send({
     type: "escape",
@@ -843,7 +866,10 @@ function runEscapeAction() {
   }
   if (menu.escapeBehavior === "select_last_option") {
     const lastIndex = menu.items.length - 1;
-    if (lastIndex >= 0) {
+    if (lastIndex >= 0 && (menu.totalItems ?? 0) > menu.items.length) {
+      // The last item isn't loaded yet; the server resolves it from the full list.
+      network.send({ type: "menu", menu_id: menu.menuId, selection: menu.totalItems });
+    } else if (lastIndex >= 0) {
       menuView.setSelection(lastIndex);
       sendMenuSelection(lastIndex);
     }
@@ -1262,6 +1288,8 @@ function handlePacket(packet) {
         escapeBehavior: packet.escape_behavior ?? "keybind",
         gridEnabled: packet.grid_enabled ?? false,
         gridWidth: packet.grid_width ?? 1,
+        totalItems: packet.total_items ?? items.length,
+        itemsRequested: false,
       });
       updateActionsButtonVisibility();
       if (focusMenuOnNextMenuPacket) {
@@ -1272,6 +1300,22 @@ function handlePacket(packet) {
       }
       break;
     }
+    case "menu_items": {
+      const menu = store.state.currentMenu;
+      if (packet.menu_id !== menu.menuId) {
+        break;
+      }
+      if (packet.offset !== menu.items.length) {
+        menu.itemsRequested = false;
+        break;
+      }
+      store.setMenu({
+        items: menu.items.concat(parseMenuItems(packet.items)),
+        totalItems: packet.total_items,
+        itemsRequested: false,
+      });
+      break;
+    }
     case "speak": {
       const text = packet.text || "";
       if (!text) {
@@ -1450,6 +1494,7 @@ async function bootstrap() {
       }
     },
     onPacket: handlePacket,
+    onBatch: (apply) => store.batch(apply),
     onError: (message) => {
       historyView.addEntry(message, { buffer: "activity", announce: true, assertive: true });
       if (!reconnectState.active) {
@@ -1528,6 +1573,7 @@ async function bootstrap() {
         patch: 0,
         client_type: "Web",
         platform: getPlatformString(),
+        features: CLIENT_FEATURES,
       },
     });
   });
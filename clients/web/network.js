@@ -140,7 +140,18 @@ export async function loadPacketValidator() {
   }
 }
 
-export function createNetworkClient({ validator, onStatus, onPacket, onError }) {
+// Runs a frame's packet handlers; callers can wrap it to defer rendering.
+function applyImmediately(apply) {
+  apply();
+}
+
+export function createNetworkClient({
+  validator,
+  onStatus,
+  onPacket,
+  onBatch = applyImmediately,
+  onError,
+}) {
   let ws = null;
 
   function isConnected() {
@@ -192,17 +203,29 @@ export function createNetworkClient({ validator, onStatus, onPacket, onError })
       if (socket !== ws) {
         return;
       }
+      let packets;
       try {
-        const packet = JSON.parse(event.data);
-        const check = validator.validateIncoming(packet);
-        if (!check.ok) {
-          onError(`Ignored incoming packet: ${check.error}`);
-          return;
-        }
-        onPacket(packet);
+        const parsed = JSON.parse(event.data);
+        // A batched frame is a JSON array of packets, applied together.
+        packets = Array.isArray(parsed) ? parsed : [parsed];
       } catch (error) {
         onError(`Invalid server message: ${String(error)}`);
+        return;
       }
+      onBatch(() => {
+        for (const packet of packets) {
+          const check = validator.validateIncoming(packet);
+          if (!check.ok) {
+            onError(`Ignored incoming packet: ${check.error}`);
+            continue;
+          }
+          try {
+            onPacket(packet);
+          } catch (error) {
+            onError(`Invalid server message: ${String(error)}`);
+          }
+        }
+      });
     });
 
     socket.addEventListener("close", () => {
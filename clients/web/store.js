@@ -15,6 +15,8 @@ export function createStore() {
       escapeBehavior: "keybind",
       gridEnabled: false,
       gridWidth: 1,
+      totalItems: 0,
+      itemsRequested: false,
     },
     historyBuffers: {
       all: [],
@@ -33,8 +35,14 @@ export function createStore() {
   };
 
   const listeners = new Set();
+  let batchDepth = 0;
+  let notifyPending = false;
 
   function notify() {
+    if (batchDepth > 0) {
+      notifyPending = true;
+      return;
+    }
     for (const listener of listeners) {
       listener(state);
     }
@@ -46,6 +54,19 @@ export function createStore() {
       listeners.add(listener);
       return () => listeners.delete(listener);
     },
+    // Apply several changes, notifying listeners once at the end.
+    batch(apply) {
+      batchDepth += 1;
+      try {
+        apply();
+      } finally {
+        batchDepth -= 1;
+        if (batchDepth === 0 && notifyPending) {
+          notifyPending = false;
+          notify();
+        }
+      }
+    },
     setConnection(patch) {
       Object.assign(state.connection, patch);
       notify();
@@ -13,6 +13,9 @@ export function createHistoryView({
   let mobileCollapsed = isMobileLike;
   let renderedLogBuffer = "";
   let renderedLogCount = 0;
+  let renderedValueBuffer = null;
+  let renderedValueCount = -1;
+  let renderFrame = 0;
 
   function ensureBufferPosition(bufferName) {
     if (!Object.hasOwn(bufferPositions, bufferName)) {
@@ -78,6 +81,11 @@ export function createHistoryView({
     }
     const bufferName = store.state.historyBuffer;
     const lines = store.state.historyBuffers[bufferName] || [];
+    if (renderedValueBuffer === bufferName && renderedValueCount === lines.length) {
+      return;
+    }
+    renderedValueBuffer = bufferName;
+    renderedValueCount = lines.length;
     historyEl.value = lines.join("\n");
     historyEl.scrollTop = historyEl.scrollHeight;
 
@@ -204,7 +212,18 @@ export function createHistoryView({
     });
   }
 
-  store.subscribe(render);
+  // History only changes what is on screen, so redraw at most once per frame.
+  function scheduleRender() {
+    if (renderFrame) {
+      return;
+    }
+    renderFrame = requestAnimationFrame(() => {
+      renderFrame = 0;
+      render();
+    });
+  }
+
+  store.subscribe(scheduleRender);
   renderMobileVisibility();
   render();
 
@@ -9,6 +9,8 @@ export function createMenuView({
   let renderVersion = 0;
   let lastStructureSnapshot = "";
   let lastSelection = -1;
+  let lastShape = null;
+  let renderFrame = 0;
   const isCoarsePointer = window.matchMedia("(pointer: coarse)").matches;
   const useActiveDescendant = !isCoarsePointer;
   let searchBuffer = "";
@@ -29,6 +31,34 @@ export function createMenuView({
     ].join("::");
   }
 
+  // Cheap identity check run on every store change; the full snapshot
+  // comparison waits for the next animation frame.
+  function menuShapeChanged(menu) {
+    const shape = lastShape;
+    if (
+      shape &&
+      shape.menu === menu &&
+      shape.items === menu.items &&
+      shape.menuId === menu.menuId &&
+      shape.multiletterEnabled === menu.multiletterEnabled &&
+      shape.escapeBehavior === menu.escapeBehavior &&
+      shape.gridEnabled === menu.gridEnabled &&
+      shape.gridWidth === menu.gridWidth
+    ) {
+      return false;
+    }
+    lastShape = {
+      menu,
+      items: menu.items,
+      menuId: menu.menuId,
+      multiletterEnabled: menu.multiletterEnabled,
+      escapeBehavior: menu.escapeBehavior,
+      gridEnabled: menu.gridEnabled,
+      gridWidth: menu.gridWidth,
+    };
+    return true;
+  }
+
   function currentOptionId(index) {
     return `menu-option-${renderVersion}-${index}`;
   }
@@ -194,7 +224,8 @@ export function createMenuView({
     applySelection(store.state.currentMenu.selection);
   });
 
-  store.subscribe(() => {
+  function renderIfChanged() {
+    renderFrame = 0;
     const menu = store.state.currentMenu;
     const nextStructureSnapshot = menuStructureSnapshot(menu);
     if (nextStructureSnapshot !== lastStructureSnapshot) {
@@ -205,7 +236,20 @@ export function createMenuView({
     if (menu.selection !== lastSelection) {
       applySelection(menu.selection);
     }
+  }
+
+  store.subscribe(() => {
+    const menu = store.state.currentMenu;
+    // Menu replacements collapse into one DOM update per animation frame.
+    if (menuShapeChanged(menu) && !renderFrame) {
+      renderFrame = requestAnimationFrame(renderIfChanged);
+      return;
+    }
+    if (!renderFrame && menu.selection !== lastSelection) {
+      applySelection(menu.selection);
+    }
   });
+  menuShapeChanged(store.state.currentMenu);
   lastStructureSnapshot = menuStructureSnapshot(store.state.currentMenu);
   renderFull();
 
@@ -22,6 +22,9 @@ Usage examples:
     # List available games
     python -m server.cli list-games
 
+    # Recompute Pig ratings from stored game history (all games if omitted)
+    python -m server.cli rebuild-ratings pig --db-path var/server/playpalace.db
+
     # Show game options
     python -m server.cli show-options lightturret
 """
@@ -51,6 +54,7 @@ from server.games.base import Game, BOT_NAMES  # noqa: E402
 from server.core.users.base import User, TrustLevel, generate_uuid  # noqa: E402
 from server.core.users.bot import Bot  # noqa: E402
 from server.persistence.database import Database  # noqa: E402
+from server.game_utils.stats_helpers import RatingHelper, RatingRebuild  # noqa: E402
 from server.auth.auth import AuthManager  # noqa: E402
 
 
@@ -350,30 +354,28 @@ class GameSimulator:
 
 def cmd_list_games(args):
     """List all available games."""
-    games = GameRegistry.get_all()
+    games = GameRegistry.get_entries()
 
     if args.json:
         output = []
-        for game_class in games:
+        for entry in games:
             output.append(
                 {
-                    "type": game_class.get_type(),
-                    "name": game_class.get_name(),
-                    "category": game_class.get_category(),
-                    "min_players": game_class.get_min_players(),
-                    "max_players": game_class.get_max_players(),
+                    "type": entry.game_type,
+                    "name": entry.name,
+                    "category": entry.category,
+                    "min_players": entry.min_players,
+                    "max_players": entry.max_players,
                 }
             )
         print(json.dumps(output, indent=2))
     else:
         print("Available games:\n")
-        for game_class in games:
-            print(f"  {game_class.get_type()}")
-            print(f"    Name: {game_class.get_name()}")
-            print(f"    Category: {game_class.get_category()}")
-            print(
-                f"    Players: {game_class.get_min_players()}-{game_class.get_max_players()}"
-            )
+        for entry in games:
+            print(f"  {entry.game_type}")
+            print(f"    Name: {entry.name}")
+            print(f"    Category: {entry.category}")
+            print(f"    Players: {entry.min_players}-{entry.max_players}")
             print()
 
 
@@ -587,6 +589,67 @@ def cmd_bootstrap_owner(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def rebuild_ratings(
+    *,
+    db_path: str,
+    game_types: list[str] | None = None,
+    page_size: int = 500,
+) -> list[RatingRebuild]:
+    """
+    Recompute stored ratings by replaying game history.
+
+    Each game type is replayed with its game class's ranking rules when the
+    game is still registered. With no game types, every game type that has
+    stored results is rebuilt.
+    """
+    database = Database(db_path)
+    database.connect()
+
+    try:
+        rebuilds = []
+        for game_type in game_types or database.get_result_game_types():
+            game_class = get_game_class(game_type)
+            extractor = game_class().get_rankings_for_rating if game_class else None
+            helper = RatingHelper(database, game_type)
+            rebuilds.append(helper.rebuild(extractor, page_size=page_size))
+        return rebuilds
+    finally:
+        database.close()
+
+
+def cmd_rebuild_ratings(args: argparse.Namespace) -> None:
+    """Handle the rebuild-ratings CLI command."""
+    rebuilds = rebuild_ratings(
+        db_path=args.db_path,
+        game_types=args.game_types,
+        page_size=max(1, args.page_size),
+    )
+
+    if args.json:
+        output = [
+            {
+                "game_type": r.game_type,
+                "games": r.games,
+                "skipped": r.skipped,
+                "players": r.players,
+                "seconds": r.seconds,
+                "games_per_second": r.games_per_second,
+            }
+            for r in rebuilds
+        ]
+        print(json.dumps(output, indent=2))
+        return
+
+    if not rebuilds:
+        print("No game results found.")
+    for r in rebuilds:
+        print(
+            f"{r.game_type}: {r.games} games ({r.skipped} skipped), "
+            f"{r.players} players in {r.seconds:.2f}s "
+            f"({r.games_per_second:.0f} games/s)"
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PlayPalace CLI for AI agents",
@@ -683,6 +746,29 @@ def main():
         help="Suppress success output (useful for CI)",
     )
 
+    # rebuild-ratings command
+    rebuild_parser = subparsers.add_parser(
+        "rebuild-ratings",
+        help="Recompute player ratings from stored game results",
+    )
+    rebuild_parser.add_argument(
+        "game_types",
+        nargs="*",
+        help="Game types to rebuild (default: every game type with results)",
+    )
+    rebuild_parser.add_argument(
+        "--db-path",
+        default="playpalace.db",
+        help="Path to the server database",
+    )
+    rebuild_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=500,
+        help="Results read per database query (default: 500)",
+    )
+    rebuild_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
     args = parser.parse_args()
 
     if args.command == "list-games":
@@ -693,6 +779,8 @@ def main():
         cmd_simulate(args)
     elif args.command == "bootstrap-owner":
         cmd_bootstrap_owner(args)
+    elif args.command == "rebuild-ratings":
+        cmd_rebuild_ratings(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from ..persistence.database import Database
 
 
+# Packet types listed individually in the network traffic report
+NETWORK_STATS_ROWS = 10
+
+
 # Activity buffer helper for admin/system announcements
 def _speak_activity(user, message_id: str, **kwargs) -> None:
     """Speak a localized activity message to the admin/user."""
@@ -91,6 +95,10 @@ class AdministrationMixin:
                 text=Localization.get(user.locale, "unban-user"),
                 id="unban_user",
             ),
+            MenuItem(
+                text=Localization.get(user.locale, "network-stats"),
+                id="network_stats",
+            ),
         ]
         # Only server owners can promote/demote admins, manage virtual bots, and transfer ownership
         if user.trust_level.value >= TrustLevel.SERVER_OWNER.value:
@@ -470,6 +478,8 @@ class AdministrationMixin:
             self._show_unban_user_menu(user)
         elif selection_id == "virtual_bots":
             self._show_virtual_bots_menu(user)
+        elif selection_id == "network_stats":
+            await self._show_network_stats(user)
         elif selection_id == "back":
             self._show_main_menu(user)
 
@@ -809,9 +819,8 @@ class AdministrationMixin:
                 waiting_user.play_sound("accountdeny.ogg")
                 waiting_user.speak(full_message, buffer="activity")
                 # Flush queued messages before disconnect so client receives them
-                for msg in waiting_user.get_queued_messages():
-                    await waiting_user.connection.send(msg)
-                await waiting_user.connection.send({
+                waiting_user.connection.enqueue_many(waiting_user.get_queued_messages())
+                waiting_user.connection.enqueue({
                     "type": "disconnect",
                     "reconnect": False,
                     "show_message": True,
@@ -991,9 +1000,8 @@ class AdministrationMixin:
             target_user.play_sound("accountban.ogg")
             target_user.speak(full_message, buffer="activity")
             # Flush queued messages before disconnect so client receives them
-            for msg in target_user.get_queued_messages():
-                await target_user.connection.send(msg)
-            await target_user.connection.send({
+            target_user.connection.enqueue_many(target_user.get_queued_messages())
+            target_user.connection.enqueue({
                 "type": "disconnect",
                 "reconnect": False,
                 "show_message": True,
@@ -1031,6 +1039,49 @@ class AdministrationMixin:
 
     # ==================== Virtual Bot Actions ====================
 
+    @require_admin
+    async def _show_network_stats(self, admin: NetworkUser) -> None:
+        """Report bytes sent per packet type, before and after compression."""
+        ws_server = getattr(self, "_ws_server", None)
+        rows = ws_server.packet_stats.snapshot() if ws_server else []
+        if not rows:
+            admin.speak_l("network-stats-empty", buffer="misc")
+            self._show_admin_menu(admin)
+            return
+
+        locale = admin.locale
+
+        def _sizes(packets: int, raw_bytes: int, wire_bytes: int) -> dict:
+            return {
+                "packets": packets,
+                "raw": round(raw_bytes / 1024, 1),
+                "wire": round(wire_bytes / 1024, 1),
+                "ratio": round(raw_bytes / wire_bytes, 1) if wire_bytes else 1,
+            }
+
+        lines = [
+            Localization.get(
+                locale,
+                "network-stats-header",
+                **_sizes(
+                    sum(row["packets"] for row in rows),
+                    sum(row["raw_bytes"] for row in rows),
+                    sum(row["wire_bytes"] for row in rows),
+                ),
+            )
+        ]
+        for row in rows[:NETWORK_STATS_ROWS]:
+            lines.append(
+                Localization.get(
+                    locale,
+                    "network-stats-line",
+                    type=row["type"],
+                    **_sizes(row["packets"], row["raw_bytes"], row["wire_bytes"]),
+                )
+            )
+        admin.speak("\n".join(lines), buffer="misc")
+        self._show_admin_menu(admin)
+
     @require_server_owner
     async def _fill_virtual_bots(self, owner: NetworkUser) -> None:
         """Fill the server with virtual bots from config."""
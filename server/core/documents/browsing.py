@@ -40,6 +40,7 @@ class DocumentBrowsingMixin:
         handlers: dict[str, tuple] = {
             "documents_menu": (self._handle_documents_menu_selection, (user, selection_id, state)),
             "documents_list_menu": (self._handle_documents_list_selection, (user, selection_id, state)),
+            "document_search_menu": (self._handle_document_search_selection, (user, selection_id, state)),
             "document_actions_menu": (self._handle_document_actions_selection, (user, selection_id, state)),
             "document_settings_menu": (self._handle_document_settings_selection, (user, selection_id, state)),
             "document_title_lang_menu": (self._handle_document_title_lang_selection, (user, selection_id, state)),
@@ -64,11 +65,21 @@ class DocumentBrowsingMixin:
             folder_name = state.get("folder_name", "")
             if self._is_transcriber(user.username) or self._is_admin(user):
                 self._show_document_actions(user, folder_name, state)
+            elif state.get("search_query"):
+                self._show_document_search_results(user, state["search_query"])
             else:
                 category_slug = state.get("category_slug")
                 self._show_documents_list(user, category_slug)
             return True
 
+        if current_menu == "document_search_editbox":
+            query = packet.get("text", "").strip()
+            if query:
+                self._show_document_search_results(user, query)
+            else:
+                self._show_documents_menu(user)
+            return True
+
         if current_menu == "document_title_editbox":
             text = packet.get("text", "")
             await self._handle_document_title_editbox(user, text, state)
@@ -119,6 +130,12 @@ class DocumentBrowsingMixin:
                 id="uncategorized",
             )
         )
+        items.append(
+            MenuItem(
+                text=Localization.get(user.locale, "documents-search"),
+                id="search",
+            )
+        )
         items.append(
             MenuItem(
                 text=Localization.get(user.locale, "transcribers-by-language"),
@@ -152,6 +169,8 @@ class DocumentBrowsingMixin:
             self._show_documents_list(user, None)
         elif selection_id == "uncategorized":
             self._show_documents_list(user, "")
+        elif selection_id == "search":
+            self._show_document_search_prompt(user)
         elif selection_id == "transcribers_by_language":
             self._show_transcribers_by_language(user)
         elif selection_id == "transcribers_by_user":
@@ -199,6 +218,64 @@ class DocumentBrowsingMixin:
             else:
                 self._show_document_view(user, folder_name, state)
 
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _show_document_search_prompt(self, user: NetworkUser) -> None:
+        """Ask for words to search document contents for."""
+        user.show_editbox(
+            "document_search_editbox",
+            Localization.get(user.locale, "documents-search-prompt"),
+        )
+        self._user_states[user.username] = {"menu": "document_search_editbox"}
+
+    def _show_document_search_results(self, user: NetworkUser, query: str) -> None:
+        """Show ranked documents matching a search query."""
+        matches = self._documents.search_documents(query, user.locale)
+        if not matches:
+            user.speak_l("documents-search-no-results", query=query)
+            self._show_document_search_prompt(user)
+            return
+
+        items = [
+            MenuItem(
+                text=(
+                    f"{match['title']}: {match['snippet']}"
+                    if match["snippet"]
+                    else match["title"]
+                ),
+                id=f"doc_{match['folder_name']}",
+            )
+            for match in matches
+        ]
+        items.append(
+            MenuItem(text=Localization.get(user.locale, "back"), id="back")
+        )
+        user.show_menu(
+            "document_search_menu",
+            items,
+            multiletter=True,
+            escape_behavior=EscapeBehavior.SELECT_LAST,
+        )
+        self._user_states[user.username] = {
+            "menu": "document_search_menu",
+            "search_query": query,
+        }
+
+    async def _handle_document_search_selection(
+        self, user: NetworkUser, selection_id: str, state: dict
+    ) -> None:
+        """Handle search result menu selection."""
+        if selection_id == "back":
+            self._show_documents_menu(user)
+        elif selection_id.startswith("doc_"):
+            folder_name = selection_id[4:]
+            if self._is_transcriber(user.username) or self._is_admin(user):
+                self._show_document_actions(user, folder_name, state)
+            else:
+                self._show_document_view(user, folder_name, state)
+
     # ------------------------------------------------------------------
     # Document view
     # ------------------------------------------------------------------
@@ -227,6 +304,7 @@ class DocumentBrowsingMixin:
             "menu": "document_view",
             "folder_name": folder_name,
             "category_slug": state.get("category_slug"),
+            "search_query": state.get("search_query"),
         }
 
     # ------------------------------------------------------------------
@@ -264,6 +342,7 @@ class DocumentBrowsingMixin:
             "menu": "document_actions_menu",
             "folder_name": folder_name,
             "category_slug": state.get("category_slug"),
+            "search_query": state.get("search_query"),
         }
 
     async def _handle_document_actions_selection(
@@ -272,7 +351,10 @@ class DocumentBrowsingMixin:
         """Handle document action menu selection."""
         folder_name = state.get("folder_name", "")
         if selection_id == "back":
-            self._show_documents_list(user, state.get("category_slug"))
+            if state.get("search_query"):
+                self._show_document_search_results(user, state["search_query"])
+            else:
+                self._show_documents_list(user, state.get("category_slug"))
         elif selection_id == "view":
             self._show_document_view(user, folder_name, state)
         elif selection_id == "edit":
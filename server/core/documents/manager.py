@@ -1,15 +1,26 @@
 """Document manager for loading, editing, and versioning server documents."""
 
+import bisect
 import json
 import logging
+import re
 import shutil
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
 LOG = logging.getLogger("playpalace.documents")
 
 _MAX_HISTORY_PER_LOCALE = 5
+_SNIPPET_RADIUS = 60
+_TITLE_MATCH_BONUS = 10
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into case-folded search terms."""
+    return _WORD_RE.findall(text.casefold())
 
 
 class DocumentManager:
@@ -24,6 +35,10 @@ class DocumentManager:
         self._categories: dict = {}  # slug -> {sort, name: {locale: str}}
         self._documents: dict = {}  # folder_name -> document metadata dict
         self._edit_locks: dict = {}  # (folder_name, locale) -> {user, timestamp}
+        self._content: dict = {}  # (folder_name, locale) -> markdown text
+        self._term_counts: dict = {}  # (folder_name, locale) -> Counter of terms
+        self._index: dict = {}  # locale -> term -> {folder_name: count}
+        self._vocabulary: dict = {}  # locale -> sorted terms, rebuilt lazily
 
     # ------------------------------------------------------------------
     # Loading
@@ -63,6 +78,16 @@ class DocumentManager:
                 self._documents[entry.name] = self._generate_default_metadata(entry)
                 self._save_document_metadata(entry.name)
 
+        self._content.clear()
+        self._term_counts.clear()
+        self._index.clear()
+        self._vocabulary.clear()
+        for folder_name, meta in self._documents.items():
+            for locale in meta.get("locales", {}):
+                md_path = self._dir / folder_name / f"{locale}.md"
+                if md_path.exists():
+                    self._set_content(folder_name, locale, md_path.read_text(encoding="utf-8"))
+
         return len(self._documents)
 
     def _generate_default_metadata(self, folder: Path) -> dict:
@@ -160,13 +185,72 @@ class DocumentManager:
         return len(meta.get("locales", {}))
 
     def get_document_content(self, folder_name: str, locale: str) -> str | None:
-        """Read a document's ``.md`` file for the given locale."""
+        """Return a document's content for the given locale.
+
+        Content is cached after the first read; every write below keeps the
+        cache and the search index in step with the ``.md`` files.
+        """
         if folder_name not in self._documents:
             return None
+        content = self._content.get((folder_name, locale))
+        if content is not None:
+            return content
         md_path = self._dir / folder_name / f"{locale}.md"
         if not md_path.exists():
             return None
-        return md_path.read_text(encoding="utf-8")
+        content = md_path.read_text(encoding="utf-8")
+        self._set_content(folder_name, locale, content)
+        return content
+
+    def search_documents(self, query: str, locale: str, limit: int = 20) -> list[dict]:
+        """Search document contents in a locale.
+
+        Every query word must appear in a document's content or title, either
+        as a whole word or as the start of one. Documents without a
+        translation in *locale* are searched in English, matching how they
+        are displayed. Matches are ranked by how often the words appear, with
+        a bonus for title matches.
+
+        Returns a list of dicts with ``folder_name``, ``title`` and ``snippet``.
+        """
+        terms = _tokenize(query)
+        if not terms:
+            return []
+
+        matches = self._term_matches(terms, locale, None)
+        if locale != "en":
+            translated = {
+                folder for folder, content_locale in self._content if content_locale == locale
+            }
+            for term_matches, fallback in zip(matches, self._term_matches(terms, "en", translated)):
+                term_matches.update(fallback)
+
+        results = []
+        for folder_name, meta in self._documents.items():
+            titles = meta.get("titles", {})
+            title = titles.get(locale) or titles.get("en") or folder_name
+            title_words = _tokenize(title)
+            # Each term may be matched by the content or by the title
+            in_title = [any(word.startswith(term) for word in title_words) for term in terms]
+            counts = [term_matches.get(folder_name, 0) for term_matches in matches]
+            if not all(count or titled for count, titled in zip(counts, in_title)):
+                continue
+            score = sum(counts)
+            if all(in_title):
+                score += _TITLE_MATCH_BONUS
+            content_locale = locale if (folder_name, locale) in self._content else "en"
+            content = self._content.get((folder_name, content_locale), "")
+            results.append((
+                -score,
+                title.lower(),
+                {
+                    "folder_name": folder_name,
+                    "title": title,
+                    "snippet": self._snippet(content, terms),
+                },
+            ))
+        results.sort(key=lambda r: r[:2])
+        return [r[2] for r in results[:limit]]
 
     # ------------------------------------------------------------------
     # Writing
@@ -193,6 +277,7 @@ class DocumentManager:
             self._backup_version(folder_name, locale)
 
         md_path.write_text(content, encoding="utf-8")
+        self._set_content(folder_name, locale, content)
 
         # Update metadata timestamp
         meta = self._documents[folder_name]
@@ -248,6 +333,7 @@ class DocumentManager:
 
         md_path = doc_dir / f"{locale}.md"
         md_path.write_text(content, encoding="utf-8")
+        self._set_content(folder_name, locale, content)
         return True
 
     def set_document_title(
@@ -322,6 +408,7 @@ class DocumentManager:
         titles[locale] = title
         md_path = self._dir / folder_name / f"{locale}.md"
         md_path.write_text(content, encoding="utf-8")
+        self._set_content(folder_name, locale, content)
         self._save_document_metadata(folder_name)
         return True
 
@@ -343,6 +430,7 @@ class DocumentManager:
         md_path = self._dir / folder_name / f"{locale}.md"
         if md_path.exists():
             md_path.unlink()
+        self._drop_content(folder_name, locale)
         # Remove history backups for this locale
         history_dir = self._dir / folder_name / "_history"
         if history_dir.exists():
@@ -361,6 +449,8 @@ class DocumentManager:
         doc_dir = self._dir / folder_name
         if doc_dir.exists():
             shutil.rmtree(doc_dir)
+        for key in [key for key in self._content if key[0] == folder_name]:
+            self._drop_content(*key)
         del self._documents[folder_name]
         return True
 
@@ -417,6 +507,87 @@ class DocumentManager:
         for key in stale:
             del self._edit_locks[key]
 
+    # ------------------------------------------------------------------
+    # Content cache and search index
+    # ------------------------------------------------------------------
+
+    def _set_content(self, folder_name: str, locale: str, content: str) -> None:
+        """Cache content and replace its entries in the locale's index."""
+        self._drop_content(folder_name, locale)
+        counts = Counter(_tokenize(content))
+        self._content[(folder_name, locale)] = content
+        self._term_counts[(folder_name, locale)] = counts
+        index = self._index.setdefault(locale, {})
+        for term, count in counts.items():
+            index.setdefault(term, {})[folder_name] = count
+        self._vocabulary.pop(locale, None)
+
+    def _drop_content(self, folder_name: str, locale: str) -> None:
+        """Forget cached content and remove it from the locale's index."""
+        self._content.pop((folder_name, locale), None)
+        counts = self._term_counts.pop((folder_name, locale), None)
+        if not counts:
+            return
+        index = self._index.get(locale, {})
+        for term in counts:
+            postings = index.get(term)
+            if postings is None:
+                continue
+            postings.pop(folder_name, None)
+            if not postings:
+                del index[term]
+        self._vocabulary.pop(locale, None)
+
+    def _term_matches(
+        self, terms: list[str], locale: str, exclude: set[str] | None
+    ) -> list[dict[str, int]]:
+        """Count each term's occurrences (or prefix matches) per document in *locale*."""
+        index = self._index.get(locale)
+        if not index:
+            return [{} for _ in terms]
+        vocabulary = self._vocabulary.get(locale)
+        if vocabulary is None:
+            vocabulary = self._vocabulary[locale] = sorted(index)
+
+        matches = []
+        for term in terms:
+            counts: dict[str, int] = {}
+            start = bisect.bisect_left(vocabulary, term)
+            for word in vocabulary[start:]:
+                if not word.startswith(term):
+                    break
+                for folder_name, count in index[word].items():
+                    counts[folder_name] = counts.get(folder_name, 0) + count
+            if exclude:
+                for folder_name in exclude:
+                    counts.pop(folder_name, None)
+            matches.append(counts)
+        return matches
+
+    @staticmethod
+    def _snippet(content: str, terms: list[str]) -> str:
+        """Return a single-line excerpt around the first word matching the query.
+
+        Words are found with the same tokenization and prefix rule as the
+        search index, so "at" centres on "at" or "attack", not on "that".
+        """
+        pos = next(
+            (
+                match.start()
+                for match in _WORD_RE.finditer(content)
+                if any(match.group().casefold().startswith(term) for term in terms)
+            ),
+            0,
+        )
+        start = max(0, pos - _SNIPPET_RADIUS)
+        end = pos + _SNIPPET_RADIUS
+        excerpt = " ".join(content[start:end].replace("#", " ").replace("*", " ").split())
+        if start > 0:
+            excerpt = "..." + excerpt
+        if end < len(content):
+            excerpt += "..."
+        return excerpt
+
     # ------------------------------------------------------------------
     # Persistence helpers
     # ------------------------------------------------------------------
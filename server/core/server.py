@@ -32,7 +32,8 @@ from .administration import AdministrationMixin
 from .documents.browsing import DocumentBrowsingMixin, _DOCUMENTS_DIR
 from .documents.transcriber_role import TranscriberRoleMixin
 from .virtual_bots import VirtualBotManager
-from ..network.websocket_server import WebSocketServer, ClientConnection
+from ..network.compression import MAX_WINDOW_BITS, MIN_WINDOW_BITS, CompressionSettings
+from ..network.websocket_server import WebSocketServer, ClientConnection, OutboundLimits
 from ..persistence.database import Database
 from ..auth.auth import AuthManager, AuthResult
 from .tables.manager import TableManager
@@ -159,11 +160,17 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._users: dict[str, NetworkUser] = {}  # username -> NetworkUser
         self._user_states: dict[str, dict] = {}  # username -> UI state
 
+        # Lobby menu viewers receiving live updates
+        self._lobby_subscribers: dict[tuple[str, str | None], set[str]] = {}
+        self._lobby_subscriptions: dict[str, tuple[tuple[str, str | None], list[MenuItem]]] = {}
+        self._lobby_pushed_version = 0
+
         # Document manager
         self._documents = DocumentManager(_DOCUMENTS_DIR)
 
         # Virtual bot manager
         self._virtual_bots = VirtualBotManager(self)
+        self._tables.add_change_listener(self._virtual_bots.on_tables_changed)
         self._localization_warmup_task: asyncio.Task | None = None
 
         # Credential limits (overridable via config)
@@ -172,6 +179,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         self._password_min_length = DEFAULT_PASSWORD_MIN_LENGTH
         self._password_max_length = DEFAULT_PASSWORD_MAX_LENGTH
         self._ws_max_message_size = DEFAULT_WS_MAX_MESSAGE_BYTES
+        self._outbound_limits = OutboundLimits()
+        self._compression = CompressionSettings()
         self._config_path = Path(config_path) if config_path else get_default_config_path()
         self._allow_insecure_ws = False
         self._preload_locales = preload_locales
@@ -269,6 +278,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             ssl_cert=self._ssl_cert,
             ssl_key=self._ssl_key,
             max_message_size=self._ws_max_message_size,
+            outbound_limits=self._outbound_limits,
+            compression=self._compression,
         )
         await self._ws_server.start()
         if not self._ssl_cert:
@@ -277,6 +288,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             )
         if self._ws_max_message_size != DEFAULT_WS_MAX_MESSAGE_BYTES:
             print(f"Max inbound websocket message size: {self._ws_max_message_size} bytes")
+        if not self._compression.enabled:
+            print("Websocket compression is disabled.")
 
         # Start tick scheduler
         self._tick_scheduler = TickScheduler(self._on_tick, tick_interval_ms)
@@ -387,6 +400,38 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             self._allow_insecure_ws = _coerce_bool(
                 net_cfg.get("allow_insecure_ws"), self._allow_insecure_ws
             )
+            limits = self._outbound_limits
+            self._outbound_limits = OutboundLimits(
+                max_packets=_read_limit(net_cfg, "outbound_max_packets", limits.max_packets),
+                max_bytes=_read_limit(net_cfg, "outbound_max_bytes", limits.max_bytes),
+                max_lag_seconds=_read_limit(
+                    net_cfg, "outbound_max_lag_seconds", int(limits.max_lag_seconds)
+                ),
+            )
+
+            def _read_window_bits(key: str, current: int | None) -> int | None:
+                bits = _read_limit(net_cfg, key, current, minimum=MIN_WINDOW_BITS)
+                return None if bits is None else min(MAX_WINDOW_BITS, bits)
+
+            compression = self._compression
+            self._compression = CompressionSettings(
+                enabled=_coerce_bool(net_cfg.get("compression"), compression.enabled),
+                server_max_window_bits=_read_window_bits(
+                    "compression_window_bits", compression.server_max_window_bits
+                ),
+                client_max_window_bits=_read_window_bits(
+                    "compression_client_window_bits", compression.client_max_window_bits
+                ),
+                memory_level=min(
+                    9, _read_limit(net_cfg, "compression_memory_level", compression.memory_level)
+                ),
+                level=min(
+                    9, _read_limit(net_cfg, "compression_level", compression.level, minimum=0)
+                ),
+                min_bytes=_read_limit(
+                    net_cfg, "compression_min_bytes", compression.min_bytes, minimum=0
+                ),
+            )
 
         rate_cfg = auth_cfg.get("rate_limits") if isinstance(auth_cfg, dict) else None
         if isinstance(rate_cfg, dict):
@@ -815,18 +860,20 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         # Tick virtual bots (handle state transitions)
         self._virtual_bots.on_tick()
 
+        # Push lobby changes to users viewing table lists
+        self._push_lobby_updates()
+
         # Flush queued messages for all users
         self._flush_user_messages()
 
     def _flush_user_messages(self) -> None:
-        """Send all queued messages for all users."""
+        """Move all queued messages into each user's outbound connection queue."""
         for username, user in self._users.items():
             messages = user.get_queued_messages()
             if messages and self._ws_server:
                 client = self._ws_server.get_client_by_username(username)
                 if client:
-                    for msg in messages:
-                        asyncio.create_task(client.send(msg))
+                    client.enqueue_many(messages)
 
     async def _handoff_existing_session(self, user: NetworkUser, new_client: ClientConnection) -> None:
         """Disconnect the existing client session for a user and bind the new connection."""
@@ -932,7 +979,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             user.speak_l("user-is-server-owner", buffer="activity", player=owner_name)
 
     def _broadcast_table_created(self, host_name: str, game_type: str) -> None:
-        """Broadcast a table creation announcement to all approved online users not in a game."""
+        """Announce a new table to approved online users not in a game.
+
+        Lobby viewers whose live listing will show the table are skipped;
+        they get it through ``_push_lobby_updates`` instead.
+        """
         game_class = get_game_class(game_type)
         if not game_class:
             return
@@ -943,6 +994,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             state = self._user_states.get(username, {})
             if state.get("menu") == "in_game":
                 continue
+            if self._sees_live_listing(username, state, game_type):
+                continue
             game_name = Localization.get(user.locale, name_key)
             user.speak_l("table-created", buffer="activity", host=host_name, game=game_name)
             user.play_sound("table_created.ogg")
@@ -974,6 +1027,10 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         elif packet_type == "menu":
             # Allow menu selections for all authenticated users (including unapproved)
             await self._handle_menu(client, packet)
+        elif packet_type == "request_menu_items":
+            user = self._users.get(client.username)
+            if user:
+                user.send_menu_items(packet["menu_id"], packet["offset"])
         else:
             # For all other packets, check if user is approved
             user = self._users.get(client.username)
@@ -1132,9 +1189,9 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         ban_message = Localization.get(user.locale, "account-banned")
         user.play_sound("accountban.ogg")
         user.speak_l("account-banned", buffer="activity")
-        for msg in user.get_queued_messages():
-            await user.connection.send(msg)
-        await user.connection.send({
+        # Queued behind anything already waiting, so the client gets it all in order
+        user.connection.enqueue_many(user.get_queued_messages())
+        user.connection.enqueue({
             "type": "disconnect",
             "reconnect": False,
             "show_message": True,
@@ -1215,6 +1272,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         locale = packet.get("locale") or self._default_locale
         client.client_type = packet.get("client_type") or ""
         client.platform = packet.get("platform") or ""
+        client.features = frozenset(packet.get("features") or ())
 
         if session_token:
             token_username = self._auth.validate_session(session_token)
@@ -1347,6 +1405,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         username_hint = packet.get("username", "")
         client.client_type = packet.get("client_type") or ""
         client.platform = packet.get("platform") or ""
+        client.features = frozenset(packet.get("features") or ())
         client_ip = self._get_client_ip(client)
         throttle_message = self._check_refresh_rate_limit(client_ip)
         if throttle_message:
@@ -1398,11 +1457,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
     async def _send_game_list(self, client: ClientConnection) -> None:
         """Send the list of available games to the client."""
         games = []
-        for game_class in GameRegistry.get_all():
+        for entry in GameRegistry.get_entries():
             games.append(
                 {
-                    "type": game_class.get_type(),
-                    "name": game_class.get_name(),
+                    "type": entry.game_type,
+                    "name": entry.name,
                 }
             )
 
@@ -1474,7 +1533,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
     def _show_categories_menu(self, user: NetworkUser) -> None:
         """Show game categories menu."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_entries_by_category()
         items = []
         for category_key in sorted(categories.keys()):
             category_name = Localization.get(user.locale, category_key)
@@ -1497,13 +1556,13 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
     def _show_games_menu(self, user: NetworkUser, category: str) -> None:
         """Show games in a category."""
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_entries_by_category()
         games = categories.get(category, [])
 
         items = []
-        for game_class in games:
-            game_name = Localization.get(user.locale, game_class.get_name_key())
-            items.append(MenuItem(text=game_name, id=f"game_{game_class.get_type()}"))
+        for entry in games:
+            game_name = Localization.get(user.locale, entry.name_key)
+            items.append(MenuItem(text=game_name, id=f"game_{entry.game_type}"))
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
 
         user.show_menu(
@@ -1516,7 +1575,6 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
     def _show_tables_menu(self, user: NetworkUser, game_type: str) -> None:
         """Show available tables for a game."""
-        tables = self._tables.get_waiting_tables(game_type)
         game_class = get_game_class(game_type)
         game_name = (
             Localization.get(user.locale, game_class.get_name_key())
@@ -1524,41 +1582,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             else game_type
         )
 
-        items = [
-            MenuItem(
-                text=Localization.get(user.locale, "create-table"), id="create_table"
-            )
-        ]
-
-        for table in tables:
-            member_count = len(table.members)
-            member_names = [
-                member.username
-                for member in table.members
-                if member.username != table.host
-            ]
-            members_str = Localization.format_list_and(user.locale, member_names)
-            if member_count == 1:
-                listing_key = "table-listing-one"
-            elif member_names:
-                listing_key = "table-listing-with"
-            else:
-                listing_key = "table-listing"
-            items.append(
-                MenuItem(
-                    text=Localization.get(
-                        user.locale,
-                        listing_key,
-                        host=table.host,
-                        count=member_count,
-                        members=members_str,
-                    ),
-                    id=f"table_{table.table_id}",
-                )
-            )
-
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
+        items = self._tables_menu_items(user.locale, game_type)
         user.show_menu(
             "tables_menu",
             items,
@@ -1570,49 +1594,142 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             "game_type": game_type,
             "game_name": game_name,
         }
+        self._subscribe_lobby(user, ("tables_menu", game_type), items)
+
+    def _tables_menu_items(self, locale: str, game_type: str) -> list[MenuItem]:
+        """Build the tables menu for one game: create, waiting tables, back."""
+        items = [MenuItem(text=Localization.get(locale, "create-table"), id="create_table")]
+        items.extend(
+            self._tables.cached_render(
+                "tables_menu",
+                locale,
+                lambda: self._render_table_listings(locale, game_type),
+                key=game_type,
+            )
+        )
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
+
+    def _active_tables_menu_items(self, locale: str) -> list[MenuItem]:
+        """Build the active tables menu: waiting tables of every game, back."""
+        items = list(
+            self._tables.cached_render(
+                "active_tables_menu",
+                locale,
+                lambda: self._render_table_listings(locale),
+            )
+        )
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
-    def _show_active_tables_menu(self, user: NetworkUser) -> None:
-        """Show available tables across all games."""
-        tables = self._tables.get_waiting_tables()
-        if not tables:
-            user.speak_l("no-active-tables")
-            self._show_main_menu(user)
+    def _subscribe_lobby(
+        self, user: NetworkUser, key: tuple[str, str | None], items: list[MenuItem]
+    ) -> None:
+        """Register a user viewing a lobby menu for live updates."""
+        previous = self._lobby_subscriptions.get(user.username)
+        if previous is not None and previous[0] != key:
+            self._lobby_subscribers.get(previous[0], set()).discard(user.username)
+        self._lobby_subscribers.setdefault(key, set()).add(user.username)
+        self._lobby_subscriptions[user.username] = (key, items)
+
+    def _sees_live_listing(self, username: str, state: dict, game_type: str) -> bool:
+        """Return True if a user is viewing a subscribed lobby menu listing *game_type*."""
+        subscription = self._lobby_subscriptions.get(username)
+        if subscription is None:
+            return False
+        menu_id, subscribed_type = subscription[0]
+        if state.get("menu") != menu_id or state.get("game_type") != subscribed_type:
+            return False
+        return subscribed_type is None or subscribed_type == game_type
+
+    def _push_lobby_updates(self) -> None:
+        """Send refreshed lobby menus to subscribed viewers after lobby changes.
+
+        Runs once per tick and does nothing unless the lobby version moved.
+        Subscribers that have left the menu or gone offline are dropped
+        here. Viewers get an update only if their menu's items changed;
+        clients apply it as an id-based diff and keep their focus.
+        """
+        version = self._tables.lobby_version
+        if version == self._lobby_pushed_version:
             return
-        items: list[MenuItem] = []
-        for table in tables:
-            game_class = get_game_class(table.game_type)
-            game_name = (
-                Localization.get(user.locale, game_class.get_name_key())
-                if game_class
-                else table.game_type
-            )
+        self._lobby_pushed_version = version
+        subscriptions = self._lobby_subscriptions
+        for key, usernames in list(self._lobby_subscribers.items()):
+            menu_id, game_type = key
+            for username in list(usernames):
+                user = self._users.get(username)
+                state = self._user_states.get(username, {})
+                if (
+                    user is None
+                    or state.get("menu") != menu_id
+                    or state.get("game_type") != game_type
+                ):
+                    usernames.discard(username)
+                    subscriptions.pop(username, None)
+                    continue
+                if menu_id == "tables_menu":
+                    items = self._tables_menu_items(user.locale, game_type)
+                else:
+                    items = self._active_tables_menu_items(user.locale)
+                if items != subscriptions[username][1]:
+                    subscriptions[username] = (key, items)
+                    user.update_menu(menu_id, items)
+            if not usernames:
+                del self._lobby_subscribers[key]
+
+    def _render_table_listings(
+        self, locale: str, game_type: str | None = None
+    ) -> tuple[MenuItem, ...]:
+        """Render waiting-table listings for one game, or for all games with names."""
+        listings: list[MenuItem] = []
+        for table in self._tables.get_waiting_tables(game_type):
             member_count = len(table.members)
             member_names = [
                 member.username
                 for member in table.members
                 if member.username != table.host
             ]
-            members_str = Localization.format_list_and(user.locale, member_names)
+            members_str = Localization.format_list_and(locale, member_names)
             if member_count == 1:
-                listing_key = "table-listing-game-one"
+                suffix = "-one"
             elif member_names:
-                listing_key = "table-listing-game-with"
+                suffix = "-with"
             else:
-                listing_key = "table-listing-game"
-            items.append(
-                MenuItem(
-                    text=Localization.get(
-                        user.locale,
-                        listing_key,
-                        game=game_name,
-                        host=table.host,
-                        count=member_count,
-                        members=members_str,
-                    ),
-                    id=f"table_{table.table_id}",
+                suffix = ""
+            if game_type:
+                text = Localization.get(
+                    locale,
+                    f"table-listing{suffix}",
+                    host=table.host,
+                    count=member_count,
+                    members=members_str,
                 )
-            )
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
+            else:
+                game_class = get_game_class(table.game_type)
+                game_name = (
+                    Localization.get(locale, game_class.get_name_key())
+                    if game_class
+                    else table.game_type
+                )
+                text = Localization.get(
+                    locale,
+                    f"table-listing-game{suffix}",
+                    game=game_name,
+                    host=table.host,
+                    count=member_count,
+                    members=members_str,
+                )
+            listings.append(MenuItem(text=text, id=f"table_{table.table_id}"))
+        return tuple(listings)
+
+    def _show_active_tables_menu(self, user: NetworkUser) -> None:
+        """Show available tables across all games."""
+        items = self._active_tables_menu_items(user.locale)
+        if len(items) == 1:
+            user.speak_l("no-active-tables")
+            self._show_main_menu(user)
+            return
         user.show_menu(
             "active_tables_menu",
             items,
@@ -1620,6 +1737,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
             escape_behavior=EscapeBehavior.SELECT_LAST,
         )
         self._user_states[user.username] = {"menu": "active_tables_menu"}
+        self._subscribe_lobby(user, ("active_tables_menu", None), items)
 
     # Dice keeping style display names
     DICE_KEEPING_STYLES = {
@@ -1783,10 +1901,10 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         if not user:
             return
 
-        selection_id = packet.get("selection_id", "")
-
         state = self._user_states.get(username, {})
         current_menu = state.get("menu")
+        self._resolve_selection_id(user, packet.get("menu_id") or current_menu, packet)
+        selection_id = packet.get("selection_id", "")
         self._remember_menu_position(user, current_menu, packet)
 
         # Check if user is in a table - delegate all events to game
@@ -1835,6 +1953,26 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         if isinstance(current_menus, dict):
             current_menus.pop(previous_menu, None)
 
+    def _resolve_selection_id(
+        self, user: NetworkUser, menu_id: str | None, packet: dict
+    ) -> None:
+        """Fill in a missing selection_id from the selected index.
+
+        Paging clients only hold part of a long menu, so an escape that picks
+        the last item sends just its index; resolve it against the full list.
+        """
+        if packet.get("selection_id") or not menu_id:
+            return
+        selection = packet.get("selection")
+        menu_state = getattr(user, "_current_menus", {}).get(menu_id)
+        if not menu_state or not isinstance(selection, int) or selection < 1:
+            return
+        items = menu_state.get("items", [])
+        if selection <= len(items):
+            item = items[selection - 1]
+            if isinstance(item, dict) and item.get("id"):
+                packet["selection_id"] = item["id"]
+
     def _remember_menu_position(
         self, user: NetworkUser, current_menu: str | None, packet: dict
     ) -> None:
@@ -2198,11 +2336,8 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 self._show_tables_menu(user, game_type)
 
         elif selection_id == "back":
-            category = None
-            for cat, games in GameRegistry.get_by_category().items():
-                if any(g.get_type() == game_type for g in games):
-                    category = cat
-                    break
+            entry = GameRegistry.get_entry(game_type)
+            category = entry.category if entry else None
             if category:
                 self._show_games_menu(user, category)
             else:
@@ -2459,6 +2594,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
 
         # Update host to the restorer
         game.host = user.username
+        game._table_state_changed()
 
         # Attach users and transfer all human players
         # NOTE: We must attach users by player.id (UUID), not by username.
@@ -2506,15 +2642,15 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         Args:
             user: Acting user.
         """
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_entries_by_category()
         items = []
 
         # Add all games from all categories
         for category_key in sorted(categories.keys()):
-            for game_class in categories[category_key]:
-                game_name = Localization.get(user.locale, game_class.get_name_key())
+            for entry in categories[category_key]:
+                game_name = Localization.get(user.locale, entry.name_key)
                 items.append(
-                    MenuItem(text=game_name, id=f"lb_{game_class.get_type()}")
+                    MenuItem(text=game_name, id=f"lb_{entry.game_type}")
                 )
 
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
@@ -3177,13 +3313,13 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
         Args:
             user: Acting user.
         """
-        categories = GameRegistry.get_by_category()
+        categories = GameRegistry.get_entries_by_category()
         items = []
 
         # Add only games where the user has stats
         for category_key in sorted(categories.keys()):
-            for game_class in categories[category_key]:
-                game_type = game_class.get_type()
+            for entry in categories[category_key]:
+                game_type = entry.game_type
                 # Check if user has played this game
                 game_results = self._get_game_results(game_type)
                 has_stats = any(
@@ -3192,7 +3328,7 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                     for p in result.player_results
                 )
                 if has_stats:
-                    game_name = Localization.get(user.locale, game_class.get_name_key())
+                    game_name = Localization.get(user.locale, entry.name_key)
                     items.append(
                         MenuItem(text=game_name, id=f"stats_{game_type}")
                     )
@@ -3701,7 +3837,11 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                     self._show_main_menu(user, reset_history=True)
 
     async def _handle_chat(self, client: ClientConnection, packet: dict) -> None:
-        """Handle chat message."""
+        """Handle chat message.
+
+        Recipients get the message through their bounded outbound queues, so
+        a stalled client never holds up delivery to the others.
+        """
         username = client.username
         if not username:
             return
@@ -3724,19 +3864,19 @@ class Server(AdministrationMixin, DocumentBrowsingMixin, TranscriberRoleMixin):
                 for member_name in [m.username for m in table.members]:
                     user = self._users.get(member_name)
                     if user and user.approved:  # Only send to approved users
-                        await user.connection.send(chat_packet)
+                        user.connection.enqueue(chat_packet)
             else:
                 for user in self._users.values():
                     if not user.approved:
                         continue
                     if self._tables.find_user_table(user.username):
                         continue
-                    await user.connection.send(chat_packet)
+                    user.connection.enqueue(chat_packet)
         elif convo == "global":
             # Broadcast to all approved users only
             for user in self._users.values():
                 if user.approved:
-                    await user.connection.send(chat_packet)
+                    user.connection.enqueue(chat_packet)
 
     def _get_online_usernames(self) -> list[str]:
         """Return sorted list of online usernames."""
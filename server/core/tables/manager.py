@@ -1,6 +1,8 @@
 """Table manager for tracking all active tables."""
 
-from typing import TYPE_CHECKING, Any
+from collections import Counter
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 import uuid
 
 from .table import Table
@@ -8,14 +10,146 @@ from .table import Table
 if TYPE_CHECKING:
     from server.core.users.base import User
 
+HOST_KIND_HUMAN = "human"
+HOST_KIND_VIRTUAL_BOT = "virtual_bot"
+
+T = TypeVar("T")
+
+
+class TableIndexKey(NamedTuple):
+    """Indexed attributes of one table."""
+
+    game_type: str
+    status: str  # Table.status
+    game_status: str  # Live game status (falls back to Table.status)
+    host_kind: str
+    open_seats: int
+
+    @property
+    def joinable(self) -> bool:
+        return self.game_status == "waiting" and self.open_seats > 0
+
 
 class TableManager:
-    """Manage all active tables on the server."""
+    """Manage all active tables on the server.
+
+    Tables are indexed by status, game type, host kind and joinable seats.
+    Tables report membership and status changes through ``table_changed``;
+    games report status, host and player changes through ``game_changed``
+    and ``on_tick`` reindexes just those tables, so lookups used by the
+    lobby and by virtual bots never scan every table.
+
+    ``lobby_version`` increases whenever a table is created, removed, joined,
+    left or changes status. Lobby menus render through ``cached_render``,
+    so every user with the same locale shares one rendering per version.
+    """
 
     def __init__(self):
         """Initialize the table registry."""
         self._tables: dict[str, Table] = {}
         self._server: Any = None  # Reference to server for destroy/save notifications
+        self._change_listeners: list[Callable[[], None]] = []
+        self._index_keys: dict[str, TableIndexKey] = {}
+        self._by_type: dict[str, dict[str, Table]] = {}
+        self._by_status: dict[str, dict[str, Table]] = {}
+        self._by_type_status: dict[tuple[str, str], dict[str, Table]] = {}
+        self._joinable_by_type: dict[str, dict[str, Table]] = {}
+        self._joinable_cache: dict[str | None, tuple[Table, ...]] = {}
+        self._host_counts: Counter[tuple[str, str]] = Counter()
+        self._open_seats: Counter[str] = Counter()
+        self.lobby_version = 0
+        self._renders: dict[tuple[str, str, Hashable], tuple[int, Any]] = {}
+        self._user_tables: dict[str, Table] = {}
+        self._user_tables_version = -1
+        self._changed_games: dict[str, Table] = {}
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback run whenever a table is added or removed."""
+        self._change_listeners.append(listener)
+
+    def _notify_changed(self) -> None:
+        self.lobby_version += 1
+        for listener in self._change_listeners:
+            listener()
+
+    def _index_key(self, table: Table) -> TableIndexKey:
+        game = table.game
+        host_name = table.host
+        game_status = table.status
+        open_seats = 0
+        if game is not None:
+            host_name = getattr(game, "host", "") or host_name
+            game_status = getattr(game, "status", game_status)
+            if hasattr(game, "get_max_players"):
+                open_seats = max(0, game.get_max_players() - len(game.players))
+        host_user = table.get_user(host_name)
+        host_kind = (
+            HOST_KIND_VIRTUAL_BOT
+            if getattr(host_user, "is_virtual_bot", False)
+            else HOST_KIND_HUMAN
+        )
+        return TableIndexKey(table.game_type, table.status, game_status, host_kind, open_seats)
+
+    def _index_add(self, table: Table, key: TableIndexKey) -> None:
+        table_id = table.table_id
+        self._by_type.setdefault(key.game_type, {})[table_id] = table
+        self._by_status.setdefault(key.status, {})[table_id] = table
+        self._by_type_status.setdefault((key.game_type, key.status), {})[table_id] = table
+        if key.joinable:
+            self._joinable_by_type.setdefault(key.game_type, {})[table_id] = table
+            self._joinable_cache.clear()
+        self._host_counts[(key.game_type, key.host_kind)] += 1
+        self._open_seats[key.game_type] += key.open_seats
+        self._index_keys[table_id] = key
+
+    def _index_remove(self, table_id: str) -> None:
+        key = self._index_keys.pop(table_id, None)
+        if key is None:
+            return
+        self._by_type.get(key.game_type, {}).pop(table_id, None)
+        self._by_status.get(key.status, {}).pop(table_id, None)
+        self._by_type_status.get((key.game_type, key.status), {}).pop(table_id, None)
+        if key.joinable:
+            self._joinable_by_type.get(key.game_type, {}).pop(table_id, None)
+            self._joinable_cache.clear()
+        self._host_counts[(key.game_type, key.host_kind)] -= 1
+        self._open_seats[key.game_type] -= key.open_seats
+
+    def reindex(self, table: Table) -> None:
+        """Refresh one table's index entries after its status, game or members change."""
+        if self._tables.get(table.table_id) is not table:
+            return
+        key = self._index_key(table)
+        if self._index_keys.get(table.table_id) == key:
+            return
+        self.lobby_version += 1
+        self._index_remove(table.table_id)
+        self._index_add(table, key)
+
+    def table_changed(self, table: Table) -> None:
+        """Record a membership or status change on one table."""
+        self.lobby_version += 1
+        self.reindex(table)
+
+    def game_changed(self, table: Table) -> None:
+        """Queue a table for reindexing at the end of the current tick."""
+        self._changed_games[table.table_id] = table
+
+    def cached_render(
+        self, kind: str, locale: str, build: Callable[[], T], key: Hashable = None
+    ) -> T:
+        """Return ``build()`` for (kind, locale, key), reusing it until the lobby changes.
+
+        Callers must treat the returned value as read-only; it is shared by
+        every user who views the same menu in the same locale.
+        """
+        entry_key = (kind, locale, key)
+        cached = self._renders.get(entry_key)
+        if cached is not None and cached[0] == self.lobby_version:
+            return cached[1]
+        value = build()
+        self._renders[entry_key] = (self.lobby_version, value)
+        return value
 
     def create_table(
         self,
@@ -45,6 +179,8 @@ class TableManager:
             table._db = self._server._db
         table.add_member(host_username, host_user, as_spectator=False)
         self._tables[table_id] = table
+        self.reindex(table)
+        self._notify_changed()
         return table
 
     def get_table(self, table_id: str) -> Table | None:
@@ -53,7 +189,9 @@ class TableManager:
 
     def remove_table(self, table_id: str) -> None:
         """Remove a table by id."""
-        self._tables.pop(table_id, None)
+        if self._tables.pop(table_id, None) is not None:
+            self._index_remove(table_id)
+            self._notify_changed()
 
     def get_all_tables(self) -> list[Table]:
         """Get all tables."""
@@ -61,22 +199,53 @@ class TableManager:
 
     def get_tables_by_type(self, game_type: str) -> list[Table]:
         """Get all tables of a specific game type."""
-        return [t for t in self._tables.values() if t.game_type == game_type]
+        return list(self._by_type.get(game_type, {}).values())
 
     def get_waiting_tables(self, game_type: str | None = None) -> list[Table]:
         """Get all tables in waiting status."""
-        tables = self._tables.values()
         if game_type:
-            tables = [t for t in tables if t.game_type == game_type]
-        return [t for t in tables if t.status == "waiting"]
+            return list(self._by_type_status.get((game_type, "waiting"), {}).values())
+        return list(self._by_status.get("waiting", {}).values())
+
+    def get_joinable_tables(self, game_type: str | None = None) -> tuple[Table, ...]:
+        """Get tables whose game is waiting for players and has a free seat.
+
+        The result is cached until a table enters or leaves the joinable set,
+        so repeated lookups (e.g. virtual bots choosing a table) are O(1).
+        """
+        cached = self._joinable_cache.get(game_type)
+        if cached is None:
+            if game_type:
+                cached = tuple(self._joinable_by_type.get(game_type, {}).values())
+            else:
+                cached = tuple(
+                    table
+                    for tables in self._joinable_by_type.values()
+                    for table in tables.values()
+                )
+            self._joinable_cache[game_type] = cached
+        return cached
+
+    def count_tables(self, game_type: str, host_kind: str | None = None) -> int:
+        """Count tables of one game type, optionally only those with one host kind."""
+        if host_kind is None:
+            return len(self._by_type.get(game_type, {}))
+        return self._host_counts[(game_type, host_kind)]
+
+    def open_seat_count(self, game_type: str) -> int:
+        """Total free player seats across tables of one game type."""
+        return self._open_seats[game_type]
 
     def find_user_table(self, username: str) -> Table | None:
         """Find the table a user is currently in."""
-        for table in self._tables.values():
-            for member in table.members:
-                if member.username == username:
-                    return table
-        return None
+        if self._user_tables_version != self.lobby_version:
+            user_tables: dict[str, Table] = {}
+            for table in self._tables.values():
+                for member in table.members:
+                    user_tables.setdefault(member.username, table)
+            self._user_tables = user_tables
+            self._user_tables_version = self.lobby_version
+        return self._user_tables.get(username)
 
     def on_tick(self) -> None:
         """Tick all active tables and destroy empty ones."""
@@ -85,6 +254,9 @@ class TableManager:
                 table.destroy()
                 continue
             table.on_tick()
+        changed, self._changed_games = self._changed_games, {}
+        for table in changed.values():
+            self.reindex(table)
 
     def add_table(self, table: Table) -> None:
         """Add an existing table (e.g., loaded from database)."""
@@ -92,7 +264,10 @@ class TableManager:
         table._server = self._server
         if self._server:
             table._db = self._server._db
+        self._index_remove(table.table_id)
         self._tables[table.table_id] = table
+        self.reindex(table)
+        self._notify_changed()
 
     def save_all(self) -> list[Table]:
         """Save all tables' game state and return them."""
@@ -53,6 +53,23 @@ class Table(DataClassJSONMixin):
         self._server = None
         self._db = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("status", "members"):
+            self._reindex()
+
+    def _reindex(self) -> None:
+        """Tell the manager this table's members or status may have changed."""
+        table_changed = getattr(self.__dict__.get("_manager"), "table_changed", None)
+        if table_changed:
+            table_changed(self)
+
+    def game_state_changed(self) -> None:
+        """Queue a reindex after the game's status, host or players changed."""
+        game_changed = getattr(self.__dict__.get("_manager"), "game_changed", None)
+        if game_changed:
+            game_changed(self)
+
     @property
     def game(self) -> "Game | None":
         """Return the current game instance."""
@@ -64,6 +81,7 @@ class Table(DataClassJSONMixin):
         self._game = value
         if value:
             self.game_json = value.to_json()
+        self._reindex()
 
     def add_member(
         self, username: str, user: "User", as_spectator: bool = False
@@ -82,6 +100,7 @@ class Table(DataClassJSONMixin):
 
         self.members.append(TableMember(username=username, is_spectator=as_spectator))
         self._users[username] = user
+        self._reindex()
 
     def remove_member(self, username: str) -> None:
         """Remove a member from the table."""
@@ -91,6 +110,8 @@ class Table(DataClassJSONMixin):
         # Destroy table if it's empty
         if not self.members:
             self.destroy()
+            return
+        self._reindex()
 
     def get_user(self, username: str) -> "User | None":
         """Get a user by username."""
@@ -99,6 +120,7 @@ class Table(DataClassJSONMixin):
     def attach_user(self, username: str, user: "User") -> None:
         """Attach a user to a member (e.g., after deserialization)."""
         self._users[username] = user
+        self._reindex()
 
     def get_players(self) -> list[TableMember]:
         """Get all non-spectator members."""
@@ -131,11 +153,9 @@ class Table(DataClassJSONMixin):
     def handle_event(self, username: str, event: dict) -> None:
         """Handle an event from a member."""
         if self._game:
-            # Find the player
-            for player in self._game.players:
-                if player.name == username:
-                    self._game.handle_event(player, event)
-                    break
+            player = self._game.get_player_by_name(username)
+            if player is not None:
+                self._game.handle_event(player, event)
 
     def save_game_state(self) -> None:
         """Save the current game state to game_json."""
@@ -0,0 +1,106 @@
+"""Hierarchical timing wheel for tick-based scheduling."""
+
+from collections.abc import Hashable
+
+
+class TimingWheel:
+    """
+    Schedule keys to fire on a future tick.
+
+    Each level has ``slots`` buckets; level ``n`` buckets span
+    ``slots ** n`` ticks. A key is filed in the lowest level whose range
+    covers its delay and cascades down as its tick approaches, so
+    scheduling, rescheduling and advancing one tick are all O(1)
+    amortized regardless of how many keys are waiting. Delays beyond the
+    top level wait in an overflow list that is re-filed once per top-level
+    rotation.
+
+    Each key has at most one live deadline. Rescheduling or cancelling a
+    key leaves its old entry in place; stale entries are skipped when
+    their bucket is reached.
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 3):
+        """Create an empty wheel positioned at tick 0."""
+        if slots < 2 or levels < 1:
+            raise ValueError("TimingWheel needs at least 2 slots and 1 level")
+        self._slots = slots
+        self._levels = levels
+        self._wheels: list[list[list[tuple[Hashable, int]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: list[tuple[Hashable, int]] = []
+        self._deadlines: dict[Hashable, int] = {}
+        self.now = 0
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> int | None:
+        """Return the tick a key is scheduled for, if any."""
+        return self._deadlines.get(key)
+
+    def keys(self) -> list[Hashable]:
+        """Return every scheduled key."""
+        return list(self._deadlines)
+
+    def schedule(self, key: Hashable, tick: int) -> None:
+        """Schedule (or reschedule) a key; ticks not in the future fire next tick."""
+        tick = max(tick, self.now + 1)
+        self._deadlines[key] = tick
+        self._file(key, tick)
+
+    def cancel(self, key: Hashable) -> None:
+        """Drop a key's pending deadline."""
+        self._deadlines.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every pending deadline."""
+        self._deadlines.clear()
+        self._overflow.clear()
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+
+    def advance(self) -> list[Hashable]:
+        """Move forward one tick and return the keys due on it, in schedule order."""
+        self.now += 1
+        span = self._slots ** self._levels
+        if self.now % span == 0 and self._overflow:
+            pending, self._overflow = self._overflow, []
+            self._refile(pending)
+        for level in range(self._levels - 1, 0, -1):
+            span = self._slots**level
+            if self.now % span == 0:
+                bucket = self._wheels[level][(self.now // span) % self._slots]
+                if bucket:
+                    pending = bucket[:]
+                    bucket.clear()
+                    self._refile(pending)
+
+        bucket = self._wheels[0][self.now % self._slots]
+        due: list[Hashable] = []
+        for key, tick in bucket:
+            if tick == self.now and self._deadlines.get(key) == tick:
+                del self._deadlines[key]
+                due.append(key)
+        bucket.clear()
+        return due
+
+    def _refile(self, entries: list[tuple[Hashable, int]]) -> None:
+        for key, tick in entries:
+            if self._deadlines.get(key) == tick:
+                self._file(key, tick)
+
+    def _file(self, key: Hashable, tick: int) -> None:
+        delay = tick - self.now
+        span = 1
+        for level in range(self._levels):
+            if delay < span * self._slots:
+                self._wheels[level][(tick // span) % self._slots].append((key, tick))
+                return
+            span *= self._slots
+        self._overflow.append((key, tick))
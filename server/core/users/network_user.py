@@ -9,6 +9,10 @@ from .preferences import UserPreferences
 if TYPE_CHECKING:
     from ...network.websocket_server import ClientConnection
 
+# Clients that advertise the "menu_paging" feature receive long menus in
+# windows of this many items and request the rest as the user reads.
+MENU_PAGE_SIZE = 40
+
 
 class NetworkUser(User):
     """
@@ -247,6 +251,9 @@ class NetworkUser(User):
             "grid_enabled": grid_enabled,
             "grid_width": grid_width,
         }
+        if previous_menu and "sent" in previous_menu:
+            # Keep the client's loaded window so re-showing never shrinks it
+            self._current_menus[menu_id]["sent"] = previous_menu["sent"]
 
         packet: dict[str, Any] = {
             "type": "menu",
@@ -260,6 +267,7 @@ class NetworkUser(User):
         if position is not None:
             # Convert 1-based to 0-based for client
             packet["position"] = position - 1
+        self._page_menu_packet(packet, position)
         self._queue_packet(packet)
 
     def update_menu(
@@ -286,8 +294,63 @@ class NetworkUser(User):
             packet["position"] = position - 1
         if selection_id is not None:
             packet["selection_id"] = selection_id
+            if position is None:
+                position = next(
+                    (
+                        index
+                        for index, item in enumerate(converted_items, 1)
+                        if isinstance(item, dict) and item.get("id") == selection_id
+                    ),
+                    None,
+                )
+        self._page_menu_packet(packet, position)
         self._queue_packet(packet)
 
+    @property
+    def pages_menus(self) -> bool:
+        """Return True if the client fetches long menus a window at a time."""
+        return "menu_paging" in getattr(self._connection, "features", ())
+
+    def _page_menu_packet(self, packet: dict[str, Any], position: int | None) -> None:
+        """Trim a menu packet to the window the client needs right now.
+
+        The window always reaches past the focused item and never shrinks
+        below what the client already loaded for this menu, so updates diff
+        cleanly against the client's list. The number of items sent is kept
+        as the menu's cursor.
+        """
+        if not self.pages_menus:
+            return
+        items = packet["items"]
+        menu = self._current_menus.get(packet["menu_id"])
+        end = max(MENU_PAGE_SIZE, menu.get("sent", 0) if menu else 0)
+        if position is not None:
+            end = max(end, position + MENU_PAGE_SIZE // 2)
+        packet["items"] = items[:end]
+        packet["total_items"] = len(items)
+        if menu is not None:
+            menu["sent"] = len(packet["items"])
+
+    def send_menu_items(self, menu_id: str, offset: int) -> None:
+        """Send the next window of a paged menu starting at a 0-based offset."""
+        menu = self._current_menus.get(menu_id)
+        if menu is None:
+            return
+        items = menu["items"]
+        if offset >= len(items):
+            return
+        window = items[offset : offset + MENU_PAGE_SIZE]
+        menu["sent"] = max(menu.get("sent", 0), offset + len(window))
+        self._queue_packet(
+            {
+                "type": "menu_items",
+                "menu_id": menu_id,
+                "offset": offset,
+                "items": window,
+                "total_items": len(items),
+            }
+        )
+
     def remove_menu(self, menu_id: str) -> None:
         """Remove a menu from the client UI."""
         self._current_menus.pop(menu_id, None)
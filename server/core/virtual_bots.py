@@ -7,10 +7,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .config_paths import get_default_config_path
+from .tables.manager import HOST_KIND_VIRTUAL_BOT
+from .timing_wheel import TimingWheel
 
 if TYPE_CHECKING:
     from .server import Server
 
+# How often an in-game bot re-checks its table (game start/finish, table gone).
+IN_GAME_POLL_TICKS = 20
+
 
 class VirtualBotState(Enum):
     """State machine for virtual bots."""
@@ -144,13 +149,13 @@ class VirtualBot:
 
     # Timing state
     cooldown_ticks: int = 0  # Ticks until next state change allowed
-    online_ticks: int = 0  # How long this bot has been online
+    online_since: int = 0  # Wheel tick the bot came online at
     target_online_ticks: int = 0  # Random target for when to consider going offline
     think_ticks: int = 0  # Ticks until next decision when idle
 
     # Game state
     table_id: str | None = None  # Current table ID if in game
-    game_join_tick: int = 0  # Tick when bot joined/created the game (for start delay)
+    game_join_tick: int = 0  # Online ticks when bot joined/created the game (for start delay)
     logout_after_game: bool = False  # If True, will log off shortly after leaving game
     profile: str = "default"
     groups: tuple[str, ...] = field(default_factory=tuple)
@@ -164,6 +169,12 @@ class VirtualBotManager:
     Virtual bots navigate menus, create/join games, and play autonomously.
     They come online and go offline on their own schedules to create
     a natural-feeling server population.
+
+    Bots sit on a timing wheel keyed by the tick of their next decision, so
+    a server tick only visits bots that are due. Countdowns (cooldown,
+    think time) are caught up from the elapsed ticks when a bot wakes
+    instead of being decremented every tick; online time is the distance
+    from the tick the bot came online.
     """
 
     def __init__(self, server: "Server"):
@@ -177,6 +188,10 @@ class VirtualBotManager:
         self._bot_profiles_map: dict[str, str] = {}
         self._guided_tables: dict[str, GuidedTableState] = {}
         self._tick_counter = 0
+        self._wheel = TimingWheel()
+        self._synced_ticks: dict[str, int] = {}  # name -> wheel tick counters are current to
+        self._guided_dirty = True
+        self._guided_refresh_tick: int | None = None
 
     def load_config(self, path: str | Path | None = None) -> None:
         """Load bot configuration from config.toml."""
@@ -259,6 +274,7 @@ class VirtualBotManager:
         for bot in self._bots.values():
             bot.profile = self._bot_profiles_map.get(bot.name, self._config.default_profile)
             bot.groups = tuple(sorted(self._bot_memberships.get(bot.name, set())))
+        self._guided_dirty = True
 
     def _parse_profiles(self, profiles_section: dict[str, Any]) -> dict[str, VirtualBotProfileOverride]:
         """Parse bot profile overrides from configuration."""
@@ -501,10 +517,11 @@ class VirtualBotManager:
 
         # Save each bot's state
         for bot in self._bots.values():
+            self._catch_up_bot(bot, self._wheel.now)
             db.save_virtual_bot(
                 name=bot.name,
                 state=bot.state.value,
-                online_ticks=bot.online_ticks,
+                online_ticks=self._online_ticks(bot),
                 target_online_ticks=bot.target_online_ticks,
                 table_id=bot.table_id,
                 game_join_tick=bot.game_join_tick,
@@ -532,7 +549,7 @@ class VirtualBotManager:
             bot = VirtualBot(
                 name=name,
                 state=VirtualBotState(data["state"]),
-                online_ticks=data["online_ticks"],
+                online_since=self._wheel.now - data["online_ticks"],
                 target_online_ticks=data["target_online_ticks"],
                 table_id=data["table_id"],
                 game_join_tick=data["game_join_tick"],
@@ -551,6 +568,7 @@ class VirtualBotManager:
             ):
                 self._restore_bot_user(bot)
 
+        self._sync_schedule()
         return count
 
     def _refresh_guided_tables(self) -> None:
@@ -717,6 +735,7 @@ class VirtualBotManager:
                 self._bots[name] = bot
             added += 1
 
+        self._sync_schedule()
         return added, online
 
     def clear_bots(self) -> tuple[int, int]:
@@ -745,6 +764,7 @@ class VirtualBotManager:
                 self._take_bot_offline_silent(bot)
 
         self._bots.clear()
+        self._sync_schedule()
 
         # Also clear from database
         if self._server._db:
@@ -760,7 +780,6 @@ class VirtualBotManager:
 
         # Update bot state
         bot.state = VirtualBotState.OFFLINE
-        bot.online_ticks = 0
         bot.table_id = None
 
     def get_status(self) -> dict[str, int]:
@@ -977,12 +996,103 @@ class VirtualBotManager:
         )
         return "linked", table.game.host, len(table.game.players), human_players
 
+    def on_tables_changed(self) -> None:
+        """Re-sync guided tables on the next tick after a table is created or removed."""
+        self._guided_dirty = True
+
     def on_tick(self) -> None:
-        """Process bot decisions each server tick."""
+        """Process decisions for the bots that are due this tick."""
         self._tick_counter += 1
-        self._refresh_guided_tables()
-        for bot in list(self._bots.values()):
+        if self._guided_dirty or (
+            self._guided_refresh_tick is not None
+            and self._tick_counter >= self._guided_refresh_tick
+        ):
+            self._guided_dirty = False
+            self._refresh_guided_tables()
+            self._guided_refresh_tick = self._next_guided_refresh_tick()
+
+        for name in self._wheel.advance():
+            bot = self._bots.get(name)
+            if bot is None:
+                continue
+            self._catch_up_bot(bot, self._wheel.now - 1)
             self._process_bot_tick(bot)
+            self._synced_ticks[name] = self._wheel.now
+            self._schedule_bot(bot)
+
+    def _next_guided_refresh_tick(self) -> int | None:
+        """Return the tick at which the next guided rule window opens or closes."""
+        changes = [
+            ticks
+            for ticks in (
+                self._ticks_until_next_change(state) for state in self._guided_tables.values()
+            )
+            if ticks is not None
+        ]
+        if not changes:
+            return None
+        return self._tick_counter + max(1, min(changes))
+
+    def _sync_schedule(self) -> None:
+        """Schedule bots added to (and drop bots removed from) ``_bots``.
+
+        Call this after every change to ``_bots``; ticks do not re-check it.
+        """
+        if self._synced_ticks.keys() == self._bots.keys() and len(self._wheel) == len(self._bots):
+            return
+        for name in list(self._synced_ticks):
+            if name not in self._bots:
+                self._wheel.cancel(name)
+                del self._synced_ticks[name]
+        for name in self._wheel.keys():
+            if name not in self._bots:
+                self._wheel.cancel(name)
+        for name, bot in self._bots.items():
+            if name not in self._synced_ticks:
+                self._synced_ticks[name] = self._wheel.now
+            if name not in self._wheel:
+                self._schedule_bot(bot)
+        self._guided_dirty = True
+
+    def _schedule_bot(self, bot: VirtualBot) -> None:
+        """File a bot on the wheel at the next tick it has something to decide."""
+        synced = self._synced_ticks.setdefault(bot.name, self._wheel.now)
+        self._wheel.schedule(bot.name, synced + self._ticks_until_due(bot))
+
+    def _ticks_until_due(self, bot: VirtualBot) -> int:
+        """Ticks until a bot's next non-countdown step, mirroring ``_process_bot_tick``."""
+        wait = max(0, bot.cooldown_ticks)
+        if bot.state == VirtualBotState.ONLINE_IDLE:
+            wait += max(0, bot.think_ticks)
+        elif bot.state == VirtualBotState.IN_GAME:
+            wait += IN_GAME_POLL_TICKS - 1
+        return wait + 1
+
+    def _catch_up_bot(self, bot: VirtualBot, through_tick: int) -> None:
+        """Apply the countdown-only ticks a bot skipped while waiting on the wheel."""
+        synced = self._synced_ticks.get(bot.name, through_tick)
+        elapsed = through_tick - synced
+        if elapsed <= 0:
+            return
+        self._synced_ticks[bot.name] = through_tick
+        cooling = min(bot.cooldown_ticks, elapsed) if bot.cooldown_ticks > 0 else 0
+        bot.cooldown_ticks -= cooling
+        active = elapsed - cooling
+        if active <= 0:
+            return
+        if bot.state == VirtualBotState.ONLINE_IDLE and bot.think_ticks > 0:
+            bot.think_ticks -= min(bot.think_ticks, active)
+
+    def _online_ticks(self, bot: VirtualBot) -> int:
+        """Return how many ticks a bot has been online."""
+        if bot.state == VirtualBotState.OFFLINE:
+            return 0
+        return self._wheel.now - bot.online_since
+
+    def _wake_bot(self, bot: VirtualBot) -> None:
+        """Reschedule a bot after its state was changed outside its own tick."""
+        self._synced_ticks[bot.name] = self._wheel.now
+        self._schedule_bot(bot)
 
     def _process_bot_tick(self, bot: VirtualBot) -> None:
         """Process a single bot's tick."""
@@ -1018,8 +1128,6 @@ class VirtualBotManager:
 
     def _process_online_idle_bot(self, bot: VirtualBot) -> None:
         """Process a bot that is online and idle."""
-        bot.online_ticks += 1
-
         # Count down think time
         if bot.think_ticks > 0:
             bot.think_ticks -= 1
@@ -1032,9 +1140,10 @@ class VirtualBotManager:
         config = self._config
 
         # Consider going offline if we've been online long enough
+        online_ticks = self._online_ticks(bot)
         if (
-            bot.online_ticks >= self._get_config_value(bot, "min_online_ticks")
-            and bot.online_ticks >= bot.target_online_ticks
+            online_ticks >= self._get_config_value(bot, "min_online_ticks")
+            and online_ticks >= bot.target_online_ticks
             and random.random() < self._get_config_value(bot, "go_offline_chance")  # nosec B311
         ):
             self._take_bot_offline(bot)
@@ -1058,8 +1167,6 @@ class VirtualBotManager:
 
     def _process_in_game_bot(self, bot: VirtualBot) -> None:
         """Process a bot that is in a game."""
-        bot.online_ticks += 1
-
         # Check if the game has ended
         if bot.table_id:
             table = self._server._tables.get_table(bot.table_id)
@@ -1075,7 +1182,7 @@ class VirtualBotManager:
             elif game.status == "waiting":
                 # Game hasn't started yet - check if we're host and should start
                 # Wait for the configured delay to give players time to join
-                ticks_in_game = bot.online_ticks - bot.game_join_tick
+                ticks_in_game = self._online_ticks(bot) - bot.game_join_tick
                 if (
                     game.host == bot.name
                     and len(game.players) >= game.get_min_players()
@@ -1087,8 +1194,6 @@ class VirtualBotManager:
 
     def _process_leaving_game_bot(self, bot: VirtualBot) -> None:
         """Process a bot that is leaving a game (staggered departure)."""
-        bot.online_ticks += 1
-
         # Leave the table and return to idle (or go offline)
         self._leave_current_table(bot)
 
@@ -1103,7 +1208,7 @@ class VirtualBotManager:
             )
             # Set target so they go offline on next process_online_idle
             bot.target_online_ticks = 0
-        elif bot.online_ticks >= bot.target_online_ticks:
+        elif self._online_ticks(bot) >= bot.target_online_ticks:
             self._take_bot_offline(bot)
         else:
             bot.state = VirtualBotState.ONLINE_IDLE
@@ -1239,7 +1344,7 @@ class VirtualBotManager:
 
         bot.state = VirtualBotState.IN_GAME
         bot.table_id = table.table_id
-        bot.game_join_tick = bot.online_ticks
+        bot.game_join_tick = self._online_ticks(bot)
         self._server._user_states[bot.name] = {"menu": "in_game", "table_id": table.table_id}
         state.table_id = table.table_id
         return True
@@ -1264,7 +1369,7 @@ class VirtualBotManager:
 
         bot.state = VirtualBotState.IN_GAME
         bot.table_id = table.table_id
-        bot.game_join_tick = bot.online_ticks
+        bot.game_join_tick = self._online_ticks(bot)
         self._server._user_states[bot.name] = {
             "menu": "in_game",
             "table_id": table.table_id,
@@ -1288,7 +1393,7 @@ class VirtualBotManager:
 
         # Set up bot state
         bot.state = VirtualBotState.ONLINE_IDLE
-        bot.online_ticks = 0
+        bot.online_since = self._wheel.now
         bot.target_online_ticks = random.randint(  # nosec B311
             self._get_config_value(bot, "min_online_ticks"),
             self._get_config_value(bot, "max_online_ticks"),
@@ -1319,7 +1424,6 @@ class VirtualBotManager:
             self._get_config_value(bot, "min_offline_ticks"),
             self._get_config_value(bot, "max_offline_ticks"),
         )
-        bot.online_ticks = 0
         bot.table_id = None
 
     def _leave_current_table(self, bot: VirtualBot) -> None:
@@ -1355,8 +1459,8 @@ class VirtualBotManager:
 
     def _try_join_game(self, bot: VirtualBot) -> bool:
         """Try to join an existing waiting table. Returns True if joined."""
-        # Get all waiting tables
-        tables = self._server._tables.get_waiting_tables()
+        # Tables whose game is waiting and has a free seat (cached by the manager)
+        tables = self._server._tables.get_joinable_tables()
         if not tables:
             return False
 
@@ -1388,7 +1492,7 @@ class VirtualBotManager:
         # Update bot state
         bot.state = VirtualBotState.IN_GAME
         bot.table_id = table.table_id
-        bot.game_join_tick = bot.online_ticks  # Track when we joined for start delay
+        bot.game_join_tick = self._online_ticks(bot)  # Track when we joined for start delay
         self._server._user_states[bot.name] = {
             "menu": "in_game",
             "table_id": table.table_id,
@@ -1398,17 +1502,7 @@ class VirtualBotManager:
 
     def _count_bot_owned_tables(self, game_type: str) -> int:
         """Count how many tables of a game type are owned by virtual bots."""
-        count = 0
-        for table in self._server._tables.get_all_tables():
-            if not table.game:
-                continue
-            if table.game.get_type() != game_type:
-                continue
-            # Check if the host is a virtual bot
-            host = table.game.host
-            if host and host in self._bots:
-                count += 1
-        return count
+        return self._server._tables.count_tables(game_type, HOST_KIND_VIRTUAL_BOT)
 
     def _can_create_game_type(self, game_type: str) -> bool:
         """Check if bots can create another table of this game type."""
@@ -1463,7 +1557,7 @@ class VirtualBotManager:
         # Update bot state
         bot.state = VirtualBotState.IN_GAME
         bot.table_id = table.table_id
-        bot.game_join_tick = bot.online_ticks  # Track when we created for start delay
+        bot.game_join_tick = self._online_ticks(bot)  # Track when we created for start delay
         self._server._user_states[bot.name] = {
             "menu": "in_game",
             "table_id": table.table_id,
@@ -1479,4 +1573,6 @@ class VirtualBotManager:
         """
         for bot in self._bots.values():
             if bot.table_id == table_id and bot.state == VirtualBotState.IN_GAME:
+                self._catch_up_bot(bot, self._wheel.now)
                 self._start_leaving_game(bot)
+                self._wake_bot(bot)
@@ -338,6 +338,7 @@ class ActionSetCreationMixin:
         if key not in self._keybinds:
             self._keybinds[key] = []
         self._keybinds[key].append(keybind)
+        self._keybinds_version = getattr(self, "_keybinds_version", 0) + 1
 
     def _get_keybind_for_action(self, action_id: str) -> str | None:
         """Get the keybind string for an action, if any."""
@@ -11,6 +11,11 @@ from .actions import Action, ActionSet, ResolvedAction
 class ActionSetSystemMixin:
     """Manage per-player action sets and resolve action state.
 
+    Lookups by action id or set name go through a runtime-only per-player
+    index. It is rebuilt when the player's set list is replaced or resized
+    (add/remove_action_set, deserialization) and dropped by the sets
+    themselves when an action is added or removed.
+
     Expected Game attributes:
         player_action_sets: dict[str, list[ActionSet]].
     """
@@ -19,12 +24,36 @@ class ActionSetSystemMixin:
         """Get ordered list of action sets for a player."""
         return self.player_action_sets.get(player.id, [])
 
+    def _get_action_index(
+        self, player_id: str
+    ) -> tuple[dict[str, tuple[ActionSet, Action]], dict[str, ActionSet]]:
+        """Return (action id -> (set, action), set name -> set) for a player."""
+        sets = self.player_action_sets.get(player_id)
+        if not sets:
+            return {}, {}
+        indexes = getattr(self, "_action_indexes", None)
+        if indexes is None:
+            indexes = self._action_indexes = {}
+        cached = indexes.get(player_id)
+        if cached is not None and cached[0] is sets and cached[1] == len(sets):
+            return cached[2], cached[3]
+
+        def invalidate(indexes=indexes, player_id=player_id) -> None:
+            indexes.pop(player_id, None)
+
+        by_action: dict[str, tuple[ActionSet, Action]] = {}
+        by_name: dict[str, ActionSet] = {}
+        for action_set in sets:
+            action_set._on_change = invalidate
+            by_name.setdefault(action_set.name, action_set)
+            for action_id, action in action_set._actions.items():
+                by_action.setdefault(action_id, (action_set, action))
+        indexes[player_id] = (sets, len(sets), by_action, by_name)
+        return by_action, by_name
+
     def get_action_set(self, player: "Player", name: str) -> ActionSet | None:
         """Get a specific action set by name for a player."""
-        for action_set in self.get_action_sets(player):
-            if action_set.name == name:
-                return action_set
-        return None
+        return self._get_action_index(player.id)[1].get(name)
 
     def add_action_set(self, player: "Player", action_set: ActionSet) -> None:
         """Add an action set to a player (appended to end of list)."""
@@ -41,18 +70,15 @@ class ActionSetSystemMixin:
 
     def find_action(self, player: "Player", action_id: str) -> Action | None:
         """Find an action by ID across all of a player's action sets."""
-        for action_set in self.get_action_sets(player):
-            action = action_set.get_action(action_id)
-            if action:
-                return action
-        return None
+        entry = self._get_action_index(player.id)[0].get(action_id)
+        return entry[1] if entry else None
 
     def resolve_action(self, player: "Player", action: Action) -> ResolvedAction:
         """Resolve a single action's state for a player."""
         # Find the action set containing this action
-        for action_set in self.get_action_sets(player):
-            if action_set.get_action(action.id):
-                return action_set.resolve_action(self, player, action)
+        entry = self._get_action_index(player.id)[0].get(action.id)
+        if entry:
+            return entry[0].resolve_action(self, player, action)
         # Fallback - resolve with defaults
         return ResolvedAction(
             action=action,
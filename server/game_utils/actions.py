@@ -1,10 +1,11 @@
 """Action system for games - declarative callbacks for state management."""
 
 import copy
+from functools import lru_cache
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
@@ -12,6 +13,19 @@ if TYPE_CHECKING:
     from ..games.base import Game, Player
 
 
+@lru_cache(maxsize=1024)
+def _accepts_action_id(func) -> bool:
+    """Return whether a callback takes an ``action_id`` keyword (cached per function)."""
+    return "action_id" in inspect.signature(func).parameters
+
+
+def _call_callback(method, player: "Player", action_id: str):
+    """Call an action callback, passing action_id only if it accepts one."""
+    if _accepts_action_id(getattr(method, "__func__", method)):
+        return method(player, action_id=action_id)
+    return method(player)
+
+
 class Visibility(str, Enum):
     """Visibility state for actions."""
 
@@ -104,25 +118,44 @@ class ActionSet(DataClassJSONMixin):
 
     Players have an ordered list of ActionSets (e.g., "turn" before "lobby").
     Action state is resolved declaratively via callbacks when building menus.
+
+    ``_on_change`` is a runtime-only hook set by the owning game so it can
+    drop its action-id index when actions are added or removed.
     """
 
     name: str  # e.g., "turn", "lobby", "hand"
     _actions: dict[str, Action] = field(default_factory=dict)
     _order: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self._on_change: Callable[[], None] | None = None
+
+    def _changed(self) -> None:
+        on_change = getattr(self, "_on_change", None)
+        if on_change is not None:
+            on_change()
+
     def add(self, action: Action) -> None:
         """Add an action to this set."""
         self._actions[action.id] = action
         if action.id not in self._order:
             self._order.append(action.id)
+        self._changed()
 
     def remove(self, action_id: str) -> None:
         """Remove an action from this set."""
         if action_id in self._actions:
             del self._actions[action_id]
+            self._changed()
         if action_id in self._order:
             self._order.remove(action_id)
 
+    def clear(self) -> None:
+        """Remove every action from this set."""
+        self._actions.clear()
+        self._order.clear()
+        self._changed()
+
     def remove_by_prefix(self, prefix: str) -> None:
         """Remove all actions whose ID starts with the given prefix."""
         to_remove = [aid for aid in self._actions if aid.startswith(prefix)]
@@ -142,24 +175,14 @@ class ActionSet(DataClassJSONMixin):
         if action.is_enabled:
             method = getattr(game, action.is_enabled, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    disabled_reason = method(player, action_id=action.id)
-                else:
-                    disabled_reason = method(player)
+                disabled_reason = _call_callback(method, player, action.id)
 
         # Resolve visibility
         visible = True
         if action.is_hidden:
             method = getattr(game, action.is_hidden, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    visibility = method(player, action_id=action.id)
-                else:
-                    visibility = method(player)
+                visibility = _call_callback(method, player, action.id)
                 visible = visibility == Visibility.VISIBLE
 
         # Resolve label
@@ -174,12 +197,7 @@ class ActionSet(DataClassJSONMixin):
         if action.get_sound:
             method = getattr(game, action.get_sound, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
-                    sound = method(player, action_id=action.id)
-                else:
-                    sound = method(player)
+                sound = _call_callback(method, player, action.id)
 
         return ResolvedAction(
             action=action,
@@ -235,4 +253,6 @@ class ActionSet(DataClassJSONMixin):
 
     def copy(self) -> "ActionSet":
         """Deep copy for templates."""
-        return copy.deepcopy(self)
+        clone = copy.deepcopy(self)
+        clone._on_change = None
+        return clone
@@ -14,6 +14,7 @@ class EventHandlingMixin:
         _pending_actions: dict[str, str].
         _status_box_open: set[str].
         _keybinds: dict[str, list[Keybind]].
+        _keybinds_version: int (bumped by define_keybind).
         get_user(player) -> User | None.
         find_action(player, action_id) -> Action | None.
         resolve_action(player, action) -> ResolvedAction.
@@ -21,6 +22,7 @@ class EventHandlingMixin:
         get_all_visible_actions(player) -> list[ResolvedAction].
         rebuild_player_menu(player).
         rebuild_all_menus().
+        rebuild_changed_menus(player).
         _is_player_spectator(player) -> bool.
     """
 
@@ -97,11 +99,13 @@ class EventHandlingMixin:
             if handler and handler(player, menu_item_id):
                 return
 
-        keybinds = self._keybinds.get(key)
-        if keybinds is None:
+        if key not in self._keybinds:
             return
 
         is_spectator = self._is_player_spectator(player)
+        keybinds = self._get_keybind_dispatch(player, is_spectator).get(key)
+        if not keybinds:
+            return
 
         from ..games.base import ActionContext
 
@@ -116,7 +120,44 @@ class EventHandlingMixin:
         )
 
         if self._should_rebuild_after_keybind(player, executed_any):
-            self.rebuild_all_menus()
+            self.rebuild_changed_menus(player)
+
+    def _get_keybind_dispatch(
+        self, player: "Player", is_spectator: bool
+    ) -> dict[str, tuple]:
+        """Return the player's key -> usable keybinds table.
+
+        Keybind filters (game state, spectator and player restrictions) are
+        applied once per player and reused until keybinds are redefined,
+        the game status changes or the player's spectator flag flips.
+        Whether each action is enabled is still resolved at press time.
+        """
+        keybinds = self._keybinds
+        dispatch_key = (
+            len(keybinds),
+            getattr(self, "_keybinds_version", 0),
+            getattr(self, "status", None),
+            is_spectator,
+            player.name,
+        )
+        cache = getattr(self, "_keybind_dispatch", None)
+        if cache is None:
+            cache = self._keybind_dispatch = {}
+        cached = cache.get(player.id)
+        # The keybind dict itself is held so a replaced dict can never match
+        if cached is not None and cached[0] is keybinds and cached[1] == dispatch_key:
+            return cached[2]
+        table = {}
+        for key, bound in keybinds.items():
+            usable = tuple(
+                keybind
+                for keybind in bound
+                if keybind.can_player_use(self, player, is_spectator)
+            )
+            if usable:
+                table[key] = usable
+        cache[player.id] = (keybinds, dispatch_key, table)
+        return table
 
     def _handle_actions_menu_selection(self, player: "Player", action_id: str) -> None:
         """Handle selection from the actions menu."""
@@ -217,8 +258,6 @@ class EventHandlingMixin:
     ) -> bool:
         executed_any = False
         for keybind in keybinds:
-            if not keybind.can_player_use(self, player, is_spectator):
-                continue
             if keybind.requires_focus and menu_item_id not in keybind.actions:
                 continue
             for action_id in keybind.actions:
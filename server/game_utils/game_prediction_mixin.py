@@ -55,7 +55,8 @@ class GamePredictionMixin:
         self, rating_helper: RatingHelper, players: list["Player"]
     ) -> list[tuple["Player", Any]]:
         """Collect and sort ratings for the provided players."""
-        player_ratings = [(p, rating_helper.get_rating(p.id)) for p in players]
+        ratings = rating_helper.get_ratings([p.id for p in players])
+        player_ratings = [(p, ratings[p.id]) for p in players]
         player_ratings.sort(key=lambda x: x[1].ordinal, reverse=True)
         return player_ratings
 
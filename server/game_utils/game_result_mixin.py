@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from server.core.users.base import User
 
 from .game_result import GameResult, PlayerResult
-from .stats_helpers import RatingHelper
+from .stats_helpers import RatingHelper, winner_vs_rest_rankings
 from ..messages.localization import Localization
 from server.core.users.base import MenuItem
 
@@ -39,6 +39,7 @@ class GameResultMixin:
         """
         self.game_active = False
         self.status = "finished"
+        self._table_state_changed()
 
         # Build and persist the game result
         result = self.build_game_result()
@@ -132,32 +133,7 @@ class GameResultMixin:
 
         Default: Winner first, everyone else tied for second.
         """
-        winner_name = result.custom_data.get("winner_name")
-        # Include humans and virtual bots, exclude table bots
-        human_players = [
-            p for p in result.player_results
-            if not p.is_bot or p.is_virtual_bot
-        ]
-
-        if not human_players:
-            return []
-
-        if winner_name:
-            winner_id = None
-            others = []
-            for p in human_players:
-                if p.player_name == winner_name:
-                    winner_id = p.player_id
-                else:
-                    others.append(p.player_id)
-
-            if winner_id:
-                if others:
-                    return [[winner_id], others]
-                return [[winner_id]]
-
-        # No clear winner - everyone ties
-        return [[p.player_id for p in human_players]]
+        return winner_vs_rest_rankings(result)
 
     def _show_end_screen(self, result: GameResult) -> None:
         """Show the end screen to all players using structured result."""
@@ -1,10 +1,15 @@
 """Mixin providing sound scheduling, event scheduling, and playback for games."""
 
+from bisect import bisect_right, insort
 import random
 
 
 _SOUND_RANDOM = random.Random()
 
+
+def _entry_tick(entry) -> int:
+    return entry[0]
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,6 +20,13 @@ if TYPE_CHECKING:
 class GameSoundMixin:
     """Schedule and play sounds and game events for games.
 
+    ``scheduled_sounds`` and ``event_queue`` are kept sorted by target tick
+    (ties stay in scheduling order), so due entries are always a prefix:
+    checking for due work and finding the next due tick are O(1), and
+    inserting is a binary search. Both stay plain lists, so saved games keep
+    their format; ``restore_schedule_order`` re-sorts lists loaded from saves
+    written before the queues were ordered.
+
     Expected Game attributes:
         scheduled_sounds: list of [tick, sound, vol, pan, pitch].
         sound_scheduler_tick: int.
@@ -86,7 +98,7 @@ class GameSoundMixin:
             pitch: Pitch (100 = normal).
         """
         target_tick = self.sound_scheduler_tick + delay_ticks
-        self.scheduled_sounds.append([target_tick, sound, volume, pan, pitch])
+        insort(self.scheduled_sounds, [target_tick, sound, volume, pan, pitch], key=_entry_tick)
 
     def schedule_sound_sequence(
         self,
@@ -108,20 +120,26 @@ class GameSoundMixin:
         """Clear all scheduled sounds."""
         self.scheduled_sounds.clear()
 
+    def restore_schedule_order(self) -> None:
+        """Sort loaded sound and event queues by target tick (stable)."""
+        self.scheduled_sounds.sort(key=_entry_tick)
+        self.event_queue.sort(key=_entry_tick)
+
+    def next_scheduled_tick(self) -> int | None:
+        """Return the earliest tick with a scheduled sound or event, if any."""
+        heads = [queue[0][0] for queue in (self.scheduled_sounds, self.event_queue) if queue]
+        return min(heads) if heads else None
+
     def process_scheduled_sounds(self) -> None:
         """Process scheduled sounds. Called automatically in on_tick()."""
         current_tick = self.sound_scheduler_tick
-
-        # Find and play sounds scheduled for this tick
-        remaining = []
-        for scheduled in self.scheduled_sounds:
-            tick, sound, volume, pan, pitch = scheduled
-            if tick <= current_tick:
+        scheduled = self.scheduled_sounds
+        if scheduled and scheduled[0][0] <= current_tick:
+            due_count = bisect_right(scheduled, current_tick, key=_entry_tick)
+            due = scheduled[:due_count]
+            del scheduled[:due_count]
+            for _tick, sound, volume, pan, pitch in due:
                 self.play_sound(sound, volume, pan, pitch)
-            else:
-                remaining.append(scheduled)
-
-        self.scheduled_sounds = remaining
         self.sound_scheduler_tick += 1
 
     # ==========================================================================
@@ -139,29 +157,25 @@ class GameSoundMixin:
             delay_ticks: Ticks to wait before firing (0 = next tick).
         """
         target_tick = self.sound_scheduler_tick + delay_ticks
-        self.event_queue.append((target_tick, event_type, data))
+        insort(self.event_queue, (target_tick, event_type, data), key=_entry_tick)
 
     def process_scheduled_events(self) -> None:
         """Process scheduled events. Call in on_tick() after process_scheduled_sounds().
 
-        Events whose tick has arrived are dispatched to on_game_event().
-        Uses queue-swap so events added during handling are preserved.
+        Events whose tick has arrived are dispatched to on_game_event() in
+        tick order. Due events are taken off the queue before dispatch, so
+        events scheduled while handling them wait for the next call.
         """
-        if not self.event_queue:
-            return
-
-        to_process = self.event_queue
-        self.event_queue = []
-        remaining = []
+        queue = self.event_queue
         current_tick = self.sound_scheduler_tick
+        if not queue or queue[0][0] > current_tick:
+            return
 
-        for tick, event_type, data in to_process:
-            if tick <= current_tick:
-                self.on_game_event(event_type, data)
-            else:
-                remaining.append((tick, event_type, data))
-
-        self.event_queue = remaining + self.event_queue
+        due_count = bisect_right(queue, current_tick, key=_entry_tick)
+        due = queue[:due_count]
+        del queue[:due_count]
+        for _tick, event_type, data in due:
+            self.on_game_event(event_type, data)
 
     def on_game_event(self, event_type: str, data: dict) -> None:
         """Handle a scheduled game event. Override in subclasses.
@@ -37,6 +37,7 @@ class LobbyActionsMixin:
         broadcast_l(), broadcast_sound().
         prestart_validate(), on_start().
         attach_user(), rebuild_all_menus().
+        _table_state_changed().
         get_all_enabled_actions().
         _get_keybind_for_action().
         setup_keybinds(), setup_player_actions().
@@ -61,6 +62,7 @@ class LobbyActionsMixin:
 
         # Start the game (subclasses implement this)
         self.on_start()
+        self._table_state_changed()
 
     def _bot_input_add_bot(self, player: "Player") -> str | None:
         """Get bot name for add_bot action."""
@@ -95,6 +97,7 @@ class LobbyActionsMixin:
         bot_user = Bot(bot_name)
         bot_player = self.create_player(bot_user.uuid, bot_name, is_bot=True)
         self.players.append(bot_player)
+        self._table_state_changed()
         self.attach_user(bot_player.id, bot_user)
         # Set up action sets for the bot
         self.setup_player_actions(bot_player)
@@ -107,6 +110,7 @@ class LobbyActionsMixin:
         for i in range(len(self.players) - 1, -1, -1):
             if self.players[i].is_bot:
                 bot = self.players.pop(i)
+                self._table_state_changed()
                 # Clean up action sets
                 self.player_action_sets.pop(bot.id, None)
                 self._users.pop(bot.id, None)
@@ -153,6 +157,7 @@ class LobbyActionsMixin:
         # Spectators can always leave cleanly (no bot replacement)
         if player.is_spectator:
             self.players = [p for p in self.players if p.id != player.id]
+            self._table_state_changed()
             self.player_action_sets.pop(player.id, None)
             self._users.pop(player.id, None)
             self.broadcast_l("spectator-left", player=player.name)
@@ -186,6 +191,7 @@ class LobbyActionsMixin:
 
         # Lobby or bot leaving: fully remove the player
         self.players = [p for p in self.players if p.id != player.id]
+        self._table_state_changed()
         self.player_action_sets.pop(player.id, None)
         self._users.pop(player.id, None)
 
@@ -206,6 +212,7 @@ class LobbyActionsMixin:
                 for p in self.players:
                     if not p.is_bot:
                         self.host = p.name
+                        self._table_state_changed()
                         self.broadcast_l("new-host", player=p.name)
                         break
 
@@ -285,6 +292,7 @@ class LobbyActionsMixin:
         player = self.create_player(user.uuid, name, is_bot=is_bot)
         player.is_virtual_bot = is_virtual_bot
         self.players.append(player)
+        self._table_state_changed()
         self.attach_user(player.id, user)
         # Set up action sets for the new player
         self.setup_player_actions(player)
@@ -297,6 +305,7 @@ class LobbyActionsMixin:
         player = self.create_player(user.uuid, name, is_bot=False)
         player.is_spectator = True
         self.players.append(player)
+        self._table_state_changed()
         self.attach_user(player.id, user)
         self.setup_player_actions(player)
         if hasattr(self, "_transcripts"):
@@ -19,6 +19,7 @@ class MenuManagementMixin:
         status: str.
         players: list[Player].
         _status_box_open: set[str].
+        _pending_actions / _actions_menu_open (optional, skip targeted rebuilds).
         get_user(player) -> User | None.
         get_all_visible_actions(player) -> list[ResolvedAction].
     """
@@ -48,14 +49,19 @@ class MenuManagementMixin:
         if not user:
             return
 
-        items: list[MenuItem] = []
-        for resolved in self.get_all_visible_actions(player):
-            label = resolved.label
-            if not resolved.enabled:
-                unavailable = Localization.get(user.locale, "visibility-unavailable")
-                label = f"{label}; {unavailable}"
-            items.append(MenuItem(text=label, id=resolved.action.id, sound=resolved.sound))
+        items = self._build_turn_menu_items(player, user)
+        self._show_turn_menu(player, user, items, position=position)
 
+    def _show_turn_menu(
+        self,
+        player: "Player",
+        user: "User",
+        items: list[MenuItem],
+        *,
+        position: int | None = None,
+    ) -> None:
+        """Send a built turn menu to a player and remember it."""
+        self._remember_turn_menu(player, user, items)
         user.show_menu(
             "turn_menu",
             items,
@@ -64,6 +70,67 @@ class MenuManagementMixin:
             position=position,
         )
 
+    def _build_turn_menu_items(self, player: "Player", user: "User") -> list[MenuItem]:
+        """Resolve a player's visible actions into turn menu items."""
+        items: list[MenuItem] = []
+        unavailable: str | None = None
+        for resolved in self.get_all_visible_actions(player):
+            label = resolved.label
+            if not resolved.enabled:
+                if unavailable is None:
+                    unavailable = Localization.get(user.locale, "visibility-unavailable")
+                label = f"{label}; {unavailable}"
+            items.append(MenuItem(text=label, id=resolved.action.id, sound=resolved.sound))
+        return items
+
+    def _remember_turn_menu(
+        self, player: "Player", user: "User", items: list[MenuItem]
+    ) -> None:
+        """Record the turn menu last sent to a player's current user."""
+        sent = getattr(self, "_turn_menu_sent", None)
+        if sent is None:
+            sent = self._turn_menu_sent = {}
+        sent[player.id] = (user, items)
+
+    def rebuild_changed_menus(self, acting_player: "Player") -> None:
+        """Rebuild menus after one player's action, skipping unchanged ones.
+
+        The acting player's menu is always rebuilt. Other players only get
+        a new turn menu when its items differ from the last one sent to
+        them; players with an input prompt, actions menu or status box
+        open are left alone until they close it. Changed menus still go
+        through ``rebuild_player_menu`` so game overrides apply.
+        """
+        if self._destroyed:
+            return
+        sent = getattr(self, "_turn_menu_sent", None) or {}
+        busy = (
+            getattr(self, "_pending_actions", {}).keys()
+            | getattr(self, "_actions_menu_open", set())
+            | self._status_box_open
+        )
+        for player in self.players:
+            if player.id == acting_player.id:
+                self.rebuild_player_menu(player)
+                continue
+            user = self.get_user(player)
+            previous = sent.get(player.id)
+            if previous is None or previous[0] is not user:
+                self.rebuild_player_menu(player)
+                continue
+            if player.id in busy or self.status == "finished":
+                continue
+            self._prepare_turn_menu(player)
+            if self._build_turn_menu_items(player, user) != previous[1]:
+                self.rebuild_player_menu(player)
+
+    def _prepare_turn_menu(self, player: "Player") -> None:
+        """Bring a player's turn actions up to date before menu items are built.
+
+        Games that regenerate turn actions in ``rebuild_player_menu`` should
+        do that here too, so ``rebuild_changed_menus`` compares fresh items.
+        """
+
     def rebuild_all_menus(self) -> None:
         """Rebuild menus for all players."""
         if self._destroyed:
@@ -85,14 +152,8 @@ class MenuManagementMixin:
         if not user:
             return
 
-        items: list[MenuItem] = []
-        for resolved in self.get_all_visible_actions(player):
-            label = resolved.label
-            if not resolved.enabled:
-                unavailable = Localization.get(user.locale, "visibility-unavailable")
-                label = f"{label}; {unavailable}"
-            items.append(MenuItem(text=label, id=resolved.action.id, sound=resolved.sound))
-
+        items = self._build_turn_menu_items(player, user)
+        self._remember_turn_menu(player, user, items)
         user.update_menu("turn_menu", items, selection_id=selection_id)
 
     def update_all_menus(self) -> None:
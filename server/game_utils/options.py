@@ -25,6 +25,7 @@ Usage:
 """
 
 from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Any, Callable, TYPE_CHECKING
 
 from mashumaro.mixins.json import DataClassJSONMixin
@@ -545,51 +546,128 @@ def option_field(
     return field(default=meta.default, metadata=metadata)
 
 
+VisibilityCondition = tuple[str, Callable[[Any], bool]]
+ValueOverride = tuple[str, Callable[[Any], bool], Any, bool]
+
+
+@dataclass(frozen=True)
+class OptionsSchema:
+    """Option metadata compiled once per options class.
+
+    Reading field metadata through ``dataclasses.fields`` on every lookup
+    made lobby menu rebuilds scale with the number of options squared;
+    the schema keeps the same information in read-only lookup tables.
+    """
+
+    field_order: tuple[str, ...]
+    metas: MappingProxyType
+    group_metas: MappingProxyType
+    field_groups: MappingProxyType
+    visibility: MappingProxyType
+    value_overrides: MappingProxyType
+    # ref option name -> ((dependent option, predicate, forced value), ...)
+    overrides_by_ref: MappingProxyType
+    # parent group (None = top level) -> option names / group names at that level
+    options_by_group: MappingProxyType
+    groups_by_group: MappingProxyType
+
+    @classmethod
+    def compile(cls, options_class: type) -> "OptionsSchema":
+        """Build the schema for a dataclass options class."""
+        field_order: list[str] = []
+        metas: dict[str, OptionMeta] = {}
+        group_metas: dict[str, OptionGroupMeta] = {}
+        field_groups: dict[str, str] = {}
+        visibility: dict[str, list[VisibilityCondition]] = {}
+        value_overrides: dict[str, list[ValueOverride]] = {}
+        overrides_by_ref: dict[str, list[tuple[str, Callable[[Any], bool], Any]]] = {}
+        options_by_group: dict[str | None, list[str]] = {}
+        groups_by_group: dict[str | None, list[str]] = {}
+
+        for f in fields(options_class):
+            field_order.append(f.name)
+            group = f.metadata.get("option_group")
+            if group is not None:
+                field_groups[f.name] = group
+            meta = f.metadata.get("option_meta")
+            if meta is not None:
+                metas[f.name] = meta
+                options_by_group.setdefault(group, []).append(f.name)
+            group_meta = f.metadata.get("option_group_meta")
+            if group_meta is not None:
+                group_metas[f.name] = group_meta
+                groups_by_group.setdefault(group, []).append(f.name)
+            conditions = f.metadata.get("visible_when")
+            if conditions is not None:
+                visibility[f.name] = conditions
+            overrides = f.metadata.get("value_when")
+            if overrides:
+                value_overrides[f.name] = overrides
+                for ref_name, predicate, forced_value, _enforce in overrides:
+                    overrides_by_ref.setdefault(ref_name, []).append(
+                        (f.name, predicate, forced_value)
+                    )
+
+        return cls(
+            field_order=tuple(field_order),
+            metas=MappingProxyType(metas),
+            group_metas=MappingProxyType(group_metas),
+            field_groups=MappingProxyType(field_groups),
+            visibility=MappingProxyType(visibility),
+            value_overrides=MappingProxyType(
+                {name: tuple(entries) for name, entries in value_overrides.items()}
+            ),
+            overrides_by_ref=MappingProxyType(
+                {name: tuple(entries) for name, entries in overrides_by_ref.items()}
+            ),
+            options_by_group=MappingProxyType(
+                {group: tuple(names) for group, names in options_by_group.items()}
+            ),
+            groups_by_group=MappingProxyType(
+                {group: tuple(names) for group, names in groups_by_group.items()}
+            ),
+        )
+
+
+def get_options_schema(options_class: type | Any) -> OptionsSchema:
+    """Return the compiled schema for an options class (or instance).
+
+    The schema is stored on the class itself; subclasses get their own.
+    """
+    if not isinstance(options_class, type):
+        options_class = type(options_class)
+    schema = options_class.__dict__.get("_options_schema")
+    if schema is None:
+        schema = OptionsSchema.compile(options_class)
+        options_class._options_schema = schema
+    return schema
+
+
 def get_option_meta(options_class: type, field_name: str) -> OptionMeta | None:
     """Get OptionMeta for a field, if present."""
-    for f in fields(options_class):
-        if f.name == field_name:
-            return f.metadata.get("option_meta")
-    return None
+    return get_options_schema(options_class).metas.get(field_name)
 
 
 def get_all_option_metas(options_class: type) -> dict[str, OptionMeta]:
     """Get all OptionMeta instances from an options class."""
-    result = {}
-    for f in fields(options_class):
-        meta = f.metadata.get("option_meta")
-        if meta is not None:
-            result[f.name] = meta
-    return result
+    return dict(get_options_schema(options_class).metas)
 
 
 def get_all_option_group_metas(options_class: type) -> dict[str, OptionGroupMeta]:
     """Get all OptionGroupMeta instances from an options class."""
-    result = {}
-    for f in fields(options_class):
-        meta = f.metadata.get("option_group_meta")
-        if meta is not None:
-            result[f.name] = meta
-    return result
+    return dict(get_options_schema(options_class).group_metas)
 
 
 def get_option_field_group(options_class: type, field_name: str) -> str | None:
     """Get the group name for an option field, if assigned to a group."""
-    for f in fields(options_class):
-        if f.name == field_name:
-            return f.metadata.get("option_group")
-    return None
+    return get_options_schema(options_class).field_groups.get(field_name)
 
 
 def get_visibility_conditions(
     options_class: type, field_name: str
 ) -> list[tuple[str, Callable[[Any], bool]]] | None:
     """Get the visible_when conditions for an option field, if present."""
-    for f in fields(options_class):
-        if f.name == field_name:
-            return f.metadata.get("visible_when")
-    return None
-
+    return get_options_schema(options_class).visibility.get(field_name)
 
 
 @dataclass
@@ -610,7 +688,7 @@ class GameOptions(DataClassJSONMixin):
 
     def _is_option_visible(self, name: str) -> bool:
         """Check if an option passes all visible_when conditions (AND logic)."""
-        conditions = get_visibility_conditions(type(self), name)
+        conditions = get_options_schema(type(self)).visibility.get(name)
         if not conditions:
             return True
         for ref_name, predicate in conditions:
@@ -625,39 +703,26 @@ class GameOptions(DataClassJSONMixin):
         Returns True when any value_when entry has enforce=True and its
         predicate is currently active.
         """
-        options_class = type(self)
-        for f in fields(options_class):
-            if f.name != name:
-                continue
-            overrides = f.metadata.get("value_when")
-            if not overrides:
-                return False
-            for ref_name, predicate, _forced_value, enforce in overrides:
-                if enforce:
-                    ref_value = getattr(self, ref_name, None)
-                    if predicate(ref_value):
-                        return True
-            return False
+        overrides = get_options_schema(type(self)).value_overrides.get(name, ())
+        for ref_name, predicate, _forced_value, enforce in overrides:
+            if enforce:
+                ref_value = getattr(self, ref_name, None)
+                if predicate(ref_value):
+                    return True
         return False
 
     def _apply_value_overrides(self, changed_option: str) -> None:
         """Apply value_when overrides triggered by a change to changed_option.
 
-        Scans all option fields for value_when conditions referencing
-        changed_option. When the predicate matches, sets the dependent
+        Looks up the value_when conditions referencing changed_option in the
+        compiled schema. When the predicate matches, sets the dependent
         option to the forced value.
         """
-        options_class = type(self)
+        dependents = get_options_schema(type(self)).overrides_by_ref.get(changed_option, ())
         changed_value = getattr(self, changed_option, None)
-        for f in fields(options_class):
-            overrides = f.metadata.get("value_when")
-            if not overrides:
-                continue
-            for ref_name, predicate, forced_value, _enforce in overrides:
-                if ref_name != changed_option:
-                    continue
-                if predicate(changed_value):
-                    setattr(self, f.name, forced_value)
+        for name, predicate, forced_value in dependents:
+            if predicate(changed_value):
+                setattr(self, name, forced_value)
 
     def _get_options_path(self, game: "Game", player: "Player") -> list[str]:
         """Get the current options navigation path for a player."""
@@ -670,7 +735,7 @@ class GameOptions(DataClassJSONMixin):
     ) -> None:
         """Populate an action set with options for the player's current path."""
         path = self._get_options_path(game, player)
-        options_class = type(self)
+        schema = get_options_schema(type(self))
 
         if path:
             current_level = path[-1]
@@ -680,7 +745,7 @@ class GameOptions(DataClassJSONMixin):
             if current_level.startswith("group:") and len(path) >= 2:
                 option_name = path[-2]
                 group_name = current_level.removeprefix("group:")
-                meta = get_option_meta(options_class, option_name)
+                meta = schema.metas.get(option_name)
                 if meta and isinstance(meta, MultiSelectOption):
                     groups = meta.get_groups()
                     if groups and group_name in groups:
@@ -731,7 +796,7 @@ class GameOptions(DataClassJSONMixin):
                         return
 
             # Check if current level is a MultiSelectOption
-            meta = get_option_meta(options_class, current_level)
+            meta = schema.metas.get(current_level)
             if meta and isinstance(meta, MultiSelectOption):
                 current_selections = getattr(self, current_level, [])
                 groups = meta.get_groups()
@@ -807,18 +872,15 @@ class GameOptions(DataClassJSONMixin):
             target_group = None
 
         # Add option group headers at this level
-        for group_name, group_meta in self.get_option_group_metas().items():
-            # Groups are top-level only if they have no group assignment themselves
-            group_parent = get_option_field_group(options_class, group_name)
-            if group_parent == target_group:
-                action = group_meta.create_action(group_name, game, player, locale)
-                action_set.add(action)
+        # (groups are top-level only if they have no group assignment themselves)
+        for group_name in schema.groups_by_group.get(target_group, ()):
+            group_meta = schema.group_metas[group_name]
+            action = group_meta.create_action(group_name, game, player, locale)
+            action_set.add(action)
 
         # Add regular options at this level
-        for name, meta in self.get_option_metas().items():
-            option_group_name = get_option_field_group(options_class, name)
-            if option_group_name != target_group:
-                continue
+        for name in schema.options_by_group.get(target_group, ()):
+            meta = schema.metas[name]
             # Check linked visibility
             if not self._is_option_visible(name):
                 continue
@@ -858,8 +920,7 @@ class GameOptions(DataClassJSONMixin):
         for player in game.players:
             existing_set = game.get_action_set(player, "options")
             if existing_set:
-                existing_set._actions.clear()
-                existing_set._order.clear()
+                existing_set.clear()
                 user = game.get_user(player)
                 locale = user.locale if user else "en"
                 self._populate_action_set(existing_set, game, player, locale)
@@ -7,12 +7,15 @@ Provides:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+import time
 from typing import Any, Callable, TYPE_CHECKING
 
 from openskill.models import PlackettLuce
 
+from .game_result import GameResult, PlayerResult
+
 if TYPE_CHECKING:
-    from .game_result import GameResult
     from ..persistence.database import Database
 
 
@@ -177,6 +180,62 @@ class PlayerRating:
         return f"{self.mu:.1f} ± {self.sigma:.1f}"
 
 
+@dataclass
+class RatingRebuild:
+    """Summary of a rating rebuild for one game type.
+
+    Attributes:
+        game_type: Game type that was rebuilt.
+        games: Results replayed into the ratings.
+        skipped: Results with fewer than two placements.
+        players: Players that ended up with a rating.
+        seconds: Wall-clock time for the replay and the write.
+    """
+
+    game_type: str
+    games: int
+    skipped: int
+    players: int
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        """Replay throughput."""
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+
+def winner_vs_rest_rankings(result: GameResult) -> list[list[str]]:
+    """Rank the winner first and everyone else tied for second.
+
+    Humans and virtual bots are ranked; table bots are left out. When the
+    result names no winner, everyone ties.
+    """
+    winner_name = result.custom_data.get("winner_name")
+    human_players = [
+        p for p in result.player_results
+        if not p.is_bot or p.is_virtual_bot
+    ]
+
+    if not human_players:
+        return []
+
+    if winner_name:
+        winner_id = None
+        others = []
+        for p in human_players:
+            if p.player_name == winner_name:
+                winner_id = p.player_id
+            else:
+                others.append(p.player_id)
+
+        if winner_id:
+            if others:
+                return [[winner_id], others]
+            return [[winner_id]]
+
+    return [[p.player_id for p in human_players]]
+
+
 class RatingHelper:
     """Track player ratings using OpenSkill (Plackett-Luce).
 
@@ -206,19 +265,16 @@ class RatingHelper:
 
         Returns default rating if player has no rating history.
         """
-        result = self.db.get_player_rating(player_id, self.game_type)
-        if result:
-            mu, sigma = result
-            return PlayerRating(player_id=player_id, mu=mu, sigma=sigma)
-        return PlayerRating(
-            player_id=player_id,
-            mu=self.DEFAULT_MU,
-            sigma=self.DEFAULT_SIGMA,
-        )
+        return self.get_ratings([player_id])[player_id]
 
     def get_ratings(self, player_ids: list[str]) -> dict[str, PlayerRating]:
-        """Get ratings for multiple players."""
-        return {pid: self.get_rating(pid) for pid in player_ids}
+        """Get ratings for multiple players with a single database lookup."""
+        stored = self.db.get_player_ratings(player_ids, self.game_type)
+        ratings = {}
+        for pid in player_ids:
+            mu, sigma = stored.get(pid, (self.DEFAULT_MU, self.DEFAULT_SIGMA))
+            ratings[pid] = PlayerRating(player_id=pid, mu=mu, sigma=sigma)
+        return ratings
 
     def update_ratings(
         self,
@@ -260,21 +316,22 @@ class RatingHelper:
         # Calculate new ratings
         new_teams = self.model.rate(teams)
 
-        # Update database and build result
+        # Build result and update database
         updated_ratings: dict[str, PlayerRating] = {}
 
         for group_idx, group in enumerate(rankings):
             for player_idx, pid in enumerate(group):
                 new_rating = new_teams[group_idx][player_idx]
-                self.db.set_player_rating(
-                    pid, self.game_type, new_rating.mu, new_rating.sigma
-                )
                 updated_ratings[pid] = PlayerRating(
                     player_id=pid,
                     mu=new_rating.mu,
                     sigma=new_rating.sigma,
                 )
 
+        self.db.set_player_ratings(
+            self.game_type,
+            [(pid, rating.mu, rating.sigma) for pid, rating in updated_ratings.items()],
+        )
         return updated_ratings
 
     def update_from_result(
@@ -294,35 +351,7 @@ class RatingHelper:
             Dictionary of updated ratings.
         """
         if ranking_extractor is None:
-            # Default: winner first, everyone else tied for second
-            def ranking_extractor(r: "GameResult") -> list[list[str]]:
-                """Build winner-vs-rest rankings from a GameResult."""
-                winner_name = r.custom_data.get("winner_name")
-                # Include humans and virtual bots, exclude table bots
-                human_players = [
-                    p for p in r.player_results
-                    if not p.is_bot or p.is_virtual_bot
-                ]
-
-                if not human_players:
-                    return []
-
-                if winner_name:
-                    winner_id = None
-                    others = []
-                    for p in human_players:
-                        if p.player_name == winner_name:
-                            winner_id = p.player_id
-                        else:
-                            others.append(p.player_id)
-
-                    if winner_id:
-                        if others:
-                            return [[winner_id], others]
-                        return [[winner_id]]
-
-                # No clear winner - everyone ties
-                return [[p.player_id for p in human_players]]
+            ranking_extractor = winner_vs_rest_rankings
 
         rankings = ranking_extractor(result)
         if not rankings:
@@ -330,6 +359,68 @@ class RatingHelper:
 
         return self.update_ratings(rankings)
 
+    def rebuild(
+        self,
+        ranking_extractor: Callable[[GameResult], list[list[str]]] | None = None,
+        page_size: int = 500,
+    ) -> RatingRebuild:
+        """
+        Recompute every rating for this game type from stored results.
+
+        Results are replayed oldest first against in-memory ratings, starting
+        everyone from the default, and the final ratings replace the stored
+        ones in a single write. Like live updates, results with fewer than
+        two placements are skipped.
+
+        Args:
+            ranking_extractor: Function to extract rankings from a result.
+                               Defaults to winner_vs_rest_rankings.
+            page_size: Results read from the database per query.
+        """
+        if ranking_extractor is None:
+            ranking_extractor = winner_vs_rest_rankings
+
+        started = time.perf_counter()
+        ratings: dict[str, Any] = {}
+        games = skipped = 0
+        for row in self.db.iter_game_results(self.game_type, page_size):
+            result = GameResult(
+                game_type=self.game_type,
+                timestamp=row["timestamp"],
+                duration_ticks=row["duration_ticks"] or 0,
+                player_results=[PlayerResult(**p) for p in row["players"]],
+                custom_data=row["custom_data"],
+            )
+            rankings = ranking_extractor(result)
+            if len(rankings) < 2:
+                skipped += 1
+                continue
+
+            teams = [
+                [
+                    ratings.get(pid)
+                    or self.model.rating(mu=self.DEFAULT_MU, sigma=self.DEFAULT_SIGMA)
+                    for pid in group
+                ]
+                for group in rankings
+            ]
+            for group, new_group in zip(rankings, self.model.rate(teams)):
+                for pid, new_rating in zip(group, new_group):
+                    ratings[pid] = new_rating
+            games += 1
+
+        self.db.replace_player_ratings(
+            self.game_type,
+            [(pid, r.mu, r.sigma) for pid, r in ratings.items()],
+        )
+        return RatingRebuild(
+            game_type=self.game_type,
+            games=games,
+            skipped=skipped,
+            players=len(ratings),
+            seconds=time.perf_counter() - started,
+        )
+
     def get_leaderboard(self, limit: int = 10) -> list[PlayerRating]:
         """
         Get the rating leaderboard for this game type.
@@ -350,11 +441,23 @@ class RatingHelper:
 
         Returns a value between 0 and 1.
         """
-        r1 = self.get_rating(player1_id)
-        r2 = self.get_rating(player2_id)
+        first, second = sorted((player1_id, player2_id))
+        ratings = self.get_ratings([first, second])
+        r1, r2 = ratings[first], ratings[second]
+        probability = _predict_first_wins(r1.mu, r1.sigma, r2.mu, r2.sigma)
+        return probability if first == player1_id else 1 - probability
+
+
+_PREDICTION_MODEL = PlackettLuce()
 
-        rating1 = self.model.rating(mu=r1.mu, sigma=r1.sigma)
-        rating2 = self.model.rating(mu=r2.mu, sigma=r2.sigma)
 
-        # Use OpenSkill's predict_win
-        return self.model.predict_win([[rating1], [rating2]])[0]
+@lru_cache(maxsize=4096)
+def _predict_first_wins(mu1: float, sigma1: float, mu2: float, sigma2: float) -> float:
+    """Memoized OpenSkill head-to-head prediction.
+
+    Keyed by the two ratings rather than the player ids, so a rating update
+    naturally misses the cache instead of needing an explicit invalidation.
+    """
+    rating1 = _PREDICTION_MODEL.rating(mu=mu1, sigma=sigma1)
+    rating2 = _PREDICTION_MODEL.rating(mu=mu2, sigma=sigma2)
+    return _PREDICTION_MODEL.predict_win([[rating1], [rating2]])[0]
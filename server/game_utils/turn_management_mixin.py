@@ -16,6 +16,8 @@ class TurnManagementMixin:
         turn_direction: int.
         turn_skip_count: int.
         get_player_by_id(player_id) -> Player | None.
+        _player_indexes() -> (id index, name index).
+        _player_index_version, _turn_players_key, _turn_players_cache.
         get_user(player) -> User | None.
         broadcast_l(message_id, **kwargs).
         rebuild_all_menus().
@@ -132,9 +134,23 @@ class TurnManagementMixin:
 
     @property
     def turn_players(self) -> list["Player"]:
-        """Get the list of players in turn order."""
-        return [
-            p
-            for player_id in self.turn_player_ids
-            if (p := self.get_player_by_id(player_id)) is not None
-        ]
+        """Get the list of players in turn order.
+
+        The resolved list is cached until ``turn_player_ids`` is reassigned
+        or resized, or the player index is rebuilt.
+        """
+        by_id = self._player_indexes()[0]
+        turn_ids = self.turn_player_ids
+        version = self._player_index_version
+        cached = self._turn_players_key
+        if (
+            cached is None
+            or cached[0] is not turn_ids
+            or cached[1] != len(turn_ids)
+            or cached[2] != version
+        ):
+            self._turn_players_cache = [
+                p for player_id in turn_ids if (p := by_id.get(player_id)) is not None
+            ]
+            self._turn_players_key = (turn_ids, len(turn_ids), version)
+        return list(self._turn_players_cache)
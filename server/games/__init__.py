@@ -1,43 +1,28 @@
 """Game implementations."""
 
 from .base import Game
+from .manifest import GAME_MANIFEST, GameManifestEntry
 from .registry import GameRegistry, register_game, get_game_class
 
-# Import all games to trigger registration
-from .pig.game import PigGame
-from .scopa.game import ScopaGame
-from .lightturret.game import LightTurretGame
-from .threes.game import ThreesGame
-from .milebymile.game import MileByMileGame
-from .chaosbear.game import ChaosBearGame
-from .farkle.game import FarkleGame
-from .yahtzee.game import YahtzeeGame
-from .ninetynine.game import NinetyNineGame
-from .tradeoff.game import TradeoffGame
-from .pirates.game import PiratesGame
-from .leftrightcenter.game import LeftRightCenterGame
-from .ludo.game import LudoGame
-from .tossup.game import TossUpGame
-from .midnight.game import MidnightGame
-from .ageofheroes.game import AgeOfHeroesGame
-from .fivecarddraw.game import FiveCardDrawGame
-from .holdem.game import HoldemGame
-from .crazyeights.game import CrazyEightsGame
-from .monopoly.game import MonopolyGame
-from .snakesandladders.game import SnakesAndLaddersGame
-from .rollingballs.game import RollingBallsGame
-from .sorry.game import SorryGame
-from .metalpipe.game import MetalPipeGame
-from .humanitycards.game import HumanityCardsGame
-from .nine.game import NineGame
-from .blackjack.game import BlackjackGame
-from .twentyone import TwentyOneGame
+# Game modules are imported on first use; see registry.GameRegistry.get.
+_LAZY_GAME_CLASSES = {entry.class_name: entry.game_type for entry in GAME_MANIFEST}
+
+
+def __getattr__(name: str):
+    game_type = _LAZY_GAME_CLASSES.get(name)
+    if game_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    game_class = GameRegistry.get(game_type)
+    globals()[name] = game_class
+    return game_class
+
 
 __all__ = [
     "Game",
     "GameRegistry",
     "register_game",
     "get_game_class",
+    "GameManifestEntry",
     "PigGame",
     "ScopaGame",
     "LightTurretGame",
@@ -82,6 +82,7 @@ class Player(DataClassJSONMixin):
 GameOptions = DeclarativeGameOptions
 
 
+# Game fields the table manager indexes (see TableManager._index_key)
 @dataclass
 class Game(
     ABC,
@@ -159,6 +160,16 @@ class Game(
     # Team manager (serialized for persistence)
     _team_manager: TeamManager = field(default_factory=TeamManager)
 
+    def _table_state_changed(self) -> None:
+        """Tell the table that the game's status, host or player list changed.
+
+        Call this after assigning ``status`` or ``host`` and after changing
+        ``players``; the table manager only reindexes tables that report.
+        """
+        table = self.__dict__.get("_table")
+        if table is not None:
+            table.game_state_changed()
+
     def __post_init__(self):
         """Initialize non-serialized state."""
         # These are runtime-only, not serialized
@@ -184,6 +195,10 @@ class Game(
         self._estimate_lock: threading.Lock = threading.Lock()  # Protect results list
         self._transcripts: dict[str, list[dict[str, str]]] = {}
         self._options_path: dict[str, list[str]] = {}  # player_id -> options nav stack
+        # Player lookup indexes, rebuilt whenever players/turn_player_ids change
+        self._invalidate_player_index()
+        # Saves from before the scheduler kept its queues ordered may be unsorted
+        self.restore_schedule_order()
 
     def rebuild_runtime_state(self) -> None:
         """Rebuild runtime-only state after deserialization.
@@ -192,7 +207,7 @@ class Game(
         management and sound scheduling are stored in serialized fields, so
         they do not require rebuilding.
         """
-        pass
+        self._invalidate_player_index()
 
     # Abstract methods games must implement
 
@@ -331,17 +346,38 @@ class Game(
 
     def get_player_by_id(self, player_id: str) -> Player | None:
         """Get a player by ID (UUID)."""
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        return self._player_indexes()[0].get(player_id)
 
     def get_player_by_name(self, name: str) -> Player | None:
         """Get a player by display name. Note: Names may not be unique."""
-        for player in self.players:
-            if player.name == name:
-                return player
-        return None
+        return self._player_indexes()[1].get(name)
+
+    def _invalidate_player_index(self) -> None:
+        """Drop the runtime player indexes and cached turn order."""
+        self._player_index_key: tuple[list[Player], int] | None = None
+        self._players_by_id: dict[str, Player] = {}
+        self._players_by_name: dict[str, Player] = {}
+        self._player_index_version: int = getattr(self, "_player_index_version", 0) + 1
+        self._turn_players_key: tuple[list[str], int, int] | None = None
+        self._turn_players_cache: list[Player] = []
+
+    def _player_indexes(self) -> tuple[dict[str, Player], dict[str, Player]]:
+        """Return the id and name indexes, rebuilding them if players changed.
+
+        The indexes are keyed on the identity and length of ``players``, so
+        appends, removals and list reassignment all trigger a rebuild.
+        """
+        players = self.players
+        cached = self._player_index_key
+        if cached is None or cached[0] is not players or cached[1] != len(players):
+            self._invalidate_player_index()
+            by_name: dict[str, Player] = {}
+            for player in players:
+                by_name.setdefault(player.name, player)
+            self._players_by_id = {player.id: player for player in players}
+            self._players_by_name = by_name
+            self._player_index_key = (players, len(players))
+        return self._players_by_id, self._players_by_name
 
     def _reset_transcripts(self) -> None:
         """Initialize transcript storage for seated players."""
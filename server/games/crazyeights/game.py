@@ -160,6 +160,7 @@ class CrazyEightsGame(Game):
         for i in range(len(self.players) - 1, -1, -1):
             if self.players[i].is_bot:
                 bot = self.players.pop(i)
+                self._table_state_changed()
                 self.player_action_sets.pop(bot.id, None)
                 self._users.pop(bot.id, None)
                 self.broadcast_l("table-left", player=bot.name)
@@ -185,6 +186,7 @@ class CrazyEightsGame(Game):
             return
 
         self.players = [p for p in self.players if p.id != player.id]
+        self._table_state_changed()
         self.player_action_sets.pop(player.id, None)
         self._users.pop(player.id, None)
         self.broadcast_l("table-left", player=player.name)
@@ -201,6 +203,7 @@ class CrazyEightsGame(Game):
                 for p in self.players:
                     if not p.is_bot:
                         self.host = p.name
+                        self._table_state_changed()
                         self.broadcast_l("new-host", player=p.name)
                         break
 
@@ -337,6 +340,9 @@ class CrazyEightsGame(Game):
         self._sync_turn_actions(player)
         super().rebuild_player_menu(player)
 
+    def _prepare_turn_menu(self, player: Player) -> None:
+        self._sync_turn_actions(player)
+
     def update_player_menu(self, player: Player, selection_id: str | None = None) -> None:
         self._sync_turn_actions(player)
         super().update_player_menu(player, selection_id=selection_id)
@@ -491,14 +491,8 @@ class FarkleGame(ActionGuardMixin, RoundBasedGameMixin, Game):
         user = self.get_user(player)
         locale = user.locale if user else "en"
 
-        # Remove old scoring actions from _actions dict
-        old_actions = [
-            action_id
-            for action_id in turn_set._actions.keys()
-            if action_id.startswith("score_")
-        ]
-        for action_id in old_actions:
-            del turn_set._actions[action_id]
+        # Remove old scoring actions
+        turn_set.remove_by_prefix("score_")
 
         # Get available combinations
         combos = get_available_combinations(player.current_roll)
@@ -512,15 +506,16 @@ class FarkleGame(ActionGuardMixin, RoundBasedGameMixin, Game):
             display_points = points * max(1, player.hot_dice_multiplier)
             label = self._get_combo_label(locale, combo_type, number, display_points)
 
-            turn_set._actions[action_id] = Action(
-                id=action_id,
-                label=label,
-                handler="_action_take_combo",
-                is_enabled="_is_scoring_action_enabled",
-                is_hidden="_is_scoring_action_hidden",
-                show_in_actions_menu=False,
+            turn_set.add(
+                Action(
+                    id=action_id,
+                    label=label,
+                    handler="_action_take_combo",
+                    is_enabled="_is_scoring_action_enabled",
+                    is_hidden="_is_scoring_action_hidden",
+                    show_in_actions_menu=False,
+                )
             )
-            turn_set._order.append(action_id)
 
         # Add roll, bank, check_turn_score after scoring actions
         for action_id in ["roll", "bank", "check_turn_score"]:
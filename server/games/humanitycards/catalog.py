@@ -0,0 +1,159 @@
+"""
+Process-wide card catalog for Humanity Cards.
+
+The pack file is parsed once per process into flat, read-only arrays and
+every card gets a compact integer id (its position in the catalog). Game
+state stores only these ids; card text is resolved when it is rendered.
+Ids shift whenever the pack file changes, so saves also record the
+catalog's ``fingerprint`` and are migrated by text when it no longer
+matches.
+
+White and black cards have separate id spaces. Cards of one pack occupy a
+contiguous id range, so building a deck from a set of packs is a handful
+of ``range`` slices rather than a copy of every card dict.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+import hashlib
+import json
+from pathlib import Path
+import threading
+
+PACKS_PATH = Path(__file__).parent / "humanity_packs.json"
+
+
+@dataclass(frozen=True)
+class HumanityCatalog:
+    """Immutable card catalog shared by all Humanity Cards tables.
+
+    Attributes:
+        pack_names: Pack names in file order.
+        white_texts: White card text by white id (trailing period trimmed).
+        black_texts: Black card text by black id.
+        black_picks: Number of white cards each black card needs.
+        white_ranges: ``(start, stop)`` white id range per pack index.
+        black_ranges: ``(start, stop)`` black id range per pack index.
+        fingerprint: Hash of everything card ids depend on.
+    """
+
+    pack_names: tuple[str, ...]
+    white_texts: tuple[str, ...]
+    black_texts: tuple[str, ...]
+    black_picks: array
+    white_ranges: tuple[tuple[int, int], ...]
+    black_ranges: tuple[tuple[int, int], ...]
+    fingerprint: str = ""
+    _text_lookups: dict[str, dict[str, int]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_packs(cls, packs: list[dict]) -> "HumanityCatalog":
+        """Build a catalog from the raw pack list."""
+        pack_names: list[str] = []
+        white_texts: list[str] = []
+        black_texts: list[str] = []
+        black_picks = array("B")
+        white_ranges: list[tuple[int, int]] = []
+        black_ranges: list[tuple[int, int]] = []
+
+        for pack in packs:
+            pack_names.append(pack["name"])
+
+            start = len(white_texts)
+            for card in pack.get("white", []):
+                white_texts.append(card["text"].rstrip("."))
+            white_ranges.append((start, len(white_texts)))
+
+            start = len(black_texts)
+            for card in pack.get("black", []):
+                text = card["text"]
+                pick = text.count("_")
+                if pick == 0:
+                    pick = 1  # Cards with no blanks get 1 pick
+                black_texts.append(text)
+                black_picks.append(min(pick, 255))
+            black_ranges.append((start, len(black_texts)))
+
+        digest = hashlib.sha256()
+        for name, white_range, black_range in zip(pack_names, white_ranges, black_ranges):
+            digest.update(f"{name}\0{white_range}\0{black_range}\0".encode())
+        for text in white_texts + black_texts:
+            digest.update(text.encode())
+            digest.update(b"\0")
+
+        return cls(
+            pack_names=tuple(pack_names),
+            white_texts=tuple(white_texts),
+            black_texts=tuple(black_texts),
+            black_picks=black_picks,
+            white_ranges=tuple(white_ranges),
+            black_ranges=tuple(black_ranges),
+            fingerprint=digest.hexdigest()[:16],
+        )
+
+    def _pack_indices(self, pack_names: list[str] | set[str]) -> list[int]:
+        wanted = set(pack_names)
+        return [i for i, name in enumerate(self.pack_names) if name in wanted]
+
+    def white_ids_for_packs(self, pack_names: list[str] | set[str]) -> list[int]:
+        """Get all white card ids belonging to the given packs."""
+        ids: list[int] = []
+        for i in self._pack_indices(pack_names):
+            ids.extend(range(*self.white_ranges[i]))
+        return ids
+
+    def black_ids_for_packs(self, pack_names: list[str] | set[str]) -> list[int]:
+        """Get all black card ids belonging to the given packs."""
+        ids: list[int] = []
+        for i in self._pack_indices(pack_names):
+            ids.extend(range(*self.black_ranges[i]))
+        return ids
+
+    def white_text(self, card_id: int) -> str:
+        """Get the text of a white card."""
+        return self.white_texts[card_id]
+
+    def black_text(self, card_id: int) -> str:
+        """Get the text of a black card."""
+        return self.black_texts[card_id]
+
+    def black_pick(self, card_id: int) -> int:
+        """Get how many white cards a black card needs."""
+        return self.black_picks[card_id]
+
+    def white_id_for_text(self, text: str) -> int | None:
+        """Find a white card id by text (used to migrate legacy saves)."""
+        return self._text_lookup("white").get(text.rstrip("."))
+
+    def black_id_for_text(self, text: str) -> int | None:
+        """Find a black card id by text (used to migrate legacy saves)."""
+        return self._text_lookup("black").get(text)
+
+    def _text_lookup(self, color: str) -> dict[str, int]:
+        """Build (once) a text -> id map; only needed for legacy saves."""
+        lookup = self._text_lookups.get(color)
+        if lookup is None:
+            texts = self.white_texts if color == "white" else self.black_texts
+            lookup = {}
+            for card_id, text in enumerate(texts):
+                lookup.setdefault(text, card_id)
+            self._text_lookups[color] = lookup
+        return lookup
+
+
+_catalog: HumanityCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> HumanityCatalog:
+    """Get the process-wide catalog, loading it on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                with open(PACKS_PATH, "r", encoding="utf-8") as f:
+                    _catalog = HumanityCatalog.from_packs(json.load(f))
+    return _catalog
+
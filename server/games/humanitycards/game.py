@@ -7,9 +7,8 @@ submit white cards to fill in blanks. The judge picks the funniest submission.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
 import random
-from pathlib import Path
+from typing import Any
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -25,28 +24,17 @@ from ...game_utils.options import (
 )
 from ...messages.localization import Localization
 from server.core.ui.keybinds import KeybindState
+from .catalog import get_catalog
 
 
 # ==========================================================================
-# Pack loading (cached globally)
+# Pack options (backed by the shared card catalog)
 # ==========================================================================
 
-_humanity_packs: list[dict] | None = None
-
-
-def load_humanity_packs() -> list[dict]:
-    """Load card packs from JSON file. Results are cached."""
-    global _humanity_packs
-    if _humanity_packs is None:
-        packs_path = Path(__file__).parent / "humanity_packs.json"
-        with open(packs_path, "r", encoding="utf-8") as f:
-            _humanity_packs = json.load(f)
-    return _humanity_packs
-
 
 def get_pack_names() -> list[str]:
     """Get list of all pack names."""
-    return [pack["name"] for pack in load_humanity_packs()]
+    return list(get_catalog().pack_names)
 
 
 def get_pack_groups() -> dict[str, list[str]]:
@@ -102,18 +90,133 @@ def _get_default_packs() -> list[str]:
     return list(groups.get("Base Set", get_pack_names()[:1]))
 
 
-# ==========================================================================
-# Card ID counter
-# ==========================================================================
+def _has_legacy_cards(d: dict[str, Any]) -> bool:
+    """Check whether saved state still embeds card dicts or texts."""
+    deck_keys = ("white_deck", "white_discard", "black_deck", "black_discard")
+    lists = [d.get(key) or [] for key in deck_keys]
+    lists.extend(p.get("hand") or [] for p in d.get("players", []))
+    lists.extend(p.get("submitted_cards") or [] for p in d.get("players", []))
+    lists.extend(sub.get("cards") or [] for sub in d.get("submissions", []))
+    if isinstance(d.get("current_black_card"), dict):
+        return True
+    return any(cards and not isinstance(cards[0], int) for cards in lists)
 
-_next_card_id = 0
 
+def _migrate_legacy_card_state(d: dict[str, Any]) -> dict[str, Any]:
+    """Map card dicts/texts from older saves onto catalog ids.
 
-def _make_card_id() -> int:
-    """Generate a unique card ID for this session."""
-    global _next_card_id
-    _next_card_id += 1
-    return _next_card_id
+    Older saves embedded every card's text in the game state. Cards whose
+    text no longer exists in the catalog are dropped.
+    """
+    if not _has_legacy_cards(d):
+        return d
+    catalog = get_catalog()
+
+    def white_ids(cards: list) -> list[int]:
+        ids = []
+        for card in cards:
+            if isinstance(card, int):
+                ids.append(card)
+                continue
+            text = card["text"] if isinstance(card, dict) else card
+            card_id = catalog.white_id_for_text(text)
+            if card_id is not None:
+                ids.append(card_id)
+        return ids
+
+    def black_id(card: Any) -> int | None:
+        if card is None or isinstance(card, int):
+            return card
+        return catalog.black_id_for_text(card["text"])
+
+    def black_ids(cards: list) -> list[int]:
+        return [i for i in (black_id(card) for card in cards) if i is not None]
+
+    for key in ("white_deck", "white_discard"):
+        if key in d:
+            d[key] = white_ids(d[key])
+    for key in ("black_deck", "black_discard"):
+        if key in d:
+            d[key] = black_ids(d[key])
+    if "current_black_card" in d:
+        d["current_black_card"] = black_id(d["current_black_card"])
+    for player in d.get("players", []):
+        if "hand" in player:
+            player["hand"] = white_ids(player["hand"])
+        if player.get("submitted_cards") is not None:
+            player["submitted_cards"] = white_ids(player["submitted_cards"])
+    for sub in d.get("submissions", []):
+        sub["cards"] = white_ids(sub.get("cards", []))
+    return d
+
+
+def _in_play_white_lists(d: dict[str, Any]) -> list[list]:
+    """Get every saved white card list that holds cards in play."""
+    lists = []
+    for player in d.get("players", []):
+        lists.append(player.get("hand") or [])
+        lists.append(player.get("submitted_cards") or [])
+    lists.extend(sub.get("cards") or [] for sub in d.get("submissions", []))
+    return lists
+
+
+def _in_play_card_texts(d: dict[str, Any]) -> dict[str, dict[str, str]]:
+    """Snapshot the text of every card in play, keyed by catalog id."""
+    catalog = get_catalog()
+    white = {
+        str(card_id): catalog.white_text(card_id)
+        for cards in _in_play_white_lists(d)
+        for card_id in cards
+    }
+    black = {}
+    if d.get("current_black_card") is not None:
+        card_id = d["current_black_card"]
+        black[str(card_id)] = catalog.black_text(card_id)
+    return {"white": white, "black": black}
+
+
+def _reload_stale_card_ids(d: dict[str, Any]) -> dict[str, Any]:
+    """Turn card ids from a different catalog back into text.
+
+    Cards in play are restored from the text snapshot saved with them and
+    then go through the legacy text migration. Deck order can't be
+    recovered, so the decks are rebuilt from the selected packs minus the
+    cards in play, and the discard piles start empty.
+    """
+    fingerprint = d.pop("card_catalog", "")
+    card_texts = d.pop("card_texts", None) or {}
+    catalog = get_catalog()
+    if not fingerprint or fingerprint == catalog.fingerprint:
+        return d
+
+    white_texts = card_texts.get("white", {})
+    black_texts = card_texts.get("black", {})
+    for cards in _in_play_white_lists(d):
+        cards[:] = [
+            white_texts[str(card)] for card in cards if str(card) in white_texts
+        ]
+    black = d.get("current_black_card")
+    if black is not None:
+        text = black_texts.get(str(black))
+        d["current_black_card"] = {"text": text} if text is not None else None
+
+    packs = (d.get("options") or {}).get("card_packs") or _get_default_packs()
+    in_play = {text.rstrip(".") for cards in _in_play_white_lists(d) for text in cards}
+    white_deck = [
+        card_id
+        for card_id in catalog.white_ids_for_packs(packs)
+        if catalog.white_text(card_id) not in in_play
+    ]
+    black_deck = [
+        card_id
+        for card_id in catalog.black_ids_for_packs(packs)
+        if catalog.black_text(card_id) not in black_texts.values()
+    ]
+    random.shuffle(white_deck)  # nosec B311
+    random.shuffle(black_deck)  # nosec B311
+    d["white_deck"], d["black_deck"] = white_deck, black_deck
+    d["white_discard"], d["black_discard"] = [], []
+    return d
 
 
 # ==========================================================================
@@ -126,8 +229,8 @@ class HumanityCardsPlayer(Player):
     """Player state for Humanity Cards game."""
 
     score: int = 0
-    hand: list[dict] = field(default_factory=list)  # {"text": str, "pack": str, "id": int}
-    submitted_cards: list[str] | None = None  # Text of submitted cards (None = not submitted)
+    hand: list[int] = field(default_factory=list)  # White card catalog ids
+    submitted_cards: list[int] | None = None  # Submitted white card ids (None = not submitted)
     selected_indices: list[int] = field(default_factory=list)  # Indices into hand
 
 
@@ -220,14 +323,15 @@ class HumanityCardsGame(Game):
 
     # Game state
     phase: str = "waiting"  # waiting, submitting, judging, round_end
-    white_deck: list[dict] = field(default_factory=list)
-    black_deck: list[dict] = field(default_factory=list)
-    white_discard: list[dict] = field(default_factory=list)
-    black_discard: list[dict] = field(default_factory=list)
-    current_black_card: dict | None = None  # {"text": str, "pick": int, "pack": str}
+    # Cards are catalog ids; text is resolved from the shared catalog at render time
+    white_deck: list[int] = field(default_factory=list)
+    black_deck: list[int] = field(default_factory=list)
+    white_discard: list[int] = field(default_factory=list)
+    black_discard: list[int] = field(default_factory=list)
+    current_black_card: int | None = None
     judge_indices: list[int] = field(default_factory=list)  # Indices into active players
     last_winner_index: int = -1  # For "Most Recent Winner" czar selection
-    submissions: list[dict] = field(default_factory=list)  # [{"player_id": str, "cards": [str]}]
+    submissions: list[dict] = field(default_factory=list)  # [{"player_id": str, "cards": [int]}]
     submission_order: list[int] = field(default_factory=list)  # Shuffled indices into submissions
     round_end_ticks: int = 0  # Countdown ticks before next round starts
 
@@ -256,6 +360,17 @@ class HumanityCardsGame(Game):
     ) -> HumanityCardsPlayer:
         return HumanityCardsPlayer(id=player_id, name=name, is_bot=is_bot)
 
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[str, Any]) -> dict[str, Any]:
+        """Convert saves from older or different card catalogs into catalog ids."""
+        return _migrate_legacy_card_state(_reload_stale_card_ids(d))
+
+    def __post_serialize__(self, d: dict[str, Any]) -> dict[str, Any]:
+        """Record which catalog the saved card ids belong to."""
+        d["card_catalog"] = get_catalog().fingerprint
+        d["card_texts"] = _in_play_card_texts(d)
+        return d
+
     # ==========================================================================
     # Deck management
     # ==========================================================================
@@ -266,42 +381,39 @@ class HumanityCardsGame(Game):
 
     def _build_decks(self) -> None:
         """Build white and black decks from selected packs."""
-        packs = load_humanity_packs()
-        active_pack_names = set(self._get_active_packs())
+        catalog = get_catalog()
+        active_pack_names = self._get_active_packs()
 
-        self.white_deck = []
-        self.black_deck = []
+        self.white_deck = catalog.white_ids_for_packs(active_pack_names)
+        self.black_deck = catalog.black_ids_for_packs(active_pack_names)
         self.white_discard = []
         self.black_discard = []
 
-        for pack in packs:
-            if pack["name"] not in active_pack_names:
-                continue
-            pack_name = pack["name"]
-
-            for card in pack.get("white", []):
-                text = card["text"].rstrip(".")
-                self.white_deck.append({
-                    "text": text,
-                    "pack": pack_name,
-                    "id": _make_card_id(),
-                })
-
-            for card in pack.get("black", []):
-                text = card["text"]
-                pick = text.count("_")
-                if pick == 0:
-                    pick = 1  # Cards with no blanks get 1 pick
-                self.black_deck.append({
-                    "text": text,
-                    "pick": pick,
-                    "pack": pack_name,
-                })
-
         random.shuffle(self.white_deck)  # nosec B311
         random.shuffle(self.black_deck)  # nosec B311
 
-    def _draw_white(self, count: int = 1) -> list[dict]:
+    def _white_text(self, card_id: int) -> str:
+        """Resolve a white card id to its text."""
+        return get_catalog().white_text(card_id)
+
+    def _white_texts(self, card_ids: list[int]) -> list[str]:
+        """Resolve white card ids to their texts."""
+        catalog = get_catalog()
+        return [catalog.white_text(card_id) for card_id in card_ids]
+
+    def _black_text(self) -> str:
+        """Get the text of the current black card (empty if none)."""
+        if self.current_black_card is None:
+            return ""
+        return get_catalog().black_text(self.current_black_card)
+
+    def _black_pick(self) -> int:
+        """Get how many white cards the current black card needs."""
+        if self.current_black_card is None:
+            return 1
+        return get_catalog().black_pick(self.current_black_card)
+
+    def _draw_white(self, count: int = 1) -> list[int]:
         """Draw white cards from the deck, reshuffling discard if needed."""
         cards = []
         for _ in range(count):
@@ -317,7 +429,7 @@ class HumanityCardsGame(Game):
                 cards.append(self.white_deck.pop())
         return cards
 
-    def _draw_black(self) -> dict | None:
+    def _draw_black(self) -> int | None:
         """Draw a black card from the deck, reshuffling discard if needed."""
         if not self.black_deck:
             if self.black_discard:
@@ -639,12 +751,12 @@ class HumanityCardsGame(Game):
         idx = int(action_id.removeprefix("toggle_card_"))
         if idx >= len(hcp.hand):
             return f"Card {idx + 1}"
-        card = hcp.hand[idx]
+        text = self._white_text(hcp.hand[idx])
         user = self.get_user(player)
         locale = user.locale if user else "en"
         if idx in hcp.selected_indices:
-            return Localization.get(locale, "hc-card-selected", text=card["text"])
-        return Localization.get(locale, "hc-card-not-selected", text=card["text"])
+            return Localization.get(locale, "hc-card-selected", text=text)
+        return Localization.get(locale, "hc-card-not-selected", text=text)
 
     def _get_toggle_card_sound(self, player: Player, action_id: str) -> str | None:
         hcp: HumanityCardsPlayer = player  # type: ignore
@@ -665,7 +777,7 @@ class HumanityCardsGame(Game):
             return "hc-already-submitted"
         if self.phase != "submitting":
             return "action-not-playing"
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         if len(hcp.selected_indices) != required:
             return ("hc-wrong-card-count", {"count": required})
         return None
@@ -686,7 +798,7 @@ class HumanityCardsGame(Game):
         hcp: HumanityCardsPlayer = player  # type: ignore
         user = self.get_user(player)
         locale = user.locale if user else "en"
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         return Localization.get(
             locale, "hc-submit-cards",
             selected=len(hcp.selected_indices),
@@ -726,12 +838,10 @@ class HumanityCardsGame(Game):
         if idx < len(self.submission_order):
             sub_idx = self.submission_order[idx]
             if sub_idx < len(self.submissions):
-                sub = self.submissions[sub_idx]
-                if self.current_black_card:
-                    return self._fill_in_blanks(
-                        self.current_black_card["text"], sub["cards"]
-                    )
-                return ", ".join(sub["cards"])
+                cards = self._white_texts(self.submissions[sub_idx]["cards"])
+                if self.current_black_card is not None:
+                    return self._fill_in_blanks(self._black_text(), cards)
+                return ", ".join(cards)
         return f"Submission {idx + 1}"
 
     # ==========================================================================
@@ -754,8 +864,8 @@ class HumanityCardsGame(Game):
         return Visibility.VISIBLE
 
     def _get_judge_prompt_header_label(self, player: Player, action_id: str) -> str:
-        if self.current_black_card:
-            prompt_text = self._speech_friendly_black(self.current_black_card["text"])
+        if self.current_black_card is not None:
+            prompt_text = self._speech_friendly_black(self._black_text())
             return f"Choose the best card that matches: {prompt_text}"
         return "Choose the best card"
 
@@ -764,13 +874,11 @@ class HumanityCardsGame(Game):
         options = []
         for idx in self.submission_order:
             if idx < len(self.submissions):
-                sub = self.submissions[idx]
-                if self.current_black_card:
-                    filled = self._fill_in_blanks(
-                        self.current_black_card["text"], sub["cards"]
-                    )
+                cards = self._white_texts(self.submissions[idx]["cards"])
+                if self.current_black_card is not None:
+                    filled = self._fill_in_blanks(self._black_text(), cards)
                 else:
-                    filled = ", ".join(sub["cards"])
+                    filled = ", ".join(cards)
                 options.append(filled)
         return options
 
@@ -904,7 +1012,7 @@ class HumanityCardsGame(Game):
         if index >= len(hcp.hand):
             return
 
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
 
         user = self.get_user(player)
         if index in hcp.selected_indices:
@@ -1040,22 +1148,17 @@ class HumanityCardsGame(Game):
         if self._is_judge(hcp):
             return
 
-        required = self.current_black_card["pick"] if self.current_black_card else 1
+        required = self._black_pick()
         if len(hcp.selected_indices) != required:
             user = self.get_user(player)
             if user:
                 user.speak_l("hc-wrong-card-count", count=required)
             return
 
-        # Collect submitted card texts
-        submitted_texts = []
-        # Sort indices in selection order (the order they were picked)
-        for idx in hcp.selected_indices:
-            if idx < len(hcp.hand):
-                card = hcp.hand[idx]
-                submitted_texts.append(card["text"])
-
-        hcp.submitted_cards = submitted_texts
+        # Collect submitted card ids in selection order (the order they were picked)
+        hcp.submitted_cards = [
+            hcp.hand[idx] for idx in hcp.selected_indices if idx < len(hcp.hand)
+        ]
 
         # Remove submitted cards from hand (highest index first to avoid shift)
         for idx in sorted(hcp.selected_indices, reverse=True):
@@ -1116,8 +1219,7 @@ class HumanityCardsGame(Game):
 
         # Announce winner
         winning_text = self._fill_in_blanks(
-            self.current_black_card["text"] if self.current_black_card else "",
-            winning_sub["cards"],
+            self._black_text(), self._white_texts(winning_sub["cards"])
         )
 
         # Play judge choice sound
@@ -1146,8 +1248,7 @@ class HumanityCardsGame(Game):
             sub_player = self.get_player_by_id(sub["player_id"])
             if sub_player:
                 filled = self._fill_in_blanks(
-                    self.current_black_card["text"] if self.current_black_card else "",
-                    sub["cards"],
+                    self._black_text(), self._white_texts(sub["cards"])
                 )
                 self.broadcast_l(
                     "hc-submission-reveal",
@@ -1167,7 +1268,7 @@ class HumanityCardsGame(Game):
             self.round_end_ticks = 100  # ~5 seconds at 20 ticks/sec
 
             # Discard current black card
-            if self.current_black_card:
+            if self.current_black_card is not None:
                 self.black_discard.append(self.current_black_card)
                 self.current_black_card = None
 
@@ -1176,9 +1277,9 @@ class HumanityCardsGame(Game):
     def _action_view_black_card(self, player: Player, action_id: str) -> None:
         """View the current black card prompt."""
         user = self.get_user(player)
-        if not user or not self.current_black_card:
+        if not user or self.current_black_card is None:
             return
-        text = self._speech_friendly_black(self.current_black_card["text"])
+        text = self._speech_friendly_black(self._black_text())
         user.speak_l("hc-black-card", text=text)
 
     def _action_view_submission(self, player: Player, action_id: str) -> None:
@@ -1188,19 +1289,17 @@ class HumanityCardsGame(Game):
         if not user:
             return
 
-        if hcp.submitted_cards is not None and self.current_black_card:
+        if hcp.submitted_cards is not None and self.current_black_card is not None:
             filled = self._fill_in_blanks(
-                self.current_black_card["text"], hcp.submitted_cards
+                self._black_text(), self._white_texts(hcp.submitted_cards)
             )
             user.speak_l("hc-your-submission", text=filled)
-        elif hcp.selected_indices and self.current_black_card:
+        elif hcp.selected_indices and self.current_black_card is not None:
             # Preview current selection
-            cards = [
-                hcp.hand[i]["text"]
-                for i in hcp.selected_indices
-                if i < len(hcp.hand)
-            ]
-            filled = self._fill_in_blanks(self.current_black_card["text"], cards)
+            cards = self._white_texts(
+                [hcp.hand[i] for i in hcp.selected_indices if i < len(hcp.hand)]
+            )
+            filled = self._fill_in_blanks(self._black_text(), cards)
             user.speak_l("hc-preview-submission-text", text=filled)
         else:
             user.speak_l("hc-select-cards-first")
@@ -1314,12 +1413,12 @@ class HumanityCardsGame(Game):
 
         # Draw black card
         self.current_black_card = self._draw_black()
-        if not self.current_black_card:
+        if self.current_black_card is None:
             self.broadcast_l("hc-not-enough-cards")
             self.finish_game()
             return
 
-        pick_count = self.current_black_card.get("pick", 1)
+        pick_count = self._black_pick()
 
         # Announce round
         self.broadcast_l("hc-round-start", round=self.round)
@@ -1333,7 +1432,7 @@ class HumanityCardsGame(Game):
             self.broadcast_l("hc-judge-is", player=judges[0].name, count=len(judges), others=others)
 
         # Announce black card
-        black_text = self._speech_friendly_black(self.current_black_card["text"])
+        black_text = self._speech_friendly_black(self._black_text())
         self.broadcast_l("hc-black-card", text=black_text)
         if pick_count > 1:
             self.broadcast_l("hc-black-card-pick", count=pick_count)
@@ -1398,7 +1497,7 @@ class HumanityCardsGame(Game):
         if self.phase == "submitting" and not self._is_judge(player):
             if player.submitted_cards is not None:
                 return None
-            required = self.current_black_card["pick"] if self.current_black_card else 1
+            required = self._black_pick()
 
             # Select random cards if not enough selected
             if len(player.selected_indices) < required:
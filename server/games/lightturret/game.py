@@ -449,6 +449,7 @@ class LightTurretGame(Game):
         # Mark status as finished to disable turn actions, but keep game_active
         # True until sounds finish playing (so ticks continue)
         self.status = "finished"
+        self._table_state_changed()
 
         self.broadcast_l("lightturret-game-over")
 
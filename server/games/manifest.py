@@ -0,0 +1,310 @@
+"""Static manifest of the games shipped with the server.
+
+Each entry records what menus, the lobby and the CLI need to know about a
+game (type, display name, localization keys, category and player limits)
+plus where its class lives, so ``GameRegistry`` can list games without
+importing them and load a module only when its class is first requested.
+Keep entries in sync with the game classes; ``test_game_registry`` checks
+every field against the class it describes.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GameManifestEntry:
+    """Import-free description of one game."""
+
+    game_type: str
+    module: str
+    class_name: str
+    name: str
+    name_key: str
+    category: str
+    min_players: int
+    max_players: int
+
+
+# Module paths are relative to the ``server.games`` package.
+GAME_MANIFEST: tuple[GameManifestEntry, ...] = (
+    GameManifestEntry(
+        game_type="pig",
+        module=".pig.game",
+        class_name="PigGame",
+        name="Pig",
+        name_key="game-name-pig",
+        category="category-dice-games",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="scopa",
+        module=".scopa.game",
+        class_name="ScopaGame",
+        name="Scopa",
+        name_key="game-name-scopa",
+        category="category-card-games",
+        min_players=2,
+        max_players=16,
+    ),
+    GameManifestEntry(
+        game_type="lightturret",
+        module=".lightturret.game",
+        class_name="LightTurretGame",
+        name="Light Turret",
+        name_key="game-name-lightturret",
+        category="category-rb-play-center",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="threes",
+        module=".threes.game",
+        class_name="ThreesGame",
+        name="Threes",
+        name_key="game-name-threes",
+        category="category-dice-games",
+        min_players=2,
+        max_players=8,
+    ),
+    GameManifestEntry(
+        game_type="milebymile",
+        module=".milebymile.game",
+        class_name="MileByMileGame",
+        name="Mile by Mile",
+        name_key="game-name-milebymile",
+        category="category-card-games",
+        min_players=2,
+        max_players=9,
+    ),
+    GameManifestEntry(
+        game_type="chaosbear",
+        module=".chaosbear.game",
+        class_name="ChaosBearGame",
+        name="Chaos Bear",
+        name_key="game-name-chaosbear",
+        category="category-rb-play-center",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="farkle",
+        module=".farkle.game",
+        class_name="FarkleGame",
+        name="Farkle",
+        name_key="game-name-farkle",
+        category="category-dice-games",
+        min_players=2,
+        max_players=20,
+    ),
+    GameManifestEntry(
+        game_type="yahtzee",
+        module=".yahtzee.game",
+        class_name="YahtzeeGame",
+        name="Yahtzee",
+        name_key="game-name-yahtzee",
+        category="category-dice-games",
+        min_players=1,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="ninetynine",
+        module=".ninetynine.game",
+        class_name="NinetyNineGame",
+        name="Ninety Nine",
+        name_key="game-name-ninetynine",
+        category="category-card-games",
+        min_players=2,
+        max_players=6,
+    ),
+    GameManifestEntry(
+        game_type="tradeoff",
+        module=".tradeoff.game",
+        class_name="TradeoffGame",
+        name="Tradeoff",
+        name_key="game-name-tradeoff",
+        category="category-dice-games",
+        min_players=2,
+        max_players=8,
+    ),
+    GameManifestEntry(
+        game_type="pirates",
+        module=".pirates.game",
+        class_name="PiratesGame",
+        name="Pirates of the Lost Seas",
+        name_key="game-name-pirates",
+        category="category-uncategorized",
+        min_players=2,
+        max_players=5,
+    ),
+    GameManifestEntry(
+        game_type="leftrightcenter",
+        module=".leftrightcenter.game",
+        class_name="LeftRightCenterGame",
+        name="Left Right Center",
+        name_key="game-name-leftrightcenter",
+        category="category-dice-games",
+        min_players=2,
+        max_players=20,
+    ),
+    GameManifestEntry(
+        game_type="ludo",
+        module=".ludo.game",
+        class_name="LudoGame",
+        name="Ludo",
+        name_key="game-name-ludo",
+        category="category-board-games",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="tossup",
+        module=".tossup.game",
+        class_name="TossUpGame",
+        name="Toss Up",
+        name_key="game-name-tossup",
+        category="category-dice-games",
+        min_players=2,
+        max_players=8,
+    ),
+    GameManifestEntry(
+        game_type="midnight",
+        module=".midnight.game",
+        class_name="MidnightGame",
+        name="1-4-24",
+        name_key="game-name-midnight",
+        category="category-dice-games",
+        min_players=2,
+        max_players=6,
+    ),
+    GameManifestEntry(
+        game_type="ageofheroes",
+        module=".ageofheroes.game",
+        class_name="AgeOfHeroesGame",
+        name="Age of Heroes",
+        name_key="game-name-ageofheroes",
+        category="category-uncategorized",
+        min_players=2,
+        max_players=6,
+    ),
+    GameManifestEntry(
+        game_type="fivecarddraw",
+        module=".fivecarddraw.game",
+        class_name="FiveCardDrawGame",
+        name="Five Card Draw",
+        name_key="game-name-fivecarddraw",
+        category="category-poker",
+        min_players=2,
+        max_players=5,
+    ),
+    GameManifestEntry(
+        game_type="holdem",
+        module=".holdem.game",
+        class_name="HoldemGame",
+        name="Texas Hold'em",
+        name_key="game-name-holdem",
+        category="category-poker",
+        min_players=2,
+        max_players=12,
+    ),
+    GameManifestEntry(
+        game_type="crazyeights",
+        module=".crazyeights.game",
+        class_name="CrazyEightsGame",
+        name="Crazy Eights",
+        name_key="game-name-crazyeights",
+        category="category-card-games",
+        min_players=2,
+        max_players=8,
+    ),
+    GameManifestEntry(
+        game_type="monopoly",
+        module=".monopoly.game",
+        class_name="MonopolyGame",
+        name="Monopoly",
+        name_key="game-name-monopoly",
+        category="category-uncategorized",
+        min_players=2,
+        max_players=6,
+    ),
+    GameManifestEntry(
+        game_type="snakesandladders",
+        module=".snakesandladders.game",
+        class_name="SnakesAndLaddersGame",
+        name="Snakes and Ladders",
+        name_key="game-name-snakesandladders",
+        category="category-board-games",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="rollingballs",
+        module=".rollingballs.game",
+        class_name="RollingBallsGame",
+        name="Rolling Balls",
+        name_key="game-name-rollingballs",
+        category="category-uncategorized",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="sorry",
+        module=".sorry.game",
+        class_name="SorryGame",
+        name="Sorry!",
+        name_key="game-name-sorry",
+        category="category-board-games",
+        min_players=2,
+        max_players=4,
+    ),
+    GameManifestEntry(
+        game_type="metalpipe",
+        module=".metalpipe.game",
+        class_name="MetalPipeGame",
+        name="Metal Pipe",
+        name_key="game-name-metalpipe",
+        category="category-uncategorized",
+        min_players=2,
+        max_players=8,
+    ),
+    GameManifestEntry(
+        game_type="humanitycards",
+        module=".humanitycards.game",
+        class_name="HumanityCardsGame",
+        name="Cards Against Humanity",
+        name_key="game-name-humanitycards",
+        category="category-party-games",
+        min_players=3,
+        max_players=10,
+    ),
+    GameManifestEntry(
+        game_type="nine",
+        module=".nine.game",
+        class_name="NineGame",
+        name="Nine",
+        name_key="game-name-nine",
+        category="category-card-games",
+        min_players=2,
+        max_players=6,
+    ),
+    GameManifestEntry(
+        game_type="blackjack",
+        module=".blackjack.game",
+        class_name="BlackjackGame",
+        name="Blackjack",
+        name_key="game-name-blackjack",
+        category="category-card-games",
+        min_players=1,
+        max_players=7,
+    ),
+    GameManifestEntry(
+        game_type="twentyone",
+        module=".twentyone",
+        class_name="TwentyOneGame",
+        name="21 (Survival Rules)",
+        name_key="21",
+        category="category-card-games",
+        min_players=2,
+        max_players=2,
+    ),
+)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from ...base import Player
 from ....messages.localization import Localization
+from ..valuation import expected_income
 
 if TYPE_CHECKING:
     from ..game import MonopolyGame
@@ -161,7 +162,7 @@ def bot_select_auction_bid(game: MonopolyGame, player: Player, options: list[str
     if not space:
         return options[0]
 
-    cap = min(space.price, int(game._current_liquid_balance(player) * 0.85))
+    cap = game._bot_auction_bid_cap(player, space)
     affordable = []
     for option in options:
         try:
@@ -329,17 +330,18 @@ def options_for_sell_house(game: MonopolyGame, player: Player) -> list[str]:
 
 
 def bot_select_mortgage_property(game: MonopolyGame, player: Player, options: list[str]) -> str | None:
-    """Pick the mortgage option that raises the most cash."""
-    _ = player
+    """Pick the mortgage option that gives up the least income per dollar raised."""
     if not options:
         return None
     pairs = list(zip(options, mortgage_space_ids(game, player), strict=False))
     if not pairs:
         return None
-    return max(
-        pairs,
-        key=lambda pair: game._mortgage_value(game.active_space_by_id[pair[1]]),
-    )[0]
+
+    def _score(space_id: str) -> tuple[float, int]:
+        cash = game._mortgage_value(game.active_space_by_id[space_id])
+        return (expected_income(game, space_id, player.id) / cash, -cash)
+
+    return min(pairs, key=lambda pair: _score(pair[1]))[0]
 
 
 def bot_select_unmortgage_property(
@@ -373,18 +375,14 @@ def bot_select_build_house(game: MonopolyGame, player: Player, options: list[str
     if not pairs:
         return None
 
-    def _score(space_id: str) -> tuple[int, int, str]:
+    valuation = game._position_valuation()
+
+    def _score(space_id: str) -> tuple[float, int, str]:
         space = game.active_space_by_id[space_id]
         level = game._building_level(space_id)
-        if space.rents:
-            current_rent = space.rents[min(level, len(space.rents) - 1)]
-            if level == 0 and game._owner_has_full_color_set(player.id, space.color_group):
-                current_rent = space.rents[0] * 2
-            next_rent = space.rents[min(level + 1, len(space.rents) - 1)]
-        else:
-            current_rent = space.rent
-            next_rent = space.rent
-        gain = max(0, next_rent - current_rent)
-        return (gain, -space.house_cost, game._space_label(space_id))
+        current_rent = game._calculate_rent_due(space, player.id, None, level=level)
+        next_rent = game._calculate_rent_due(space, player.id, None, level=level + 1)
+        gain = max(0, next_rent - current_rent) * valuation.probability(space_id)
+        return (gain / max(1, space.house_cost), -space.house_cost, game._space_label(space_id))
 
     return max(pairs, key=lambda pair: _score(pair[1]))[0]
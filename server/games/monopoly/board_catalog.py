@@ -0,0 +1,200 @@
+"""Compiled, process-wide Monopoly board catalog.
+
+Each board's manual rule artifact is parsed once (see ``manual_rules.loader``)
+and compiled here into read-only runtime structures: ordered spaces, a space
+index, color-group and kind indexes, rent tables, card deck ids with a card
+lookup, and rule-pack capabilities. Every Monopoly table on the same board
+shares one ``CompiledBoard``; creating or restoring a table only copies the
+small lists it owns.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import time
+
+from .board_profile import BOARD_PROFILES, get_board_profile
+from .board_rules_registry import get_rule_pack
+from .board_spaces import (
+    CLASSIC_STANDARD_BOARD,
+    COLOR_GROUP_TO_SPACE_IDS,
+    MonopolySpace,
+)
+from .manual_rules.loader import load_manual_rule_set
+from .manual_rules.models import ManualRuleSet
+
+CLASSIC_BOARD_KEY = ""
+DECK_TYPES: tuple[str, ...] = ("chance", "community_chest")
+
+
+@dataclass(frozen=True)
+class CompiledBoard:
+    """Read-only runtime structures for one board layout."""
+
+    board_id: str
+    manual_rule_set: ManualRuleSet | None
+    spaces: tuple[MonopolySpace, ...]
+    space_by_id: dict[str, MonopolySpace]
+    color_group_to_space_ids: dict[str, tuple[str, ...]]
+    space_ids_by_kind: dict[str, tuple[str, ...]]
+    rents_by_space_id: dict[str, tuple[int, ...]]
+    deck_ids: dict[str, tuple[str, ...]]
+    card_definitions: dict[tuple[str, str], dict[str, object]]
+    capability_ids: frozenset[str]
+
+    def color_groups_copy(self) -> dict[str, list[str]]:
+        """Return a mutable copy of the color-group index for one table."""
+        return {key: list(values) for key, values in self.color_group_to_space_ids.items()}
+
+
+def build_space_from_manual_row(row: dict[str, object], fallback_index: int) -> MonopolySpace:
+    """Build one MonopolySpace from a manual rule artifact row."""
+    index = int(row.get("position", fallback_index))
+    space_id = str(row.get("space_id", f"space_{index}"))
+    name = str(row.get("name", space_id.replace("_", " ").title()))
+    kind = str(row.get("kind", "property"))
+    price = int(row.get("price", 0))
+    rent = int(row.get("rent", 0))
+    color_group = str(row.get("color_group", ""))
+    house_cost = int(row.get("house_cost", 0))
+    rents_raw = row.get("rents", ())
+    rents: tuple[int, ...]
+    if isinstance(rents_raw, list):
+        rents = tuple(int(value) for value in rents_raw)
+    else:
+        rents = ()
+    return MonopolySpace(
+        index=index,
+        space_id=space_id,
+        name=name,
+        kind=kind,
+        price=price,
+        rent=rent,
+        color_group=color_group,
+        house_cost=house_cost,
+        rents=rents,
+    )
+
+
+def _manual_spaces(manual_rule_set: ManualRuleSet) -> list[MonopolySpace]:
+    spaces_payload = manual_rule_set.board.get("spaces", [])
+    if not isinstance(spaces_payload, list):
+        return []
+    spaces = [
+        build_space_from_manual_row(row, idx)
+        for idx, row in enumerate(spaces_payload)
+        if isinstance(row, dict)
+    ]
+    spaces.sort(key=lambda space: space.index)
+    return spaces
+
+
+def _manual_decks(
+    manual_rule_set: ManualRuleSet | None,
+) -> tuple[dict[str, tuple[str, ...]], dict[tuple[str, str], dict[str, object]]]:
+    deck_ids: dict[str, tuple[str, ...]] = {}
+    card_definitions: dict[tuple[str, str], dict[str, object]] = {}
+    if manual_rule_set is None:
+        return deck_ids, card_definitions
+    for deck_type, deck_rows in manual_rule_set.cards.items():
+        if not isinstance(deck_rows, list):
+            continue
+        ids: list[str] = []
+        for row in deck_rows:
+            if not isinstance(row, dict):
+                continue
+            card_id = row.get("id")
+            if not isinstance(card_id, str) or not card_id:
+                continue
+            ids.append(card_id)
+            card_definitions.setdefault((deck_type, card_id), row)
+        deck_ids[deck_type] = tuple(ids)
+    return deck_ids, card_definitions
+
+
+def compile_board(
+    board_id: str,
+    manual_rule_set: ManualRuleSet | None,
+    rule_pack_id: str = "",
+) -> CompiledBoard:
+    """Compile runtime structures for a board and its (optional) manual rules."""
+    spaces: list[MonopolySpace] = []
+    if manual_rule_set is not None:
+        spaces = _manual_spaces(manual_rule_set)
+    if spaces:
+        color_groups: dict[str, list[str]] = {}
+        for space in spaces:
+            if space.kind == "property" and space.color_group:
+                color_groups.setdefault(space.color_group, []).append(space.space_id)
+    else:
+        spaces = list(CLASSIC_STANDARD_BOARD)
+        color_groups = COLOR_GROUP_TO_SPACE_IDS
+
+    space_ids_by_kind: dict[str, list[str]] = {}
+    for space in spaces:
+        space_ids_by_kind.setdefault(space.kind, []).append(space.space_id)
+
+    deck_ids, card_definitions = _manual_decks(manual_rule_set)
+    rule_pack = get_rule_pack(rule_pack_id) if rule_pack_id else None
+
+    return CompiledBoard(
+        board_id=board_id,
+        manual_rule_set=manual_rule_set,
+        spaces=tuple(spaces),
+        space_by_id={space.space_id: space for space in spaces},
+        color_group_to_space_ids={key: tuple(values) for key, values in color_groups.items()},
+        space_ids_by_kind={key: tuple(values) for key, values in space_ids_by_kind.items()},
+        rents_by_space_id={space.space_id: space.rents for space in spaces if space.rents},
+        deck_ids=deck_ids,
+        card_definitions=card_definitions,
+        capability_ids=frozenset(rule_pack.capability_ids) if rule_pack else frozenset(),
+    )
+
+
+_compiled_boards: dict[tuple[str, str], CompiledBoard] = {}
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_board(
+    board_id: str,
+    manual_rule_set: ManualRuleSet | None,
+    rule_pack_id: str = "",
+) -> CompiledBoard:
+    """Return the shared compiled board for a board id and its manual rules.
+
+    Boards without manual rules share the classic layout. A cached entry is
+    reused only while it was compiled from the same ``ManualRuleSet``
+    instance, which the loader keeps stable for the life of the process.
+    """
+    key = (board_id if manual_rule_set is not None else CLASSIC_BOARD_KEY, rule_pack_id)
+    compiled = _compiled_boards.get(key)
+    if compiled is not None and compiled.manual_rule_set is manual_rule_set:
+        return compiled
+    with _compiled_lock:
+        compiled = _compiled_boards.get(key)
+        if compiled is None or compiled.manual_rule_set is not manual_rule_set:
+            compiled = compile_board(board_id, manual_rule_set, rule_pack_id)
+            _compiled_boards[key] = compiled
+    return compiled
+
+
+def warm_board_catalog(board_ids: list[str] | None = None) -> dict[str, float]:
+    """Load and compile boards ahead of first use.
+
+    Returns per-board build time in seconds, which ``scripts/monopoly``
+    uses as a startup benchmark.
+    """
+    timings: dict[str, float] = {}
+    for board_id in board_ids if board_ids is not None else list(BOARD_PROFILES):
+        started = time.perf_counter()
+        rule_pack_id = get_board_profile(board_id).rule_pack_id or ""
+        manual_rule_set: ManualRuleSet | None = None
+        if rule_pack_id:
+            try:
+                manual_rule_set = load_manual_rule_set(board_id)
+            except (FileNotFoundError, ValueError):
+                manual_rule_set = None
+        get_compiled_board(board_id, manual_rule_set, rule_pack_id)
+        timings[board_id] = time.perf_counter() - started
+    return timings
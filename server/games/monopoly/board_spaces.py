@@ -0,0 +1,289 @@
+"""Board space model and the classic Monopoly board layout."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MonopolySpace:
+    """A board space on the classic Monopoly board."""
+
+    index: int
+    space_id: str
+    name: str
+    kind: str
+    price: int = 0
+    rent: int = 0
+    color_group: str = ""
+    house_cost: int = 0
+    rents: tuple[int, ...] = ()
+
+
+CLASSIC_STANDARD_BOARD = [
+    MonopolySpace(0, "go", "GO", "start"),
+    MonopolySpace(
+        1,
+        "mediterranean_avenue",
+        "Mediterranean Avenue",
+        "property",
+        60,
+        2,
+        color_group="brown",
+        house_cost=50,
+        rents=(2, 10, 30, 90, 160, 250),
+    ),
+    MonopolySpace(2, "community_chest_1", "Community Chest", "community_chest"),
+    MonopolySpace(
+        3,
+        "baltic_avenue",
+        "Baltic Avenue",
+        "property",
+        60,
+        4,
+        color_group="brown",
+        house_cost=50,
+        rents=(4, 20, 60, 180, 320, 450),
+    ),
+    MonopolySpace(4, "income_tax", "Income Tax", "tax"),
+    MonopolySpace(5, "reading_railroad", "Reading Railroad", "railroad", 200, 25),
+    MonopolySpace(
+        6,
+        "oriental_avenue",
+        "Oriental Avenue",
+        "property",
+        100,
+        6,
+        color_group="light_blue",
+        house_cost=50,
+        rents=(6, 30, 90, 270, 400, 550),
+    ),
+    MonopolySpace(7, "chance_1", "Chance", "chance"),
+    MonopolySpace(
+        8,
+        "vermont_avenue",
+        "Vermont Avenue",
+        "property",
+        100,
+        6,
+        color_group="light_blue",
+        house_cost=50,
+        rents=(6, 30, 90, 270, 400, 550),
+    ),
+    MonopolySpace(
+        9,
+        "connecticut_avenue",
+        "Connecticut Avenue",
+        "property",
+        120,
+        8,
+        color_group="light_blue",
+        house_cost=50,
+        rents=(8, 40, 100, 300, 450, 600),
+    ),
+    MonopolySpace(10, "jail", "Jail / Just Visiting", "jail"),
+    MonopolySpace(
+        11,
+        "st_charles_place",
+        "St. Charles Place",
+        "property",
+        140,
+        10,
+        color_group="pink",
+        house_cost=100,
+        rents=(10, 50, 150, 450, 625, 750),
+    ),
+    MonopolySpace(12, "electric_company", "Electric Company", "utility", 150, 20),
+    MonopolySpace(
+        13,
+        "states_avenue",
+        "States Avenue",
+        "property",
+        140,
+        10,
+        color_group="pink",
+        house_cost=100,
+        rents=(10, 50, 150, 450, 625, 750),
+    ),
+    MonopolySpace(
+        14,
+        "virginia_avenue",
+        "Virginia Avenue",
+        "property",
+        160,
+        12,
+        color_group="pink",
+        house_cost=100,
+        rents=(12, 60, 180, 500, 700, 900),
+    ),
+    MonopolySpace(15, "pennsylvania_railroad", "Pennsylvania Railroad", "railroad", 200, 25),
+    MonopolySpace(
+        16,
+        "st_james_place",
+        "St. James Place",
+        "property",
+        180,
+        14,
+        color_group="orange",
+        house_cost=100,
+        rents=(14, 70, 200, 550, 750, 950),
+    ),
+    MonopolySpace(17, "community_chest_2", "Community Chest", "community_chest"),
+    MonopolySpace(
+        18,
+        "tennessee_avenue",
+        "Tennessee Avenue",
+        "property",
+        180,
+        14,
+        color_group="orange",
+        house_cost=100,
+        rents=(14, 70, 200, 550, 750, 950),
+    ),
+    MonopolySpace(
+        19,
+        "new_york_avenue",
+        "New York Avenue",
+        "property",
+        200,
+        16,
+        color_group="orange",
+        house_cost=100,
+        rents=(16, 80, 220, 600, 800, 1000),
+    ),
+    MonopolySpace(20, "free_parking", "Free Parking", "free_parking"),
+    MonopolySpace(
+        21,
+        "kentucky_avenue",
+        "Kentucky Avenue",
+        "property",
+        220,
+        18,
+        color_group="red",
+        house_cost=150,
+        rents=(18, 90, 250, 700, 875, 1050),
+    ),
+    MonopolySpace(22, "chance_2", "Chance", "chance"),
+    MonopolySpace(
+        23,
+        "indiana_avenue",
+        "Indiana Avenue",
+        "property",
+        220,
+        18,
+        color_group="red",
+        house_cost=150,
+        rents=(18, 90, 250, 700, 875, 1050),
+    ),
+    MonopolySpace(
+        24,
+        "illinois_avenue",
+        "Illinois Avenue",
+        "property",
+        240,
+        20,
+        color_group="red",
+        house_cost=150,
+        rents=(20, 100, 300, 750, 925, 1100),
+    ),
+    MonopolySpace(25, "bo_railroad", "B. & O. Railroad", "railroad", 200, 25),
+    MonopolySpace(
+        26,
+        "atlantic_avenue",
+        "Atlantic Avenue",
+        "property",
+        260,
+        22,
+        color_group="yellow",
+        house_cost=150,
+        rents=(22, 110, 330, 800, 975, 1150),
+    ),
+    MonopolySpace(
+        27,
+        "ventnor_avenue",
+        "Ventnor Avenue",
+        "property",
+        260,
+        22,
+        color_group="yellow",
+        house_cost=150,
+        rents=(22, 110, 330, 800, 975, 1150),
+    ),
+    MonopolySpace(28, "water_works", "Water Works", "utility", 150, 20),
+    MonopolySpace(
+        29,
+        "marvin_gardens",
+        "Marvin Gardens",
+        "property",
+        280,
+        24,
+        color_group="yellow",
+        house_cost=150,
+        rents=(24, 120, 360, 850, 1025, 1200),
+    ),
+    MonopolySpace(30, "go_to_jail", "Go to Jail", "go_to_jail"),
+    MonopolySpace(
+        31,
+        "pacific_avenue",
+        "Pacific Avenue",
+        "property",
+        300,
+        26,
+        color_group="green",
+        house_cost=200,
+        rents=(26, 130, 390, 900, 1100, 1275),
+    ),
+    MonopolySpace(
+        32,
+        "north_carolina_avenue",
+        "North Carolina Avenue",
+        "property",
+        300,
+        26,
+        color_group="green",
+        house_cost=200,
+        rents=(26, 130, 390, 900, 1100, 1275),
+    ),
+    MonopolySpace(33, "community_chest_3", "Community Chest", "community_chest"),
+    MonopolySpace(
+        34,
+        "pennsylvania_avenue",
+        "Pennsylvania Avenue",
+        "property",
+        320,
+        28,
+        color_group="green",
+        house_cost=200,
+        rents=(28, 150, 450, 1000, 1200, 1400),
+    ),
+    MonopolySpace(35, "short_line", "Short Line", "railroad", 200, 25),
+    MonopolySpace(36, "chance_3", "Chance", "chance"),
+    MonopolySpace(
+        37,
+        "park_place",
+        "Park Place",
+        "property",
+        350,
+        35,
+        color_group="dark_blue",
+        house_cost=200,
+        rents=(35, 175, 500, 1100, 1300, 1500),
+    ),
+    MonopolySpace(38, "luxury_tax", "Luxury Tax", "tax"),
+    MonopolySpace(
+        39,
+        "boardwalk",
+        "Boardwalk",
+        "property",
+        400,
+        50,
+        color_group="dark_blue",
+        house_cost=200,
+        rents=(50, 200, 600, 1400, 1700, 2000),
+    ),
+]
+SPACE_BY_ID = {space.space_id: space for space in CLASSIC_STANDARD_BOARD}
+COLOR_GROUP_TO_SPACE_IDS: dict[str, list[str]] = {}
+for _space in CLASSIC_STANDARD_BOARD:
+    if _space.color_group:
+        COLOR_GROUP_TO_SPACE_IDS.setdefault(_space.color_group, []).append(_space.space_id)
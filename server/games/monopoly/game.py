@@ -6,6 +6,8 @@ from dataclasses import dataclass, field, replace
 import random
 import re
 
+from mashumaro import field_options
+
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.action_guard_mixin import ActionGuardMixin
@@ -60,6 +62,20 @@ from .hardware_emulation import HardwareEvent, HardwareResult, resolve_hardware_
 from .manual_rules.loader import load_manual_rule_set
 from .manual_rules.models import ManualRuleSet
 from .deck_provider import resolve_deck_provider
+from .board_catalog import CompiledBoard, build_space_from_manual_row, get_compiled_board
+from .valuation import PositionValuation, get_position_valuation, property_value
+from .ownership_index import (
+    IndexedBuildingLevels,
+    IndexedMortgageList,
+    IndexedOwnerMap,
+    OwnershipIndex,
+)
+from .board_spaces import (
+    CLASSIC_STANDARD_BOARD,
+    COLOR_GROUP_TO_SPACE_IDS,
+    SPACE_BY_ID,
+    MonopolySpace,
+)
 from .presets import (
     DEFAULT_PRESET_ID,
     MonopolyPreset,
@@ -98,288 +114,6 @@ JUNIOR_MODERN_PRESET_ID = "junior_modern"
 JUNIOR_LEGACY_PRESET_ID = "junior_legacy"
 
 
-@dataclass(frozen=True)
-class MonopolySpace:
-    """A board space on the classic Monopoly board."""
-
-    index: int
-    space_id: str
-    name: str
-    kind: str
-    price: int = 0
-    rent: int = 0
-    color_group: str = ""
-    house_cost: int = 0
-    rents: tuple[int, ...] = ()
-
-
-CLASSIC_STANDARD_BOARD = [
-    MonopolySpace(0, "go", "GO", "start"),
-    MonopolySpace(
-        1,
-        "mediterranean_avenue",
-        "Mediterranean Avenue",
-        "property",
-        60,
-        2,
-        color_group="brown",
-        house_cost=50,
-        rents=(2, 10, 30, 90, 160, 250),
-    ),
-    MonopolySpace(2, "community_chest_1", "Community Chest", "community_chest"),
-    MonopolySpace(
-        3,
-        "baltic_avenue",
-        "Baltic Avenue",
-        "property",
-        60,
-        4,
-        color_group="brown",
-        house_cost=50,
-        rents=(4, 20, 60, 180, 320, 450),
-    ),
-    MonopolySpace(4, "income_tax", "Income Tax", "tax"),
-    MonopolySpace(5, "reading_railroad", "Reading Railroad", "railroad", 200, 25),
-    MonopolySpace(
-        6,
-        "oriental_avenue",
-        "Oriental Avenue",
-        "property",
-        100,
-        6,
-        color_group="light_blue",
-        house_cost=50,
-        rents=(6, 30, 90, 270, 400, 550),
-    ),
-    MonopolySpace(7, "chance_1", "Chance", "chance"),
-    MonopolySpace(
-        8,
-        "vermont_avenue",
-        "Vermont Avenue",
-        "property",
-        100,
-        6,
-        color_group="light_blue",
-        house_cost=50,
-        rents=(6, 30, 90, 270, 400, 550),
-    ),
-    MonopolySpace(
-        9,
-        "connecticut_avenue",
-        "Connecticut Avenue",
-        "property",
-        120,
-        8,
-        color_group="light_blue",
-        house_cost=50,
-        rents=(8, 40, 100, 300, 450, 600),
-    ),
-    MonopolySpace(10, "jail", "Jail / Just Visiting", "jail"),
-    MonopolySpace(
-        11,
-        "st_charles_place",
-        "St. Charles Place",
-        "property",
-        140,
-        10,
-        color_group="pink",
-        house_cost=100,
-        rents=(10, 50, 150, 450, 625, 750),
-    ),
-    MonopolySpace(12, "electric_company", "Electric Company", "utility", 150, 20),
-    MonopolySpace(
-        13,
-        "states_avenue",
-        "States Avenue",
-        "property",
-        140,
-        10,
-        color_group="pink",
-        house_cost=100,
-        rents=(10, 50, 150, 450, 625, 750),
-    ),
-    MonopolySpace(
-        14,
-        "virginia_avenue",
-        "Virginia Avenue",
-        "property",
-        160,
-        12,
-        color_group="pink",
-        house_cost=100,
-        rents=(12, 60, 180, 500, 700, 900),
-    ),
-    MonopolySpace(15, "pennsylvania_railroad", "Pennsylvania Railroad", "railroad", 200, 25),
-    MonopolySpace(
-        16,
-        "st_james_place",
-        "St. James Place",
-        "property",
-        180,
-        14,
-        color_group="orange",
-        house_cost=100,
-        rents=(14, 70, 200, 550, 750, 950),
-    ),
-    MonopolySpace(17, "community_chest_2", "Community Chest", "community_chest"),
-    MonopolySpace(
-        18,
-        "tennessee_avenue",
-        "Tennessee Avenue",
-        "property",
-        180,
-        14,
-        color_group="orange",
-        house_cost=100,
-        rents=(14, 70, 200, 550, 750, 950),
-    ),
-    MonopolySpace(
-        19,
-        "new_york_avenue",
-        "New York Avenue",
-        "property",
-        200,
-        16,
-        color_group="orange",
-        house_cost=100,
-        rents=(16, 80, 220, 600, 800, 1000),
-    ),
-    MonopolySpace(20, "free_parking", "Free Parking", "free_parking"),
-    MonopolySpace(
-        21,
-        "kentucky_avenue",
-        "Kentucky Avenue",
-        "property",
-        220,
-        18,
-        color_group="red",
-        house_cost=150,
-        rents=(18, 90, 250, 700, 875, 1050),
-    ),
-    MonopolySpace(22, "chance_2", "Chance", "chance"),
-    MonopolySpace(
-        23,
-        "indiana_avenue",
-        "Indiana Avenue",
-        "property",
-        220,
-        18,
-        color_group="red",
-        house_cost=150,
-        rents=(18, 90, 250, 700, 875, 1050),
-    ),
-    MonopolySpace(
-        24,
-        "illinois_avenue",
-        "Illinois Avenue",
-        "property",
-        240,
-        20,
-        color_group="red",
-        house_cost=150,
-        rents=(20, 100, 300, 750, 925, 1100),
-    ),
-    MonopolySpace(25, "bo_railroad", "B. & O. Railroad", "railroad", 200, 25),
-    MonopolySpace(
-        26,
-        "atlantic_avenue",
-        "Atlantic Avenue",
-        "property",
-        260,
-        22,
-        color_group="yellow",
-        house_cost=150,
-        rents=(22, 110, 330, 800, 975, 1150),
-    ),
-    MonopolySpace(
-        27,
-        "ventnor_avenue",
-        "Ventnor Avenue",
-        "property",
-        260,
-        22,
-        color_group="yellow",
-        house_cost=150,
-        rents=(22, 110, 330, 800, 975, 1150),
-    ),
-    MonopolySpace(28, "water_works", "Water Works", "utility", 150, 20),
-    MonopolySpace(
-        29,
-        "marvin_gardens",
-        "Marvin Gardens",
-        "property",
-        280,
-        24,
-        color_group="yellow",
-        house_cost=150,
-        rents=(24, 120, 360, 850, 1025, 1200),
-    ),
-    MonopolySpace(30, "go_to_jail", "Go to Jail", "go_to_jail"),
-    MonopolySpace(
-        31,
-        "pacific_avenue",
-        "Pacific Avenue",
-        "property",
-        300,
-        26,
-        color_group="green",
-        house_cost=200,
-        rents=(26, 130, 390, 900, 1100, 1275),
-    ),
-    MonopolySpace(
-        32,
-        "north_carolina_avenue",
-        "North Carolina Avenue",
-        "property",
-        300,
-        26,
-        color_group="green",
-        house_cost=200,
-        rents=(26, 130, 390, 900, 1100, 1275),
-    ),
-    MonopolySpace(33, "community_chest_3", "Community Chest", "community_chest"),
-    MonopolySpace(
-        34,
-        "pennsylvania_avenue",
-        "Pennsylvania Avenue",
-        "property",
-        320,
-        28,
-        color_group="green",
-        house_cost=200,
-        rents=(28, 150, 450, 1000, 1200, 1400),
-    ),
-    MonopolySpace(35, "short_line", "Short Line", "railroad", 200, 25),
-    MonopolySpace(36, "chance_3", "Chance", "chance"),
-    MonopolySpace(
-        37,
-        "park_place",
-        "Park Place",
-        "property",
-        350,
-        35,
-        color_group="dark_blue",
-        house_cost=200,
-        rents=(35, 175, 500, 1100, 1300, 1500),
-    ),
-    MonopolySpace(38, "luxury_tax", "Luxury Tax", "tax"),
-    MonopolySpace(
-        39,
-        "boardwalk",
-        "Boardwalk",
-        "property",
-        400,
-        50,
-        color_group="dark_blue",
-        house_cost=200,
-        rents=(50, 200, 600, 1400, 1700, 2000),
-    ),
-]
-SPACE_BY_ID = {space.space_id: space for space in CLASSIC_STANDARD_BOARD}
-COLOR_GROUP_TO_SPACE_IDS: dict[str, list[str]] = {}
-for _space in CLASSIC_STANDARD_BOARD:
-    if _space.color_group:
-        COLOR_GROUP_TO_SPACE_IDS.setdefault(_space.color_group, []).append(_space.space_id)
 PURCHASABLE_KINDS = {"property", "railroad", "utility"}
 BOARD_SIZE = len(CLASSIC_STANDARD_BOARD)
 STARTING_CASH = 1500
@@ -617,15 +351,24 @@ class MonopolyGame(ActionGuardMixin, Game):
     active_board_deck_mode: str = "classic"
     active_board_parity_fidelity_status: str = "none"
     active_board_hardware_capability_ids: tuple[str, ...] = ()
-    active_manual_rule_set: ManualRuleSet | None = None
+    # Board structures derive from the shared compiled catalog; they are not
+    # serialized and are rebuilt in rebuild_runtime_state().
+    active_manual_rule_set: ManualRuleSet | None = field(
+        default=None, metadata=field_options(serialize="omit")
+    )
     active_board_spaces: list[MonopolySpace] = field(
-        default_factory=lambda: CLASSIC_STANDARD_BOARD.copy()
+        default_factory=lambda: CLASSIC_STANDARD_BOARD.copy(),
+        metadata=field_options(serialize="omit"),
+    )
+    active_space_by_id: dict[str, MonopolySpace] = field(
+        default_factory=lambda: SPACE_BY_ID.copy(),
+        metadata=field_options(serialize="omit"),
     )
-    active_space_by_id: dict[str, MonopolySpace] = field(default_factory=lambda: SPACE_BY_ID.copy())
     active_color_group_to_space_ids: dict[str, list[str]] = field(
         default_factory=lambda: {
             key: values.copy() for key, values in COLOR_GROUP_TO_SPACE_IDS.items()
-        }
+        },
+        metadata=field_options(serialize="omit"),
     )
     active_board_size: int = BOARD_SIZE
     active_sound_mode: str = "none"
@@ -709,6 +452,25 @@ class MonopolyGame(ActionGuardMixin, Game):
         """Create a Monopoly player."""
         return MonopolyPlayer(id=player_id, name=name, is_bot=is_bot)
 
+    def __post_init__(self):
+        super().__post_init__()
+        self._attach_ownership_index()
+
+    def rebuild_runtime_state(self) -> None:
+        """Reattach shared board structures after deserialization."""
+        super().rebuild_runtime_state()
+        self._load_active_board_structures()
+
+    def _attach_ownership_index(self) -> None:
+        """Wrap ownership containers so the ownership index tracks every change."""
+        self._ownership_index = OwnershipIndex(self)
+        self.property_owners = IndexedOwnerMap(self.property_owners, self._ownership_index)
+        self.mortgaged_space_ids = IndexedMortgageList(
+            self.mortgaged_space_ids, self._ownership_index
+        )
+        self.building_levels = IndexedBuildingLevels(self.building_levels, self._ownership_index)
+        self._ownership_index.rebuild()
+
     def _add_turn_roll_and_purchase_actions(self, action_set: ActionSet, locale: str) -> None:
         action_set.add(
             Action(
@@ -2595,105 +2357,49 @@ class MonopolyGame(ActionGuardMixin, Game):
 
     def _build_space_from_manual_row(self, row: dict[str, object], fallback_index: int) -> MonopolySpace:
         """Build one MonopolySpace from a manual rule artifact row."""
-        index = int(row.get("position", fallback_index))
-        space_id = str(row.get("space_id", f"space_{index}"))
-        name = str(row.get("name", space_id.replace("_", " ").title()))
-        kind = str(row.get("kind", "property"))
-        price = int(row.get("price", 0))
-        rent = int(row.get("rent", 0))
-        color_group = str(row.get("color_group", ""))
-        house_cost = int(row.get("house_cost", 0))
-        rents_raw = row.get("rents", ())
-        rents: tuple[int, ...]
-        if isinstance(rents_raw, list):
-            rents = tuple(int(value) for value in rents_raw)
-        else:
-            rents = ()
-        return MonopolySpace(
-            index=index,
-            space_id=space_id,
-            name=name,
-            kind=kind,
-            price=price,
-            rent=rent,
-            color_group=color_group,
-            house_cost=house_cost,
-            rents=rents,
+        return build_space_from_manual_row(row, fallback_index)
+
+    def _active_compiled_board(self) -> CompiledBoard:
+        """Return the shared compiled structures for the active board."""
+        return get_compiled_board(
+            self.active_board_id,
+            self.active_manual_rule_set,
+            self.active_board_rule_pack_id,
         )
 
+    def _load_active_board_structures(self) -> None:
+        """Attach shared manual rules and rebuild this table's board maps."""
+        self.active_manual_rule_set = self._load_active_manual_rule_set()
+        (
+            self.active_board_spaces,
+            self.active_space_by_id,
+            self.active_color_group_to_space_ids,
+        ) = self._resolve_active_board_structures()
+        self._sync_active_space_names_from_locale()
+        self._ownership_index.rebuild()
+
     def _resolve_active_board_structures(
         self,
     ) -> tuple[list[MonopolySpace], dict[str, MonopolySpace], dict[str, list[str]]]:
         """Resolve active board maps from manual rule set when available."""
-        if self.active_manual_rule_set is None:
-            return (
-                CLASSIC_STANDARD_BOARD.copy(),
-                SPACE_BY_ID.copy(),
-                {key: values.copy() for key, values in COLOR_GROUP_TO_SPACE_IDS.items()},
-            )
-
-        board_payload = self.active_manual_rule_set.board
-        spaces_payload = board_payload.get("spaces", [])
-        if not isinstance(spaces_payload, list):
-            spaces_payload = []
-
-        spaces: list[MonopolySpace] = []
-        for idx, row in enumerate(spaces_payload):
-            if not isinstance(row, dict):
-                continue
-            spaces.append(self._build_space_from_manual_row(row, idx))
-
-        if not spaces:
-            return (
-                CLASSIC_STANDARD_BOARD.copy(),
-                SPACE_BY_ID.copy(),
-                {key: values.copy() for key, values in COLOR_GROUP_TO_SPACE_IDS.items()},
-            )
-
-        spaces.sort(key=lambda space: space.index)
-        space_by_id = {space.space_id: space for space in spaces}
-        color_groups: dict[str, list[str]] = {}
-        for space in spaces:
-            if not self._is_street_property(space):
-                continue
-            color_groups.setdefault(space.color_group, []).append(space.space_id)
-        return spaces, space_by_id, color_groups
+        compiled = self._active_compiled_board()
+        return (
+            list(compiled.spaces),
+            dict(compiled.space_by_id),
+            compiled.color_groups_copy(),
+        )
 
     def _manual_deck_ids(self, deck_type: str) -> list[str]:
         """Return ordered manual deck ids for one deck type when available."""
         if self.active_manual_rule_set is None:
             return []
-        cards_payload = self.active_manual_rule_set.cards
-        deck_rows = cards_payload.get(deck_type, [])
-        if not isinstance(deck_rows, list):
-            return []
-        deck_ids: list[str] = []
-        for row in deck_rows:
-            if not isinstance(row, dict):
-                continue
-            card_id = row.get("id")
-            if not isinstance(card_id, str):
-                continue
-            if not card_id:
-                continue
-            deck_ids.append(card_id)
-        return deck_ids
+        return list(self._active_compiled_board().deck_ids.get(deck_type, ()))
 
     def _manual_card_definition(self, deck_type: str, card_id: str) -> dict[str, object] | None:
         """Resolve one manual card definition by deck type and id."""
         if self.active_manual_rule_set is None:
             return None
-        cards_payload = self.active_manual_rule_set.cards
-        deck_rows = cards_payload.get(deck_type, [])
-        if not isinstance(deck_rows, list):
-            return None
-        for row in deck_rows:
-            if not isinstance(row, dict):
-                continue
-            row_id = row.get("id")
-            if isinstance(row_id, str) and row_id == card_id:
-                return row
-        return None
+        return self._active_compiled_board().card_definitions.get((deck_type, card_id))
 
     def _apply_manual_card_effect(
         self,
@@ -3330,15 +3036,19 @@ class MonopolyGame(ActionGuardMixin, Game):
         group_ids = self.active_color_group_to_space_ids.get(color_group, [])
         if not group_ids:
             return False
-        return all(self.property_owners.get(space_id) == owner_id for space_id in group_ids)
+        return self._ownership_index.group_count(owner_id, color_group) >= len(group_ids)
 
     def _owns_all_of_kind(self, owner_id: str, kind: str) -> bool:
         """Return True when one owner controls every active space of one kind."""
-        total = sum(1 for space in self.active_board_spaces if space.kind == kind)
+        total = self._ownership_index.kind_total(kind)
         if total <= 0:
             return False
         return self._count_owned_kind(owner_id, kind) >= total
 
+    def _owner_asset_value(self, owner_id: str) -> int:
+        """Return indexed property, mortgage, and building value for one owner."""
+        return self._ownership_index.asset_value(owner_id)
+
     def _color_group_label(self, color_group: str, locale: str) -> str:
         """Return one localized color-group label."""
         return self._monopoly_text(
@@ -3572,6 +3282,21 @@ class MonopolyGame(ActionGuardMixin, Game):
                 total += self._mortgage_value(space)
         return total
 
+    def _position_valuation(self) -> PositionValuation:
+        """Return the shared landing-probability model for the active board."""
+        return get_position_valuation(self._active_compiled_board())
+
+    def _bot_property_value(self, space_id: str, owner_id: str) -> int:
+        """Estimate what one property is worth to an owner, for bot decisions."""
+        return property_value(self, space_id, owner_id)
+
+    def _bot_auction_bid_cap(self, player: MonopolyPlayer, space: MonopolySpace) -> int:
+        """Return the most a bot will bid for one auctioned space."""
+        return min(
+            max(space.price, self._bot_property_value(space.space_id, player.id)),
+            int(self._current_liquid_balance(player) * 0.85),
+        )
+
     def _property_trade_value(self, space_id: str) -> int:
         """Estimate trade value for a property."""
         space = self.active_space_by_id.get(space_id)
@@ -3818,12 +3543,20 @@ class MonopolyGame(ActionGuardMixin, Game):
 
         target_gain = (
             offer.give_cash
-            + (self._property_trade_value(offer.give_property_id) if offer.give_property_id else 0)
+            + (
+                self._bot_property_value(offer.give_property_id, target.id)
+                if offer.give_property_id
+                else 0
+            )
             + (offer.give_jail_cards * JAIL_CARD_TRADE_CASH)
         )
         target_cost = (
             offer.receive_cash
-            + (self._property_trade_value(offer.receive_property_id) if offer.receive_property_id else 0)
+            + (
+                self._bot_property_value(offer.receive_property_id, target.id)
+                if offer.receive_property_id
+                else 0
+            )
             + (offer.receive_jail_cards * JAIL_CARD_TRADE_CASH)
         )
         return target_gain >= target_cost
@@ -4177,31 +3910,34 @@ class MonopolyGame(ActionGuardMixin, Game):
 
     def _count_owned_kind(self, owner_id: str, kind: str) -> int:
         """Count how many properties of a kind the owner controls."""
-        total = 0
-        for space_id, space_owner_id in self.property_owners.items():
-            if space_owner_id != owner_id:
-                continue
-            space = self.active_space_by_id.get(space_id)
-            if space and space.kind == kind:
-                total += 1
-        return total
+        return self._ownership_index.kind_count(owner_id, kind)
 
     def _calculate_junior_rent_due(
-        self, space: MonopolySpace, owner_id: str, dice_total: int | None
+        self,
+        space: MonopolySpace,
+        owner_id: str,
+        dice_total: int | None,
+        *,
+        full_set: bool | None = None,
+        owned: int | None = None,
     ) -> int:
         """Compute Junior rent using active ruleset profile."""
         ruleset = self.junior_ruleset
         if ruleset is None:
             return max(0, space.rent)
+        if full_set is None and self._is_street_property(space):
+            full_set = self._owner_has_full_color_set(owner_id, space.color_group)
+        if owned is None and space.kind in ("railroad", "utility"):
+            owned = self._count_owned_kind(owner_id, space.kind)
 
         if ruleset.rent_mode == "modern_tier":
             if self._is_street_property(space):
                 base = max(1, space.rent)
-                if self._owner_has_full_color_set(owner_id, space.color_group):
+                if full_set:
                     return base + 1
                 return base
             if space.kind == "railroad":
-                return max(2, 2 * self._count_owned_kind(owner_id, "railroad"))
+                return max(2, 2 * owned)
             if space.kind == "utility":
                 roll_value = dice_total if dice_total is not None else sum(self.turn_last_roll)
                 return max(2, max(1, roll_value // 2))
@@ -4212,45 +3948,61 @@ class MonopolyGame(ActionGuardMixin, Game):
                 base = space.rents[0]
             else:
                 base = space.rent
-            if self._owner_has_full_color_set(owner_id, space.color_group):
+            if full_set:
                 return base * 2
             return base
 
         if space.kind == "railroad":
-            owned = max(1, self._count_owned_kind(owner_id, "railroad"))
-            return 5 * owned
+            return 5 * max(1, owned)
 
         if space.kind == "utility":
-            owned = max(1, self._count_owned_kind(owner_id, "utility"))
             roll_value = dice_total if dice_total is not None else sum(self.turn_last_roll)
-            return max(2, owned * max(1, roll_value // 2))
+            return max(2, max(1, owned) * max(1, roll_value // 2))
 
         return max(1, space.rent)
 
     def _calculate_rent_due(
-        self, space: MonopolySpace, owner_id: str, dice_total: int | None
+        self,
+        space: MonopolySpace,
+        owner_id: str,
+        dice_total: int | None,
+        *,
+        full_set: bool | None = None,
+        owned: int | None = None,
+        level: int | None = None,
     ) -> int:
-        """Compute official-ish rent for a landed space."""
+        """Compute official-ish rent for a landed space.
+
+        ``full_set``, ``owned`` (railroads or utilities held) and ``level``
+        override the live board state so bots can price hypothetical
+        ownership with the same rules.
+        """
         if self._is_junior_preset():
-            return self._calculate_junior_rent_due(space, owner_id, dice_total)
+            return self._calculate_junior_rent_due(
+                space, owner_id, dice_total, full_set=full_set, owned=owned
+            )
         if self._is_street_property(space):
-            level = self._building_level(space.space_id)
+            if level is None:
+                level = self._building_level(space.space_id)
             if space.rents:
                 if level > 0:
                     return space.rents[min(level, len(space.rents) - 1)]
                 base = space.rents[0]
             else:
                 base = space.rent
-            if self._owner_has_full_color_set(owner_id, space.color_group):
+            if full_set is None:
+                full_set = self._owner_has_full_color_set(owner_id, space.color_group)
+            if full_set:
                 return base * 2
             return base
 
+        if owned is None and space.kind in ("railroad", "utility"):
+            owned = self._count_owned_kind(owner_id, space.kind)
+
         if space.kind == "railroad":
-            owned = max(1, self._count_owned_kind(owner_id, "railroad"))
-            return 25 * (2 ** (owned - 1))
+            return 25 * (2 ** (max(1, owned) - 1))
 
         if space.kind == "utility":
-            owned = max(1, self._count_owned_kind(owner_id, "utility"))
             factor = 10 if owned >= 2 else 4
             roll_value = dice_total if dice_total is not None else sum(self.turn_last_roll)
             return factor * max(0, roll_value)
@@ -5463,18 +5215,7 @@ class MonopolyGame(ActionGuardMixin, Game):
 
     def _standard_total_asset_value(self, player: MonopolyPlayer) -> int:
         """Return a standard Monopoly total-asset estimate for endgame scoring."""
-        total = max(0, self._current_liquid_balance(player))
-        for space_id in player.owned_space_ids:
-            space = self._space_by_id_or_none(space_id)
-            if not space:
-                continue
-            if space_id in self.mortgaged_space_ids:
-                total += self._mortgage_value(space)
-            else:
-                total += max(0, space.price)
-            if self._is_street_property(space):
-                total += max(0, space.house_cost // 2) * self._building_level(space_id)
-        return total
+        return max(0, self._current_liquid_balance(player)) + self._owner_asset_value(player.id)
 
     def _sync_total_asset_scores(self) -> None:
         """Mirror total asset value into team scores for finished standard games."""
@@ -5497,6 +5238,7 @@ class MonopolyGame(ActionGuardMixin, Game):
     ) -> bool:
         """Finish City game selecting richest player by final value."""
         self.status = "finished"
+        self._table_state_changed()
         self.game_active = False
         self.set_turn_players([winner])
         self.turn_index = 0
@@ -5549,11 +5291,7 @@ class MonopolyGame(ActionGuardMixin, Game):
 
     def _owned_property_count(self, player: MonopolyPlayer) -> int:
         """Return how many currently owned board spaces belong to a player."""
-        return sum(
-            1
-            for owner_id in self.property_owners.values()
-            if owner_id == player.id
-        )
+        return self._ownership_index.owned_count(player.id)
 
     def _finish_junior_game_by_cash(self, contenders: list[MonopolyPlayer]) -> bool:
         """Finish junior game selecting highest-cash player as winner."""
@@ -5574,6 +5312,7 @@ class MonopolyGame(ActionGuardMixin, Game):
                 key=lambda item: (self._current_liquid_balance(item), -item.position, item.name),
             )
         self.status = "finished"
+        self._table_state_changed()
         self.game_active = False
         self.set_turn_players([winner])
         self.turn_index = 0
@@ -5718,6 +5457,7 @@ class MonopolyGame(ActionGuardMixin, Game):
         remaining = [turn_player for turn_player in ordered_before if not turn_player.bankrupt]
         if len(remaining) <= 1:
             self.status = "finished"
+            self._table_state_changed()
             self.game_active = False
             self.set_turn_players(remaining)
             self._sync_total_asset_scores()
@@ -6918,7 +6658,7 @@ class MonopolyGame(ActionGuardMixin, Game):
             if bidder.bot_think_ticks > 0:
                 bidder.bot_think_ticks -= 1
                 return True
-            action_id = self.bot_think(bidder)
+            action_id = self._bot_think_active_auction(bidder)
             if action_id:
                 self.execute_action(bidder, action_id)
         return True
@@ -6928,16 +6668,11 @@ class MonopolyGame(ActionGuardMixin, Game):
             return None
         current_bidder = self._current_auction_bidder()
         if current_bidder and current_bidder.id == player.id:
-            bid_options = self._options_for_auction_bid(player)
-            if not bid_options:
+            min_bid = self._auction_min_bid()
+            if self._current_liquid_balance(player) < min_bid:
                 return "auction_pass"
             space = self._pending_auction_space()
-            min_bid = int(bid_options[0])
-            cap = (
-                min(space.price, int(self._current_liquid_balance(player) * 0.85))
-                if space
-                else min_bid
-            )
+            cap = self._bot_auction_bid_cap(player, space) if space else min_bid
             if cap >= min_bid:
                 return "auction_bid"
             return "auction_pass"
@@ -7092,14 +6827,8 @@ class MonopolyGame(ActionGuardMixin, Game):
             self.active_board_id,
             self.active_board_deck_mode,
         ).mode
-        self.active_manual_rule_set = self._load_active_manual_rule_set()
+        self._load_active_board_structures()
         self.active_currency_name = self._resolve_active_currency_name()
-        (
-            self.active_board_spaces,
-            self.active_space_by_id,
-            self.active_color_group_to_space_ids,
-        ) = self._resolve_active_board_structures()
-        self._sync_active_space_names_from_locale()
         self.active_board_size = len(self.active_board_spaces)
         self.active_sound_mode = "none"
         self.last_hardware_event_id = ""
@@ -7163,9 +6892,12 @@ class MonopolyGame(ActionGuardMixin, Game):
         self.rule_profile = self._resolve_rule_profile(self.active_preset_id)
         self.property_owners.clear()
         self.mortgaged_space_ids.clear()
-        self.building_levels = {
-            space.space_id: 0 for space in self.active_board_spaces if self._is_street_property(space)
-        }
+        self.building_levels.clear()
+        self.building_levels.update(
+            (space.space_id, 0)
+            for space in self.active_board_spaces
+            if self._is_street_property(space)
+        )
         self.pending_trade_offer = None
         self.held_get_out_of_jail_cards_by_player_id.clear()
         self.free_parking_pool = 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 from pathlib import Path
 
@@ -11,9 +12,24 @@ from .models import ManualRuleSet
 DEFAULT_DATA_DIR = Path(__file__).resolve().parent / "data"
 
 
+@lru_cache(maxsize=None)
+def _load_manual_rule_set(path_str: str) -> ManualRuleSet:
+    """Parse one manual rule artifact (cached per process, shared read-only)."""
+    payload = json.loads(Path(path_str).read_text(encoding="utf-8"))
+    return ManualRuleSet.from_dict(payload)
+
+
 def load_manual_rule_set(board_id: str, data_dir: Path | None = None) -> ManualRuleSet:
-    """Load one board manual rule set from JSON artifact."""
+    """Load one board manual rule set from JSON artifact.
+
+    Artifacts are parsed once per process; every caller receives the same
+    instance and must treat its payload dicts as read-only.
+    """
     base = data_dir or DEFAULT_DATA_DIR
     path = base / f"{board_id}.json"
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    return ManualRuleSet.from_dict(payload)
+    return _load_manual_rule_set(str(path.resolve()))
+
+
+def clear_manual_rule_set_cache() -> None:
+    """Drop cached artifacts (for tools that rewrite them in place)."""
+    _load_manual_rule_set.cache_clear()
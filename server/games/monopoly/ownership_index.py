@@ -0,0 +1,272 @@
+"""Incrementally maintained ownership indexes for Monopoly tables.
+
+``OwnershipIndex`` keeps per-owner counters (properties per color group and
+per space kind) and total asset value. The game's
+``property_owners``, ``building_levels`` and ``mortgaged_space_ids``
+containers are wrapped in thin subclasses that report every mutation to
+the index, so rent, build, bot and endgame scoring decisions read
+counters instead of scanning the board. The wrappers serialize exactly like the plain
+containers they replace.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .board_spaces import MonopolySpace
+    from .game import MonopolyGame
+
+
+class OwnershipIndex:
+    """Per-owner counters derived from a Monopoly table's ownership state."""
+
+    def __init__(self, game: MonopolyGame):
+        self._game = game
+        self._group_counts: dict[str, Counter[str]] = {}
+        self._kind_counts: dict[str, Counter[str]] = {}
+        self._asset_values: dict[str, int] = {}
+        self._kind_totals: Counter[str] = Counter()
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Recompute every counter from the game's current state."""
+        game = self._game
+        self._group_counts = {}
+        self._kind_counts = {}
+        self._asset_values = {}
+        self._kind_totals = Counter(space.kind for space in game.active_board_spaces)
+        for space_id, owner_id in game.property_owners.items():
+            self._add_space(space_id, owner_id)
+
+    def owner_changed(self, space_id: str, old_owner: str | None, new_owner: str | None) -> None:
+        """Move one space between owners."""
+        if old_owner == new_owner:
+            return
+        if old_owner is not None:
+            self._remove_space(space_id, old_owner)
+        if new_owner is not None:
+            self._add_space(space_id, new_owner)
+
+    def building_changed(self, space_id: str, old_level: int, new_level: int) -> None:
+        """Apply a building level change on one space."""
+        space = self._space(space_id)
+        owner_id = self._game.property_owners.get(space_id)
+        if space is None or owner_id is None or old_level == new_level:
+            return
+        self._asset_values[owner_id] = self._asset_values.get(owner_id, 0) + (
+            (new_level - old_level) * self._building_value(space)
+        )
+
+    def mortgage_changed(self, space_id: str, mortgaged: bool) -> None:
+        """Apply a mortgage or unmortgage on one space."""
+        space = self._space(space_id)
+        owner_id = self._game.property_owners.get(space_id)
+        if space is None or owner_id is None:
+            return
+        delta = max(0, space.price) - self._game._mortgage_value(space)
+        self._asset_values[owner_id] = self._asset_values.get(owner_id, 0) + (
+            -delta if mortgaged else delta
+        )
+
+    def _space(self, space_id: str) -> MonopolySpace | None:
+        return self._game.active_space_by_id.get(space_id)
+
+    def _building_value(self, space: MonopolySpace) -> int:
+        if not self._game._is_street_property(space):
+            return 0
+        return max(0, space.house_cost // 2)
+
+    def _space_value(self, space: MonopolySpace) -> int:
+        game = self._game
+        if space.space_id in game.mortgaged_space_ids:
+            value = game._mortgage_value(space)
+        else:
+            value = max(0, space.price)
+        return value + self._building_value(space) * game.building_levels.get(space.space_id, 0)
+
+    def _add_space(self, space_id: str, owner_id: str) -> None:
+        space = self._space(space_id)
+        if space is None:
+            return
+        self._kind_counts.setdefault(owner_id, Counter())[space.kind] += 1
+        if self._game._is_street_property(space):
+            self._group_counts.setdefault(owner_id, Counter())[space.color_group] += 1
+        self._asset_values[owner_id] = self._asset_values.get(owner_id, 0) + self._space_value(
+            space
+        )
+
+    def _remove_space(self, space_id: str, owner_id: str) -> None:
+        space = self._space(space_id)
+        if space is None:
+            return
+        self._kind_counts.setdefault(owner_id, Counter())[space.kind] -= 1
+        if self._game._is_street_property(space):
+            self._group_counts.setdefault(owner_id, Counter())[space.color_group] -= 1
+        self._asset_values[owner_id] = self._asset_values.get(owner_id, 0) - self._space_value(
+            space
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def group_count(self, owner_id: str, color_group: str) -> int:
+        """Number of street properties of one color group an owner holds."""
+        counts = self._group_counts.get(owner_id)
+        return counts[color_group] if counts else 0
+
+    def kind_count(self, owner_id: str, kind: str) -> int:
+        """Number of spaces of one kind an owner holds."""
+        counts = self._kind_counts.get(owner_id)
+        return counts[kind] if counts else 0
+
+    def kind_total(self, kind: str) -> int:
+        """Number of spaces of one kind on the active board."""
+        return self._kind_totals[kind]
+
+    def owned_count(self, owner_id: str) -> int:
+        """Number of active board spaces one owner holds."""
+        counts = self._kind_counts.get(owner_id)
+        return counts.total() if counts else 0
+
+    def asset_value(self, owner_id: str) -> int:
+        """Property, mortgage and building value held by one owner."""
+        return self._asset_values.get(owner_id, 0)
+
+
+class IndexedOwnerMap(dict):
+    """``property_owners`` mapping that reports changes to an OwnershipIndex."""
+
+    def __init__(self, data: dict[str, str], index: OwnershipIndex):
+        super().__init__(data)
+        self._index = index
+
+    def __setitem__(self, space_id: str, owner_id: str) -> None:
+        old_owner = self.get(space_id)
+        super().__setitem__(space_id, owner_id)
+        self._index.owner_changed(space_id, old_owner, owner_id)
+
+    def __delitem__(self, space_id: str) -> None:
+        old_owner = self[space_id]
+        super().__delitem__(space_id)
+        self._index.owner_changed(space_id, old_owner, None)
+
+    def pop(self, space_id, *default):
+        if space_id not in self:
+            return super().pop(space_id, *default)
+        old_owner = super().pop(space_id)
+        self._index.owner_changed(space_id, old_owner, None)
+        return old_owner
+
+    def setdefault(self, space_id, default=None):
+        if space_id not in self:
+            self[space_id] = default
+        return self[space_id]
+
+    def popitem(self):
+        item = super().popitem()
+        self._index.rebuild()
+        return item
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._index.rebuild()
+
+    def clear(self) -> None:
+        super().clear()
+        self._index.rebuild()
+
+
+class IndexedBuildingLevels(dict):
+    """``building_levels`` mapping that reports changes to an OwnershipIndex."""
+
+    def __init__(self, data: dict[str, int], index: OwnershipIndex):
+        super().__init__(data)
+        self._index = index
+
+    def __setitem__(self, space_id: str, level: int) -> None:
+        old_level = self.get(space_id, 0)
+        super().__setitem__(space_id, level)
+        self._index.building_changed(space_id, old_level, level)
+
+    def __delitem__(self, space_id: str) -> None:
+        old_level = self[space_id]
+        super().__delitem__(space_id)
+        self._index.building_changed(space_id, old_level, 0)
+
+    def pop(self, space_id, *default):
+        if space_id not in self:
+            return super().pop(space_id, *default)
+        old_level = super().pop(space_id)
+        self._index.building_changed(space_id, old_level, 0)
+        return old_level
+
+    def setdefault(self, space_id, default=0):
+        if space_id not in self:
+            self[space_id] = default
+        return self[space_id]
+
+    def popitem(self):
+        item = super().popitem()
+        self._index.rebuild()
+        return item
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._index.rebuild()
+
+    def clear(self) -> None:
+        super().clear()
+        self._index.rebuild()
+
+
+class IndexedMortgageList(list):
+    """``mortgaged_space_ids`` list that reports changes to an OwnershipIndex."""
+
+    def __init__(self, data: list[str], index: OwnershipIndex):
+        super().__init__(data)
+        self._index = index
+
+    def append(self, space_id: str) -> None:
+        was_mortgaged = space_id in self
+        super().append(space_id)
+        if not was_mortgaged:
+            self._index.mortgage_changed(space_id, True)
+
+    def remove(self, space_id: str) -> None:
+        super().remove(space_id)
+        if space_id not in self:
+            self._index.mortgage_changed(space_id, False)
+
+    def _changed(self, result=None):
+        self._index.rebuild()
+        return result
+
+    def insert(self, index, space_id) -> None:
+        self._changed(super().insert(index, space_id))
+
+    def extend(self, space_ids) -> None:
+        self._changed(super().extend(space_ids))
+
+    def pop(self, index=-1):
+        return self._changed(super().pop(index))
+
+    def clear(self) -> None:
+        self._changed(super().clear())
+
+    def __setitem__(self, index, value) -> None:
+        self._changed(super().__setitem__(index, value))
+
+    def __delitem__(self, index) -> None:
+        self._changed(super().__delitem__(index))
+
+    def __iadd__(self, space_ids):
+        super().__iadd__(space_ids)
+        self._index.rebuild()
+        return self
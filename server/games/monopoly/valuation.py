@@ -0,0 +1,178 @@
+"""Position valuation model for Monopoly bots.
+
+Landing probabilities are the stationary distribution of a Markov chain over
+board positions (two six-sided dice, Go To Jail and the jail cards in the
+Chance and Community Chest decks). They depend only on the board layout, so
+they are computed once per compiled board and shared by every table using
+it. Bot decisions combine them with the game's rent rules and the live
+ownership index to estimate what each property earns.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import TYPE_CHECKING
+
+from .board_catalog import CompiledBoard
+
+if TYPE_CHECKING:
+    from .board_spaces import MonopolySpace
+    from .game import MonopolyGame
+
+# Opponent turns a bot expects to hold a property for when valuing it.
+HORIZON_TURNS_PER_OPPONENT = 20
+# Share of card draws that send the player to jail (1 card in each 16-card deck).
+CARD_JAIL_PROBABILITY = 1 / 16
+CARD_SPACE_KINDS = frozenset({"chance", "community_chest"})
+EXPECTED_DICE_TOTAL = 7
+DICE_TOTAL_PROBABILITIES: tuple[tuple[int, float], ...] = tuple(
+    (total, (6 - abs(total - 7)) / 36) for total in range(2, 13)
+)
+
+_MAX_ITERATIONS = 500
+_TOLERANCE = 1e-10
+
+
+def compute_landing_probabilities(spaces: tuple[MonopolySpace, ...]) -> dict[str, float]:
+    """Return the long-run share of turns that end on each space."""
+    count = len(spaces)
+    if count == 0:
+        return {}
+    jail_index = next(
+        (position for position, space in enumerate(spaces) if space.kind == "jail"),
+        None,
+    )
+
+    def _destinations(position: int) -> list[tuple[int, float]]:
+        landed = spaces[position]
+        if jail_index is None:
+            return [(position, 1.0)]
+        if landed.kind == "go_to_jail":
+            return [(jail_index, 1.0)]
+        if landed.kind in CARD_SPACE_KINDS:
+            return [(jail_index, CARD_JAIL_PROBABILITY), (position, 1 - CARD_JAIL_PROBABILITY)]
+        return [(position, 1.0)]
+
+    transitions: list[list[tuple[int, float]]] = []
+    for start in range(count):
+        row: dict[int, float] = {}
+        for total, chance in DICE_TOTAL_PROBABILITIES:
+            for target, share in _destinations((start + total) % count):
+                row[target] = row.get(target, 0.0) + chance * share
+        transitions.append(list(row.items()))
+
+    distribution = [1.0 / count] * count
+    for _ in range(_MAX_ITERATIONS):
+        updated = [0.0] * count
+        for start, weight in enumerate(distribution):
+            if weight:
+                for target, chance in transitions[start]:
+                    updated[target] += weight * chance
+        delta = max(abs(a - b) for a, b in zip(updated, distribution))
+        distribution = updated
+        if delta < _TOLERANCE:
+            break
+    return {space.space_id: distribution[position] for position, space in enumerate(spaces)}
+
+
+@dataclass(frozen=True)
+class PositionValuation:
+    """Read-only landing probabilities for one compiled board."""
+
+    board: CompiledBoard
+    landing_probability: dict[str, float]
+
+    def probability(self, space_id: str) -> float:
+        """Return the landing probability for one space (0 when unknown)."""
+        return self.landing_probability.get(space_id, 0.0)
+
+
+_valuations: dict[int, PositionValuation] = {}
+_valuations_lock = threading.Lock()
+
+
+def get_position_valuation(board: CompiledBoard) -> PositionValuation:
+    """Return the shared valuation for a compiled board, computing it once."""
+    valuation = _valuations.get(id(board))
+    if valuation is not None and valuation.board is board:
+        return valuation
+    with _valuations_lock:
+        valuation = _valuations.get(id(board))
+        if valuation is None or valuation.board is not board:
+            valuation = PositionValuation(
+                board=board,
+                landing_probability=compute_landing_probabilities(board.spaces),
+            )
+            _valuations[id(board)] = valuation
+    return valuation
+
+
+def expected_income(game: MonopolyGame, space_id: str, owner_id: str) -> float:
+    """Expected rent per opponent turn from one space if ``owner_id`` holds it.
+
+    Includes the extra rent the owner's other spaces earn because of it
+    (completed color set, more railroads or utilities owned). Rents come
+    from the game's own rules, so junior and classic boards are both priced
+    correctly.
+    """
+    space = game.active_space_by_id.get(space_id)
+    if space is None:
+        return 0.0
+    valuation = game._position_valuation()
+    index = game._ownership_index
+    held = game.property_owners.get(space_id) == owner_id
+    extra = 0 if held else 1
+
+    def rent(target: MonopolySpace, **hypothetical: object) -> int:
+        return game._calculate_rent_due(target, owner_id, EXPECTED_DICE_TOTAL, **hypothetical)
+
+    if game._is_street_property(space):
+        group_ids = game.active_color_group_to_space_ids.get(space.color_group, [])
+        full_set = bool(group_ids) and (
+            index.group_count(owner_id, space.color_group) + extra >= len(group_ids)
+        )
+        income = valuation.probability(space_id) * rent(space, full_set=full_set)
+        if full_set:
+            for other_id in group_ids:
+                if other_id == space_id or game._building_level(other_id) > 0:
+                    continue
+                other = game.active_space_by_id.get(other_id)
+                if other is not None and other_id not in game.mortgaged_space_ids:
+                    gain = rent(other, full_set=True) - rent(other, full_set=False)
+                    income += valuation.probability(other_id) * gain
+        return income
+
+    if space.kind in ("railroad", "utility"):
+        owned = index.kind_count(owner_id, space.kind) + extra
+        income = valuation.probability(space_id) * rent(space, owned=owned)
+        gain_per_other = (
+            rent(space, owned=owned) - rent(space, owned=owned - 1) if owned > 1 else 0
+        )
+        if gain_per_other:
+            for other_id, other_owner_id in game.property_owners.items():
+                if other_id == space_id or other_owner_id != owner_id:
+                    continue
+                other = game.active_space_by_id.get(other_id)
+                if (
+                    other is not None
+                    and other.kind == space.kind
+                    and other_id not in game.mortgaged_space_ids
+                ):
+                    income += valuation.probability(other_id) * gain_per_other
+        return income
+
+    return valuation.probability(space_id) * max(0, rent(space))
+
+
+def property_value(game: MonopolyGame, space_id: str, owner_id: str) -> int:
+    """Estimate what one property is worth to ``owner_id`` in cash."""
+    space = game.active_space_by_id.get(space_id)
+    if space is None:
+        return 100
+    opponents = max(1, len(game.get_active_players()) - 1)
+    horizon = HORIZON_TURNS_PER_OPPONENT * opponents
+    value = max(1, space.price) + int(horizon * expected_income(game, space_id, owner_id))
+    if space_id in game.mortgaged_space_ids:
+        value -= game._unmortgage_cost(space)
+    return max(1, value)
@@ -1,42 +1,112 @@
-"""Game registry for registering and looking up game types."""
+"""Game registry for registering and looking up game types.
 
+Games listed in ``manifest.GAME_MANIFEST`` are known to the registry before
+their modules are imported. Metadata queries (``get_entry``,
+``get_entries``, ``get_entries_by_category``) never import game code; the
+first ``get``/``get_game_class`` for a type imports its module, whose
+``@register_game`` decorator fills in the class.
+"""
+
+from importlib import import_module
 from typing import Type, TYPE_CHECKING
 
+from .manifest import GAME_MANIFEST, GameManifestEntry
+
 if TYPE_CHECKING:
     from .base import Game
 
 
+def _entry_for_class(game_class: Type["Game"]) -> GameManifestEntry:
+    """Build a manifest entry for a game registered outside the manifest."""
+    return GameManifestEntry(
+        game_type=game_class.get_type(),
+        module=game_class.__module__,
+        class_name=game_class.__name__,
+        name=game_class.get_name(),
+        name_key=game_class.get_name_key(),
+        category=game_class.get_category(),
+        min_players=game_class.get_min_players(),
+        max_players=game_class.get_max_players(),
+    )
+
+
 class GameRegistry:
     """Registry of all available game types."""
 
     _games: dict[str, Type["Game"]] = {}
+    _manifest: dict[str, GameManifestEntry] = {
+        entry.game_type: entry for entry in GAME_MANIFEST
+    }
 
     @classmethod
     def register(cls, game_class: Type["Game"]) -> None:
         """Register a game class."""
         game_type = game_class.get_type()
         cls._games[game_type] = game_class
+        if game_type not in cls._manifest:
+            cls._manifest[game_type] = _entry_for_class(game_class)
 
     @classmethod
     def get(cls, game_type: str) -> Type["Game"] | None:
-        """Get a game class by type."""
-        return cls._games.get(game_type)
+        """Get a game class by type, importing its module on first use."""
+        game_class = cls._games.get(game_type)
+        if game_class is None and game_type in cls._manifest:
+            game_class = cls._load(cls._manifest[game_type])
+        return game_class
+
+    @classmethod
+    def _load(cls, entry: GameManifestEntry) -> Type["Game"] | None:
+        module = import_module(entry.module, __package__)
+        game_class = cls._games.get(entry.game_type)
+        if game_class is None:
+            game_class = getattr(module, entry.class_name, None)
+            if game_class is not None:
+                cls.register(game_class)
+        return game_class
 
     @classmethod
     def get_game_class(cls, game_type: str) -> Type["Game"] | None:
         """Backward compatible alias for getting a game class by type."""
         return cls.get(game_type)
 
+    @classmethod
+    def is_loaded(cls, game_type: str) -> bool:
+        """Return whether a game's module has been imported."""
+        return game_type in cls._games
+
+    @classmethod
+    def get_entry(cls, game_type: str) -> GameManifestEntry | None:
+        """Get a game's manifest entry without importing it."""
+        return cls._manifest.get(game_type)
+
+    @classmethod
+    def get_entries(cls) -> list[GameManifestEntry]:
+        """Get manifest entries for every known game without importing them."""
+        return list(cls._manifest.values())
+
+    @classmethod
+    def get_entries_by_category(cls) -> dict[str, list[GameManifestEntry]]:
+        """Get manifest entries organized by category without importing games."""
+        categories: dict[str, list[GameManifestEntry]] = {}
+        for entry in cls._manifest.values():
+            categories.setdefault(entry.category, []).append(entry)
+        return categories
+
     @classmethod
     def get_all(cls) -> list[Type["Game"]]:
-        """Get all registered game classes."""
-        return list(cls._games.values())
+        """Get all game classes, importing any that are not loaded yet."""
+        classes = []
+        for game_type in list(cls._manifest):
+            game_class = cls.get(game_type)
+            if game_class is not None:
+                classes.append(game_class)
+        return classes
 
     @classmethod
     def get_by_category(cls) -> dict[str, list[Type["Game"]]]:
         """Get games organized by category."""
         categories: dict[str, list[Type["Game"]]] = {}
-        for game_class in cls._games.values():
+        for game_class in cls.get_all():
             category = game_class.get_category()
             if category not in categories:
                 categories[category] = []
@@ -7,11 +7,25 @@ Handles bot decision making for card play.
 from typing import TYPE_CHECKING
 
 from ...game_utils.cards import Card
-from .capture import find_captures, select_best_capture
+from .capture import (
+    COINS_SUIT,
+    PRIMIERA_FACE_VALUE,
+    PlayEvaluation,
+    get_capture_index,
+    is_settebello,
+    primiera_value,
+)
 
 if TYPE_CHECKING:
     from .game import ScopaGame, ScopaPlayer
 
+# Penalty for leaving a table the next player can sweep with one card.
+SCOPA_RISK_PENALTY = 15
+# Capture bonuses for the round points the won cards count towards.
+COIN_BONUS = 5
+SETTEBELLO_BONUS = 25
+PRIMIERA_WEIGHT = 0.3
+
 
 def bot_think(game: "ScopaGame", player: "ScopaPlayer") -> str | None:
     """
@@ -73,11 +87,12 @@ def find_best_combo_chain(
     best_captured: list[Card] = []
     best_score = 0.0
 
+    index = get_capture_index(table)
     for card in remaining_hand:
-        captures = find_captures(table, card.rank, escoba)
-        if captures:
+        best_capture = list(index.best_capture(card.rank, escoba))
+        if best_capture:
             sequence, captured, score = _evaluate_combo_completion(
-                captures, cards_played, card
+                best_capture, cards_played, card
             )
         else:
             sequence, captured, score = _explore_combo_chain(
@@ -99,9 +114,8 @@ def find_best_combo_chain(
 
 
 def _evaluate_combo_completion(
-    captures: list[list[Card]], cards_played: list[Card], card: Card
+    best_capture: list[Card], cards_played: list[Card], card: Card
 ) -> tuple[list[Card], list[Card], float]:
-    best_capture = select_best_capture(captures)
     played_set = {c.id for c in cards_played}
     captured_from_combo = [c for c in best_capture if c.id in played_set]
     if not captured_from_combo:
@@ -126,12 +140,11 @@ def _score_combo_completion(
 def _score_combo_captured_cards(captured_cards: list[Card]) -> float:
     score = 0.0
     for card in captured_cards:
-        if card.suit == 1:  # Diamond
+        if card.suit == COINS_SUIT:
             score += 2
-        if card.rank == 7:
-            score += 3
-        if card.rank == 7 and card.suit == 1:
+        if is_settebello(card):
             score += 5
+        score += (primiera_value(card) - PRIMIERA_FACE_VALUE) * PRIMIERA_WEIGHT
     return score
 
 
@@ -245,58 +258,62 @@ def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float
     inverse = game.options.inverse_scopa
     escoba = game.options.escoba
 
-    captures = find_captures(game.table_cards, card.rank, escoba)
+    evaluation = get_capture_index(game.table_cards).evaluate_play(card, escoba)
 
-    if not captures:
-        return _score_non_capture(game, card, player, inverse, escoba)
+    if not evaluation.captured_count:
+        return _score_non_capture(game, card, player, evaluation, inverse, escoba)
 
-    return _score_capture(game, card, captures, inverse)
+    return _score_capture(evaluation, inverse)
 
 
 def _score_non_capture(
-    game: "ScopaGame", card: Card, player: "ScopaPlayer", inverse: bool, escoba: bool
+    game: "ScopaGame",
+    card: Card,
+    player: "ScopaPlayer",
+    evaluation: PlayEvaluation,
+    inverse: bool,
+    escoba: bool,
 ) -> float:
     score = 10 - (card.rank * 0.5) if inverse else -5 + (card.rank * 0.5)
     score += check_combo_potential(game, card, player)
     if escoba and len(game.table_cards) == 0:
+        # Empty-table escoba safety already accounts for sweep risk
         score += evaluate_escoba_empty_table(card, inverse)
+    else:
+        score += _score_scopa_risk(evaluation, inverse)
     return score
 
 
-def _score_capture(
-    game: "ScopaGame", card: Card, captures: list[list[Card]], inverse: bool
-) -> float:
-    best_capture = select_best_capture(captures)
-    score = _score_capture_size(best_capture, inverse)
-    score += _score_scopa(best_capture, game.table_cards, inverse)
-    score += _score_capture_cards(best_capture, inverse)
+def _score_capture(evaluation: PlayEvaluation, inverse: bool) -> float:
+    score = _score_capture_size(evaluation.captured_count, inverse)
+    score += _score_scopa(evaluation.is_scopa, inverse)
+    score += _score_won_cards(evaluation, inverse)
+    score += _score_scopa_risk(evaluation, inverse)
     return score
 
 
-def _score_capture_size(best_capture: list[Card], inverse: bool) -> float:
-    num_captured = len(best_capture)
+def _score_capture_size(num_captured: int, inverse: bool) -> float:
     return -num_captured * 10 if inverse else num_captured * 10
 
 
-def _score_scopa(
-    best_capture: list[Card], table_cards: list[Card], inverse: bool
-) -> float:
-    num_captured = len(best_capture)
-    is_scopa = num_captured == len(table_cards) and len(table_cards) > 0
+def _score_scopa(is_scopa: bool, inverse: bool) -> float:
     if not is_scopa:
         return 0.0
     return -100 if inverse else 100
 
 
-def _score_capture_cards(best_capture: list[Card], inverse: bool) -> float:
-    score = 0.0
-    for card in best_capture:
-        if card.suit == 1:  # Diamond
-            score += -5 if inverse else 5
-        if card.rank == 7 and card.suit == 1:
-            score += -20 if inverse else 20
-        if card.rank == 7:
-            score += -3 if inverse else 3
-        if card.rank in (1, 6):
-            score += -2 if inverse else 2
-    return score
+def _score_scopa_risk(evaluation: PlayEvaluation, inverse: bool) -> float:
+    if not evaluation.scopa_risk:
+        return 0.0
+    return SCOPA_RISK_PENALTY if inverse else -SCOPA_RISK_PENALTY
+
+
+def _score_won_cards(evaluation: PlayEvaluation, inverse: bool) -> float:
+    """Score the coins, settebello and primiera strength of the cards won."""
+    won = evaluation.captured_count + 1
+    score = evaluation.coins * COIN_BONUS
+    if evaluation.settebello:
+        score += SETTEBELLO_BONUS
+    # Only primiera points above a face card's are worth chasing
+    score += (evaluation.primiera_value - PRIMIERA_FACE_VALUE * won) * PRIMIERA_WEIGHT
+    return -score if inverse else score
@@ -2,10 +2,29 @@
 Capture logic for Scopa game.
 
 Handles finding valid capture combinations and selecting the best one.
+
+Subset sums for a table layout are computed once by ``CaptureIndex`` and
+shared between menu hints, card play and bot simulation. Subsets are
+stored as bitmasks over table positions, so answering "what can a card of
+value v capture" is a dictionary lookup after the first build.
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from ...game_utils.cards import Card, card_name
 
+# Largest capture sum that can be asked for: escoba targets 15 minus the
+# played card, scopa targets the played rank (Italian ranks stop at 10).
+MAX_INDEXED_SUM = 15
+
+# Primiera points per rank (Italian deck).
+PRIMIERA_VALUES = {7: 21, 6: 18, 1: 16, 5: 15, 4: 14, 3: 13, 2: 12}
+PRIMIERA_FACE_VALUE = 10
+
+COINS_SUIT = 1  # Diamonds
+SETTEBELLO_RANK = 7
+
 
 def find_subsets_with_sum(cards: list[Card], target: int) -> list[list[Card]]:
     """Find all subsets of cards that sum to target."""
@@ -29,6 +48,155 @@ def find_subsets_with_sum(cards: list[Card], target: int) -> list[list[Card]]:
     return results
 
 
+def primiera_value(card: Card) -> int:
+    """Get the primiera points of a single card."""
+    return PRIMIERA_VALUES.get(card.rank, PRIMIERA_FACE_VALUE)
+
+
+def is_settebello(card: Card) -> bool:
+    """Check whether a card is the settebello (7 of diamonds)."""
+    return card.rank == SETTEBELLO_RANK and card.suit == COINS_SUIT
+
+
+@dataclass(frozen=True)
+class PlayEvaluation:
+    """Outcome of playing one card onto a table.
+
+    Attributes:
+        card: The card being played.
+        capture: Table cards taken by the best capture (empty if none).
+        captured_count: Number of table cards taken.
+        coins: Diamonds among the cards won (capture plus played card).
+        primiera_value: Primiera points of the cards won.
+        settebello: True if the settebello is among the cards won.
+        is_scopa: True if the capture clears the table.
+        scopa_risk: True if the next player could sweep the resulting table
+            with a single card.
+        remaining_total: Sum of ranks left on the table after the play.
+    """
+
+    card: Card
+    capture: tuple[Card, ...]
+    captured_count: int
+    coins: int
+    primiera_value: int
+    settebello: bool
+    is_scopa: bool
+    scopa_risk: bool
+    remaining_total: int
+
+
+class CaptureIndex:
+    """Precomputed capture combinations for one table layout.
+
+    Every subset of the table whose rank sum is at most ``MAX_INDEXED_SUM``
+    is enumerated once and grouped by sum. Subsets are kept in the same
+    depth-first order that ``find_subsets_with_sum`` produces so capture
+    choice (and its tie-breaking) is unchanged.
+    """
+
+    __slots__ = ("cards", "total", "_masks_by_sum", "_subsets")
+
+    def __init__(self, table_cards: list[Card] | tuple[Card, ...]):
+        self.cards: tuple[Card, ...] = tuple(table_cards)
+        self.total = sum(c.rank for c in self.cards)
+        self._masks_by_sum: dict[int, list[int]] = {}
+        self._subsets: dict[int, tuple[tuple[Card, ...], ...]] = {}
+        self._collect(0, 0, 0)
+
+    def _collect(self, start: int, mask: int, total: int) -> None:
+        for i in range(start, len(self.cards)):
+            new_total = total + self.cards[i].rank
+            if new_total > MAX_INDEXED_SUM:
+                continue
+            new_mask = mask | (1 << i)
+            self._masks_by_sum.setdefault(new_total, []).append(new_mask)
+            self._collect(i + 1, new_mask, new_total)
+
+    def _cards_for_mask(self, mask: int) -> tuple[Card, ...]:
+        return tuple(card for i, card in enumerate(self.cards) if mask >> i & 1)
+
+    def subsets_with_sum(self, target: int) -> tuple[tuple[Card, ...], ...]:
+        """Get all table subsets summing to target."""
+        if target <= 0:
+            return ()
+        if target > MAX_INDEXED_SUM:
+            return tuple(tuple(s) for s in find_subsets_with_sum(list(self.cards), target))
+        subsets = self._subsets.get(target)
+        if subsets is None:
+            subsets = tuple(
+                self._cards_for_mask(mask) for mask in self._masks_by_sum.get(target, ())
+            )
+            self._subsets[target] = subsets
+        return subsets
+
+    def captures(self, card_value: int, escoba: bool = False) -> tuple[tuple[Card, ...], ...]:
+        """Get all valid capture combinations for a card value."""
+        if escoba:
+            return self.subsets_with_sum(15 - card_value)
+        rank_matches = tuple((c,) for c in self.cards if c.rank == card_value)
+        if rank_matches:
+            return rank_matches
+        return self.subsets_with_sum(card_value)
+
+    def best_capture(self, card_value: int, escoba: bool = False) -> tuple[Card, ...]:
+        """Get the best capture (most cards) for a card value."""
+        captures = self.captures(card_value, escoba)
+        if not captures:
+            return ()
+        return max(captures, key=len)
+
+    def can_sweep(self, escoba: bool = False) -> bool:
+        """Check whether a single card could capture the whole table."""
+        return bool(self.cards) and _sweepable(self.total, escoba)
+
+    def evaluate_play(self, card: Card, escoba: bool = False) -> PlayEvaluation:
+        """Evaluate playing a card onto this table."""
+        capture = self.best_capture(card.rank, escoba)
+        won = capture + (card,) if capture else ()
+        if capture:
+            remaining_total = self.total - sum(c.rank for c in capture)
+            is_scopa = len(capture) == len(self.cards)
+        else:
+            remaining_total = self.total + card.rank
+            is_scopa = False
+        # Sweeping only depends on what is left, so no index is built for it
+        scopa_risk = not is_scopa and _sweepable(remaining_total, escoba)
+        return PlayEvaluation(
+            card=card,
+            capture=capture,
+            captured_count=len(capture),
+            coins=sum(1 for c in won if c.suit == COINS_SUIT),
+            primiera_value=sum(primiera_value(c) for c in won),
+            settebello=any(is_settebello(c) for c in won),
+            is_scopa=is_scopa,
+            scopa_risk=scopa_risk,
+            remaining_total=remaining_total,
+        )
+
+
+def _sweepable(table_total: int, escoba: bool) -> bool:
+    """Check whether one card could take a non-empty table with this rank sum."""
+    if escoba:
+        return 1 <= 15 - table_total <= 10
+    return table_total <= 10
+
+
+@lru_cache(maxsize=512)
+def _cached_index(key: tuple[tuple[int, int, int], ...]) -> CaptureIndex:
+    return CaptureIndex([Card(id=card_id, rank=rank, suit=suit) for card_id, rank, suit in key])
+
+
+def get_capture_index(table_cards: list[Card] | tuple[Card, ...]) -> CaptureIndex:
+    """
+    Get the shared capture index for a table layout.
+
+    Indexes are cached per process by table contents, so every menu label,
+    play and bot simulation over the same table reuses one build.
+    """
+    return _cached_index(tuple((c.id, c.rank, c.suit) for c in table_cards))
+
+
 def find_captures(
     table_cards: list[Card], card_value: int, escoba: bool = False
 ) -> list[list[Card]]:
@@ -46,18 +214,8 @@ def find_captures(
     For standard scopa: rank match first, then sum combinations.
     For escoba: find combinations that sum to 15 (including played card).
     """
-    if escoba:
-        # Escoba: find subsets that sum to 15 - card_value
-        target = 15 - card_value
-        return find_subsets_with_sum(table_cards, target)
-    else:
-        # Standard scopa: rank match first
-        rank_matches = [c for c in table_cards if c.rank == card_value]
-        if rank_matches:
-            # Return each single match as a separate option
-            return [[c] for c in rank_matches]
-        # No rank match, find sum combinations
-        return find_subsets_with_sum(table_cards, card_value)
+    captures = get_capture_index(table_cards).captures(card_value, escoba)
+    return [list(capture) for capture in captures]
 
 
 def select_best_capture(captures: list[list[Card]]) -> list[Card]:
@@ -82,10 +240,9 @@ def get_capture_hint(
     Returns:
         Hint string like " -> 7 of Coins" or " -> 3 cards", or empty string.
     """
-    captures = find_captures(table_cards, card.rank, escoba)
-    if not captures:
+    best = get_capture_index(table_cards).best_capture(card.rank, escoba)
+    if not best:
         return ""
-    best = select_best_capture(captures)
     if len(best) == 1:
         return f" -> {card_name(best[0], locale)}"
     else:
@@ -34,7 +34,7 @@ from ...messages.localization import Localization
 from server.core.ui.keybinds import KeybindState
 
 # Modular components
-from .capture import find_captures, select_best_capture, get_capture_hint
+from .capture import get_capture_hint, get_capture_index
 from .scoring import score_round, check_winner, declare_winner
 from .bot import bot_think
 
@@ -646,11 +646,12 @@ class ScopaGame(Game):
         self.play_sound(f"game_cards/{play_sound}")
 
         # Find and execute capture
-        captures = find_captures(self.table_cards, card.rank, self.options.escoba)
+        best_capture = get_capture_index(self.table_cards).best_capture(
+            card.rank, self.options.escoba
+        )
 
-        if captures:
-            best_capture = select_best_capture(captures)
-            self._execute_capture(player, card, best_capture)
+        if best_capture:
+            self._execute_capture(player, card, list(best_capture))
         else:
             # No capture, card goes to table
             self.table_cards.append(card)
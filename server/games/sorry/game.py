@@ -316,6 +316,7 @@ class SorryGame(Game):
     def _finish_game(self, winner: Player) -> None:
         self.game_active = False
         self.status = "finished"
+        self._table_state_changed()
         self.broadcast_l("game-winner", player=winner.name)
         self.rebuild_all_menus()
 
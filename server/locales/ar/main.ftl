@@ -349,6 +349,12 @@ demote-announcement-you = تم تخفيض رتبتك من مشرف.
 not-admin-anymore = لم تعد مشرفاً ولا يمكنك تنفيذ هذا الإجراء.
 not-server-owner = مالك الخادم فقط يمكنه تنفيذ هذا الإجراء.
 
+# Network traffic report
+network-stats = حركة الشبكة
+network-stats-empty = لم تُرسل أي حزم منذ بدء تشغيل الخادم.
+network-stats-header = أُرسلت { $packets } حزمة: { $raw } كيلوبايت قبل الضغط، و{ $wire } كيلوبايت عبر الشبكة (نسبة { $ratio } إلى 1).
+network-stats-line = { $type }: { $packets } حزمة، { $raw } كيلوبايت، أُرسل منها { $wire } كيلوبايت (نسبة { $ratio } إلى 1).
+
 # نقل ملكية الخادم
 transfer-ownership = نقل الملكية
 transfer-ownership-menu-title = نقل الملكية
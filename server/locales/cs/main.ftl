@@ -324,6 +324,12 @@ demote-announcement-you = Byli jste odebráni z adminů.
 not-admin-anymore = Již nejste admin a nemůžete provést tuto akci.
 not-server-owner = Pouze vlastník serveru může provést tuto akci.
 
+# Network traffic report
+network-stats = Síťový provoz
+network-stats-empty = Od spuštění serveru nebyly odeslány žádné pakety.
+network-stats-header = Odesláno { $packets } paketů: { $raw } KB před kompresí, { $wire } KB po síti (poměr { $ratio } ku 1).
+network-stats-line = { $type }: { $packets } paketů, { $raw } KB, odesláno { $wire } KB (poměr { $ratio } ku 1).
+
 # Převod vlastnictví serveru
 transfer-ownership = Převést vlastnictví
 transfer-ownership-menu-title = Převést vlastnictví
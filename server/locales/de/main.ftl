@@ -288,6 +288,12 @@ demote-announcement-you = Sie wurden vom Admin herabgestuft.
 not-admin-anymore = Sie sind kein Admin mehr und können diese Aktion nicht durchführen.
 not-server-owner = Nur der Serverbesitzer kann diese Aktion durchführen.
 
+# Network traffic report
+network-stats = Netzwerkverkehr
+network-stats-empty = Seit dem Serverstart wurden keine Pakete gesendet.
+network-stats-header = { $packets } Pakete gesendet: { $raw } KB vor der Komprimierung, { $wire } KB übertragen (Verhältnis { $ratio } zu 1).
+network-stats-line = { $type }: { $packets } Pakete, { $raw } KB, { $wire } KB gesendet (Verhältnis { $ratio } zu 1).
+
 # Serverbesitzübertragung
 transfer-ownership = Besitz übertragen
 transfer-ownership-menu-title = Besitz übertragen
@@ -303,6 +303,12 @@ demote-announcement-you = You have been demoted from admin.
 not-admin-anymore = You are no longer an admin and cannot perform this action.
 not-server-owner = Only the server owner can perform this action.
 
+# Network traffic report
+network-stats = Network Traffic
+network-stats-empty = No packets have been sent since the server started.
+network-stats-header = { $packets } packets sent: { $raw } KB before compression, { $wire } KB on the wire ({ $ratio } to 1).
+network-stats-line = { $type }: { $packets } packets, { $raw } KB, { $wire } KB sent ({ $ratio } to 1).
+
 # Server ownership transfer
 transfer-ownership = Transfer Ownership
 transfer-ownership-menu-title = Transfer Ownership
@@ -376,6 +382,9 @@ documents-all = All documents
 documents-uncategorized = Uncategorized documents
 documents-no-documents = No documents found.
 documents-no-content = No content available for this document.
+documents-search = Search documents
+documents-search-prompt = Enter words to search for:
+documents-search-no-results = No documents match { $query }.
 
 # Document actions
 documents-view = View document content
@@ -288,6 +288,12 @@ demote-announcement-you = Has sido degradado de administrador.
 not-admin-anymore = Ya no eres administrador y no puedes realizar esta acción.
 not-server-owner = Solo el propietario del servidor puede realizar esta acción.
 
+# Network traffic report
+network-stats = Tráfico de red
+network-stats-empty = No se han enviado paquetes desde que se inició el servidor.
+network-stats-header = { $packets } paquetes enviados: { $raw } KB antes de la compresión, { $wire } KB transmitidos (proporción { $ratio } a 1).
+network-stats-line = { $type }: { $packets } paquetes, { $raw } KB, { $wire } KB enviados (proporción { $ratio } a 1).
+
 # Server ownership transfer
 transfer-ownership = Transferir Propiedad
 transfer-ownership-menu-title = Transferir Propiedad
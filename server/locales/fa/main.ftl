@@ -288,6 +288,12 @@ demote-announcement-you = شما از مدیر کاهش یافتید.
 not-admin-anymore = شما دیگر مدیر نیستید و نمی‌توانید این اقدام را انجام دهید.
 not-server-owner = فقط مالک سرور می‌تواند این اقدام را انجام دهد.
 
+# Network traffic report
+network-stats = ترافیک شبکه
+network-stats-empty = از زمان راه‌اندازی سرور هیچ بسته‌ای ارسال نشده است.
+network-stats-header = { $packets } بسته ارسال شد: { $raw } کیلوبایت پیش از فشرده‌سازی، { $wire } کیلوبایت روی شبکه (نسبت { $ratio } به 1).
+network-stats-line = { $type }: { $packets } بسته، { $raw } کیلوبایت، { $wire } کیلوبایت ارسال‌شده (نسبت { $ratio } به 1).
+
 # Server ownership transfer
 transfer-ownership = انتقال مالکیت
 transfer-ownership-menu-title = انتقال مالکیت
@@ -291,6 +291,12 @@ demote-announcement-you = Vous avez été rétrogradé d'administrateur.
 not-admin-anymore = Vous n'êtes plus administrateur et ne pouvez pas effectuer cette action.
 not-server-owner = Seul le propriétaire du serveur peut effectuer cette action.
 
+# Network traffic report
+network-stats = Trafic réseau
+network-stats-empty = Aucun paquet n'a été envoyé depuis le démarrage du serveur.
+network-stats-header = { $packets } paquets envoyés : { $raw } Ko avant compression, { $wire } Ko transmis (rapport { $ratio } pour 1).
+network-stats-line = { $type } : { $packets } paquets, { $raw } Ko, { $wire } Ko envoyés (rapport { $ratio } pour 1).
+
 # Transfert de propriété du serveur
 transfer-ownership = Transférer la propriété
 transfer-ownership-menu-title = Transférer la propriété
@@ -288,6 +288,12 @@ demote-announcement-you = आपको प्रशासक से पदाव
 not-admin-anymore = आप अब प्रशासक नहीं हैं और यह कार्रवाई नहीं कर सकते।
 not-server-owner = केवल सर्वर स्वामी ही यह कार्रवाई कर सकता है।
 
+# Network traffic report
+network-stats = नेटवर्क ट्रैफ़िक
+network-stats-empty = सर्वर शुरू होने के बाद से कोई पैकेट नहीं भेजा गया है।
+network-stats-header = { $packets } पैकेट भेजे गए: संपीड़न से पहले { $raw } KB, नेटवर्क पर { $wire } KB (अनुपात { $ratio } से 1)।
+network-stats-line = { $type }: { $packets } पैकेट, { $raw } KB, { $wire } KB भेजे गए (अनुपात { $ratio } से 1)।
+
 # Server ownership transfer
 transfer-ownership = स्वामित्व स्थानांतरित करें
 transfer-ownership-menu-title = स्वामित्व स्थानांतरित करें
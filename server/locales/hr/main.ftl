@@ -288,6 +288,12 @@ demote-announcement-you = Razriješen si s pozicije administratora.
 not-admin-anymore = Više nisi administrator i ne možeš izvršiti ovu radnju.
 not-server-owner = Samo vlasnik servera može izvršiti ovu radnju.
 
+# Network traffic report
+network-stats = Mrežni promet
+network-stats-empty = Od pokretanja poslužitelja nije poslan nijedan paket.
+network-stats-header = Poslano { $packets } paketa: { $raw } KB prije sažimanja, { $wire } KB mrežom (omjer { $ratio } prema 1).
+network-stats-line = { $type }: { $packets } paketa, { $raw } KB, poslano { $wire } KB (omjer { $ratio } prema 1).
+
 # Server ownership transfer
 transfer-ownership = Prenesi vlasništvo
 transfer-ownership-menu-title = Prenesi vlasništvo
@@ -288,6 +288,12 @@ demote-announcement-you = Le lettél fokozva az adminisztrátori pozícióból.
 not-admin-anymore = Már nem vagy adminisztrátor és nem hajthatod végre ezt a műveletet.
 not-server-owner = Csak a szerver tulajdonosa hajthatja végre ezt a műveletet.
 
+# Network traffic report
+network-stats = Hálózati forgalom
+network-stats-empty = A szerver indulása óta nem lett csomag elküldve.
+network-stats-header = { $packets } csomag elküldve: { $raw } KB tömörítés előtt, { $wire } KB a hálózaton ({ $ratio } az 1-hez arány).
+network-stats-line = { $type }: { $packets } csomag, { $raw } KB, { $wire } KB elküldve ({ $ratio } az 1-hez arány).
+
 # Server ownership transfer
 transfer-ownership = Tulajdonjog átruházása
 transfer-ownership-menu-title = Tulajdonjog átruházása
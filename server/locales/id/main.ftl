@@ -288,6 +288,12 @@ demote-announcement-you = Anda telah diturunkan dari admin.
 not-admin-anymore = Anda tidak lagi admin dan tidak dapat melakukan aksi ini.
 not-server-owner = Hanya pemilik server yang dapat melakukan aksi ini.
 
+# Network traffic report
+network-stats = Lalu lintas jaringan
+network-stats-empty = Belum ada paket yang dikirim sejak server dimulai.
+network-stats-header = { $packets } paket terkirim: { $raw } KB sebelum kompresi, { $wire } KB melalui jaringan (rasio { $ratio } banding 1).
+network-stats-line = { $type }: { $packets } paket, { $raw } KB, { $wire } KB terkirim (rasio { $ratio } banding 1).
+
 # Server ownership transfer
 transfer-ownership = Transfer Kepemilikan
 transfer-ownership-menu-title = Transfer Kepemilikan
@@ -288,6 +288,12 @@ demote-announcement-you = Sei stato retrocesso da amministratore.
 not-admin-anymore = Non sei più un amministratore e non puoi eseguire questa azione.
 not-server-owner = Solo il proprietario del server può eseguire questa azione.
 
+# Network traffic report
+network-stats = Traffico di rete
+network-stats-empty = Nessun pacchetto è stato inviato dall'avvio del server.
+network-stats-header = { $packets } pacchetti inviati: { $raw } KB prima della compressione, { $wire } KB trasmessi (rapporto { $ratio } a 1).
+network-stats-line = { $type }: { $packets } pacchetti, { $raw } KB, { $wire } KB inviati (rapporto { $ratio } a 1).
+
 # Server ownership transfer
 transfer-ownership = Trasferisci proprietà
 transfer-ownership-menu-title = Trasferisci proprietà
@@ -279,6 +279,12 @@ demote-announcement-you = あなたは管理者から降格されました。
 not-admin-anymore = あなたはもう管理者ではないため、このアクションを実行できません。
 not-server-owner = サーバーオーナーだけがこのアクションを実行できます。
 
+# Network traffic report
+network-stats = ネットワーク通信量
+network-stats-empty = サーバー起動後、パケットはまだ送信されていません。
+network-stats-header = { $packets } 個のパケットを送信しました: 圧縮前 { $raw } KB、実際の送信量 { $wire } KB（{ $ratio } 対 1）。
+network-stats-line = { $type }: { $packets } 個、{ $raw } KB、送信量 { $wire } KB（{ $ratio } 対 1）。
+
 # サーバー所有権の譲渡
 transfer-ownership = 所有権を譲渡
 transfer-ownership-menu-title = 所有権を譲渡
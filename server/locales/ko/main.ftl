@@ -279,6 +279,12 @@ demote-announcement-you = 당신은 관리자에서 강등되었습니다.
 not-admin-anymore = 당신은 더 이상 관리자가 아니므로 이 작업을 수행할 수 없습니다.
 not-server-owner = 서버 소유자만 이 작업을 수행할 수 있습니다.
 
+# Network traffic report
+network-stats = 네트워크 트래픽
+network-stats-empty = 서버가 시작된 이후 전송된 패킷이 없습니다.
+network-stats-header = 패킷 { $packets }개 전송: 압축 전 { $raw } KB, 실제 전송 { $wire } KB ({ $ratio } 대 1).
+network-stats-line = { $type }: 패킷 { $packets }개, { $raw } KB, 전송 { $wire } KB ({ $ratio } 대 1).
+
 # Server ownership transfer
 transfer-ownership = 소유권 이전
 transfer-ownership-menu-title = 소유권 이전
@@ -288,6 +288,12 @@ demote-announcement-you = Та админаас буугдлаа.
 not-admin-anymore = Та админ байхаа больсон тул энэ үйлдлийг хийж чадахгүй.
 not-server-owner = Зөвхөн серверийн эзэн энэ үйлдлийг хийж чадна.
 
+# Network traffic report
+network-stats = Сүлжээний урсгал
+network-stats-empty = Сервер эхэлснээс хойш ямар ч пакет илгээгдээгүй байна.
+network-stats-header = { $packets } пакет илгээсэн: шахахаас өмнө { $raw } KB, сүлжээгээр { $wire } KB (харьцаа { $ratio } : 1).
+network-stats-line = { $type }: { $packets } пакет, { $raw } KB, илгээсэн { $wire } KB (харьцаа { $ratio } : 1).
+
 # Server ownership transfer
 transfer-ownership = Эзэмшил шилжүүлэх
 transfer-ownership-menu-title = Эзэмшил шилжүүлэх
@@ -288,6 +288,12 @@ demote-announcement-you = Je bent gedegradeerd van beheerder.
 not-admin-anymore = Je bent geen beheerder meer en kunt deze actie niet uitvoeren.
 not-server-owner = Alleen de servereigenaar kan deze actie uitvoeren.
 
+# Network traffic report
+network-stats = Netwerkverkeer
+network-stats-empty = Er zijn geen pakketten verzonden sinds de server is gestart.
+network-stats-header = { $packets } pakketten verzonden: { $raw } KB vóór compressie, { $wire } KB over het netwerk (verhouding { $ratio } op 1).
+network-stats-line = { $type }: { $packets } pakketten, { $raw } KB, { $wire } KB verzonden (verhouding { $ratio } op 1).
+
 # Server ownership transfer
 transfer-ownership = Draag Eigendom Over
 transfer-ownership-menu-title = Draag Eigendom Over
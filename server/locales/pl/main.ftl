@@ -285,6 +285,12 @@ demote-announcement-you = Zostałeś zdegradowany z funkcji administratora.
 not-admin-anymore = Nie jesteś już administratorem, i nie możesz wykonać tej akcji.
 not-server-owner = Tylko właściciel serwera może wykonać tę akcję.
 
+# Network traffic report
+network-stats = Ruch sieciowy
+network-stats-empty = Od uruchomienia serwera nie wysłano żadnych pakietów.
+network-stats-header = Wysłano { $packets } pakietów: { $raw } KB przed kompresją, { $wire } KB przez sieć (stosunek { $ratio } do 1).
+network-stats-line = { $type }: { $packets } pakietów, { $raw } KB, wysłano { $wire } KB (stosunek { $ratio } do 1).
+
 # Server ownership transfer
 transfer-ownership = Przekaż własność
 transfer-ownership-menu-title = Przekaż własność
@@ -246,6 +246,12 @@ demote-announcement-you = Você foi rebaixado de admin.
 not-admin-anymore = Você não é mais um admin e não pode realizar esta ação.
 not-server-owner = Apenas o proprietário do servidor pode realizar esta ação.
 
+# Network traffic report
+network-stats = Tráfego de rede
+network-stats-empty = Nenhum pacote foi enviado desde que o servidor foi iniciado.
+network-stats-header = { $packets } pacotes enviados: { $raw } KB antes da compressão, { $wire } KB transmitidos (proporção de { $ratio } para 1).
+network-stats-line = { $type }: { $packets } pacotes, { $raw } KB, { $wire } KB enviados (proporção de { $ratio } para 1).
+
 # Transferência de propriedade do servidor
 transfer-ownership = Transferir Propriedade
 transfer-ownership-menu-title = Transferir Propriedade
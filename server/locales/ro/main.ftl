@@ -291,6 +291,12 @@ demote-announcement-you = Ai fost retrogradat de la administrator.
 not-admin-anymore = Nu mai ești administrator și nu poți efectua această acțiune.
 not-server-owner = Doar proprietarul serverului poate efectua această acțiune.
 
+# Network traffic report
+network-stats = Trafic de rețea
+network-stats-empty = Nu a fost trimis niciun pachet de la pornirea serverului.
+network-stats-header = { $packets } pachete trimise: { $raw } KB înainte de comprimare, { $wire } KB prin rețea (raport { $ratio } la 1).
+network-stats-line = { $type }: { $packets } pachete, { $raw } KB, { $wire } KB trimiși (raport { $ratio } la 1).
+
 # Server ownership transfer
 transfer-ownership = Transferă proprietatea
 transfer-ownership-menu-title = Transferă proprietatea
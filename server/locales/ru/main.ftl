@@ -327,6 +327,12 @@ demote-announcement-you = С вас сняты права администрат
 not-admin-anymore = Вы больше не являетесь администратором и не можете выполнить это действие.
 not-server-owner = Только владелец сервера может выполнить это действие.
 
+# Network traffic report
+network-stats = Сетевой трафик
+network-stats-empty = С момента запуска сервера не было отправлено ни одного пакета.
+network-stats-header = Отправлено пакетов: { $packets }. До сжатия { $raw } КБ, по сети { $wire } КБ (соотношение { $ratio } к 1).
+network-stats-line = { $type }: пакетов { $packets }, { $raw } КБ, отправлено { $wire } КБ (соотношение { $ratio } к 1).
+
 # Server ownership transfer
 transfer-ownership = Передать владение
 transfer-ownership-menu-title = Передача владения
@@ -294,6 +294,12 @@ demote-announcement-you = Boli ste degradovaný z administrátora.
 not-admin-anymore = Už nie ste administrátor a nemôžete vykonať túto akciu.
 not-server-owner = Túto akciu môže vykonať len majiteľ servera.
 
+# Network traffic report
+network-stats = Sieťová prevádzka
+network-stats-empty = Od spustenia servera neboli odoslané žiadne pakety.
+network-stats-header = Odoslaných { $packets } paketov: { $raw } KB pred kompresiou, { $wire } KB cez sieť (pomer { $ratio } ku 1).
+network-stats-line = { $type }: { $packets } paketov, { $raw } KB, odoslaných { $wire } KB (pomer { $ratio } ku 1).
+
 # Server ownership transfer
 transfer-ownership = Previesť vlastníctvo
 transfer-ownership-menu-title = Previesť vlastníctvo
@@ -288,6 +288,12 @@ demote-announcement-you = Ponižan si bil iz administratorja.
 not-admin-anymore = Nisi več administrator in ne moreš izvesti tega dejanja.
 not-server-owner = To dejanje lahko izvede samo lastnik strežnika.
 
+# Network traffic report
+network-stats = Omrežni promet
+network-stats-empty = Od zagona strežnika ni bil poslan noben paket.
+network-stats-header = Poslanih { $packets } paketov: { $raw } KB pred stiskanjem, { $wire } KB po omrežju (razmerje { $ratio } proti 1).
+network-stats-line = { $type }: { $packets } paketov, { $raw } KB, poslanih { $wire } KB (razmerje { $ratio } proti 1).
+
 # Server ownership transfer
 transfer-ownership = Prenesi lastništvo
 transfer-ownership-menu-title = Prenesi lastništvo
@@ -291,6 +291,12 @@ demote-announcement-you = Više niste administrator.
 not-admin-anymore = Više niste administrator i ne možete izvršiti ovu radnju.
 not-server-owner = Samo vlasnik servera može da izvrši ovu radnju.
 
+# Network traffic report
+network-stats = Мрежни саобраћај
+network-stats-empty = Од покретања сервера није послат ниједан пакет.
+network-stats-header = Послато { $packets } пакета: { $raw } KB пре компресије, { $wire } KB мрежом (однос { $ratio } према 1).
+network-stats-line = { $type }: { $packets } пакета, { $raw } KB, послато { $wire } KB (однос { $ratio } према 1).
+
 # Server ownership transfer
 transfer-ownership = Prebaci vlasništvo
 transfer-ownership-menu-title = Prebaci vlasništvo
@@ -288,6 +288,12 @@ demote-announcement-you = Du har degraderats från administratör.
 not-admin-anymore = Du är inte längre administratör och kan inte utföra denna åtgärd.
 not-server-owner = Endast serverägaren kan utföra denna åtgärd.
 
+# Network traffic report
+network-stats = Nätverkstrafik
+network-stats-empty = Inga paket har skickats sedan servern startade.
+network-stats-header = { $packets } paket skickade: { $raw } KB före komprimering, { $wire } KB över nätverket (förhållande { $ratio } till 1).
+network-stats-line = { $type }: { $packets } paket, { $raw } KB, { $wire } KB skickade (förhållande { $ratio } till 1).
+
 # Server ownership transfer
 transfer-ownership = Överför ägarskap
 transfer-ownership-menu-title = Överför ägarskap
@@ -279,6 +279,12 @@ demote-announcement-you = คุณถูกปลดจากผู้ดูแ
 not-admin-anymore = คุณไม่ใช่ผู้ดูแลระบบอีกต่อไปและไม่สามารถทำการกระทำนี้ได้
 not-server-owner = เฉพาะเจ้าของเซิร์ฟเวอร์เท่านั้นที่สามารถทำการกระทำนี้ได้
 
+# Network traffic report
+network-stats = ปริมาณการใช้เครือข่าย
+network-stats-empty = ยังไม่มีการส่งแพ็กเก็ตใดตั้งแต่เซิร์ฟเวอร์เริ่มทำงาน
+network-stats-header = ส่งแพ็กเก็ตแล้ว { $packets } รายการ: ก่อนบีบอัด { $raw } KB, ส่งจริง { $wire } KB (อัตราส่วน { $ratio } ต่อ 1)
+network-stats-line = { $type }: { $packets } แพ็กเก็ต, { $raw } KB, ส่งจริง { $wire } KB (อัตราส่วน { $ratio } ต่อ 1)
+
 # Server ownership transfer
 transfer-ownership = โอนความเป็นเจ้าของ
 transfer-ownership-menu-title = โอนความเป็นเจ้าของ
@@ -288,6 +288,12 @@ demote-announcement-you = Yöneticiden düşürüldün.
 not-admin-anymore = Artık yönetici değilsin ve bu eylemi gerçekleştiremezsin.
 not-server-owner = Bu eylemi sadece sunucu sahibi gerçekleştirebilir.
 
+# Network traffic report
+network-stats = Ağ trafiği
+network-stats-empty = Sunucu başlatıldığından beri hiç paket gönderilmedi.
+network-stats-header = { $packets } paket gönderildi: sıkıştırmadan önce { $raw } KB, ağ üzerinden { $wire } KB (oran { $ratio }'e 1).
+network-stats-line = { $type }: { $packets } paket, { $raw } KB, gönderilen { $wire } KB (oran { $ratio }'e 1).
+
 # Sunucu sahipliği transferi
 transfer-ownership = Sahipliği Aktar
 transfer-ownership-menu-title = Sahipliği Aktar
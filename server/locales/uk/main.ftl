@@ -288,6 +288,12 @@ demote-announcement-you = Вас знято з адміністратора.
 not-admin-anymore = Ви більше не адміністратор і не можете виконати цю дію.
 not-server-owner = Тільки власник сервера може виконати цю дію.
 
+# Network traffic report
+network-stats = Мережевий трафік
+network-stats-empty = Від запуску сервера не було надіслано жодного пакета.
+network-stats-header = Надіслано пакетів: { $packets }. До стиснення { $raw } КБ, мережею { $wire } КБ (співвідношення { $ratio } до 1).
+network-stats-line = { $type }: пакетів { $packets }, { $raw } КБ, надіслано { $wire } КБ (співвідношення { $ratio } до 1).
+
 # Server ownership transfer
 transfer-ownership = Передати володіння
 transfer-ownership-menu-title = Передати володіння
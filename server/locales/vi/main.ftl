@@ -288,6 +288,12 @@ demote-announcement-you = Bạn đã bị bãi nhiệm Admin.
 not-admin-anymore = Bạn không còn là Admin và không thể thực hiện hành động này.
 not-server-owner = Chỉ chủ sở hữu máy chủ mới được thực hiện hành động này.
 
+# Network traffic report
+network-stats = Lưu lượng mạng
+network-stats-empty = Chưa có gói tin nào được gửi kể từ khi máy chủ khởi động.
+network-stats-header = Đã gửi { $packets } gói tin: { $raw } KB trước khi nén, { $wire } KB truyền đi (tỉ lệ { $ratio } trên 1).
+network-stats-line = { $type }: { $packets } gói tin, { $raw } KB, đã gửi { $wire } KB (tỉ lệ { $ratio } trên 1).
+
 # Chuyển nhượng quyền sở hữu Server
 transfer-ownership = Chuyển nhượng quyền sở hữu
 transfer-ownership-menu-title = Chuyển nhượng quyền sở hữu
@@ -236,6 +236,12 @@ demote-announcement-you = 您已被降级。
 not-admin-anymore = 您已不再是管理员，无法执行此操作。
 not-server-owner = 只有服务器所有者才能执行此操作。
 
+# Network traffic report
+network-stats = 网络流量
+network-stats-empty = 自服务器启动以来尚未发送任何数据包。
+network-stats-header = 已发送 { $packets } 个数据包：压缩前 { $raw } KB，实际传输 { $wire } KB（压缩比 { $ratio } 比 1）。
+network-stats-line = { $type }：{ $packets } 个数据包，{ $raw } KB，实际发送 { $wire } KB（压缩比 { $ratio } 比 1）。
+
 # 服务器所有权转移
 transfer-ownership = 转移所有权
 transfer-ownership-menu-title = 转移所有权
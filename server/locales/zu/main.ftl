@@ -288,6 +288,12 @@ demote-announcement-you = Wena uyehliselwe emlaululini.
 not-admin-anymore = Awuseyena umlawuli futhi awukwazi ukwenza lesi senzo.
 not-server-owner = Umnikazi weseva kuphela ongakwenza lesi senzo.
 
+# Network traffic report
+network-stats = Ithrafikhi yenethiwekhi
+network-stats-empty = Awekho amaphakethe athunyelwe selokhu iseva yaqala.
+network-stats-header = Kuthunyelwe amaphakethe angu-{ $packets }: u-{ $raw } KB ngaphambi kokucindezela, u-{ $wire } KB kunethiwekhi (isilinganiso { $ratio } ku-1).
+network-stats-line = { $type }: amaphakethe angu-{ $packets }, u-{ $raw } KB, kuthunyelwe u-{ $wire } KB (isilinganiso { $ratio } ku-1).
+
 # Server ownership transfer
 transfer-ownership = Dlulisela Ubunini
 transfer-ownership-menu-title = Dlulisela Ubunini
@@ -0,0 +1,156 @@
+"""Websocket compression settings and per-packet-type size telemetry."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from websockets.extensions.base import ServerExtensionFactory
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import CTRL_OPCODES, Frame, Opcode
+
+MIN_WINDOW_BITS = 9
+MAX_WINDOW_BITS = 15
+
+
+@dataclass(frozen=True)
+class CompressionSettings:
+    """permessage-deflate settings offered to clients.
+
+    The defaults match what ``websockets`` negotiates on its own, plus
+    ``min_bytes``: messages shorter than this are sent uncompressed, since
+    deflate framing costs more than it saves on tiny packets.
+    """
+
+    enabled: bool = True
+    server_max_window_bits: int = 12
+    client_max_window_bits: int | None = 12
+    memory_level: int = 5
+    level: int = 6
+    min_bytes: int = 64
+
+    def extensions(self) -> list[ServerExtensionFactory]:
+        """Return the extension factories to pass to ``serve``."""
+        if not self.enabled:
+            return []
+        return [
+            ThresholdPerMessageDeflateFactory(
+                min_bytes=self.min_bytes,
+                server_max_window_bits=self.server_max_window_bits,
+                client_max_window_bits=self.client_max_window_bits,
+                compress_settings={"memLevel": self.memory_level, "level": self.level},
+            )
+        ]
+
+
+class ThresholdPerMessageDeflate(PerMessageDeflate):
+    """permessage-deflate that leaves short messages uncompressed.
+
+    RFC 7692 lets either side send a message without the RSV1 bit, so
+    skipping small messages needs no extra negotiation. ``on_encoded`` is
+    called with the raw and on-the-wire payload size of every data message.
+    """
+
+    def __init__(self, *args: Any, min_bytes: int = 0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.min_bytes = min_bytes
+        self.on_encoded: Callable[[int, int], None] | None = None
+        self._passthrough = False
+        self._raw_bytes = 0
+        self._wire_bytes = 0
+
+    def encode(self, frame: Frame) -> Frame:
+        """Compress an outgoing frame unless its message is under the threshold."""
+        if frame.opcode in CTRL_OPCODES:
+            return frame
+        if frame.opcode is not Opcode.CONT:
+            self._passthrough = frame.fin and len(frame.data) < self.min_bytes
+            self._raw_bytes = 0
+            self._wire_bytes = 0
+        encoded = frame if self._passthrough else super().encode(frame)
+        self._raw_bytes += len(frame.data)
+        self._wire_bytes += len(encoded.data)
+        if frame.fin and self.on_encoded is not None:
+            self.on_encoded(self._raw_bytes, self._wire_bytes)
+        return encoded
+
+
+class ThresholdPerMessageDeflateFactory(ServerPerMessageDeflateFactory):
+    """Server factory negotiating ``ThresholdPerMessageDeflate``."""
+
+    def __init__(self, *, min_bytes: int = 0, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.min_bytes = min_bytes
+
+    def process_request_params(self, params, accepted_extensions):
+        """Negotiate as usual, then swap in the thresholded extension."""
+        response_params, extension = super().process_request_params(
+            params, accepted_extensions
+        )
+        return response_params, ThresholdPerMessageDeflate(
+            extension.remote_no_context_takeover,
+            extension.local_no_context_takeover,
+            extension.remote_max_window_bits,
+            extension.local_max_window_bits,
+            extension.compress_settings,
+            min_bytes=self.min_bytes,
+        )
+
+
+@dataclass
+class PacketSizeTotals:
+    """Running totals for one packet type."""
+
+    packets: int = 0
+    raw_bytes: float = 0.0
+    wire_bytes: float = 0.0
+
+
+class PacketSizeStats:
+    """Server-wide byte counters per packet type, before and after compression.
+
+    A batched frame is compressed as a whole, so its sizes are split
+    between the packets in it in proportion to their serialized length.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[str, PacketSizeTotals] = {}
+
+    def record(
+        self, parts: Sequence[tuple[str, int]], raw_bytes: int, wire_bytes: int
+    ) -> None:
+        """Add one sent frame.
+
+        Args:
+            parts: ``(packet_type, serialized_length)`` for each packet in the frame.
+            raw_bytes: Frame payload size before compression.
+            wire_bytes: Frame payload size as sent.
+        """
+        weight_total = sum(weight for _, weight in parts) or 1
+        for packet_type, weight in parts:
+            totals = self._totals.get(packet_type)
+            if totals is None:
+                totals = self._totals[packet_type] = PacketSizeTotals()
+            share = weight / weight_total
+            totals.packets += 1
+            totals.raw_bytes += raw_bytes * share
+            totals.wire_bytes += wire_bytes * share
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return per-type totals, largest uncompressed volume first."""
+        rows = [
+            {
+                "type": packet_type,
+                "packets": totals.packets,
+                "raw_bytes": round(totals.raw_bytes),
+                "wire_bytes": round(totals.wire_bytes),
+            }
+            for packet_type, totals in self._totals.items()
+        ]
+        rows.sort(key=lambda row: row["raw_bytes"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        """Forget all counters."""
+        self._totals.clear()
@@ -49,6 +49,7 @@ class AuthorizePacket(BasePacket):
     patch: int | None = None
     client_type: str | None = None
     platform: str | None = None
+    features: list[str] | None = None
 
     @model_validator(mode="after")
     def _ensure_credentials(self) -> "AuthorizePacket":
@@ -72,6 +73,7 @@ class RefreshSessionPacket(BasePacket):
     username: str | None = None
     client_type: str | None = None
     platform: str | None = None
+    features: list[str] | None = None
 
 
 class MenuSelectionPacket(BasePacket):
@@ -81,6 +83,12 @@ class MenuSelectionPacket(BasePacket):
     selection_id: str | None = None
 
 
+class RequestMenuItemsPacket(BasePacket):
+    type: Literal["request_menu_items"] = "request_menu_items"
+    menu_id: str
+    offset: int = Field(ge=0)
+
+
 class EscapePacket(BasePacket):
     type: Literal["escape"] = "escape"
     menu_id: str | None = None
@@ -178,6 +186,7 @@ ClientToServerPacket = Annotated[
         RegisterPacket,
         RefreshSessionPacket,
         MenuSelectionPacket,
+        RequestMenuItemsPacket,
         KeybindPacket,
         EscapePacket,
         EditboxPacket,
@@ -277,6 +286,15 @@ class MenuPacket(BasePacket):
     selection_id: str | None = None
     grid_enabled: bool | None = None
     grid_width: MenuIndex | None = None
+    total_items: int | None = Field(default=None, ge=0)
+
+
+class MenuItemsPacket(BasePacket):
+    type: Literal["menu_items"] = "menu_items"
+    menu_id: str
+    offset: int = Field(ge=0)
+    items: list[MenuItem]
+    total_items: int = Field(ge=0)
 
 
 class RequestInputPacket(BasePacket):
@@ -403,6 +421,7 @@ ServerToClientPacket = Annotated[
         PlayAmbiencePacket,
         StopAmbiencePacket,
         MenuPacket,
+        MenuItemsPacket,
         RequestInputPacket,
         ClearUIPacket,
         DisconnectPacket,
@@ -1,26 +1,93 @@
 """WebSocket server for client connections."""
 
+import asyncio
+from collections import deque
 import errno
 import json
 import logging
 import ssl
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Coroutine
+from typing import Any, Callable, Coroutine
 
 import websockets
 from pydantic import ValidationError
 from websockets.asyncio.server import serve, ServerConnection
 
+from .compression import CompressionSettings, PacketSizeStats, ThresholdPerMessageDeflate
 from .packet_models import SERVER_TO_CLIENT_PACKET_ADAPTER
 
 PACKET_LOGGER = logging.getLogger("playpalace.packets")
 
+DEFAULT_OUTBOUND_MAX_PACKETS = 2048
+DEFAULT_OUTBOUND_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_OUTBOUND_MAX_LAG_SECONDS = 30.0
+LAGGING_DISCONNECT_TIMEOUT_SECONDS = 5.0
+# Clients that advertise the "packet_batches" feature receive whatever is
+# queued when the writer wakes as one JSON array frame of up to this many packets.
+MAX_BATCH_PACKETS = 64
 
-@dataclass
+# Later packets of these types replace any queued earlier one.
+_SUPERSEDING_CHANNELS = {
+    "play_music": "music",
+    "stop_music": "music",
+    "play_ambience": "ambience",
+    "stop_ambience": "ambience",
+}
+# Queued packets of these types are dropped first when a queue is over its limits.
+_SHEDDABLE_TYPES = frozenset({"play_sound"})
+
+
+@dataclass(frozen=True)
+class OutboundLimits:
+    """High-water marks for one connection's outbound queue.
+
+    A client whose queue stays over ``max_packets``/``max_bytes`` after
+    coalescing and shedding, or whose oldest queued packet is older than
+    ``max_lag_seconds``, is disconnected with the reconnect flag set.
+    """
+
+    max_packets: int = DEFAULT_OUTBOUND_MAX_PACKETS
+    max_bytes: int = DEFAULT_OUTBOUND_MAX_BYTES
+    max_lag_seconds: float = DEFAULT_OUTBOUND_MAX_LAG_SECONDS
+
+
+class _Outbound:
+    """One queued, already serialized packet."""
+
+    __slots__ = ("packet", "text", "size", "key", "queued_at")
+
+    def __init__(self, packet: dict[str, Any], text: str, key: tuple | None, queued_at: float):
+        self.packet = packet
+        self.text: str | None = text
+        self.size = len(text)
+        self.key = key
+        self.queued_at = queued_at
+
+
+def _coalesce_key(packet: dict[str, Any]) -> tuple | None:
+    packet_type = packet.get("type")
+    if packet_type == "menu":
+        return ("menu", packet.get("menu_id"))
+    channel = _SUPERSEDING_CHANNELS.get(packet_type)
+    return (channel,) if channel else None
+
+
+@dataclass(eq=False)
 class ClientConnection:
-    """Represents a connected client."""
+    """Represents a connected client.
+
+    Packets from ``enqueue`` go through a bounded per-connection queue
+    drained by a single writer task, so a slow client never holds more
+    than ``limits`` worth of pending output. While a packet waits, a newer
+    menu packet for the same ``menu_id`` is merged into it and newer music
+    or ambience packets replace older ones. Clients with the
+    ``packet_batches`` feature get queued packets bundled into array frames.
+    Every frame sent is counted in ``stats`` by packet type, before and
+    after compression.
+    """
 
     websocket: ServerConnection
     address: str
@@ -29,24 +96,214 @@ class ClientConnection:
     replaced: bool = False
     client_type: str = ""
     platform: str = ""
+    features: frozenset[str] = frozenset()
+    limits: OutboundLimits = field(default_factory=OutboundLimits)
+    stats: PacketSizeStats | None = None
+    lagging: bool = False
+    _outbound: deque[_Outbound] = field(default_factory=deque, init=False, repr=False)
+    _pending: dict[tuple, _Outbound] = field(default_factory=dict, init=False, repr=False)
+    _queued_packets: int = field(default=0, init=False, repr=False)
+    _queued_bytes: int = field(default=0, init=False, repr=False)
+    _writer: asyncio.Task | None = field(default=None, init=False, repr=False)
+    _deflate: ThresholdPerMessageDeflate | None = field(default=None, init=False, repr=False)
+    _deflate_checked: bool = field(default=False, init=False, repr=False)
+    _sending: list[tuple[str, int]] = field(default_factory=list, init=False, repr=False)
 
-    async def send(self, packet: dict) -> None:
-        """Send a packet to this client."""
+    def _encode(self, packet: dict) -> tuple[dict[str, Any], str] | None:
         try:
             packet_model = SERVER_TO_CLIENT_PACKET_ADAPTER.validate_python(packet)
             payload = packet_model.model_dump(exclude_none=True)
         except ValidationError as exc:
             identifier = self.username or self.address
             PACKET_LOGGER.warning("Refusing to send invalid packet to %s: %s", identifier, exc)
+            return None
+        return payload, json.dumps(payload)
+
+    async def send(self, packet: dict) -> None:
+        """Send a packet to this client immediately."""
+        encoded = self._encode(packet)
+        if encoded is None:
             return
 
+        payload, text = encoded
         try:
-            await self.websocket.send(json.dumps(payload))
+            await self._send_frame(text, [(payload["type"], len(text))])
         except websockets.exceptions.ConnectionClosed:
             pass
 
+    async def _send_frame(self, text: str, parts: list[tuple[str, int]]) -> None:
+        deflate = self._deflate_extension()
+        # The websocket encodes the frame before its first await, so the
+        # extension's size callback always sees this frame's parts.
+        self._sending = parts
+        await self.websocket.send(text)
+        if deflate is None and self.stats is not None:
+            size = len(text.encode("utf-8"))
+            self.stats.record(parts, size, size)
+
+    def _deflate_extension(self) -> ThresholdPerMessageDeflate | None:
+        if not self._deflate_checked:
+            self._deflate_checked = True
+            protocol = getattr(self.websocket, "protocol", None)
+            for extension in getattr(protocol, "extensions", ()):
+                if isinstance(extension, ThresholdPerMessageDeflate):
+                    extension.on_encoded = self._on_frame_encoded
+                    self._deflate = extension
+        return self._deflate
+
+    def _on_frame_encoded(self, raw_bytes: int, wire_bytes: int) -> None:
+        if self.stats is not None:
+            self.stats.record(self._sending, raw_bytes, wire_bytes)
+
+    @property
+    def queued_packets(self) -> int:
+        """Number of packets waiting in the outbound queue."""
+        return self._queued_packets
+
+    @property
+    def queued_bytes(self) -> int:
+        """Serialized size of the packets waiting in the outbound queue."""
+        return self._queued_bytes
+
+    def enqueue(self, packet: dict) -> None:
+        """Queue a packet for delivery by this connection's writer task."""
+        if self.lagging:
+            return
+        encoded = self._encode(packet)
+        if encoded is None:
+            return
+        payload, text = encoded
+        now = time.monotonic()
+        key = _coalesce_key(payload)
+        if key is not None:
+            previous = self._pending.pop(key, None)
+            if previous is not None:
+                self._discard(previous)
+                if key[0] == "menu":
+                    payload = {**previous.packet, **payload}
+                    text = json.dumps(payload)
+                # Keep the older timestamp so coalescing cannot hide lag.
+                now = previous.queued_at
+        entry = _Outbound(payload, text, key, now)
+        if key is not None:
+            self._pending[key] = entry
+        self._outbound.append(entry)
+        self._queued_packets += 1
+        self._queued_bytes += entry.size
+        if len(self._outbound) > 2 * self._queued_packets + 64:
+            self._outbound = deque(item for item in self._outbound if item.text is not None)
+
+        if self._over_limits():
+            self._shed_sounds()
+        if self._over_limits() or self._oldest_age() > self.limits.max_lag_seconds:
+            self._disconnect_lagging()
+            return
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._drain())
+
+    def enqueue_many(self, packets: list[dict]) -> None:
+        """Queue several packets in order."""
+        for packet in packets:
+            self.enqueue(packet)
+
+    def _discard(self, entry: _Outbound) -> None:
+        if entry.text is None:
+            return
+        entry.text = None
+        self._queued_packets -= 1
+        self._queued_bytes -= entry.size
+
+    def _over_limits(self) -> bool:
+        return (
+            self._queued_packets > self.limits.max_packets
+            or self._queued_bytes > self.limits.max_bytes
+        )
+
+    def _oldest_age(self) -> float:
+        while self._outbound and self._outbound[0].text is None:
+            self._outbound.popleft()
+        if not self._outbound:
+            return 0.0
+        return time.monotonic() - self._outbound[0].queued_at
+
+    def _shed_sounds(self) -> None:
+        for entry in self._outbound:
+            if not self._over_limits():
+                return
+            if entry.text is not None and entry.packet.get("type") in _SHEDDABLE_TYPES:
+                self._discard(entry)
+
+    def _clear_outbound(self) -> None:
+        self._outbound.clear()
+        self._pending.clear()
+        self._queued_packets = 0
+        self._queued_bytes = 0
+
+    def _take_batch(self) -> list[tuple[str, str]]:
+        limit = MAX_BATCH_PACKETS if "packet_batches" in self.features else 1
+        batch: list[tuple[str, str]] = []
+        while self._outbound and len(batch) < limit:
+            entry = self._outbound.popleft()
+            text = entry.text
+            if text is None:
+                continue
+            self._discard(entry)
+            if entry.key is not None and self._pending.get(entry.key) is entry:
+                del self._pending[entry.key]
+            batch.append((entry.packet["type"], text))
+        return batch
+
+    async def _drain(self) -> None:
+        try:
+            while self._outbound:
+                batch = self._take_batch()
+                if not batch:
+                    continue
+                texts = [text for _, text in batch]
+                frame = texts[0] if len(texts) == 1 else "[" + ",".join(texts) + "]"
+                parts = [(packet_type, len(text)) for packet_type, text in batch]
+                try:
+                    await self._send_frame(frame, parts)
+                except websockets.exceptions.ConnectionClosed:
+                    self._clear_outbound()
+                    return
+        finally:
+            self._writer = None
+
+    def _disconnect_lagging(self) -> None:
+        identifier = self.username or self.address
+        PACKET_LOGGER.warning(
+            "Disconnecting %s: outbound queue over limits (%d packets, %d bytes)",
+            identifier,
+            self._queued_packets,
+            self._queued_bytes,
+        )
+        self.lagging = True
+        self._clear_outbound()
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        asyncio.get_running_loop().create_task(self._send_disconnect_and_close())
+
+    async def _send_disconnect_and_close(self) -> None:
+        encoded = self._encode({"type": "disconnect", "reconnect": True})
+        if encoded is not None:
+            text = encoded[1]
+            try:
+                await asyncio.wait_for(
+                    self._send_frame(text, [("disconnect", len(text))]),
+                    LAGGING_DISCONNECT_TIMEOUT_SECONDS,
+                )
+            except (asyncio.TimeoutError, OSError, websockets.exceptions.ConnectionClosed):
+                pass
+        await self.close()
+
     async def close(self) -> None:
-        """Close this connection."""
+        """Close this connection and drop any queued output."""
+        self._clear_outbound()
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+            self._writer = None
         try:
             await self.websocket.close()
         except (OSError, RuntimeError, websockets.exceptions.ConnectionClosed) as exc:
@@ -71,6 +328,8 @@ class WebSocketServer:
         ssl_cert: str | Path | None = None,
         ssl_key: str | Path | None = None,
         max_message_size: int | None = None,
+        outbound_limits: OutboundLimits | None = None,
+        compression: CompressionSettings | None = None,
     ):
         self.host = host
         self.port = port
@@ -82,6 +341,9 @@ class WebSocketServer:
         self._running = False
         self._ssl_context = None
         self._max_message_size = max_message_size
+        self._outbound_limits = outbound_limits or OutboundLimits()
+        self._compression = compression or CompressionSettings()
+        self.packet_stats = PacketSizeStats()
 
         # Configure SSL if certificates provided
         if ssl_cert and ssl_key:
@@ -111,6 +373,8 @@ class WebSocketServer:
                 self.port,
                 ssl=self._ssl_context,
                 max_size=self._max_message_size,
+                compression=None,
+                extensions=self._compression.extensions(),
             ).__aenter__()
         except OSError as exc:
             print(
@@ -149,7 +413,12 @@ class WebSocketServer:
     async def _handle_client(self, websocket: ServerConnection) -> None:
         """Handle a client connection."""
         address = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        client = ClientConnection(websocket=websocket, address=address)
+        client = ClientConnection(
+            websocket=websocket,
+            address=address,
+            limits=self._outbound_limits,
+            stats=self.packet_stats,
+        )
         self._clients[address] = client
 
         try:
@@ -167,6 +436,7 @@ class WebSocketServer:
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
+            client._clear_outbound()
             if address in self._clients:
                 del self._clients[address]
             if self._on_disconnect:
@@ -4,6 +4,7 @@ import sqlite3
 import sys
 import json
 from pathlib import Path
+from typing import Iterator
 from dataclasses import dataclass, field
 
 from server.core.tables.table import Table
@@ -70,6 +71,8 @@ class Database:
         """Initialize the database wrapper with a path."""
         self.db_path = Path(db_path)
         self._conn: sqlite3.Connection | None = None
+        self._rating_cache: dict[str, dict[str, tuple[float, float]]] = {}
+        self._rating_cache_version: int | None = None
 
     def connect(self) -> None:
         """Connect to the database and create tables if needed."""
@@ -83,6 +86,7 @@ class Database:
             raise SystemExit(1) from exc
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA foreign_keys = ON")
+        self._rating_cache.clear()
         self._create_tables()
 
     def close(self) -> None:
@@ -180,6 +184,14 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_result_players_player
             ON game_result_players(player_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_result_players_result
+            ON game_result_players(result_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_game_results_type_time
+            ON game_results(game_type, timestamp, id)
+        """)
 
         # Player ratings (for skill-based matchmaking)
         cursor.execute("""
@@ -1084,6 +1096,74 @@ class Database:
             for row in cursor.fetchall()
         ]
 
+    def get_result_game_types(self) -> list[str]:
+        """Get every game type that has at least one stored result."""
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT DISTINCT game_type FROM game_results ORDER BY game_type")
+        return [row["game_type"] for row in cursor.fetchall()]
+
+    def iter_game_results(
+        self, game_type: str, page_size: int = 500
+    ) -> Iterator[dict]:
+        """
+        Stream every result for a game type, oldest first.
+
+        Results are read in keyset-paginated pages so memory stays flat no
+        matter how much history exists. Player rows for a page are loaded
+        with a single query.
+
+        Yields:
+            Game result dictionaries with a "players" list in the
+            get_game_result_players format.
+        """
+        cursor = self._conn.cursor()
+        last_timestamp, last_id = "", 0
+        while True:
+            cursor.execute(
+                """
+                SELECT id, timestamp, duration_ticks, custom_data
+                FROM game_results
+                WHERE game_type = ?
+                  AND (timestamp, id) > (?, ?)
+                ORDER BY timestamp, id
+                LIMIT ?
+                """,
+                (game_type, last_timestamp, last_id, page_size),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return
+
+            players: dict[int, list[dict]] = {row["id"]: [] for row in rows}
+            placeholders = ",".join("?" * len(rows))
+            cursor.execute(
+                f"""
+                SELECT result_id, player_id, player_name, is_bot, is_virtual_bot
+                FROM game_result_players
+                WHERE result_id IN ({placeholders})
+                ORDER BY id
+                """,
+                list(players),
+            )
+            for player in cursor.fetchall():
+                players[player["result_id"]].append({
+                    "player_id": player["player_id"],
+                    "player_name": player["player_name"],
+                    "is_bot": bool(player["is_bot"]),
+                    "is_virtual_bot": bool(player["is_virtual_bot"]),
+                })
+
+            for row in rows:
+                yield {
+                    "id": row["id"],
+                    "game_type": game_type,
+                    "timestamp": row["timestamp"],
+                    "duration_ticks": row["duration_ticks"],
+                    "custom_data": json.loads(row["custom_data"]) if row["custom_data"] else {},
+                    "players": players[row["id"]],
+                }
+            last_timestamp, last_id = rows[-1]["timestamp"], rows[-1]["id"]
+
     def get_game_stats_aggregate(self, game_type: str) -> dict:
         """
         Get aggregate statistics for a game type.
@@ -1150,41 +1230,108 @@ class Database:
 
     # Player rating operations
 
+    def _ratings_for(self, game_type: str) -> dict[str, tuple[float, float]]:
+        """Return the cached ratings for a game type, loading them on first use.
+
+        SQLite bumps ``data_version`` whenever another connection commits
+        (such as the ``rebuild-ratings`` command), so the cache is dropped
+        then instead of serving, and later writing back, stale ratings. The
+        version is checked once per public rating call, not per player.
+        """
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._rating_cache_version:
+            self._rating_cache.clear()
+            self._rating_cache_version = version
+        ratings = self._rating_cache.get(game_type)
+        if ratings is None:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                "SELECT player_id, mu, sigma FROM player_ratings WHERE game_type = ?",
+                (game_type,),
+            )
+            ratings = {
+                row["player_id"]: (row["mu"], row["sigma"]) for row in cursor.fetchall()
+            }
+            self._rating_cache[game_type] = ratings
+        return ratings
+
     def get_player_rating(
         self, player_id: str, game_type: str
     ) -> tuple[float, float] | None:
         """
         Get a player's rating for a game type.
 
+        Ratings for a game type are read from SQLite once and then served
+        from memory; every rating write below keeps that copy current, and
+        it is reloaded after another process changes the database.
+
         Returns:
             (mu, sigma) tuple or None if no rating exists
         """
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT mu, sigma FROM player_ratings
-            WHERE player_id = ? AND game_type = ?
-            """,
-            (player_id, game_type),
-        )
-        row = cursor.fetchone()
-        if row:
-            return (row["mu"], row["sigma"])
-        return None
+        return self._ratings_for(game_type).get(player_id)
+
+    def get_player_ratings(
+        self, player_ids: list[str], game_type: str
+    ) -> dict[str, tuple[float, float]]:
+        """
+        Get the ratings of several players for a game type.
+
+        Returns:
+            player_id -> (mu, sigma) for the players that have a rating
+        """
+        ratings = self._ratings_for(game_type)
+        return {pid: ratings[pid] for pid in player_ids if pid in ratings}
 
     def set_player_rating(
         self, player_id: str, game_type: str, mu: float, sigma: float
     ) -> None:
         """Set or update a player's rating for a game type."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma)
-            VALUES (?, ?, ?, ?)
-            """,
-            (player_id, game_type, mu, sigma),
-        )
-        self._conn.commit()
+        self.set_player_ratings(game_type, [(player_id, mu, sigma)])
+
+    def set_player_ratings(
+        self, game_type: str, ratings: list[tuple[str, float, float]]
+    ) -> None:
+        """
+        Set or update several players' ratings for a game type in one commit.
+
+        Args:
+            game_type: The game type being rated
+            ratings: (player_id, mu, sigma) tuples
+        """
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(pid, game_type, mu, sigma) for pid, mu, sigma in ratings],
+            )
+        cached = self._ratings_for(game_type)
+        for pid, mu, sigma in ratings:
+            cached[pid] = (mu, sigma)
+
+    def replace_player_ratings(
+        self, game_type: str, ratings: list[tuple[str, float, float]]
+    ) -> None:
+        """
+        Replace every rating for a game type in one transaction.
+
+        Args:
+            game_type: The game type being rewritten
+            ratings: (player_id, mu, sigma) tuples
+        """
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM player_ratings WHERE game_type = ?", (game_type,)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO player_ratings (player_id, game_type, mu, sigma)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(pid, game_type, mu, sigma) for pid, mu, sigma in ratings],
+            )
+        self._rating_cache[game_type] = {pid: (mu, sigma) for pid, mu, sigma in ratings}
 
     def get_rating_leaderboard(
         self, game_type: str, limit: int = 10
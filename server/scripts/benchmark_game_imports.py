@@ -0,0 +1,83 @@
+"""Benchmark cold-start import time of the game registry.
+
+Each scenario runs in a fresh interpreter so module caches do not carry
+over between samples.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_TIMED = """
+import time
+started = time.perf_counter()
+{body}
+print(time.perf_counter() - started)
+"""
+
+SCENARIOS: dict[str, str] = {
+    "registry": "import server.games.registry",
+    "menus": (
+        "from server.games.registry import GameRegistry\n"
+        "GameRegistry.get_entries_by_category()"
+    ),
+    "one-game": (
+        "from server.games.registry import GameRegistry\n"
+        "GameRegistry.get_game_class({game_type!r})"
+    ),
+    "all-games": (
+        "from server.games.registry import GameRegistry\n"
+        "GameRegistry.get_all()"
+    ),
+}
+
+
+def _sample(body: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMED.format(body=body)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(game_type: str, iterations: int) -> None:
+    """Print median import timings for each scenario."""
+    for name, template in SCENARIOS.items():
+        body = template.format(game_type=game_type)
+        samples = [_sample(body) for _ in range(iterations)]
+        print(
+            f"{name}: median {statistics.median(samples) * 1000:.1f} ms, "
+            f"min {min(samples) * 1000:.1f} ms over {iterations} runs"
+        )
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Benchmark game registry import time.")
+    parser.add_argument(
+        "--game",
+        default="pig",
+        help="Game type loaded by the one-game scenario.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=5,
+        help="Fresh interpreter runs per scenario.",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.game, max(1, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
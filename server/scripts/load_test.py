@@ -0,0 +1,604 @@
+"""Drive simulated websocket clients against a local PlayPalace server.
+
+Each step starts a fresh server in a child process, so its CPU and memory
+are measured apart from the clients, seeds approved accounts, and connects
+N asyncio clients. Clients log in, walk the menus to Pig, create and join
+tables in groups, and then play by keybind until the step ends.
+
+Reported per step:
+
+- p50/p99 latency from a client event to the server's response, split by
+  event kind (authorize, menu, keybind)
+- tick overrun rate: the share of ticks whose work plus loop delay exceeded
+  one tick interval
+- JSON payload bytes the server sent per client
+- server CPU utilisation and resident memory
+
+Usage:
+    python -m server.scripts.load_test --clients 20,100,500 --duration 30
+
+Thousands of clients need a raised open-file limit (``ulimit -n``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
+
+
+# Allow direct script execution: python server/scripts/load_test.py
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from server.network.packet_models import CLIENT_TO_SERVER_PACKET_ADAPTER  # noqa: E402
+
+
+LOCALES_DIR = Path(__file__).resolve().parents[1] / "locales"
+CLIENT_LOCALE = "en"
+GAME_TYPE = "pig"
+GAME_CATEGORY = "category-dice-games"
+MIN_TABLE_SIZE = 2
+MAX_TABLE_SIZE = 4
+PASSWORD = "load-test-password"
+BANK_CHANCE = 0.3
+
+Predicate = Callable[[dict[str, Any]], bool]
+
+
+def _any_packet(packet: dict[str, Any]) -> bool:
+    return True
+
+
+def _menu(menu_id: str) -> Predicate:
+    return lambda packet: packet.get("type") == "menu" and packet.get("menu_id") == menu_id
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def table_groups(count: int, size: int) -> list[list[int]]:
+    """Split client indexes into tables of ``size``, never leaving one alone."""
+    size = max(MIN_TABLE_SIZE, min(MAX_TABLE_SIZE, size))
+    groups = [list(range(start, min(start + size, count))) for start in range(0, count, size)]
+    if len(groups) > 1 and len(groups[-1]) < MIN_TABLE_SIZE:
+        lone = groups.pop()
+        if len(groups[-1]) < MAX_TABLE_SIZE:
+            groups[-1].extend(lone)
+        else:
+            groups.append([groups[-1].pop(), *lone])
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Server process
+# ---------------------------------------------------------------------------
+
+
+class TickRecorder:
+    """Wrap the server tick callback and record how long each tick took."""
+
+    def __init__(self, interval_ms: int):
+        self.interval = interval_ms / 1000.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new measurement window."""
+        self.durations: list[float] = []
+        self.overruns = 0
+        self._last_end: float | None = None
+
+    def wrap(self, on_tick: Callable[[], None]) -> Callable[[], None]:
+        """Return ``on_tick`` instrumented to record durations and overruns."""
+
+        def timed_tick() -> None:
+            started = time.perf_counter()
+            try:
+                on_tick()
+            finally:
+                ended = time.perf_counter()
+                self.durations.append(ended - started)
+                # The scheduler sleeps one interval between ticks; anything
+                # beyond a second interval is tick work or loop delay.
+                if self._last_end is not None and ended - self._last_end > 2 * self.interval:
+                    self.overruns += 1
+                self._last_end = ended
+
+        return timed_tick
+
+    def snapshot(self) -> dict[str, float]:
+        """Return tick statistics for the current window."""
+        count = len(self.durations)
+        return {
+            "ticks": count,
+            "tick_overrun_rate": self.overruns / count if count else 0.0,
+            "tick_p50_ms": _percentile(self.durations, 0.5) * 1000,
+            "tick_p99_ms": _percentile(self.durations, 0.99) * 1000,
+            "tick_max_ms": max(self.durations, default=0.0) * 1000,
+        }
+
+
+def _rss_bytes() -> int:
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    if resource is not None:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    return 0
+
+
+def _write_config(directory: Path, tick_interval_ms: int) -> Path:
+    config_path = directory / "config.toml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "[auth.rate_limits]",
+                "login_per_minute = 0",
+                "login_failures_per_minute = 0",
+                "",
+                "[network]",
+                "allow_insecure_ws = true",
+                "",
+                "[server]",
+                f"tick_interval_ms = {tick_interval_ms}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def _copy_client_locale(directory: Path) -> Path:
+    """Copy just the clients' locale so the server compiles one bundle, not all."""
+    locales_dir = directory / "locales"
+    shutil.copytree(LOCALES_DIR / CLIENT_LOCALE, locales_dir / CLIENT_LOCALE)
+    return locales_dir
+
+
+def _seed_users(db_path: Path, usernames: list[str]) -> None:
+    from server.auth.auth import AuthManager
+    from server.persistence.database import Database
+
+    db = Database(db_path)
+    db.connect()
+    try:
+        password_hash = AuthManager(db).hash_password(PASSWORD)
+        for username in usernames:
+            db.create_user(username, password_hash, approved=True)
+    finally:
+        db.close()
+
+
+def _serve(conn, port: int, directory: str, tick_interval_ms: int, quiet: bool) -> None:
+    """Child process entrypoint: run a server and answer stats commands."""
+    if quiet:
+        sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    asyncio.run(_serve_async(conn, port, Path(directory), tick_interval_ms))
+
+
+async def _serve_async(conn, port: int, directory: Path, tick_interval_ms: int) -> None:
+    from server.core.server import Server
+
+    # Compile locales before listening so warm-up is not measured as load.
+    server = Server(
+        host="127.0.0.1",
+        port=port,
+        db_path=str(directory / "load.db"),
+        locales_dir=directory / "locales",
+        config_path=directory / "config.toml",
+        preload_locales=True,
+    )
+    ticks = TickRecorder(tick_interval_ms)
+    # start() hands self._on_tick to the scheduler, so wrap it first.
+    server._on_tick = ticks.wrap(server._on_tick)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    conn.send("ready")
+    try:
+        while True:
+            command = await loop.run_in_executor(None, conn.recv)
+            if command == "reset":
+                ticks.reset()
+                cpu_started = time.process_time()
+                wall_started = time.perf_counter()
+                conn.send("ok")
+            elif command == "stats":
+                wall = time.perf_counter() - wall_started
+                stats = ticks.snapshot()
+                stats["server_cpu_percent"] = (
+                    100 * (time.process_time() - cpu_started) / wall if wall else 0.0
+                )
+                stats["server_rss_mib"] = _rss_bytes() / (1024 * 1024)
+                conn.send(stats)
+            else:
+                break
+    finally:
+        await server.stop()
+
+
+# ---------------------------------------------------------------------------
+# Simulated clients
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RunStats:
+    """Client-side measurements shared by every client in one step."""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    timeouts: int = 0
+    failures: int = 0
+
+    def record(self, kind: str, seconds: float) -> None:
+        """Record one event-to-response latency."""
+        self.latencies.setdefault(kind, []).append(seconds)
+
+
+@dataclass
+class TableGroup:
+    """Coordinates one host and the clients joining its table."""
+
+    host: str
+    size: int
+    created: asyncio.Event = field(default_factory=asyncio.Event)
+    all_joined: asyncio.Event = field(default_factory=asyncio.Event)
+    joined: int = 0
+
+    def mark_joined(self) -> None:
+        """Count one joining client; release the host once all have joined."""
+        self.joined += 1
+        if self.joined >= self.size - 1:
+            self.all_joined.set()
+
+
+class SimulatedClient:
+    """One websocket client speaking the PlayPalace protocol."""
+
+    def __init__(self, url: str, username: str, stats: RunStats, timeout: float):
+        self.url = url
+        self.username = username
+        self.stats = stats
+        self.timeout = timeout
+        self.bytes_received = 0
+        self.menus: dict[str, list[Any]] = {}
+        self._ws: ClientConnection | None = None
+        self._reader: asyncio.Task | None = None
+        self._waiter: tuple[Predicate, asyncio.Future] | None = None
+
+    async def connect(self) -> None:
+        """Open the websocket and start reading packets."""
+        self._ws = await connect(self.url, max_size=None, open_timeout=self.timeout)
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self) -> None:
+        """Close the websocket."""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+    async def _read(self) -> None:
+        try:
+            async for message in self._ws:
+                if isinstance(message, str):
+                    message = message.encode("utf-8")
+                self.bytes_received += len(message)
+                packet = json.loads(message)
+                if packet.get("type") == "menu":
+                    self.menus[packet.get("menu_id", "")] = packet.get("items", [])
+                waiter = self._waiter
+                if waiter is not None and not waiter[1].done() and waiter[0](packet):
+                    waiter[1].set_result(packet)
+        except ConnectionClosed:
+            pass
+        finally:
+            waiter = self._waiter
+            if waiter is not None and not waiter[1].done():
+                waiter[1].set_exception(ConnectionError("connection closed"))
+
+    async def request(
+        self, kind: str, packet: dict[str, Any], expect: Predicate = _any_packet
+    ) -> dict[str, Any] | None:
+        """Send a packet and time the first reply matching ``expect``."""
+        CLIENT_TO_SERVER_PACKET_ADAPTER.validate_python(packet)
+        future = asyncio.get_running_loop().create_future()
+        self._waiter = (expect, future)
+        started = time.perf_counter()
+        try:
+            await self._ws.send(json.dumps(packet))
+            response = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            return None
+        finally:
+            self._waiter = None
+        self.stats.record(kind, time.perf_counter() - started)
+        return response
+
+    async def select(self, menu_id: str, selection_id: str, expect_menu: str | None = None):
+        """Select a menu item and wait for the resulting menu (or any reply)."""
+        packet = {"type": "menu", "menu_id": menu_id, "selection_id": selection_id}
+        expect = _menu(expect_menu) if expect_menu else _any_packet
+        return await self.request("menu", packet, expect)
+
+    def item_ids(self, menu_id: str) -> list[str]:
+        """Return the ids of the latest items shown in a menu."""
+        return [
+            item.get("id", "")
+            for item in self.menus.get(menu_id, [])
+            if isinstance(item, dict)
+        ]
+
+    def find_item(self, menu_id: str, prefix: str, text: str) -> str | None:
+        """Return the id of the first item with ``prefix`` whose text contains ``text``."""
+        for item in self.menus.get(menu_id, []):
+            if (
+                isinstance(item, dict)
+                and item.get("id", "").startswith(prefix)
+                and text in item.get("text", "")
+            ):
+                return item["id"]
+        return None
+
+
+async def _run_client(
+    client: SimulatedClient,
+    group: TableGroup,
+    delay: float,
+    deadline: float,
+    think: tuple[float, float],
+    rng: random.Random,
+) -> None:
+    await asyncio.sleep(delay)
+    is_host = client.username == group.host
+    try:
+        await client.connect()
+        authorize = {
+            "type": "authorize",
+            "username": client.username,
+            "password": PASSWORD,
+            "locale": CLIENT_LOCALE,
+            "client_type": "load_test",
+        }
+        if await client.request("authorize", authorize, _menu("main_menu")) is None:
+            return
+        await client.select("main_menu", "play", "categories_menu")
+        await client.select("categories_menu", f"category_{GAME_CATEGORY}", "games_menu")
+
+        if is_host:
+            await client.select("games_menu", f"game_{GAME_TYPE}", "tables_menu")
+            await client.select("tables_menu", "create_table", "turn_menu")
+            group.created.set()
+            await asyncio.wait_for(group.all_joined.wait(), client.timeout * 4)
+            await client.select("turn_menu", "start_game")
+        else:
+            await asyncio.wait_for(group.created.wait(), client.timeout * 4)
+            await client.select("games_menu", f"game_{GAME_TYPE}", "tables_menu")
+            table_item = client.find_item("tables_menu", "table_", group.host)
+            if table_item is None:
+                client.stats.failures += 1
+                return
+            await client.select("tables_menu", table_item, "turn_menu")
+            group.mark_joined()
+
+        loop = asyncio.get_running_loop()
+        while loop.time() < deadline:
+            ids = client.item_ids("turn_menu")
+            if "roll" in ids:
+                key = "b" if "bank" in ids and rng.random() < BANK_CHANCE else "r"
+                await client.request(
+                    "keybind", {"type": "keybind", "key": key, "menu_id": "turn_menu"}
+                )
+            await asyncio.sleep(rng.uniform(*think))
+    except (OSError, ConnectionError, asyncio.TimeoutError):
+        client.stats.failures += 1
+    finally:
+        if not is_host:
+            # Never leave a host waiting on a client that failed to join.
+            group.all_joined.set()
+
+
+async def _drive_clients(
+    url: str,
+    usernames: list[str],
+    table_size: int,
+    duration: float,
+    ramp: float,
+    think: tuple[float, float],
+    timeout: float,
+    seed: int,
+) -> tuple[RunStats, list[SimulatedClient]]:
+    stats = RunStats()
+    rng = random.Random(seed)
+    clients = [SimulatedClient(url, name, stats, timeout) for name in usernames]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ramp + duration
+    tasks = []
+    for indexes in table_groups(len(clients), table_size):
+        group = TableGroup(host=usernames[indexes[0]], size=len(indexes))
+        for index in indexes:
+            delay = ramp * index / max(1, len(clients))
+            tasks.append(
+                _run_client(clients[index], group, delay, deadline, think, random.Random(rng.random()))
+            )
+    await asyncio.gather(*tasks)
+    return stats, clients
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_step(
+    client_count: int,
+    *,
+    table_size: int = 2,
+    duration: float = 30.0,
+    ramp: float = 5.0,
+    think: tuple[float, float] = (0.5, 1.5),
+    timeout: float = 10.0,
+    tick_interval_ms: int = 50,
+    seed: int = 0,
+    quiet: bool = True,
+) -> dict[str, Any]:
+    """Run one load step against a fresh server and return its measurements."""
+    usernames = [f"lt{index:05d}" for index in range(client_count)]
+    with tempfile.TemporaryDirectory(prefix="playpalace-load-") as tmp:
+        directory = Path(tmp)
+        _write_config(directory, tick_interval_ms)
+        _copy_client_locale(directory)
+        _seed_users(directory / "load.db", usernames)
+
+        port = _free_port()
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_serve,
+            args=(child_conn, port, tmp, tick_interval_ms, quiet),
+        )
+        process.start()
+        try:
+            if not parent_conn.poll(300) or parent_conn.recv() != "ready":
+                raise RuntimeError("Load-test server did not start")
+            parent_conn.send("reset")
+            parent_conn.recv()
+            stats, clients = asyncio.run(
+                _drive_clients(
+                    f"ws://127.0.0.1:{port}",
+                    usernames,
+                    table_size,
+                    duration,
+                    ramp,
+                    think,
+                    timeout,
+                    seed,
+                )
+            )
+            parent_conn.send("stats")
+            server_stats = parent_conn.recv()
+            asyncio.run(_close_clients(clients))
+        finally:
+            parent_conn.send("stop")
+            process.join(60)
+            if process.is_alive():
+                process.terminate()
+
+    events = [sample for kind, samples in stats.latencies.items() if kind != "authorize" for sample in samples]
+    result: dict[str, Any] = {
+        "clients": client_count,
+        "p50_ms": _percentile(events, 0.5) * 1000,
+        "p99_ms": _percentile(events, 0.99) * 1000,
+        "latency_ms": {
+            kind: {
+                "count": len(samples),
+                "p50": _percentile(samples, 0.5) * 1000,
+                "p99": _percentile(samples, 0.99) * 1000,
+            }
+            for kind, samples in sorted(stats.latencies.items())
+        },
+        "timeouts": stats.timeouts,
+        "failures": stats.failures,
+        "bytes_per_client": sum(c.bytes_received for c in clients) / max(1, client_count),
+    }
+    result.update(server_stats)
+    return result
+
+
+async def _close_clients(clients: list[SimulatedClient]) -> None:
+    await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    print(
+        f"{result['clients']:>7} clients: "
+        f"p50 {result['p50_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms, "
+        f"tick overrun {result['tick_overrun_rate'] * 100:.1f}% "
+        f"(p99 {result['tick_p99_ms']:.1f} ms), "
+        f"{result['bytes_per_client'] / 1024:.1f} KiB/client, "
+        f"server CPU {result['server_cpu_percent']:.0f}%, "
+        f"RSS {result['server_rss_mib']:.0f} MiB, "
+        f"timeouts {result['timeouts']}, failures {result['failures']}"
+    )
+    for kind, summary in result["latency_ms"].items():
+        print(
+            f"          {kind}: {summary['count']} events, "
+            f"p50 {summary['p50']:.1f} ms, p99 {summary['p99']:.1f} ms"
+        )
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Load-test a local PlayPalace server.")
+    parser.add_argument(
+        "--clients",
+        default="10,50,100",
+        help="Comma-separated client counts; each runs against a fresh server.",
+    )
+    parser.add_argument("--table-size", type=int, default=2, help="Players per Pig table (2-4).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of play per step.")
+    parser.add_argument("--ramp", type=float, default=5.0, help="Seconds over which clients connect.")
+    parser.add_argument(
+        "--think-ms",
+        type=int,
+        nargs=2,
+        default=(500, 1500),
+        metavar=("MIN", "MAX"),
+        help="Pause between a client's keybinds, in milliseconds.",
+    )
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for a response.")
+    parser.add_argument("--tick-interval-ms", type=int, default=50, help="Server tick interval.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for client behaviour.")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path.")
+    parser.add_argument("--verbose", action="store_true", help="Show server output.")
+    args = parser.parse_args()
+
+    results = []
+    for count in (int(value) for value in args.clients.split(",") if value.strip()):
+        result = run_step(
+            max(MIN_TABLE_SIZE, count),
+            table_size=args.table_size,
+            duration=args.duration,
+            ramp=args.ramp,
+            think=(args.think_ms[0] / 1000, args.think_ms[1] / 1000),
+            timeout=args.timeout,
+            tick_interval_ms=args.tick_interval_ms,
+            seed=args.seed,
+            quiet=not args.verbose,
+        )
+        _print_result(result)
+        results.append(result)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark Monopoly board catalog warm-up, table creation and save restore."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import time
+
+
+# Allow direct script execution: python server/scripts/monopoly/benchmark_catalog.py
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from server.core.users.test_user import MockUser  # noqa: E402
+from server.games.monopoly.board_catalog import warm_board_catalog  # noqa: E402
+from server.games.monopoly.game import MonopolyGame, MonopolyOptions  # noqa: E402
+from server.messages.localization import Localization  # noqa: E402
+
+
+LOCALES_DIR = Path(__file__).resolve().parents[2] / "locales"
+
+
+def _start_game(board_id: str) -> MonopolyGame:
+    game = MonopolyGame(options=MonopolyOptions(board_id=board_id, board_rules_mode="auto"))
+    game.add_player("Host", MockUser("Host"))
+    game.add_player("Guest", MockUser("Guest"))
+    game.host = "Host"
+    game.on_start()
+    return game
+
+
+def _median_ms(samples: list[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def run_benchmark(board_ids: list[str] | None, iterations: int) -> None:
+    """Print catalog warm-up, table creation and restore timings."""
+    started = time.perf_counter()
+    timings = warm_board_catalog(board_ids)
+    cold_total = time.perf_counter() - started
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:5]
+    print(f"Compiled {len(timings)} boards in {cold_total * 1000:.1f} ms (cold)")
+    for board_id, seconds in slowest:
+        print(f"  {board_id}: {seconds * 1000:.2f} ms")
+
+    started = time.perf_counter()
+    warm_board_catalog(board_ids)
+    print(f"Warm catalog lookup: {(time.perf_counter() - started) * 1000:.2f} ms")
+
+    for board_id in list(timings)[: min(len(timings), 5)]:
+        create_samples: list[float] = []
+        restore_samples: list[float] = []
+        save_size = 0
+        for _ in range(iterations):
+            t0 = time.perf_counter()
+            game = _start_game(board_id)
+            create_samples.append(time.perf_counter() - t0)
+
+            game_json = game.to_json()
+            save_size = len(game_json)
+            t0 = time.perf_counter()
+            restored = MonopolyGame.from_json(game_json)
+            restored.rebuild_runtime_state()
+            restore_samples.append(time.perf_counter() - t0)
+        print(
+            f"{board_id}: create {_median_ms(create_samples):.2f} ms, "
+            f"restore {_median_ms(restore_samples):.2f} ms, save {save_size / 1024:.1f} KiB"
+        )
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Benchmark the Monopoly board catalog.")
+    parser.add_argument(
+        "--board",
+        action="append",
+        dest="boards",
+        help="Board id to benchmark (repeatable). Defaults to every board profile.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10,
+        help="Table create/restore samples per board.",
+    )
+    args = parser.parse_args()
+
+    Localization.init(LOCALES_DIR)
+    run_benchmark(args.boards, max(1, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
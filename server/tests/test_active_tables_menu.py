@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from server.core.server import Server
 from server.core.tables.manager import TableManager
 from server.core.users.test_user import MockUser
@@ -22,6 +24,9 @@ def _make_server() -> Server:
     server = Server.__new__(Server)
     server._tables = TableManager()
     server._user_states = {}
+    server._lobby_subscribers = {}
+    server._lobby_subscriptions = {}
+    server._lobby_pushed_version = 0
     return server
 
 
@@ -61,3 +66,66 @@ def test_main_menu_includes_active_tables_option() -> None:
     texts = _menu_texts(viewer, "main_menu")
     expected = Localization.get(viewer.locale, "view-active-tables")
     assert expected in texts
+
+
+def test_active_tables_menu_shares_render_until_lobby_changes() -> None:
+    server = _make_server()
+    table = server._tables.create_table("pig", "Bob", MockUser("Bob"))
+    first, second = MockUser("Alice"), MockUser("Carol")
+
+    server._show_active_tables_menu(first)
+    server._show_active_tables_menu(second)
+    assert _menu_texts(first, "active_tables_menu") == _menu_texts(second, "active_tables_menu")
+    assert server._tables.cached_render(
+        "active_tables_menu", "en", lambda: pytest.fail("render was not shared")
+    )
+
+    table.add_member("Sue", MockUser("Sue"), as_spectator=False)
+    server._show_active_tables_menu(first)
+    assert "Pig: Bob's table (2 users) with Sue" in _menu_texts(first, "active_tables_menu")
+
+
+def test_lobby_changes_push_updates_only_to_viewers() -> None:
+    server = _make_server()
+    server._tables.create_table("pig", "Bob", MockUser("Bob"))
+    viewer, pig_viewer, elsewhere = MockUser("Alice"), MockUser("Carol"), MockUser("Dan")
+    server._users = {"Alice": viewer, "Carol": pig_viewer, "Dan": elsewhere}
+    server._show_active_tables_menu(viewer)
+    server._show_tables_menu(pig_viewer, "pig")
+    server._show_active_tables_menu(elsewhere)
+    server._user_states["Dan"] = {"menu": "main_menu"}
+
+    server._push_lobby_updates()
+    assert not any(m.type == "update_menu" for m in viewer.messages)
+
+    server._tables.create_table("farkle", "Kate", MockUser("Kate"))
+    server._push_lobby_updates()
+
+    updates = [m for m in viewer.messages if m.type == "update_menu"]
+    assert len(updates) == 1
+    assert "Farkle: Kate's table (1 user)" in _menu_texts(viewer, "active_tables_menu")
+    # The pig tables menu did not change, so Carol gets nothing.
+    assert not any(m.type == "update_menu" for m in pig_viewer.messages)
+    assert not any(m.type == "update_menu" for m in elsewhere.messages)
+    assert "Dan" not in server._lobby_subscriptions
+
+
+def test_table_created_announcement_skips_live_listing_viewers() -> None:
+    server = _make_server()
+    server._tables.create_table("farkle", "Kate", MockUser("Kate"))
+    viewer, pig_viewer, farkle_viewer, idle = (
+        MockUser("Alice"), MockUser("Carol"), MockUser("Eve"), MockUser("Dan")
+    )
+    server._users = {"Alice": viewer, "Carol": pig_viewer, "Eve": farkle_viewer, "Dan": idle}
+    server._show_active_tables_menu(viewer)
+    server._show_tables_menu(pig_viewer, "pig")
+    server._show_tables_menu(farkle_viewer, "farkle")
+    server._user_states["Dan"] = {"menu": "main_menu"}
+
+    server._broadcast_table_created("Bob", "pig")
+
+    assert "table_created.ogg" not in viewer.get_sounds_played()
+    assert "table_created.ogg" not in pig_viewer.get_sounds_played()
+    # The farkle listing will not show a pig table, so Eve is still told.
+    assert "table_created.ogg" in farkle_viewer.get_sounds_played()
+    assert "table_created.ogg" in idle.get_sounds_played()
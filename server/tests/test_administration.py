@@ -8,6 +8,7 @@ import pytest
 from server.core import administration
 from server.core.administration import AdministrationMixin, require_admin, require_server_owner
 from server.core.users.base import TrustLevel, MenuItem
+from server.network.compression import PacketSizeStats
 
 
 @pytest.fixture(autouse=True)
@@ -31,6 +32,9 @@ class DummyUser:
     def speak_l(self, message_id: str, **kwargs):
         self.spoken.append((message_id, kwargs))
 
+    def speak(self, text: str, buffer: str = "misc"):
+        self.spoken.append((text, {"buffer": buffer}))
+
     def play_sound(self, sound: str):
         self.sounds.append(sound)
 
@@ -136,7 +140,7 @@ def test_show_admin_menu_includes_owner_actions():
 
     host._show_admin_menu(admin_user)
     admin_ids = _get_menu_ids(admin_user)
-    assert admin_ids == ["account_approval", "ban_user", "unban_user", "back"]
+    assert admin_ids == ["account_approval", "ban_user", "unban_user", "network_stats", "back"]
     assert host._user_states["admin"]["menu"] == "admin_menu"
 
     host._show_admin_menu(owner_user)
@@ -145,6 +149,7 @@ def test_show_admin_menu_includes_owner_actions():
         "account_approval",
         "ban_user",
         "unban_user",
+        "network_stats",
         "promote_admin",
         "demote_admin",
         "virtual_bots",
@@ -337,3 +342,22 @@ async def test_handle_admin_menu_selection_routes_correctly(monkeypatch):
 
     await host._handle_admin_menu_selection(admin_user, "virtual_bots")
     assert called == [("virtual", "admin")]
+
+
+@pytest.mark.asyncio
+async def test_network_stats_reports_packet_types_by_volume():
+    host = AdminHost()
+    admin_user = DummyUser("admin", TrustLevel.ADMIN)
+
+    await host._show_network_stats(admin_user)
+    assert admin_user.spoken[-1][0] == "network-stats-empty"
+
+    stats = PacketSizeStats()
+    stats.record([("speak", 10)], raw_bytes=100, wire_bytes=100)
+    stats.record([("menu", 10)], raw_bytes=4096, wire_bytes=512)
+    host._ws_server = SimpleNamespace(packet_stats=stats)
+    await host._show_network_stats(admin_user)
+
+    report = admin_user.spoken[-1][0].split("\n")
+    assert report == ["network-stats-header", "network-stats-line", "network-stats-line"]
+    assert admin_user.menus[-1]["menu_id"] == "admin_menu"
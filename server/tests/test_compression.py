@@ -0,0 +1,89 @@
+"""Tests for websocket compression settings and packet size telemetry."""
+
+import asyncio
+import json
+import socket
+
+import pytest
+from websockets.asyncio.client import connect
+
+from server.network.compression import CompressionSettings, PacketSizeStats
+from server.network.websocket_server import WebSocketServer
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_packet_size_stats_split_batched_frames_by_length():
+    stats = PacketSizeStats()
+    stats.record([("menu", 300), ("speak", 100)], raw_bytes=400, wire_bytes=80)
+    stats.record([("speak", 50)], raw_bytes=50, wire_bytes=50)
+
+    rows = {row["type"]: row for row in stats.snapshot()}
+    assert rows["menu"] == {"type": "menu", "packets": 1, "raw_bytes": 300, "wire_bytes": 60}
+    assert rows["speak"] == {"type": "speak", "packets": 2, "raw_bytes": 150, "wire_bytes": 70}
+    assert [row["type"] for row in stats.snapshot()] == ["menu", "speak"]
+
+    stats.reset()
+    assert stats.snapshot() == []
+
+
+def test_disabled_compression_offers_no_extensions():
+    assert CompressionSettings(enabled=False).extensions() == []
+    (factory,) = CompressionSettings(server_max_window_bits=10, min_bytes=32).extensions()
+    assert factory.server_max_window_bits == 10
+    assert factory.min_bytes == 32
+
+
+async def _round_trip(settings: CompressionSettings, packets: list[dict]):
+    port = _free_port()
+    connected = asyncio.Event()
+    clients = []
+
+    async def on_connect(client):
+        clients.append(client)
+        connected.set()
+
+    server = WebSocketServer(
+        host="127.0.0.1", port=port, on_connect=on_connect, compression=settings
+    )
+    await server.start()
+    try:
+        async with connect(f"ws://127.0.0.1:{port}") as websocket:
+            await connected.wait()
+            for packet in packets:
+                await clients[0].send(packet)
+            received = [json.loads(await websocket.recv()) for _ in packets]
+    finally:
+        await server.stop()
+    return received, {row["type"]: row for row in server.packet_stats.snapshot()}
+
+
+@pytest.mark.asyncio
+async def test_large_packets_are_compressed_and_small_ones_sent_as_is():
+    menu = {
+        "type": "menu",
+        "menu_id": "turn_menu",
+        "items": [f"Play card number {i} of the deck" for i in range(60)],
+    }
+    received, stats = await _round_trip(
+        CompressionSettings(min_bytes=200), [menu, {"type": "pong"}]
+    )
+
+    assert received[0]["items"] == menu["items"]
+    assert received[1]["type"] == "pong"
+    assert stats["menu"]["wire_bytes"] * 5 < stats["menu"]["raw_bytes"]
+    assert stats["pong"]["wire_bytes"] == stats["pong"]["raw_bytes"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_compression_counts_raw_bytes():
+    received, stats = await _round_trip(
+        CompressionSettings(enabled=False), [{"type": "speak", "text": "hello " * 50}]
+    )
+
+    assert received[0]["text"].startswith("hello")
+    assert stats["speak"]["wire_bytes"] == stats["speak"]["raw_bytes"] > 300
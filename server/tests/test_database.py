@@ -225,3 +225,76 @@ def test_approve_and_delete_user(db):
 
     assert db.delete_user("pending") is True
     assert db.get_user("pending") is None
+
+
+def test_iter_game_results_pages_in_timestamp_order(db):
+    for i, stamp in enumerate(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-02"]):
+        db.save_game_result(
+            "pig", stamp, 10, [(f"p{i}", f"P{i}", False, False), ("bot", "Bot", True, False)],
+            {"winner_name": f"P{i}"},
+        )
+    db.save_game_result("farkle", "2024-01-01", 5, [("x", "X", False, False)])
+
+    results = list(db.iter_game_results("pig", page_size=1))
+
+    assert [r["timestamp"] for r in results] == ["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03"]
+    assert [r["players"][0]["player_id"] for r in results] == ["p1", "p2", "p3", "p0"]
+    assert results[0]["players"][1]["is_bot"] is True
+    assert results[0]["custom_data"] == {"winner_name": "P1"}
+    assert db.get_result_game_types() == ["farkle", "pig"]
+
+
+def test_replace_player_ratings_only_touches_game_type(db):
+    db.set_player_rating("alice", "pig", 30.0, 5.0)
+    db.set_player_rating("stale", "pig", 20.0, 5.0)
+    db.set_player_rating("alice", "farkle", 22.0, 6.0)
+
+    db.replace_player_ratings("pig", [("alice", 31.0, 4.0), ("bob", 19.0, 4.5)])
+
+    assert db.get_player_rating("alice", "pig") == (31.0, 4.0)
+    assert db.get_player_rating("bob", "pig") == (19.0, 4.5)
+    assert db.get_player_rating("stale", "pig") is None
+    assert db.get_player_rating("alice", "farkle") == (22.0, 6.0)
+
+
+def test_player_ratings_are_served_from_memory_after_first_read(db):
+    db.set_player_rating("alice", "pig", 30.0, 5.0)
+    assert db.get_player_rating("alice", "pig") == (30.0, 5.0)
+
+    # Rows changed behind the cache are not re-read...
+    db._conn.execute("UPDATE player_ratings SET mu = 1.0")
+    assert db.get_player_rating("alice", "pig") == (30.0, 5.0)
+
+    # ...but writes through the database keep it current.
+    db.set_player_rating("bob", "pig", 20.0, 4.0)
+    assert db.get_player_rating("bob", "pig") == (20.0, 4.0)
+    db.replace_player_ratings("pig", [("carol", 25.0, 3.0)])
+    assert db.get_player_rating("alice", "pig") is None
+    assert db.get_player_rating("carol", "pig") == (25.0, 3.0)
+
+
+def test_player_rating_cache_reloads_after_another_process_writes(db):
+    db.set_player_rating("alice", "pig", 30.0, 5.0)
+    assert db.get_player_rating("alice", "pig") == (30.0, 5.0)
+
+    # e.g. ``rebuild-ratings`` running against the live database
+    other = Database(db.db_path)
+    other.connect()
+    other.replace_player_ratings("pig", [("alice", 12.0, 2.0)])
+    other.close()
+
+    assert db.get_player_rating("alice", "pig") == (12.0, 2.0)
+    db.set_player_rating("bob", "pig", 20.0, 4.0)
+    assert db.get_player_rating("alice", "pig") == (12.0, 2.0)
+
+
+def test_player_rating_batches_check_for_outside_writes_once(db):
+    db.set_player_ratings("pig", [("alice", 30.0, 5.0), ("bob", 20.0, 4.0)])
+    statements = []
+    db._conn.set_trace_callback(statements.append)
+
+    ratings = db.get_player_ratings(["alice", "bob", "carol"], "pig")
+
+    db._conn.set_trace_callback(None)
+    assert ratings == {"alice": (30.0, 5.0), "bob": (20.0, 4.0)}
+    assert statements == ["PRAGMA data_version"]
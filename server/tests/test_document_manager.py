@@ -389,3 +389,69 @@ class TestCreateOperations:
         manager.create_category("faq", "FAQ", "en")
         result = manager.create_category("faq", "FAQ 2", "en")
         assert result is False
+
+
+# ------------------------------------------------------------------
+# Content cache and search
+# ------------------------------------------------------------------
+
+
+class TestSearch:
+    def _setup_docs(self, manager):
+        manager.load()
+        manager.create_document("pig_rules", [], "en", "Pig Rules", "Roll the die. Bank your points before a one.")
+        manager.create_document("farkle_rules", [], "en", "Farkle Rules", "Roll six dice and bank scoring dice. Banking ends the turn.")
+        manager.add_document_translation("pig_rules", "fr", "Règles du cochon", "Lancez le dé et sauvez vos points.")
+
+    def test_ranked_prefix_matches_with_snippets(self, manager):
+        self._setup_docs(manager)
+        results = manager.search_documents("Bank", "en")
+        assert [r["folder_name"] for r in results] == ["farkle_rules", "pig_rules"]
+        assert "bank" in results[0]["snippet"].lower()
+        assert manager.search_documents("bank dice", "en")[0]["folder_name"] == "farkle_rules"
+        assert manager.search_documents("bank zebra", "en") == []
+
+    def test_title_matches_rank_first(self, manager):
+        self._setup_docs(manager)
+        results = manager.search_documents("pig", "en")
+        assert results[0]["folder_name"] == "pig_rules"
+        assert results[0]["title"] == "Pig Rules"
+
+    def test_query_words_can_split_between_title_and_content(self, manager):
+        self._setup_docs(manager)
+        assert [r["folder_name"] for r in manager.search_documents("farkle turn", "en")] == ["farkle_rules"]
+        assert manager.search_documents("pig turn", "en") == []
+
+    def test_snippet_centres_on_a_whole_word_match(self, manager):
+        manager.load()
+        content = "That " + "filler " * 20 + "at the end"
+        manager.create_document("notes", [], "en", "Notes", content)
+
+        snippet = manager.search_documents("at", "en")[0]["snippet"]
+
+        assert snippet.startswith("...")
+        assert snippet.endswith("at the end")
+
+    def test_falls_back_to_english_for_untranslated_documents(self, manager):
+        self._setup_docs(manager)
+        assert [r["folder_name"] for r in manager.search_documents("points", "fr")] == ["pig_rules"]
+        assert manager.search_documents("points", "fr")[0]["title"] == "Règles du cochon"
+        assert [r["folder_name"] for r in manager.search_documents("six", "fr")] == ["farkle_rules"]
+
+    def test_writes_update_cache_and_index(self, manager, docs_dir):
+        self._setup_docs(manager)
+        manager.save_document_content("pig_rules", "en", "Hold to keep your turn total.", "alice")
+        assert manager.get_document_content("pig_rules", "en") == "Hold to keep your turn total."
+        assert [r["folder_name"] for r in manager.search_documents("bank", "en")] == ["farkle_rules"]
+        assert [r["folder_name"] for r in manager.search_documents("hold", "en")] == ["pig_rules"]
+
+        manager.remove_document_translation("pig_rules", "fr")
+        assert manager.search_documents("sauvez", "fr") == []
+        manager.delete_document("farkle_rules")
+        assert manager.search_documents("dice", "en") == []
+
+    def test_index_built_on_load(self, manager, docs_dir):
+        self._setup_docs(manager)
+        reloaded = DocumentManager(docs_dir)
+        reloaded.load()
+        assert [r["folder_name"] for r in reloaded.search_documents("scoring", "en")] == ["farkle_rules"]
@@ -37,8 +37,10 @@ class DummyKeybind:
         self.actions = actions
         self._allow = allow
         self.requires_focus = requires_focus
+        self.checks = 0
 
     def can_player_use(self, _game, _player, _is_spectator: bool = False) -> bool:
+        self.checks += 1
         return self._allow
 
 
@@ -55,6 +57,7 @@ class DummyGame(EventHandlingMixin):
         self.executed: list[tuple[str, str, dict]] = []
         self.rebuild_all_calls = 0
         self.rebuild_player_calls = 0
+        self.rebuild_changed_calls: list[str] = []
         self.leave_requests: list[str] = []
 
     # Helpers for tests
@@ -97,6 +100,9 @@ class DummyGame(EventHandlingMixin):
     def rebuild_player_menu(self, _player: Player) -> None:
         self.rebuild_player_calls += 1
 
+    def rebuild_changed_menus(self, player: Player) -> None:
+        self.rebuild_changed_calls.append(player.id)
+
     def _is_player_spectator(self, player: Player) -> bool:
         return player.is_spectator
 
@@ -204,4 +210,31 @@ def test_keybind_event_executes_enabled_and_speaks_disabled():
     context = executed[2]["context"]
     assert isinstance(context, ActionContext)
     assert context.from_keybind
-    assert game.rebuild_all_calls == 1
+    assert game.rebuild_changed_calls == [player.id]
+    assert game.rebuild_all_calls == 0
+
+
+def test_keybind_dispatch_table_is_reused_until_keybinds_change():
+    game = DummyGame()
+    player = make_player()
+    game._users[player.id] = DummyUser()
+    jump = DummyKeybind(["jump"])
+    blocked = DummyKeybind(["jump"], allow=False)
+    game._keybinds["space"] = [jump, blocked]
+    game.register_action("jump", enabled=True)
+
+    for _ in range(3):
+        game.handle_event(player, {"type": "keybind", "key": "space"})
+
+    assert len(game.executed) == 3
+    assert jump.checks == 1
+    assert blocked.checks == 1
+
+    game._keybinds_version = 1
+    game.handle_event(player, {"type": "keybind", "key": "space"})
+    assert jump.checks == 2
+
+    # A replacement dict with the same size and version is not a cache hit
+    game._keybinds = {"space": [jump, blocked]}
+    game.handle_event(player, {"type": "keybind", "key": "space"})
+    assert jump.checks == 3
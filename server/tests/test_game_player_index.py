@@ -0,0 +1,61 @@
+"""Tests for the runtime player lookup indexes on Game."""
+
+from server.games.pig.game import PigGame
+from server.core.users.test_user import MockUser
+
+
+def _game_with_players(*names: str) -> PigGame:
+    game = PigGame()
+    for name in names:
+        game.add_player(name, MockUser(name))
+    return game
+
+
+def test_player_lookups_follow_list_changes():
+    game = _game_with_players("Alice", "Bob")
+    alice, bob = game.players
+
+    assert game.get_player_by_id(bob.id) is bob
+    assert game.get_player_by_name("Alice") is alice
+
+    carol = game.add_player("Carol", MockUser("Carol"))
+    assert game.get_player_by_id(carol.id) is carol
+
+    game.players = [p for p in game.players if p.id != bob.id]
+    assert game.get_player_by_id(bob.id) is None
+    assert game.get_player_by_name("Bob") is None
+
+    game.players.pop(0)
+    assert game.get_player_by_name("Alice") is None
+    assert game.get_player_by_name("Carol") is carol
+
+
+def test_duplicate_names_resolve_to_first_player():
+    game = _game_with_players("Sam", "Sam")
+    assert game.get_player_by_name("Sam") is game.players[0]
+
+
+def test_turn_players_cache_tracks_turn_order_changes():
+    game = _game_with_players("Alice", "Bob", "Carol")
+    alice, bob, carol = game.players
+
+    game.set_turn_players([bob, alice])
+    assert game.turn_players == [bob, alice]
+    assert game.current_player is bob
+
+    game.set_turn_players([carol, bob, alice])
+    assert game.turn_players == [carol, bob, alice]
+
+    game.players.remove(bob)
+    assert game.turn_players == [carol, alice]
+
+
+def test_indexes_are_rebuilt_after_load():
+    game = _game_with_players("Alice", "Bob")
+    game.set_turn_players(list(reversed(game.players)))
+
+    loaded = PigGame.from_json(game.to_json())
+    loaded.rebuild_runtime_state()
+
+    assert [p.name for p in loaded.turn_players] == ["Bob", "Alice"]
+    assert loaded.get_player_by_name("Alice").id == game.players[0].id
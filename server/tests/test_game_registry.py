@@ -0,0 +1,57 @@
+"""Tests for the manifest-backed lazy game registry."""
+
+from pathlib import Path
+import subprocess
+import sys
+
+from server.games.manifest import GAME_MANIFEST
+from server.games.registry import GameRegistry
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_manifest_matches_game_classes():
+    assert len({entry.game_type for entry in GAME_MANIFEST}) == len(GAME_MANIFEST)
+    for entry in GAME_MANIFEST:
+        game_class = GameRegistry.get(entry.game_type)
+        assert game_class is not None, entry.game_type
+        assert game_class.__name__ == entry.class_name
+        assert game_class.get_type() == entry.game_type
+        assert game_class.get_name() == entry.name
+        assert game_class.get_name_key() == entry.name_key
+        assert game_class.get_category() == entry.category
+        assert game_class.get_min_players() == entry.min_players
+        assert game_class.get_max_players() == entry.max_players
+
+
+def test_entries_by_category_follow_manifest_order():
+    categories = GameRegistry.get_entries_by_category()
+    flattened = [entry for entries in categories.values() for entry in entries]
+    assert sorted(e.game_type for e in flattened) == sorted(e.game_type for e in GAME_MANIFEST)
+    dice = [entry.game_type for entry in categories["category-dice-games"]]
+    assert dice[0] == "pig"
+    assert GameRegistry.get_entry("monopoly").max_players == 6
+    assert GameRegistry.get_entry("missing") is None
+    assert GameRegistry.get("missing") is None
+
+
+def test_metadata_queries_do_not_import_games():
+    script = (
+        "import sys\n"
+        "import server.games as games\n"
+        "from server.games.registry import GameRegistry\n"
+        "GameRegistry.get_entries_by_category()\n"
+        "assert not any(name.endswith('.game') for name in sys.modules if name.startswith('server.games.'))\n"
+        "assert games.PigGame is GameRegistry.get('pig')\n"
+        "assert 'server.games.pig.game' in sys.modules\n"
+        "assert 'server.games.monopoly.game' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
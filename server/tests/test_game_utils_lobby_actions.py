@@ -82,6 +82,7 @@ class DummyLobbyGame(LobbyActionsMixin):
         self.broadcasts: list[tuple[str, dict]] = []
         self.broadcast_sounds: list[str] = []
         self.rebuild_count = 0
+        self.table_state_changes = 0
         self.setup_player_actions_calls: list[str] = []
         self.attached_users: list[tuple[str, StubUser]] = []
         self.on_start_called = False
@@ -107,6 +108,9 @@ class DummyLobbyGame(LobbyActionsMixin):
     def rebuild_all_menus(self) -> None:
         self.rebuild_count += 1
 
+    def _table_state_changed(self) -> None:
+        self.table_state_changes += 1
+
     def broadcast_l(self, key: str, **kwargs) -> None:
         self.broadcasts.append((key, kwargs))
 
@@ -160,11 +164,13 @@ def test_start_game_success_triggers_on_start():
     game = DummyLobbyGame()
     host, _ = _add_host(game)
     game._prestart_errors = []
+    changes = game.table_state_changes
 
     game._action_start_game(host, "start")
 
     assert game.on_start_called is True
     assert ("game-starting", {}) in game.broadcasts
+    assert game.table_state_changes == changes + 1
 
 
 def test_add_bot_assigns_default_name_and_attaches_user(monkeypatch):
@@ -201,11 +207,13 @@ def test_remove_bot_drops_last_bot():
     game.player_action_sets[bot.id] = ["actions"]
     game._users[bot.id] = StubUser("Bot")
 
+    changes = game.table_state_changes
     game._action_remove_bot(human, "remove")
 
     assert all(not p.is_bot for p in game.players)
     assert bot.id not in game.player_action_sets
     assert game.rebuild_count == 1
+    assert game.table_state_changes == changes + 1
 
 
 def test_toggle_spectator_announces_changes():
@@ -260,11 +268,14 @@ def test_leave_game_reassigns_host_when_needed():
     host, _ = _add_host(game)
     other, _ = game.add_human("Charlie")
     game.status = "waiting"
+    changes = game.table_state_changes
 
     game._perform_leave_game(host)
 
     assert game.host == "Charlie"
     assert ("new-host", {"player": "Charlie"}) in game.broadcasts
+    # One report for the player list, one for the new host
+    assert game.table_state_changes == changes + 2
 
 
 def test_show_actions_menu_lists_enabled_actions():
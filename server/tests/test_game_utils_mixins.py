@@ -8,6 +8,7 @@ from server.game_utils.actions import Action, MenuInput, EditboxInput, ResolvedA
 from server.game_utils.duration_estimate_mixin import DurationEstimateMixin
 from server.game_utils.game_prediction_mixin import GamePredictionMixin
 from server.game_utils.game_scores_mixin import GameScoresMixin
+from server.game_utils.game_sound_mixin import GameSoundMixin
 from server.game_utils.options import GameOptions, MenuOption, option_field
 from server.core.users.base import EscapeBehavior, MenuItem, TrustLevel
 from server.games.base import Player
@@ -115,8 +116,8 @@ def test_prediction_formats_results(monkeypatch):
         def __init__(self, db, game_type):
             self.calls = []
 
-        def get_rating(self, player_id: str):
-            return DummyRating({"p1": 30, "p2": 20}[player_id])
+        def get_ratings(self, player_ids: list[str]):
+            return {pid: DummyRating({"p1": 30, "p2": 20}[pid]) for pid in player_ids}
 
         def predict_win_probability(self, player_id: str, other_id: str) -> float:
             assert {player_id, other_id} == {"p1", "p2"}
@@ -660,3 +661,174 @@ def test_duration_estimate_rejects_parallel_request(monkeypatch):
     game._action_estimate_duration(player, "estimate")
 
     assert ("speak_l", "estimate-already-running", "misc", {}) in user.spoken
+
+
+class DummySoundGame(GameSoundMixin):
+    def __init__(self):
+        self.scheduled_sounds = []
+        self.sound_scheduler_tick = 0
+        self.event_queue = []
+        self.played = []
+        self.events = []
+
+    def play_sound(self, name, volume=100, pan=0, pitch=100):
+        self.played.append((self.sound_scheduler_tick, name))
+
+    def on_game_event(self, event_type, data):
+        self.events.append((self.sound_scheduler_tick, event_type))
+        if event_type == "chain":
+            self.schedule_event("chained", {})
+
+
+def test_scheduled_sounds_play_in_tick_then_schedule_order():
+    game = DummySoundGame()
+    game.schedule_sound("late.ogg", delay_ticks=3)
+    game.schedule_sound("first.ogg", delay_ticks=1)
+    game.schedule_sound("second.ogg", delay_ticks=1)
+    assert game.next_scheduled_tick() == 1
+
+    for _ in range(5):
+        game.process_scheduled_sounds()
+
+    assert game.played == [(1, "first.ogg"), (1, "second.ogg"), (3, "late.ogg")]
+    assert game.scheduled_sounds == []
+    assert game.next_scheduled_tick() is None
+
+
+def test_events_scheduled_during_dispatch_wait_for_next_call():
+    game = DummySoundGame()
+    game.schedule_event("later", {}, delay_ticks=2)
+    game.schedule_event("chain", {})
+
+    game.process_scheduled_events()
+    assert game.events == [(0, "chain")]
+    assert [entry[1] for entry in game.event_queue] == ["chained", "later"]
+
+    game.process_scheduled_events()
+    game.sound_scheduler_tick = 2
+    game.process_scheduled_events()
+    assert game.events == [(0, "chain"), (0, "chained"), (2, "later")]
+
+
+def test_restore_schedule_order_sorts_unordered_saved_queues():
+    game = DummySoundGame()
+    game.scheduled_sounds = [[4, "b.ogg", 100, 0, 100], [2, "a.ogg", 100, 0, 100]]
+    game.event_queue = [(3, "y", {}), (1, "x", {})]
+    game.restore_schedule_order()
+    game.sound_scheduler_tick = 2
+
+    game.process_scheduled_events()
+    game.process_scheduled_sounds()
+
+    assert game.played == [(2, "a.ogg")]
+    assert game.events == [(2, "x")]
+    assert game.next_scheduled_tick() == 3
+
+
+def test_rebuild_changed_menus_skips_unchanged_players():
+    from server.core.users.test_user import MockUser
+    from server.games.pig.game import PigGame
+
+    game = PigGame()
+    host_user, guest_user = MockUser("Host"), MockUser("Guest")
+    host = game.add_player("Host", host_user)
+    guest = game.add_player("Guest", guest_user)
+    game.host = "Host"
+    game.on_start()
+
+    def menu_sends(user):
+        return [m for m in user.messages if m.type == "show_menu"]
+
+    host_user.messages.clear()
+    guest_user.messages.clear()
+    game.rebuild_changed_menus(host)
+    assert len(menu_sends(host_user)) == 1
+    assert menu_sends(guest_user) == []
+
+    game.current_player = guest
+    game.rebuild_changed_menus(host)
+    assert len(menu_sends(guest_user)) == 1
+
+    replacement = MockUser("Guest")
+    game.attach_user(guest.id, replacement)
+    game.rebuild_changed_menus(host)
+    assert len(menu_sends(replacement)) == 1
+
+
+def test_rebuild_changed_menus_goes_through_game_overrides():
+    from server.core.users.test_user import MockUser
+    from server.games.pig.game import PigGame
+
+    class TrackingPig(PigGame):
+        def __post_init__(self):
+            super().__post_init__()
+            self.prepared: list[str] = []
+            self.rebuilt: list[str] = []
+
+        def _prepare_turn_menu(self, player):
+            self.prepared.append(player.name)
+
+        def rebuild_player_menu(self, player, *, position=None):
+            self.rebuilt.append(player.name)
+            super().rebuild_player_menu(player, position=position)
+
+    game = TrackingPig()
+    host = game.add_player("Host", MockUser("Host"))
+    guest = game.add_player("Guest", MockUser("Guest"))
+    game.host = "Host"
+    game.on_start()
+
+    game.rebuilt.clear()
+    game.rebuild_changed_menus(host)
+    assert game.rebuilt == ["Host"]
+    assert game.prepared == ["Guest"]
+
+    game.current_player = guest
+    game.rebuild_changed_menus(host)
+    assert game.rebuilt == ["Host", "Host", "Guest"]
+
+
+def _index_action(action_id: str) -> Action:
+    return Action(id=action_id, label=action_id, handler="_h", is_enabled="_e", is_hidden="_v")
+
+
+def test_action_index_follows_set_and_action_changes():
+    from server.game_utils.action_set_system_mixin import ActionSetSystemMixin
+    from server.game_utils.actions import ActionSet
+
+    class IndexGame(ActionSetSystemMixin):
+        def __init__(self):
+            self.player_action_sets = {}
+
+    game = IndexGame()
+    player = Player(id="p1", name="Alice")
+    turn = ActionSet(name="turn")
+    lobby = ActionSet(name="lobby")
+    turn.add(_index_action("roll"))
+    lobby.add(_index_action("roll"))
+    game.add_action_set(player, turn)
+    game.add_action_set(player, lobby)
+
+    assert game.find_action(player, "roll") is turn.get_action("roll")
+    assert game.get_action_set(player, "lobby") is lobby
+
+    turn.remove("roll")
+    assert game.find_action(player, "roll") is lobby.get_action("roll")
+
+    replacement = _index_action("roll")
+    lobby.add(replacement)
+    turn.add(_index_action("bank_1"))
+    assert game.find_action(player, "roll") is replacement
+    assert game.find_action(player, "bank_1") is not None
+
+    turn.remove_by_prefix("bank_")
+    assert game.find_action(player, "bank_1") is None
+
+    game.remove_action_set(player, "lobby")
+    assert game.find_action(player, "roll") is None
+    assert game.get_action_set(player, "lobby") is None
+
+    game.player_action_sets = {
+        player.id: [ActionSet.from_json(lobby.to_json())]
+    }
+    assert game.find_action(player, "roll").id == "roll"
@@ -12,6 +12,7 @@ from server.game_utils.options import (
     OptionGroupMeta,
     get_option_meta,
     get_option_field_group,
+    get_options_schema,
     get_visibility_conditions,
     multi_select_field,
     option_field,
@@ -746,3 +747,65 @@ def test_combined_visibility_hides_when_condition_false(monkeypatch):
     action_set = options.create_options_action_set(game, player)
     assert action_set.get_action("set_penalty") is None
     assert action_set.get_action("set_limit") is not None
+
+
+# =========================================================================
+# Compiled schema tests
+# =========================================================================
+
+
+@dataclass
+class OverrideOptions(GameOptions):
+    mode: str = option_field(
+        MenuOption(
+            default="casual",
+            choices=["casual", "ranked"],
+            label="opt-mode",
+            prompt="opt-mode-prompt",
+            change_msg="opt-mode-change",
+        )
+    )
+    rounds: int = option_field(
+        IntOption(
+            default=3,
+            min_val=1,
+            max_val=10,
+            value_key="rounds",
+            label="opt-rounds",
+            prompt="opt-rounds-prompt",
+            change_msg="opt-rounds-change",
+        ),
+        value_when=("mode", lambda v: v == "ranked", 5, True),
+    )
+
+
+@dataclass
+class ExtendedOverrideOptions(OverrideOptions):
+    hints: bool = option_field(
+        BoolOption(default=False, label="opt-hints", change_msg="opt-hints-change")
+    )
+
+
+def test_options_schema_is_compiled_once_per_class():
+    schema = get_options_schema(OverrideOptions)
+    assert get_options_schema(OverrideOptions()) is schema
+    assert schema.field_order == ("mode", "rounds")
+    assert schema.options_by_group[None] == ("mode", "rounds")
+
+    extended = get_options_schema(ExtendedOverrideOptions)
+    assert extended is not schema
+    assert extended.field_order == ("mode", "rounds", "hints")
+    assert "hints" not in schema.metas
+
+
+def test_value_overrides_follow_compiled_dependency_graph():
+    options = OverrideOptions()
+    schema = get_options_schema(OverrideOptions)
+    assert [entry[0] for entry in schema.overrides_by_ref["mode"]] == ["rounds"]
+
+    assert not options._is_value_enforced("rounds")
+    options.mode = "ranked"
+    options._apply_value_overrides("mode")
+    assert options.rounds == 5
+    assert options._is_value_enforced("rounds")
+    assert not options._is_value_enforced("mode")
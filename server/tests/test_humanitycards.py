@@ -0,0 +1,140 @@
+"""Tests for Humanity Cards game implementation."""
+
+import json
+import random
+
+from server.games.humanitycards.catalog import HumanityCatalog, get_catalog
+from server.games.humanitycards.game import HumanityCardsGame, HumanityCardsPlayer
+from server.core.users.bot import Bot
+from server.core.users.test_user import MockUser
+
+
+def _make_game(num_players: int = 3) -> HumanityCardsGame:
+    game = HumanityCardsGame()
+    for i in range(num_players):
+        name = f"Player{i + 1}"
+        game.add_player(name, MockUser(name))
+    return game
+
+
+class TestHumanityCatalog:
+    """Tests for the shared card catalog."""
+
+    def test_catalog_is_shared(self):
+        """Test that the catalog loads once per process."""
+        assert get_catalog() is get_catalog()
+
+    def test_catalog_from_packs(self):
+        """Test id ranges, text trimming and pick counts."""
+        catalog = HumanityCatalog.from_packs([
+            {"name": "A", "white": [{"text": "One."}, {"text": "Two"}], "black": []},
+            {
+                "name": "B",
+                "white": [{"text": "Three"}],
+                "black": [{"text": "_ and _"}, {"text": "No blanks?"}],
+            },
+        ])
+        assert catalog.white_ids_for_packs(["B"]) == [2]
+        assert catalog.white_ids_for_packs(["A", "B"]) == [0, 1, 2]
+        assert catalog.white_text(0) == "One"
+        assert catalog.black_ids_for_packs(["B"]) == [0, 1]
+        assert catalog.black_pick(0) == 2
+        assert catalog.black_pick(1) == 1
+        assert catalog.white_id_for_text("Three.") == 2
+
+
+class TestHumanityCardsState:
+    """Tests for id-based card state."""
+
+    def test_decks_store_catalog_ids(self):
+        """Test that decks and hands hold ints resolved through the catalog."""
+        game = _make_game()
+        game.on_start()
+        player: HumanityCardsPlayer = game.players[0]
+        assert player.hand and all(isinstance(card, int) for card in player.hand)
+        assert all(isinstance(card, int) for card in game.white_deck)
+        assert isinstance(game.current_black_card, int)
+        assert game._white_text(player.hand[0]) == get_catalog().white_texts[player.hand[0]]
+
+    def test_save_stays_small(self):
+        """Test that saved state no longer embeds card text."""
+        game = _make_game()
+        game.options.card_packs = list(get_catalog().pack_names)
+        game.on_start()
+        assert len(game.to_json()) < 500_000
+
+    def test_round_trip(self):
+        """Test that state survives serialization."""
+        game = _make_game()
+        game.on_start()
+        restored = HumanityCardsGame.from_json(game.to_json())
+        assert restored.players[0].hand == game.players[0].hand
+        assert restored.current_black_card == game.current_black_card
+
+    def test_legacy_save_migrates_to_ids(self):
+        """Test that saves with embedded card dicts load as ids."""
+        catalog = get_catalog()
+        game = _make_game()
+        game.on_start()
+        data = json.loads(game.to_json())
+        data["white_deck"] = [
+            {"text": catalog.white_text(i), "pack": "x", "id": 99} for i in data["white_deck"][:5]
+        ]
+        black = data["current_black_card"]
+        data["current_black_card"] = {
+            "text": catalog.black_text(black),
+            "pick": catalog.black_pick(black),
+            "pack": "x",
+        }
+        hand = data["players"][0]["hand"]
+        data["players"][0]["hand"] = [{"text": catalog.white_text(i)} for i in hand]
+
+        restored = HumanityCardsGame.from_json(json.dumps(data))
+        assert len(restored.white_deck) == 5
+        assert restored.current_black_card == black
+        assert [catalog.white_text(i) for i in restored.players[0].hand] == [
+            catalog.white_text(i) for i in hand
+        ]
+
+    def test_save_from_changed_catalog_migrates_by_text(self, monkeypatch):
+        """Test that ids saved against another pack file are remapped by text."""
+        import server.games.humanitycards.catalog as catalog_module
+
+        catalog = get_catalog()
+        game = _make_game()
+        game.on_start()
+        saved = game.to_json()
+        hand_texts = [catalog.white_text(i) for i in game.players[0].hand]
+        black_text = catalog.black_text(game.current_black_card)
+
+        with open(catalog_module.PACKS_PATH, encoding="utf-8") as f:
+            packs = json.load(f)
+        reordered = HumanityCatalog.from_packs(list(reversed(packs)))
+        assert reordered.fingerprint != catalog.fingerprint
+        monkeypatch.setattr(catalog_module, "_catalog", reordered)
+
+        restored = HumanityCardsGame.from_json(saved)
+        assert [reordered.white_text(i) for i in restored.players[0].hand] == hand_texts
+        assert reordered.black_text(restored.current_black_card) == black_text
+        assert len(restored.white_deck) + len(hand_texts) * 3 == len(
+            reordered.white_ids_for_packs(game.options.card_packs)
+        )
+        assert restored.white_discard == []
+
+
+class TestHumanityCardsPlayTest:
+    """Play tests with bots."""
+
+    def test_bot_game_completes(self):
+        """Test that a bot game reaches the end."""
+        random.seed(7)
+        game = HumanityCardsGame()
+        for i in range(3):
+            game.add_player(f"Bot{i}", Bot(f"Bot{i}"))
+        game.options.winning_score = 2
+        game.on_start()
+        for _ in range(20000):
+            if game.status == "finished":
+                break
+            game.on_tick()
+        assert game.status == "finished"
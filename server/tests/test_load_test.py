@@ -0,0 +1,36 @@
+"""Tests for the websocket load-test harness."""
+
+import pytest
+
+from server.scripts.load_test import TickRecorder, run_step, table_groups
+
+
+def test_table_groups_never_leave_a_client_alone():
+    assert table_groups(4, 2) == [[0, 1], [2, 3]]
+    assert table_groups(5, 2) == [[0, 1], [2, 3, 4]]
+    assert table_groups(9, 4) == [[0, 1, 2, 3], [4, 5, 6], [7, 8]]
+    assert table_groups(6, 9) == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_tick_recorder_counts_overruns(monkeypatch):
+    clock = iter([0.0, 0.01, 0.06, 0.07, 0.30, 0.31])
+    monkeypatch.setattr("server.scripts.load_test.time.perf_counter", lambda: next(clock))
+    recorder = TickRecorder(50)
+    tick = recorder.wrap(lambda: None)
+    for _ in range(3):
+        tick()
+
+    stats = recorder.snapshot()
+    assert stats["ticks"] == 3
+    assert stats["tick_overrun_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.slow
+def test_load_step_plays_pig_tables():
+    result = run_step(4, duration=2.0, ramp=0.5, think=(0.05, 0.1))
+
+    assert result["failures"] == 0
+    assert result["latency_ms"]["authorize"]["count"] == 4
+    assert result["latency_ms"]["keybind"]["count"] > 0
+    assert result["bytes_per_client"] > 0
+    assert result["ticks"] > 0
@@ -0,0 +1,82 @@
+"""Tests for the shared compiled Monopoly board catalog."""
+
+import json
+
+from server.games.monopoly.board_catalog import get_compiled_board, warm_board_catalog
+from server.games.monopoly.board_spaces import CLASSIC_STANDARD_BOARD
+from server.games.monopoly.game import MonopolyGame, MonopolyOptions
+from server.games.monopoly.manual_rules.loader import load_manual_rule_set
+from server.core.users.test_user import MockUser
+
+
+def _start_game(board_id: str) -> MonopolyGame:
+    game = MonopolyGame(
+        options=MonopolyOptions(
+            preset_id="classic_standard",
+            board_id=board_id,
+            board_rules_mode="auto",
+        )
+    )
+    game.add_player("Host", MockUser("Host"))
+    game.add_player("Guest", MockUser("Guest"))
+    game.host = "Host"
+    game.on_start()
+    return game
+
+
+def test_manual_rule_set_is_parsed_once_per_process():
+    assert load_manual_rule_set("mario_kart") is load_manual_rule_set("mario_kart")
+
+
+def test_compiled_board_is_shared_between_tables():
+    first = _start_game("mario_kart")
+    second = _start_game("mario_kart")
+
+    assert first.active_manual_rule_set is second.active_manual_rule_set
+    assert first._active_compiled_board() is second._active_compiled_board()
+    # Tables own their mutable copies
+    assert first.active_board_spaces is not second.active_board_spaces
+
+
+def test_classic_board_compiles_from_builtin_layout():
+    compiled = get_compiled_board("classic_default", None)
+
+    assert compiled.spaces == tuple(CLASSIC_STANDARD_BOARD)
+    assert compiled.color_group_to_space_ids["dark_blue"] == ("park_place", "boardwalk")
+    assert len(compiled.space_ids_by_kind["railroad"]) == 4
+    assert compiled.rents_by_space_id["boardwalk"][0] == 50
+
+
+def test_compiled_board_indexes_manual_decks():
+    rule_set = load_manual_rule_set("mario_kart")
+    compiled = get_compiled_board("mario_kart", rule_set, "mario_kart")
+
+    chance_rows = [row for row in rule_set.cards.get("chance", []) if row.get("id")]
+    assert compiled.deck_ids["chance"] == tuple(row["id"] for row in chance_rows)
+    first = chance_rows[0]
+    assert compiled.card_definitions[("chance", first["id"])] is first
+    assert "pass_go_credit_override" in compiled.capability_ids
+
+
+def test_saved_state_omits_board_structures_and_restores_them():
+    game = _start_game("mario_kart")
+    payload = json.loads(game.to_json())
+
+    assert "active_manual_rule_set" not in payload
+    assert "active_board_spaces" not in payload
+    assert "active_space_by_id" not in payload
+
+    restored = MonopolyGame.from_json(game.to_json())
+    restored.rebuild_runtime_state()
+
+    assert restored.active_manual_rule_set is game.active_manual_rule_set
+    assert restored.active_board_spaces == game.active_board_spaces
+    assert restored.active_space_by_id == game.active_space_by_id
+    assert restored.active_color_group_to_space_ids == game.active_color_group_to_space_ids
+
+
+def test_warm_board_catalog_reports_timings():
+    timings = warm_board_catalog(["classic_default", "mario_kart"])
+
+    assert set(timings) == {"classic_default", "mario_kart"}
+    assert all(seconds >= 0 for seconds in timings.values())
@@ -0,0 +1,89 @@
+"""Tests for the incrementally maintained Monopoly ownership index."""
+
+from server.games.monopoly.game import MonopolyGame, MonopolyOptions
+from server.core.users.test_user import MockUser
+
+
+def _start_game() -> MonopolyGame:
+    game = MonopolyGame(options=MonopolyOptions(preset_id="classic_standard"))
+    game.add_player("Host", MockUser("Host"))
+    game.add_player("Guest", MockUser("Guest"))
+    game.host = "Host"
+    game.on_start()
+    return game
+
+
+def _railroad_ids(game: MonopolyGame) -> list[str]:
+    return [space.space_id for space in game.active_board_spaces if space.kind == "railroad"]
+
+
+def test_color_set_and_kind_counts_follow_ownership_changes():
+    game = _start_game()
+    host, guest = game.players[0], game.players[1]
+
+    game.property_owners["mediterranean_avenue"] = host.id
+    assert not game._owner_has_full_color_set(host.id, "brown")
+    game.property_owners["baltic_avenue"] = host.id
+    assert game._owner_has_full_color_set(host.id, "brown")
+
+    game.property_owners["baltic_avenue"] = guest.id
+    assert not game._owner_has_full_color_set(host.id, "brown")
+    assert game._ownership_index.group_count(guest.id, "brown") == 1
+
+    for space_id in _railroad_ids(game):
+        game.property_owners[space_id] = guest.id
+    assert game._count_owned_kind(guest.id, "railroad") == 4
+    assert game._owns_all_of_kind(guest.id, "railroad")
+
+    game.property_owners.pop(_railroad_ids(game)[0])
+    assert game._count_owned_kind(guest.id, "railroad") == 3
+    assert not game._owns_all_of_kind(guest.id, "railroad")
+
+
+def test_asset_value_tracks_mortgages_and_buildings():
+    game = _start_game()
+    host = game.players[0]
+
+    game.property_owners["mediterranean_avenue"] = host.id
+    game.property_owners["baltic_avenue"] = host.id
+    assert game._owner_asset_value(host.id) == 120
+
+    game._set_building_level("baltic_avenue", 2)
+    assert game._owner_asset_value(host.id) == 120 + 2 * 25
+
+    game.mortgaged_space_ids.append("mediterranean_avenue")
+    assert game._owner_asset_value(host.id) == 30 + 60 + 2 * 25
+    game.mortgaged_space_ids.remove("mediterranean_avenue")
+    assert game._owner_asset_value(host.id) == 120 + 2 * 25
+
+
+def test_endgame_scoring_and_property_count_read_the_index():
+    game = _start_game()
+    host = game.players[0]
+    cash = max(0, game._current_liquid_balance(host))
+
+    game.property_owners["mediterranean_avenue"] = host.id
+    game.property_owners["baltic_avenue"] = host.id
+    game._set_building_level("baltic_avenue", 1)
+    game.mortgaged_space_ids.append("mediterranean_avenue")
+
+    assert game._owned_property_count(host) == 2
+    assert game._standard_total_asset_value(host) == cash + 30 + 60 + 25
+
+
+def test_index_is_rebuilt_after_save_and_load():
+    game = _start_game()
+    host = game.players[0]
+    game.property_owners["mediterranean_avenue"] = host.id
+    game.property_owners["baltic_avenue"] = host.id
+    game.mortgaged_space_ids.append("baltic_avenue")
+
+    loaded = MonopolyGame.from_json(game.to_json())
+    loaded.rebuild_runtime_state()
+
+    assert loaded.property_owners == game.property_owners
+    assert loaded._owner_has_full_color_set(host.id, "brown")
+    assert loaded._owner_asset_value(host.id) == 60 + 30
+
+    loaded.property_owners["baltic_avenue"] = "nobody"
+    assert not loaded._owner_has_full_color_set(host.id, "brown")
@@ -0,0 +1,88 @@
+"""Tests for the cached Monopoly position valuation used by bots."""
+
+from server.games.monopoly.game import MonopolyGame, MonopolyOptions, MonopolyTradeOffer
+from server.games.monopoly.valuation import expected_income, get_position_valuation
+from server.core.users.test_user import MockUser
+
+
+def _start_game(preset_id: str = "classic_standard") -> MonopolyGame:
+    game = MonopolyGame(options=MonopolyOptions(preset_id=preset_id))
+    game.add_player("Host", MockUser("Host"))
+    game.add_player("Guest", MockUser("Guest"))
+    game.host = "Host"
+    game.on_start()
+    return game
+
+
+def test_landing_probabilities_are_shared_and_favor_jail_exits():
+    first = _start_game()
+    second = _start_game()
+    valuation = first._position_valuation()
+
+    assert valuation is second._position_valuation()
+    assert valuation is get_position_valuation(first._active_compiled_board())
+    assert abs(sum(valuation.landing_probability.values()) - 1.0) < 1e-6
+    assert valuation.probability("go_to_jail") == 0.0
+    assert valuation.probability("jail") > valuation.probability("tennessee_avenue")
+    assert valuation.probability("tennessee_avenue") > valuation.probability("mediterranean_avenue")
+
+
+def test_completing_a_color_set_raises_property_value():
+    game = _start_game()
+    host, guest = game.players[0], game.players[1]
+
+    alone = game._bot_property_value("baltic_avenue", host.id)
+    game.property_owners["mediterranean_avenue"] = host.id
+    completing = game._bot_property_value("baltic_avenue", host.id)
+
+    assert alone >= 60
+    assert completing > alone
+    assert game._bot_property_value("baltic_avenue", guest.id) == alone
+
+
+def test_bot_declines_trade_that_breaks_its_color_set():
+    game = _start_game()
+    host, guest = game.players[0], game.players[1]
+    guest.owned_space_ids.append("boardwalk")
+    game.property_owners["boardwalk"] = guest.id
+    offer = MonopolyTradeOffer(
+        proposer_id=host.id,
+        target_id=guest.id,
+        give_cash=450,
+        receive_property_id="boardwalk",
+        summary="Buy Boardwalk from Guest for 450",
+    )
+    assert game._bot_accepts_trade_offer(host, guest, offer)
+
+    guest.owned_space_ids.append("park_place")
+    game.property_owners["park_place"] = guest.id
+    assert not game._bot_accepts_trade_offer(host, guest, offer)
+
+
+def test_bot_auction_cap_stays_within_cash_reserve():
+    game = _start_game()
+    host = game.players[0]
+    boardwalk = game.active_space_by_id["boardwalk"]
+
+    host.cash = 2000
+    assert game._bot_auction_bid_cap(host, boardwalk) >= boardwalk.price
+    host.cash = 300
+    assert game._bot_auction_bid_cap(host, boardwalk) == int(300 * 0.85)
+
+
+def test_expected_income_uses_junior_rent_rules():
+    game = _start_game("junior_modern")
+    host = game.players[0]
+    probability = game._position_valuation().probability
+
+    game.property_owners["reading_railroad"] = host.id
+    # Junior railroads charge 2 per railroad owned, not 25 doubling per railroad
+    assert expected_income(game, "pennsylvania_railroad", host.id) == (
+        probability("pennsylvania_railroad") * 4 + probability("reading_railroad") * 2
+    )
+
+    game.property_owners["mediterranean_avenue"] = host.id
+    # A full junior color set adds 1 to each street's rent instead of doubling it
+    assert expected_income(game, "baltic_avenue", host.id) == (
+        probability("baltic_avenue") * 5 + probability("mediterranean_avenue") * 1
+    )
@@ -156,3 +156,46 @@ def test_setters_for_trust_preferences_and_approval():
 
     user.set_approved(True)
     assert user.approved is True
+
+
+def test_network_user_pages_long_menus_for_paging_clients():
+    connection = DummyConnection()
+    connection.features = frozenset({"menu_paging"})
+    user = NetworkUser(username="alice", locale="en", connection=connection)
+    lines = [MenuItem(text=f"Line {i}", id="status_line") for i in range(1, 101)]
+
+    user.show_menu("status_box", lines)
+    packet = drain_messages(user)[0]
+    assert len(packet["items"]) == 40
+    assert packet["total_items"] == 100
+
+    user.send_menu_items("status_box", 40)
+    user.send_menu_items("status_box", 100)
+    page = drain_messages(user)
+    assert len(page) == 1
+    assert page[0]["type"] == "menu_items"
+    assert page[0]["offset"] == 40
+    assert page[0]["items"][0]["text"] == "Line 41"
+    assert len(page[0]["items"]) == 40
+
+    # Updates keep everything the client already loaded.
+    user.update_menu("status_box", lines[:90])
+    packet = drain_messages(user)[0]
+    assert len(packet["items"]) == 80
+    assert packet["total_items"] == 90
+
+    # So does showing the menu again.
+    user.show_menu("status_box", lines)
+    assert len(drain_messages(user)[0]["items"]) == 80
+
+    # The window reaches past the focused item.
+    user.show_menu("status_box", lines, position=70)
+    assert len(drain_messages(user)[0]["items"]) == 90
+
+
+def test_network_user_sends_whole_menus_to_other_clients():
+    user = NetworkUser(username="alice", locale="en", connection=DummyConnection())
+    user.show_menu("status_box", [f"Line {i}" for i in range(100)])
+    packet = drain_messages(user)[0]
+    assert len(packet["items"]) == 100
+    assert "total_items" not in packet
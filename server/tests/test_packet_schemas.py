@@ -29,6 +29,7 @@ CLIENT_TO_SERVER_SAMPLES = [
         "platform": "Linux",
     },
     {"type": "menu", "menu_id": "main", "selection": 1},
+    {"type": "request_menu_items", "menu_id": "status_box", "offset": 40},
     {"type": "keybind", "key": "f1"},
     {"type": "escape", "menu_id": "main"},
     {"type": "editbox", "text": "hello", "input_id": "chat"},
@@ -82,6 +83,8 @@ SERVER_TO_CLIENT_SAMPLES = [
     {"type": "play_ambience", "loop": "rain"},
     {"type": "stop_ambience"},
     {"type": "menu", "menu_id": "main", "items": ["Play"]},
+    {"type": "menu", "menu_id": "status_box", "items": ["Line 1"], "total_items": 90},
+    {"type": "menu_items", "menu_id": "status_box", "offset": 40, "items": ["Line 41"], "total_items": 90},
     {"type": "request_input", "input_id": "chat", "prompt": "Say something"},
     {"type": "clear_ui"},
     {
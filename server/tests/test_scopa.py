@@ -3,7 +3,13 @@
 from pathlib import Path
 
 from server.games.scopa.game import ScopaGame, ScopaPlayer, ScopaOptions
-from server.games.scopa.capture import find_captures, select_best_capture
+from server.games.scopa.capture import (
+    _cached_index,
+    find_captures,
+    find_subsets_with_sum,
+    get_capture_index,
+    select_best_capture,
+)
 from server.games.scopa.bot import (
     find_best_combo_chain,
     check_combo_potential,
@@ -305,6 +311,69 @@ class TestScopaCaptureLogic:
         best = select_best_capture(captures)
         assert len(best) == 2
 
+    def test_capture_index_matches_backtracking_order(self):
+        """Test that the index returns the same subsets in the same order."""
+        table_cards = [
+            Card(id=i, rank=rank, suit=(i % 4) + 1)
+            for i, rank in enumerate([1, 2, 3, 4, 5, 6, 1, 2, 7, 3, 10, 9])
+        ]
+        index = get_capture_index(table_cards)
+        for target in range(1, 16):
+            expected = find_subsets_with_sum(table_cards, target)
+            assert [list(s) for s in index.subsets_with_sum(target)] == expected
+
+    def test_capture_index_is_shared_per_table(self):
+        """Test that identical tables reuse one index."""
+        table_cards = [Card(id=0, rank=3, suit=1), Card(id=1, rank=4, suit=2)]
+        assert get_capture_index(table_cards) is get_capture_index(list(table_cards))
+        assert get_capture_index(table_cards) is not get_capture_index(table_cards[:1])
+
+    def test_evaluate_play_capture(self):
+        """Test play evaluation for a rank-match capture."""
+        table_cards = [
+            Card(id=0, rank=7, suit=1),
+            Card(id=1, rank=2, suit=2),
+            Card(id=2, rank=9, suit=3),
+        ]
+        evaluation = get_capture_index(table_cards).evaluate_play(
+            Card(id=3, rank=9, suit=4)
+        )
+        # Rank match beats the 7+2 sum
+        assert [c.id for c in evaluation.capture] == [2]
+        assert not evaluation.is_scopa
+        # 7 + 2 left behind can be swept by a 9
+        assert evaluation.scopa_risk
+        assert evaluation.remaining_total == 9
+        # Both nines are won: 10 primiera points each, no coins
+        assert evaluation.coins == 0
+        assert evaluation.primiera_value == 20
+        assert not evaluation.settebello
+
+        evaluation = get_capture_index(table_cards).evaluate_play(
+            Card(id=4, rank=7, suit=2)
+        )
+        assert evaluation.settebello
+        assert evaluation.coins == 1
+        assert evaluation.primiera_value == 42
+
+    def test_evaluate_play_scopa_and_escoba_risk(self):
+        """Test scopa detection and escoba sweep risk."""
+        table_cards = [Card(id=0, rank=3, suit=1), Card(id=1, rank=4, suit=2)]
+        evaluation = get_capture_index(table_cards).evaluate_play(
+            Card(id=2, rank=8, suit=3), escoba=True
+        )
+        assert evaluation.is_scopa
+        assert not evaluation.scopa_risk
+
+        # Laying a 2 leaves 3+4+2=9 on the table; a 6 sweeps it in escoba
+        index = get_capture_index(table_cards)
+        cached = _cached_index.cache_info().currsize
+        evaluation = index.evaluate_play(Card(id=3, rank=2, suit=3), escoba=True)
+        assert evaluation.captured_count == 0
+        assert evaluation.scopa_risk
+        # Sweep risk comes from the remaining total, not from a new index
+        assert _cached_index.cache_info().currsize == cached
+
 
 class TestScopaGameFlow:
     """Tests for game flow."""
@@ -645,6 +714,26 @@ class TestScopaBotAI:
         # The 4 should score higher than 1 because it sets up a combo
         assert score_4 > score_1, "Card with combo potential should score higher"
 
+    def test_evaluate_card_prefers_settebello_capture(self):
+        """Test that the bot scores captures from the evaluated card values."""
+        game = ScopaGame()
+        game.add_player("Player1", MockUser("Player1"))
+        game.add_player("Player2", MockUser("Player2"))
+        game.on_start()
+
+        player = game.players[0]
+        game.table_cards = [Card(id=100, rank=7, suit=1), Card(id=101, rank=6, suit=2)]
+        player.hand = [Card(id=102, rank=7, suit=3), Card(id=103, rank=6, suit=4)]
+
+        score_settebello = evaluate_card(game, player.hand[0], player)
+        score_six = evaluate_card(game, player.hand[1], player)
+        assert score_settebello > score_six
+
+        game.options.inverse_scopa = True
+        assert evaluate_card(game, player.hand[0], player) < evaluate_card(
+            game, player.hand[1], player
+        )
+
     def test_evaluate_card_escoba_empty_table(self):
         """Test that evaluate_card uses escoba defense on empty table."""
         game = ScopaGame()
@@ -48,7 +48,9 @@ class DummyUser:
     def connection(self):
         async def send(payload):
             self.sent.append(payload)
-        return SimpleNamespace(send=send)
+        return SimpleNamespace(
+            send=send, enqueue=self.sent.append, enqueue_many=self.sent.extend
+        )
 
 
 class DummyDB:
@@ -532,3 +532,28 @@ max_message_bytes = 2048
 def test_network_max_size_defaults(tmp_path):
     srv = Server(db_path=str(tmp_path / "auth.db"), locales_dir="locales", config_path=tmp_path / "missing.toml")
     assert srv._ws_max_message_size == DEFAULT_WS_MAX_MESSAGE_BYTES
+
+
+def test_network_compression_settings_loaded_and_clamped(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        """
+[network]
+compression_window_bits = 20
+compression_client_window_bits = 4
+compression_level = 9
+compression_min_bytes = 256
+"""
+    )
+    srv = Server(db_path=str(tmp_path / "auth.db"), locales_dir="locales", config_path=config_path)
+
+    compression = srv._compression
+    assert compression.enabled is True
+    assert compression.server_max_window_bits == 15
+    assert compression.client_max_window_bits == 9
+    assert compression.level == 9
+    assert compression.min_bytes == 256
+
+    config_path.write_text("[network]\ncompression = false\n")
+    srv = Server(db_path=str(tmp_path / "auth.db"), locales_dir="locales", config_path=config_path)
+    assert srv._compression.enabled is False
@@ -40,6 +40,9 @@ class DummyClient:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def enqueue_many(self, payloads):
+        self.sent.extend(payloads)
+
 
 class DummyWebSocketServer:
     def __init__(self, mapping):
@@ -18,6 +18,12 @@ class DummyConn:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def enqueue(self, payload):
+        self.sent.append(payload)
+
+    def enqueue_many(self, payloads):
+        self.sent.extend(payloads)
+
 
 class DummyUser:
     def __init__(self, username: str, approved: bool = True, locale: str = "en"):
@@ -92,6 +98,27 @@ async def test_handle_chat_global_only_approved(server):
     assert bob.connection.sent == []
 
 
+@pytest.mark.asyncio
+async def test_handle_chat_does_not_wait_on_stalled_recipient(server):
+    stalled = DummyUser("stalled")
+    alice = DummyUser("alice")
+
+    async def never_sends(payload):
+        await asyncio.Event().wait()
+
+    stalled.connection.send = never_sends
+    server._users = {"stalled": stalled, "alice": alice}
+    server._tables = FakeTables()
+    client = SimpleNamespace(username="alice")
+
+    await asyncio.wait_for(
+        server._handle_chat(client, {"convo": "global", "message": "hey", "language": "en"}),
+        timeout=1,
+    )
+
+    assert alice.connection.sent[0]["message"] == "hey"
+
+
 @pytest.mark.asyncio
 async def test_handle_keybind_who_online_none(server):
     alice = DummyUser("alice")
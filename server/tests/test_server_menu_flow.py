@@ -7,7 +7,7 @@ import pytest
 
 from server.core.server import Server
 from server.core.users.network_user import NetworkUser
-from server.core.users.base import TrustLevel
+from server.core.users.base import MenuItem, TrustLevel
 from server.core.users.preferences import DiceKeepingStyle
 from server.messages.localization import Localization
 
@@ -19,6 +19,12 @@ class DummyConnection:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def enqueue(self, payload):
+        self.sent.append(payload)
+
+    def enqueue_many(self, payloads):
+        self.sent.extend(payloads)
+
 
 def make_network_user(name="Player", locale="en", trust=TrustLevel.USER, approved=True):
     user = NetworkUser(name, locale, DummyConnection(), approved=approved)
@@ -136,6 +142,28 @@ async def test_handle_menu_routes_main_menu_selection(server):
     assert called == [user.username]
 
 
+@pytest.mark.asyncio
+async def test_handle_menu_resolves_index_against_full_paged_menu(server):
+    user = make_network_user("Pager")
+    user._connection.features = frozenset({"menu_paging"})
+    server._users[user.username] = user
+    server._user_states[user.username] = {"menu": "main_menu"}
+    server._tables = SimpleNamespace(find_user_table=lambda username: None)
+    items = [MenuItem(text=f"Item {i}", id=f"item_{i}") for i in range(99)]
+    user.show_menu("main_menu", items + [MenuItem(text="Back", id="back")])
+
+    dispatched = []
+
+    async def dispatch(target, selection_id, state, current_menu):
+        dispatched.append(selection_id)
+
+    server._dispatch_menu_selection = dispatch
+    client = SimpleNamespace(username=user.username)
+    await server._handle_menu(client, {"menu_id": "main_menu", "selection": 100})
+
+    assert dispatched == ["back"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 async def test_options_selection_toggles_turn_sound(server):
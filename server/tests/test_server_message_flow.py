@@ -28,6 +28,12 @@ class DummyClient:
     async def send(self, payload):
         self.sent.append(payload)
 
+    def enqueue(self, payload):
+        self.sent.append(payload)
+
+    def enqueue_many(self, payloads):
+        self.sent.extend(payloads)
+
     async def close(self):
         self.closed = True
 
@@ -150,6 +150,9 @@ class StubGameInstance:
     def rebuild_runtime_state(self):
         return None
 
+    def _table_state_changed(self):
+        return None
+
     def get_player_by_name(self, name):
         for p in self.players:
             if getattr(p, "name", None) == name:
@@ -2,12 +2,15 @@
 
 from datetime import datetime
 
+import pytest
+
 from server.game_utils.game_result import GameResult, PlayerResult
 from server.game_utils.stats_helpers import (
     LeaderboardHelper,
     LeaderboardEntry,
     RatingHelper,
 )
+from server.persistence.database import Database
 
 
 def make_result(players, custom_data):
@@ -94,9 +97,20 @@ class DummyDB:
     def get_player_rating(self, player_id, game_type):
         return self.store.get((player_id, game_type))
 
+    def get_player_ratings(self, player_ids, game_type):
+        return {
+            pid: self.store[(pid, game_type)]
+            for pid in player_ids
+            if (pid, game_type) in self.store
+        }
+
     def set_player_rating(self, player_id, game_type, mu, sigma):
         self.store[(player_id, game_type)] = (mu, sigma)
 
+    def set_player_ratings(self, game_type, ratings):
+        for player_id, mu, sigma in ratings:
+            self.set_player_rating(player_id, game_type, mu, sigma)
+
     def get_rating_leaderboard(self, game_type, limit):
         rows = [
             (pid, mu, sigma)
@@ -135,3 +149,47 @@ def test_rating_helper_update_and_prediction_flow():
 
     probability = helper.predict_win_probability("alice", "bob")
     assert 0 <= probability <= 1
+
+
+def test_rating_rebuild_matches_incremental_updates(tmp_path):
+    db = Database(tmp_path / "ratings.db")
+    db.connect()
+    try:
+        live = RatingHelper(DummyDB(), game_type="pig")
+        games = [("alice", "bob"), ("bob", "carol"), ("alice", "carol"), ("carol", "alice")]
+        for day, (winner, loser) in enumerate(games, start=1):
+            players = [(winner, winner.title(), False, False), (loser, loser.title(), False, False)]
+            result = make_result(players, {"winner_name": winner.title()})
+            db.save_game_result("pig", f"2024-01-{day:02d}", 100, players, result.custom_data)
+            live.update_from_result(result)
+        db.save_game_result("pig", "2024-01-09", 100, [("solo", "Solo", False, False)])
+        db.set_player_rating("alice", "pig", 99.0, 1.0)
+
+        helper = RatingHelper(db, game_type="pig")
+        rebuild = helper.rebuild(page_size=2)
+
+        assert (rebuild.games, rebuild.skipped, rebuild.players) == (4, 1, 3)
+        assert rebuild.games_per_second > 0
+        for pid in ("alice", "bob", "carol"):
+            assert helper.get_rating(pid).mu == pytest.approx(live.get_rating(pid).mu)
+            assert helper.get_rating(pid).sigma == pytest.approx(live.get_rating(pid).sigma)
+    finally:
+        db.close()
+
+
+def test_win_prediction_is_memoized_per_rating_pair():
+    from server.game_utils.stats_helpers import _predict_first_wins
+
+    db = DummyDB()
+    helper = RatingHelper(db, game_type="test")
+    helper.update_ratings([["alice"], ["bob"]])
+    _predict_first_wins.cache_clear()
+
+    alice_wins = helper.predict_win_probability("alice", "bob")
+    bob_wins = helper.predict_win_probability("bob", "alice")
+    assert alice_wins > 0.5
+    assert alice_wins + bob_wins == pytest.approx(1.0)
+    assert _predict_first_wins.cache_info().hits == 1
+
+    helper.update_ratings([["bob"], ["alice"]])
+    assert helper.predict_win_probability("alice", "bob") != alice_wins
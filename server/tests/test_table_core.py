@@ -38,6 +38,9 @@ class DummyGame:
     def get_player_by_id(self, pid):
         return None
 
+    def get_player_by_name(self, name):
+        return next((p for p in self.players if p.name == name), None)
+
 
 def test_add_member_does_not_duplicate():
     table = Table(table_id="t1", game_type="poker", host="host")
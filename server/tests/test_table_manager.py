@@ -115,3 +115,159 @@ def test_add_table_and_save_all_rehydrate_state():
     assert table._manager is manager
     assert table.game_json == '{"saved": 1}'
     assert saved_tables[0] is table
+
+
+class VirtualHostUser(DummyUser):
+    is_virtual_bot = True
+
+
+class SeatGame:
+    _table: Table | None = None
+
+    def __init__(self, host: str, max_players: int = 2):
+        self.host = host
+        self.status = "waiting"
+        self.players = [host]
+        self.max_players = max_players
+
+    def _table_state_changed(self) -> None:
+        # Mirrors Game._table_state_changed
+        if self._table is not None:
+            self._table.game_state_changed()
+
+    def get_max_players(self) -> int:
+        return self.max_players
+
+    def to_json(self) -> str:
+        return "{}"
+
+    def on_tick(self) -> None:
+        pass
+
+
+def test_joinable_tables_follow_game_status_and_seats():
+    manager, _ = _make_manager_with_server()
+    open_table = manager.create_table("poker", "alice", DummyUser("alice"))
+    open_table.game = SeatGame("alice")
+    open_table.game._table = open_table
+    full_table = manager.create_table("poker", "bob", DummyUser("bob"))
+    full_table.game = SeatGame("bob", max_players=1)
+
+    assert manager.get_joinable_tables() == (open_table,)
+    assert manager.get_joinable_tables("poker") == (open_table,)
+    assert manager.get_joinable_tables("yahtzee") == ()
+    assert manager.open_seat_count("poker") == 1
+
+    # Game status changes are picked up on the next tick
+    open_table.game.status = "playing"
+    open_table.game._table_state_changed()
+    manager.on_tick()
+    assert manager.get_joinable_tables() == ()
+
+    open_table.game.status = "waiting"
+    open_table.game._table_state_changed()
+    manager.on_tick()
+    assert manager.get_joinable_tables() == (open_table,)
+
+    manager.remove_table(open_table.table_id)
+    assert manager.get_joinable_tables() == ()
+    assert manager.open_seat_count("poker") == 0
+
+
+def test_on_tick_only_reindexes_tables_whose_game_changed(monkeypatch):
+    manager, _ = _make_manager_with_server()
+    tables = []
+    for name in ("alice", "bob", "carol"):
+        table = manager.create_table("poker", name, DummyUser(name))
+        table.game = SeatGame(name)
+        table.game._table = table
+        tables.append(table)
+
+    indexed = []
+    original = manager._index_key
+    monkeypatch.setattr(
+        manager, "_index_key", lambda table: indexed.append(table) or original(table)
+    )
+    manager.on_tick()
+    assert indexed == []
+
+    tables[1].game.status = "playing"
+    tables[1].game._table_state_changed()
+    tables[1].game.status = "finished"
+    tables[1].game._table_state_changed()
+    manager.on_tick()
+    assert indexed == [tables[1]]
+    assert manager.get_joinable_tables() == (tables[0], tables[2])
+
+
+def test_count_tables_by_host_kind():
+    manager, _ = _make_manager_with_server()
+    bot_table = manager.create_table("scopa", "BotA", VirtualHostUser("BotA"))
+    bot_table.game = SeatGame("BotA")
+    bot_table.game._table = bot_table
+    manager.create_table("scopa", "alice", DummyUser("alice"))
+    manager.create_table("ninetynine", "BotB", VirtualHostUser("BotB"))
+
+    assert manager.count_tables("scopa") == 2
+    assert manager.count_tables("scopa", "virtual_bot") == 1
+    assert manager.count_tables("scopa", "human") == 1
+    assert manager.count_tables("ninetynine", "virtual_bot") == 1
+
+    # Host handed to a human member
+    bot_table.add_member("carol", DummyUser("carol"))
+    bot_table.game.host = "carol"
+    bot_table.game._table_state_changed()
+    manager.on_tick()
+    assert manager.count_tables("scopa", "virtual_bot") == 0
+
+
+def test_change_listeners_fire_on_create_and_remove():
+    manager, _ = _make_manager_with_server()
+    events = []
+    manager.add_change_listener(lambda: events.append(len(manager.get_all_tables())))
+
+    table = manager.create_table("poker", "alice", DummyUser("alice"))
+    manager.remove_table(table.table_id)
+
+    assert events == [1, 0]
+
+
+def test_lobby_version_tracks_membership_and_status_changes():
+    manager, _ = _make_manager_with_server()
+    table = manager.create_table("poker", "host", DummyUser("host"))
+    renders = []
+
+    def render():
+        renders.append(manager.lobby_version)
+        return tuple(member.username for member in table.members)
+
+    assert manager.cached_render("tables_menu", "en", render, key="poker") == ("host",)
+    assert manager.cached_render("tables_menu", "en", render, key="poker") == ("host",)
+    assert manager.cached_render("tables_menu", "de", render, key="poker") == ("host",)
+    assert len(renders) == 2
+
+    for change in (
+        lambda: table.add_member("dave", DummyUser("dave")),
+        lambda: table.remove_member("dave"),
+        lambda: setattr(table, "status", "playing"),
+    ):
+        version = manager.lobby_version
+        change()
+        assert manager.lobby_version > version
+    assert manager.cached_render("tables_menu", "en", render, key="poker") == ("host",)
+    assert len(renders) == 3
+
+
+def test_find_user_table_follows_members_leaving():
+    manager, _ = _make_manager_with_server()
+    first = manager.create_table("poker", "host", DummyUser("host"))
+    second = manager.create_table("poker", "other", DummyUser("other"))
+    first.add_member("dave", DummyUser("dave"))
+    assert manager.find_user_table("dave") is first
+
+    first.remove_member("dave")
+    second.add_member("dave", DummyUser("dave"))
+    assert manager.find_user_table("dave") is second
+
+    manager.remove_table(second.table_id)
+    assert manager.find_user_table("dave") is None
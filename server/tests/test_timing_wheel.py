@@ -0,0 +1,62 @@
+"""Tests for the hierarchical timing wheel."""
+
+import random
+
+from server.core.timing_wheel import TimingWheel
+
+
+def _run_until(wheel: TimingWheel, tick: int) -> dict[int, list[str]]:
+    fired: dict[int, list[str]] = {}
+    while wheel.now < tick:
+        due = wheel.advance()
+        if due:
+            fired[wheel.now] = due
+    return fired
+
+
+def test_keys_fire_on_their_tick_across_levels():
+    wheel = TimingWheel(slots=4, levels=2)
+    wheel.schedule("soon", 1)
+    wheel.schedule("mid", 6)
+    wheel.schedule("far", 40)  # beyond both levels, waits in overflow
+
+    fired = _run_until(wheel, 50)
+
+    assert fired == {1: ["soon"], 6: ["mid"], 40: ["far"]}
+    assert len(wheel) == 0
+
+
+def test_reschedule_and_cancel_drop_stale_entries():
+    wheel = TimingWheel(slots=4, levels=2)
+    wheel.schedule("bot", 3)
+    wheel.schedule("bot", 9)
+    wheel.schedule("gone", 5)
+    wheel.cancel("gone")
+
+    fired = _run_until(wheel, 12)
+
+    assert fired == {9: ["bot"]}
+
+
+def test_past_ticks_fire_on_next_advance():
+    wheel = TimingWheel()
+    _run_until(wheel, 10)
+    wheel.schedule("late", 3)
+
+    assert wheel.deadline("late") == 11
+    assert wheel.advance() == ["late"]
+
+
+def test_matches_reference_schedule():
+    rng = random.Random(7)
+    wheel = TimingWheel(slots=4, levels=2)
+    expected: dict[int, int] = {}
+    for _ in range(2000):
+        key = rng.randint(0, 30)
+        tick = wheel.now + rng.choice([1, 2, 5, 17, 100])
+        wheel.schedule(key, tick)
+        expected[key] = tick
+        due = wheel.advance()
+        assert sorted(due) == sorted(k for k, t in expected.items() if t == wheel.now)
+        for key in due:
+            del expected[key]
@@ -21,6 +21,7 @@ class FakeTables:
     def __init__(self):
         self.tables = {}
         self.waiting_tables = []
+        self.virtual_hosts = set()
 
     def get_table(self, table_id):
         return self.tables.get(table_id)
@@ -37,6 +38,19 @@ class FakeTables:
     def get_all_tables(self):
         return list(self.tables.values())
 
+    def get_joinable_tables(self, game_type=None):
+        return tuple(self.waiting_tables)
+
+    def count_tables(self, game_type, host_kind=None):
+        count = 0
+        for table in self.get_all_tables():
+            if not table.game or table.game.get_type() != game_type:
+                continue
+            kind = "virtual_bot" if table.game.host in self.virtual_hosts else "human"
+            if host_kind is None or kind == host_kind:
+                count += 1
+        return count
+
 
 class FakeServer:
     def __init__(self, db=None):
@@ -611,6 +625,7 @@ def test_can_create_game_type_respects_limit():
     )
     server._tables.tables["tbl1"] = table
     manager._bots["BotHost"] = VirtualBot("BotHost")
+    server._tables.virtual_hosts = {"BotHost"}
 
     assert manager._can_create_game_type("crazyeights") is False
 
@@ -1272,6 +1287,7 @@ def test_on_tick_advances_waiting_bot(monkeypatch):
 
     monkeypatch.setattr(manager, "_refresh_guided_tables", lambda: None)
 
+    manager._sync_schedule()
     manager.on_tick()
 
     assert bot.state == VirtualBotState.ONLINE_IDLE
@@ -1282,7 +1298,7 @@ def test_process_in_game_bot_starts_game_when_host(monkeypatch):
     manager = _make_single_bot_manager()
     bot = manager._bots["BotA"]
     bot.state = VirtualBotState.IN_GAME
-    bot.online_ticks = 500
+    bot.online_since = manager._wheel.now - 500
     bot.game_join_tick = 0
     manager._profiles["default"].start_game_delay_ticks = 0
 
@@ -1317,7 +1333,7 @@ def test_process_leaving_game_logout_branch(monkeypatch):
     manager = VirtualBotManager(FakeServer())
     bot = VirtualBot("Leaf", state=VirtualBotState.LEAVING_GAME)
     bot.logout_after_game = True
-    bot.online_ticks = 10
+    bot.online_since = manager._wheel.now - 10
     bot.target_online_ticks = 999
     manager._bots["Leaf"] = bot
     monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
@@ -1332,7 +1348,7 @@ def test_process_leaving_game_offline_path(monkeypatch):
     manager = VirtualBotManager(FakeServer())
     bot = VirtualBot("Leaf", state=VirtualBotState.LEAVING_GAME)
     bot.logout_after_game = False
-    bot.online_ticks = 100
+    bot.online_since = manager._wheel.now - 100
     bot.target_online_ticks = 50
     manager._bots["Leaf"] = bot
     taken_offline = {}
@@ -1358,6 +1374,7 @@ def test_on_tick_processes_all_bots(monkeypatch):
 
     monkeypatch.setattr(manager, "_process_bot_tick", fake_process)
 
+    manager._sync_schedule()
     manager.on_tick()
 
     assert manager._tick_counter == 1
@@ -2220,13 +2237,14 @@ def test_virtual_bots_save_and_load_state(monkeypatch):
     manager._bots["Alpha"] = VirtualBot(
         name="Alpha",
         state=VirtualBotState.ONLINE_IDLE,
-        online_ticks=5,
+        online_since=-5,
         target_online_ticks=10,
     )
 
     manager.save_state()
     assert saved[0]["name"] == "Alpha"
     assert saved[0]["state"] == VirtualBotState.ONLINE_IDLE.value
+    assert saved[0]["online_ticks"] == 5
 
     manager._bots.clear()
     loaded = manager.load_state()
@@ -2235,6 +2253,7 @@ def test_virtual_bots_save_and_load_state(monkeypatch):
     assert "Alpha" in server._users
     assert server._user_states["Alpha"]["menu"] == "main_menu"
     assert "Ignored" not in manager._bots
+    assert manager._online_ticks(manager._bots["Alpha"]) == 12
 
 
 def test_restore_bot_user_conflict_sets_offline(monkeypatch):
@@ -2312,7 +2331,7 @@ def test_process_online_idle_bot_goes_offline_when_threshold_met(monkeypatch):
     bot = VirtualBot("Ada", state=VirtualBotState.ONLINE_IDLE)
     manager._bots["Ada"] = bot
     server._users["Ada"] = DummyNetworkUser()
-    bot.online_ticks = manager._config.min_online_ticks
+    bot.online_since = manager._wheel.now - manager._config.min_online_ticks
     bot.target_online_ticks = 0
     bot.think_ticks = 0
 
@@ -2353,7 +2372,7 @@ def test_process_online_idle_attempts_join_first(monkeypatch):
     bot = manager._bots["BotA"]
     bot.state = VirtualBotState.ONLINE_IDLE
     bot.target_online_ticks = 9999
-    bot.online_ticks = 0
+    bot.online_since = manager._wheel.now
     manager._profiles["default"].join_game_chance = 1.0
 
     monkeypatch.setattr(manager, "_handle_guided_bot", lambda b: False)
@@ -2378,7 +2397,7 @@ def test_process_online_idle_attempts_create_when_join_fails(monkeypatch):
     manager = _make_single_bot_manager()
     bot = manager._bots["BotA"]
     bot.state = VirtualBotState.ONLINE_IDLE
-    bot.online_ticks = 0
+    bot.online_since = manager._wheel.now
     bot.target_online_ticks = 9999
     profile = manager._profiles["default"]
     profile.join_game_chance = 0.0
@@ -2426,7 +2445,7 @@ def test_process_leaving_game_logout_branch(monkeypatch):
     manager = VirtualBotManager(FakeServer())
     bot = VirtualBot("Leaf", state=VirtualBotState.LEAVING_GAME)
     bot.logout_after_game = True
-    bot.online_ticks = 10
+    bot.online_since = manager._wheel.now - 10
     bot.target_online_ticks = 999
     manager._bots["Leaf"] = bot
     monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: a)
@@ -2441,7 +2460,7 @@ def test_process_leaving_game_offline_path(monkeypatch):
     manager = VirtualBotManager(FakeServer())
     bot = VirtualBot("Leaf", state=VirtualBotState.LEAVING_GAME)
     bot.logout_after_game = False
-    bot.online_ticks = 100
+    bot.online_since = manager._wheel.now - 100
     bot.target_online_ticks = 50
     manager._bots["Leaf"] = bot
     taken_offline = {}
@@ -2621,6 +2640,7 @@ def test_count_bot_owned_tables():
     manager = VirtualBotManager(server)
     manager._bots["BotA"] = VirtualBot("BotA")
     manager._bots["BotB"] = VirtualBot("BotB")
+    server._tables.virtual_hosts = {"BotA", "BotB"}
     # HumanPlayer is not a bot
 
     assert manager._count_bot_owned_tables("scopa") == 2  # BotA and BotB
@@ -2653,6 +2673,7 @@ def test_can_create_game_type_with_limits():
     manager = VirtualBotManager(server)
     manager._bots["BotA"] = VirtualBot("BotA")
     manager._bots["BotB"] = VirtualBot("BotB")
+    server._tables.virtual_hosts = {"BotA", "BotB"}
 
     # Set limit of 2 per game type
     manager._config.max_tables_per_game = 2
@@ -2701,6 +2722,7 @@ def test_try_create_game_respects_limits_and_falls_back_to_join(monkeypatch):
     manager = VirtualBotManager(server)
     manager._bots["BotA"] = VirtualBot("BotA")
     manager._bots["BotB"] = VirtualBot("BotB")
+    server._tables.virtual_hosts = {"BotA", "BotB"}
     manager._config.max_tables_per_game = 2  # Limit of 2 per game type
 
     # Create a bot that wants to create a game
@@ -2776,6 +2798,7 @@ def test_try_create_game_picks_available_game_type(monkeypatch):
     manager = VirtualBotManager(server)
     manager._bots["BotA"] = VirtualBot("BotA")
     manager._bots["BotB"] = VirtualBot("BotB")
+    server._tables.virtual_hosts = {"BotA", "BotB"}
     manager._config.max_tables_per_game = 2  # Limit of 2 per game type
 
     bot = VirtualBot("Creator", state=VirtualBotState.ONLINE_IDLE)
@@ -2820,3 +2843,85 @@ def test_try_create_game_picks_available_game_type(monkeypatch):
     assert created is True
     assert server._tables.created_game_types == ["ninetynine"]
     assert bot.state == VirtualBotState.IN_GAME
+
+
+def test_on_tick_skips_bots_until_their_think_time_elapses(monkeypatch):
+    manager = _make_single_bot_manager()
+    bot = manager._bots["BotA"]
+    bot.think_ticks = 5
+    bot.target_online_ticks = 9999
+    processed = []
+    original = manager._process_bot_tick
+
+    def tracking_process(target_bot):
+        processed.append((manager._tick_counter, target_bot.think_ticks, manager._online_ticks(target_bot)))
+        original(target_bot)
+
+    monkeypatch.setattr(manager, "_process_bot_tick", tracking_process)
+    monkeypatch.setattr(manager, "_try_join_game", lambda target_bot: False)
+    monkeypatch.setattr(manager, "_try_create_game", lambda target_bot: False)
+    monkeypatch.setattr("server.core.virtual_bots.random.randint", lambda a, b: 50)
+
+    manager._sync_schedule()
+    for _ in range(10):
+        manager.on_tick()
+
+    # Ticks 1-5 only count down think time, so the first visit is tick 6
+    assert processed == [(6, 0, 6)]
+    assert manager._online_ticks(bot) == 10
+    assert bot.think_ticks == 50
+
+
+def test_guided_refresh_runs_on_table_changes_only(monkeypatch):
+    manager = _make_single_bot_manager()
+    refreshes = []
+    monkeypatch.setattr(manager, "_refresh_guided_tables", lambda: refreshes.append(manager._tick_counter))
+    monkeypatch.setattr(manager, "_process_bot_tick", lambda bot: None)
+
+    for _ in range(5):
+        manager.on_tick()
+    assert refreshes == [1]
+
+    manager.on_tables_changed()
+    manager.on_tick()
+    assert refreshes == [1, 6]
+
+
+def test_save_state_catches_up_online_ticks(monkeypatch):
+    class RecordingDB:
+        def __init__(self):
+            self.saved = []
+
+        def delete_all_virtual_bots(self):
+            pass
+
+        def save_virtual_bot(self, **kwargs):
+            self.saved.append(kwargs)
+
+    manager = VirtualBotManager(FakeServer(db=RecordingDB()))
+    bot = VirtualBot("BotA", state=VirtualBotState.ONLINE_IDLE, think_ticks=100)
+    manager._bots["BotA"] = bot
+    monkeypatch.setattr(manager, "_refresh_guided_tables", lambda: None)
+
+    for _ in range(30):
+        manager.on_tick()
+    manager.save_state()
+
+    assert manager._server._db.saved[0]["online_ticks"] == 30
+
+
+def test_replaced_bot_is_scheduled_when_bot_count_is_unchanged(monkeypatch):
+    manager = _make_single_bot_manager()
+    monkeypatch.setattr(manager, "_refresh_guided_tables", lambda: None)
+    monkeypatch.setattr(manager, "_process_bot_tick", lambda bot: None)
+    manager._sync_schedule()
+    manager.on_tick()
+    assert "BotA" in manager._wheel
+
+    del manager._bots["BotA"]
+    manager._bots["BotB"] = VirtualBot("BotB")
+    manager._sync_schedule()
+
+    assert "BotA" not in manager._wheel
+    assert "BotA" not in manager._synced_ticks
+    assert "BotB" in manager._wheel
@@ -1,6 +1,8 @@
 """Tests for WebSocket server helpers and client handling."""
 
+import asyncio
 import json
+from types import SimpleNamespace
 
 import pytest
 
@@ -112,3 +114,115 @@ async def test_websocket_server_passes_max_size(monkeypatch):
     await ws_server.start()
     assert recorded_kwargs.get("max_size") == 2048
     await ws_server.stop()
+
+
+class StalledWebSocket(DummyWebSocket):
+    """A websocket whose sends block until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send(self, data):
+        await self.release.wait()
+        self.sent.append(data)
+
+
+def _menu(menu_id, *items, **extra):
+    return {"type": "menu", "menu_id": menu_id, "items": list(items), **extra}
+
+
+@pytest.mark.asyncio
+async def test_enqueue_coalesces_menus_and_superseded_music():
+    ws = StalledWebSocket()
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234")
+
+    conn.enqueue({"type": "speak", "text": "first"})
+    await asyncio.sleep(0)  # writer picks up "first" and stalls on it
+    conn.enqueue(_menu("turn_menu", "Roll", escape_behavior="keybind"))
+    conn.enqueue({"type": "play_music", "name": "a.ogg"})
+    conn.enqueue(_menu("turn_menu", "Roll", "Bank"))
+    conn.enqueue({"type": "play_music", "name": "b.ogg"})
+    assert conn.queued_packets == 2
+
+    ws.release.set()
+    await asyncio.sleep(0.01)
+    sent = [json.loads(data) for data in ws.sent]
+    assert [packet["type"] for packet in sent] == ["speak", "menu", "play_music"]
+    assert sent[1]["items"] == ["Roll", "Bank"]
+    assert sent[1]["escape_behavior"] == "keybind"
+    assert sent[2]["name"] == "b.ogg"
+    assert conn.queued_packets == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batches_queued_packets_for_clients_that_accept_them():
+    ws = StalledWebSocket()
+    conn = ClientConnection(
+        websocket=ws, address="127.0.0.1:1234", features=frozenset({"packet_batches"})
+    )
+
+    conn.enqueue({"type": "speak", "text": "first"})
+    await asyncio.sleep(0)
+    conn.enqueue({"type": "speak", "text": "second"})
+    conn.enqueue(_menu("turn_menu", "Roll"))
+    conn.enqueue(_menu("turn_menu", "Roll", "Bank"))
+
+    ws.release.set()
+    await asyncio.sleep(0.01)
+    assert json.loads(ws.sent[0])["text"] == "first"
+    batch = json.loads(ws.sent[1])
+    assert [packet["type"] for packet in batch] == ["speak", "menu"]
+    assert batch[1]["items"] == ["Roll", "Bank"]
+    assert len(ws.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_sheds_sounds_before_disconnecting():
+    ws = StalledWebSocket()
+    limits = websocket_server.OutboundLimits(max_packets=3)
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234", limits=limits)
+
+    conn.enqueue({"type": "speak", "text": "in flight"})
+    await asyncio.sleep(0)
+    conn.enqueue({"type": "play_sound", "name": "roll.ogg"})
+    conn.enqueue({"type": "speak", "text": "one"})
+    conn.enqueue({"type": "speak", "text": "two"})
+    conn.enqueue({"type": "speak", "text": "three"})
+    assert not conn.lagging
+    assert conn.queued_packets == 3
+
+    conn.enqueue({"type": "speak", "text": "four"})
+    assert conn.lagging
+    assert conn.queued_packets == 0
+    conn.enqueue({"type": "speak", "text": "ignored"})
+    assert conn.queued_packets == 0
+
+    ws.release.set()
+    await asyncio.sleep(0.01)
+    assert ws.closed
+    disconnect = json.loads(ws.sent[-1])
+    assert disconnect["type"] == "disconnect"
+    assert disconnect["reconnect"] is True
+
+
+@pytest.mark.asyncio
+async def test_enqueue_disconnects_clients_over_lag_budget(monkeypatch):
+    ws = StalledWebSocket()
+    limits = websocket_server.OutboundLimits(max_lag_seconds=5)
+    conn = ClientConnection(websocket=ws, address="127.0.0.1:1234", limits=limits)
+    now = [100.0]
+    monkeypatch.setattr(websocket_server, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    conn.enqueue({"type": "speak", "text": "in flight"})
+    await asyncio.sleep(0)
+    conn.enqueue({"type": "speak", "text": "waiting"})
+    now[0] += 4
+    conn.enqueue({"type": "speak", "text": "still fine"})
+    assert not conn.lagging
+
+    now[0] += 2
+    conn.enqueue({"type": "speak", "text": "too late"})
+    assert conn.lagging
+    ws.release.set()
+    await asyncio.sleep(0.01)